@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Benchmark how long it takes to import our entry points.
+
+This imports each entry point in fresh interpreters with `python -X importtime`
+and prints the best cumulative import time of each, next to its budget. The
+budgets are generous upper bounds: normally these take well under half of their
+budget. Going over probably means that something is importing the whole
+Protocol Engine or hardware controller at module level, which takes several
+seconds. Exits with status 1 if any entry point is over its budget.
+
+Usage: python scripts/benchmark_import_time.py [--runs N]
+"""
+
+import subprocess
+import sys
+from typing import List
+
+IMPORT_TIME_BUDGETS = {
+    "opentrons": 1.0,
+    "opentrons.simulate": 1.5,
+    "opentrons.execute": 1.5,
+}
+"""Upper bounds on the cumulative import time of each entry point, in seconds."""
+
+
+def _import_time(module: str) -> float:
+    """Import `module` in a fresh interpreter and return how long it took, in seconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise RuntimeError(f"{module} was not imported.")
+
+
+def main(args: List[str]) -> int:
+    """Print the best import time of each entry point against its budget."""
+    runs = 3
+    if args[:1] == ["--runs"]:
+        runs = int(args[1])
+    over_budget = False
+    for module, budget in IMPORT_TIME_BUDGETS.items():
+        best = min(_import_time(module) for _ in range(runs))
+        over_budget = over_budget or best >= budget
+        status = "over budget" if best >= budget else "ok"
+        print(f"{module:<20} {best:>6.2f} s (budget {budget:.1f} s) {status}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -3,15 +3,7 @@ import os
 from pathlib import Path
 import logging
 import re
-from typing import Any, List, Tuple
-
-from opentrons.drivers.serial_communication import get_ports_by_name
-from opentrons.hardware_control import (
-    API as HardwareAPI,
-    ThreadManager,
-    ThreadManagedHardware,
-    types as hw_types,
-)
+from typing import TYPE_CHECKING, Any, List, Tuple
 
 from opentrons.config import (
     feature_flags as ff,
@@ -26,6 +18,9 @@ from opentrons.protocols.api_support.types import APIVersion
 
 from ._version import version
 
+if TYPE_CHECKING:
+    from opentrons.hardware_control import ThreadManagedHardware
+
 HERE = os.path.abspath(os.path.dirname(__file__))
 __version__ = version
 
@@ -76,6 +71,10 @@ def _find_smoothie_file() -> Tuple[Path, str]:
 
 
 def _get_motor_control_serial_port() -> Any:
+    # Local import because the serial drivers are slow to import and only
+    # needed when connecting to real hardware.
+    from opentrons.drivers.serial_communication import get_ports_by_name
+
     port = os.environ.get("OT_SMOOTHIE_EMULATOR_URI")
 
     if port is None:
@@ -100,12 +99,20 @@ def should_use_ot3() -> bool:
     return False
 
 
-async def _create_thread_manager() -> ThreadManagedHardware:
+async def _create_thread_manager() -> "ThreadManagedHardware":
     """Build the hardware controller wrapped in a ThreadManager.
 
     .. deprecated:: 4.6
         ThreadManager is on its way out.
     """
+    # Local import because the hardware controller is slow to import, and
+    # importing this package shouldn't need it.
+    from opentrons.hardware_control import (
+        API as HardwareAPI,
+        ThreadManager,
+        types as hw_types,
+    )
+
     if os.environ.get("ENABLE_VIRTUAL_SMOOTHIE"):
         log.info("Initialized robot using virtual Smoothie")
         thread_manager: ThreadManagedHardware = ThreadManager(
@@ -137,7 +144,7 @@ async def _create_thread_manager() -> ThreadManagedHardware:
     return thread_manager
 
 
-async def initialize() -> ThreadManagedHardware:
+async def initialize() -> "ThreadManagedHardware":
     """
     Initialize the Opentrons hardware returning a hardware instance.
     """
@@ -222,6 +222,19 @@ settings = [
         robot_type=[RobotTypeEnum.OT2, RobotTypeEnum.FLEX],
         internal_only=True,
     ),
+    SettingDefinition(
+        _id="enableCompactPerformanceMetrics",
+        title="Store performance metrics compactly",
+        description=(
+            "Do not enable."
+            " This is an Opentrons internal setting to store performance metrics"
+            " as aggregates per activity, in rotating binary files, instead of"
+            " as a CSV row per tracked call."
+            " It has no effect unless performance metrics are enabled."
+        ),
+        robot_type=[RobotTypeEnum.OT2, RobotTypeEnum.FLEX],
+        internal_only=True,
+    ),
     SettingDefinition(
         _id="allowLiquidClasses",
         title="Allow the use of liquid classes",
@@ -736,6 +749,16 @@ def _migrate35to36(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
+def _migrate36to37(previous: SettingsMap) -> SettingsMap:
+    """Migrate to version 37 of the feature flags file.
+
+    - Adds the enableCompactPerformanceMetrics config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap["enableCompactPerformanceMetrics"] = None
+    return newmap
+
+
 _MIGRATIONS = [
     _migrate0to1,
     _migrate1to2,
@@ -773,6 +796,7 @@ _MIGRATIONS = [
     _migrate33to34,
     _migrate34to35,
     _migrate35to36,
+    _migrate36to37,
 ]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
@@ -76,6 +76,12 @@ def enable_performance_metrics(robot_type: RobotTypeEnum) -> bool:
     return advs.get_setting_with_env_overload("enablePerformanceMetrics", robot_type)
 
 
+def enable_compact_performance_metrics(robot_type: RobotTypeEnum) -> bool:
+    return advs.get_setting_with_env_overload(
+        "enableCompactPerformanceMetrics", robot_type
+    )
+
+
 def oem_mode_enabled() -> bool:
     return advs.get_setting_with_env_overload("enableOEMMode", RobotTypeEnum.FLEX)
 
@@ -3,7 +3,6 @@ from typing import Optional, Dict
 from opentrons.util.async_helpers import ensure_yield
 from opentrons.drivers.thermocycler.abstract import AbstractThermocyclerDriver
 from opentrons.drivers.types import Temperature, PlateTemperature, ThermocyclerLidStatus
-from opentrons.hardware_control.modules.types import ThermocyclerModuleModel
 from opentrons.drivers.asyncio.communication.errors import ErrorResponse
 
 
@@ -47,6 +46,9 @@ class SimulatingDriver(AbstractThermocyclerDriver):
 
     @ensure_yield
     async def lift_plate(self) -> None:
+        # Imported here to avoid a circular import with hardware_control.modules.
+        from opentrons.hardware_control.modules.types import ThermocyclerModuleModel
+
         if self._model == ThermocyclerModuleModel.THERMOCYCLER_V1.value:
             raise NotImplementedError()
         if self._lid_status != ThermocyclerLidStatus.OPEN:
@@ -117,6 +119,9 @@ class SimulatingDriver(AbstractThermocyclerDriver):
 
     @ensure_yield
     async def jog_lid(self, angle: float) -> None:
+        # Imported here to avoid a circular import with hardware_control.modules.
+        from opentrons.hardware_control.modules.types import ThermocyclerModuleModel
+
         if self._model == ThermocyclerModuleModel.THERMOCYCLER_V1.value:
             raise NotImplementedError()
         self._lid_status = (
@@ -5,6 +5,8 @@ contexts for running protocols during interactive sessions like Jupyter or just
 regular python shells. It also provides a console entrypoint for running a
 protocol from the command line.
 """
+from __future__ import annotations
+
 import asyncio
 import atexit
 import argparse
@@ -23,64 +25,35 @@ from typing import (
     Union,
 )
 
-from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons_shared_data.robot.types import RobotType
 
-from opentrons import protocol_api, __version__, should_use_ot3
-
-from opentrons.legacy_commands import types as command_types
+from opentrons import __version__, should_use_ot3
 
-from opentrons.hardware_control import (
-    API as OT2API,
-    ThreadManagedHardware,
-    ThreadManager,
-)
-from opentrons.hardware_control.types import HardwareFeatureFlags
-
-from opentrons.protocols import parse
-from opentrons.protocols.api_support.deck_type import (
-    guess_from_global_config as guess_deck_type_from_global_config,
-    should_load_fixed_trash,
-    should_load_fixed_trash_labware_for_python_protocol,
-)
 from opentrons.protocols.api_support.types import APIVersion
-from opentrons.protocols.execution import execute as execute_apiv2
 from opentrons.protocols.types import (
     ApiDeprecationError,
     Protocol,
     PythonProtocol,
 )
 
-from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
-from opentrons.protocol_api.protocol_context import ProtocolContext
-
-from opentrons.protocol_engine import (
-    Config,
-    DeckType,
-    EngineStatus,
-    error_recovery_policy,
-)
-from opentrons.protocol_engine.create_protocol_engine import (
-    create_protocol_engine_in_thread,
-    create_protocol_engine,
-)
-from opentrons.protocol_engine.types import PostRunHardwareState
-
-from opentrons.protocol_reader import ProtocolSource
-
-from opentrons.protocol_runner import (
-    create_protocol_runner,
-    RunOrchestrator,
-    LiveRunner,
-)
-
-from .util import entrypoint_util
-
+# Most of this module's dependencies are imported by the functions that use them,
+# not up here. Importing them loads the Protocol Engine, its command models, and the
+# hardware controller, which takes seconds on a robot, and things like
+# `opentrons_execute --help` shouldn't have to wait for that.
 if TYPE_CHECKING:
     from opentrons_shared_data.labware.types import (
         LabwareDefinition as LabwareDefinitionDict,
     )
 
+    from opentrons import protocol_api
+    from opentrons.hardware_control import ThreadManagedHardware
+    from opentrons.legacy_commands import types as command_types
+    from opentrons.protocol_api.protocol_context import ProtocolContext
+    from opentrons.protocol_engine import Config
+    from opentrons.protocol_reader import ProtocolSource
+
+    _EmitRunlogCallable = Callable[[command_types.CommandMessage], None]
+
 
 _THREAD_MANAGED_HW: Optional[ThreadManagedHardware] = None
 #: The background global cache that all protocol contexts created by
@@ -113,9 +86,6 @@ _JSON_TOO_NEW_MESSAGE = (
 )
 
 
-_EmitRunlogCallable = Callable[[command_types.CommandMessage], None]
-
-
 def get_protocol_api(
     version: Union[str, APIVersion],
     bundled_labware: Optional[Dict[str, "LabwareDefinitionDict"]] = None,
@@ -161,6 +131,13 @@ def get_protocol_api(
         data directory.
     :return: The protocol context.
     """
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+    from opentrons.protocols import parse
+    from opentrons.protocols.api_support.deck_type import (
+        guess_from_global_config as guess_deck_type_from_global_config,
+    )
+    from .util import entrypoint_util
+
     if isinstance(version, str):
         checked_version = parse.version_from_string(version)
     elif not isinstance(version, APIVersion):
@@ -365,6 +342,10 @@ def execute(
         are presented by the protocol context in
         ``ProtocolContext.bundled_data``.
     """
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+    from opentrons.protocols import parse
+    from .util import entrypoint_util
+
     stack_logger = logging.getLogger("opentrons")
     stack_logger.propagate = propagate_logs
     stack_logger.setLevel(getattr(logging, log_level.upper(), logging.WARNING))
@@ -476,6 +457,9 @@ def main() -> int:
         help="Do not print the commands as they are executed",
     )
     args = parser.parse_args()
+
+    from .util import entrypoint_util
+
     printer = None if args.no_print_runlog else make_runlog_cb()
     if args.log_level != "none":
         stack_logger = logging.getLogger("opentrons")
@@ -517,6 +501,9 @@ def _create_live_context_non_pe(
 
     This controls the robot through the older infrastructure, instead of through Protocol Engine.
     """
+    from opentrons import protocol_api
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+
     assert api_version < ENGINE_CORE_API_VERSION
     return protocol_api.create_protocol_context(
         api_version=api_version,
@@ -537,6 +524,20 @@ def _create_live_context_pe(
     bundled_data: Optional[Dict[str, bytes]],
 ) -> ProtocolContext:
     """Return a live ProtocolContext that controls the robot through ProtocolEngine."""
+    from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+
+    from opentrons import protocol_api
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+    from opentrons.protocol_engine import error_recovery_policy
+    from opentrons.protocol_engine.create_protocol_engine import (
+        create_protocol_engine_in_thread,
+    )
+    from opentrons.protocol_engine.types import PostRunHardwareState
+    from opentrons.protocols.api_support.deck_type import (
+        should_load_fixed_trash_labware_for_python_protocol,
+    )
+    from .util import entrypoint_util
+
     assert api_version >= ENGINE_CORE_API_VERSION
 
     global _LIVE_PROTOCOL_ENGINE_CONTEXTS
@@ -583,6 +584,12 @@ def _run_file_non_pe(
     emit_runlog: Optional[_EmitRunlogCallable],
 ) -> None:
     """Run a protocol file without Protocol Engine, with the older infrastructure instead."""
+    from opentrons.legacy_commands import types as command_types
+    from opentrons.protocols.api_support.deck_type import (
+        guess_from_global_config as guess_deck_type_from_global_config,
+    )
+    from opentrons.protocols.execution import execute as execute_apiv2
+
     if isinstance(protocol, PythonProtocol):
         extra_labware = protocol.extra_labware
         bundled_labware = protocol.bundled_labware
@@ -623,6 +630,15 @@ def _run_file_pe(
     emit_runlog: Optional[_EmitRunlogCallable],
 ) -> None:
     """Run a protocol file with Protocol Engine."""
+    from opentrons.protocol_engine import EngineStatus, error_recovery_policy
+    from opentrons.protocol_engine.create_protocol_engine import create_protocol_engine
+    from opentrons.protocol_runner import (
+        create_protocol_runner,
+        RunOrchestrator,
+        LiveRunner,
+    )
+    from opentrons.protocols.api_support.deck_type import should_load_fixed_trash
+    from .util import entrypoint_util
 
     async def run(protocol_source: ProtocolSource) -> None:
         # TODO (spp, 2024-03-18): use run-time param overrides once enabled for cli protocol execution
@@ -684,6 +700,11 @@ def _get_robot_type() -> RobotType:
 
 def _get_protocol_engine_config() -> Config:
     """Return a Protocol Engine config to execute protocols on this device."""
+    from opentrons.protocol_engine import Config, DeckType
+    from opentrons.protocols.api_support.deck_type import (
+        guess_from_global_config as guess_deck_type_from_global_config,
+    )
+
     return Config(
         robot_type=_get_robot_type(),
         deck_type=DeckType(guess_deck_type_from_global_config()),
@@ -699,6 +720,9 @@ def _get_global_hardware_controller(robot_type: RobotType) -> ThreadManagedHardw
     # is at script/repl scope not function scope and is synchronous so
     # you can't control the loop from inside. If we update to
     # IPython 7 we can avoid this, but for now we can't
+    from opentrons.hardware_control import API as OT2API, ThreadManager
+    from opentrons.hardware_control.types import HardwareFeatureFlags
+
     global _THREAD_MANAGED_HW
     if not _THREAD_MANAGED_HW:
         if robot_type == "OT-3 Standard":
@@ -9,38 +9,116 @@ or axis)  to a deck-absolute point (not a Smoothie-coordinate point).
 This module is not for use outside the opentrons api module. Higher-level
 functions are available elsewhere.
 """
-from .adapters import SynchronousAdapter
-from .api import API
-from .pause_manager import PauseManager
-from .backends import Controller, Simulator
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Union
+
 from .types import CriticalPoint, ExecutionState, OT3Mount
 from .constants import DROP_TIP_RELEASE_DISTANCE
-from .thread_manager import ThreadManager
-from .execution_manager import ExecutionManager
-from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
-from .protocols import HardwareControlInterface, FlexHardwareControlInterface
-from .instruments import AbstractInstrument, Gripper
-from typing import Union
-from .ot3_calibration import OT3Transforms
-from .robot_calibration import RobotCalibration
-from opentrons.config.types import RobotConfig, OT3Config
-
-from opentrons.types import Mount
-
-# TODO (lc 12-05-2022) We should 1. figure out if we need
-# to globally export a class that is strictly used in the hardware controller
-# and 2. how to properly export an ot2 and ot3 pipette.
-from .instruments.ot2.pipette import Pipette
-
-OT2HardwareControlAPI = HardwareControlInterface[RobotCalibration, Mount, RobotConfig]
-OT3HardwareControlAPI = FlexHardwareControlInterface[
-    OT3Transforms, Union[Mount, OT3Mount], OT3Config
-]
-HardwareControlAPI = Union[OT2HardwareControlAPI, OT3HardwareControlAPI]
 
-# this type ignore is because of https://github.com/python/mypy/issues/13437
-ThreadManagedHardware = ThreadManager[HardwareControlAPI]  # type: ignore[misc]
-SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
+if TYPE_CHECKING:
+    from .adapters import SynchronousAdapter
+    from .api import API
+    from .pause_manager import PauseManager
+    from .backends import Controller, Simulator
+    from .thread_manager import ThreadManager
+    from .execution_manager import ExecutionManager
+    from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
+    from .protocols import HardwareControlInterface, FlexHardwareControlInterface
+    from .instruments import AbstractInstrument, Gripper
+    from .ot3_calibration import OT3Transforms
+    from .robot_calibration import RobotCalibration
+    from opentrons.config.types import RobotConfig, OT3Config
+
+    from opentrons.types import Mount
+
+    # TODO (lc 12-05-2022) We should 1. figure out if we need
+    # to globally export a class that is strictly used in the hardware controller
+    # and 2. how to properly export an ot2 and ot3 pipette.
+    from .instruments.ot2.pipette import Pipette
+
+    OT2HardwareControlAPI = HardwareControlInterface[
+        RobotCalibration, Mount, RobotConfig
+    ]
+    OT3HardwareControlAPI = FlexHardwareControlInterface[
+        OT3Transforms, Union[Mount, OT3Mount], OT3Config
+    ]
+    HardwareControlAPI = Union[OT2HardwareControlAPI, OT3HardwareControlAPI]
+
+    # this type ignore is because of https://github.com/python/mypy/issues/13437
+    ThreadManagedHardware = ThreadManager[HardwareControlAPI]  # type: ignore[misc]
+    SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
+
+
+# The hardware controller and its backends import the module drivers, the
+# motion planning code, and a lot of models, which is slow. So that importing
+# this package (or a submodule like .types) stays cheap, they're imported the
+# first time that they're accessed, from the submodule that defines them.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "SynchronousAdapter": ".adapters",
+    "API": ".api",
+    "PauseManager": ".pause_manager",
+    "Controller": ".backends",
+    "Simulator": ".backends",
+    "ThreadManager": ".thread_manager",
+    "ExecutionManager": ".execution_manager",
+    "ThreadedAsyncLock": ".threaded_async_lock",
+    "ThreadedAsyncForbidden": ".threaded_async_lock",
+    "HardwareControlInterface": ".protocols",
+    "FlexHardwareControlInterface": ".protocols",
+    "AbstractInstrument": ".instruments",
+    "Gripper": ".instruments",
+    "OT3Transforms": ".ot3_calibration",
+    "RobotCalibration": ".robot_calibration",
+    "Pipette": ".instruments.ot2.pipette",
+}
+
+_TYPE_ALIASES = (
+    "OT2HardwareControlAPI",
+    "OT3HardwareControlAPI",
+    "HardwareControlAPI",
+    "ThreadManagedHardware",
+    "SyncHardwareAPI",
+)
+
+
+def _build_type_aliases() -> Dict[str, Any]:
+    from opentrons.config.types import RobotConfig, OT3Config
+    from opentrons.types import Mount
+    from .adapters import SynchronousAdapter
+    from .ot3_calibration import OT3Transforms
+    from .protocols import HardwareControlInterface, FlexHardwareControlInterface
+    from .robot_calibration import RobotCalibration
+    from .thread_manager import ThreadManager
+
+    ot2_hardware_control_api = HardwareControlInterface[
+        RobotCalibration, Mount, RobotConfig
+    ]
+    ot3_hardware_control_api = FlexHardwareControlInterface[
+        OT3Transforms, Union[Mount, OT3Mount], OT3Config
+    ]
+    hardware_control_api = Union[ot2_hardware_control_api, ot3_hardware_control_api]
+    return {
+        "OT2HardwareControlAPI": ot2_hardware_control_api,
+        "OT3HardwareControlAPI": ot3_hardware_control_api,
+        "HardwareControlAPI": hardware_control_api,
+        "ThreadManagedHardware": ThreadManager[hardware_control_api],  # type: ignore[misc]
+        "SyncHardwareAPI": SynchronousAdapter[hardware_control_api],
+    }
+
+
+def __getattr__(name: str) -> Any:
+    """Import the hardware controller's exports when they're first accessed."""
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _TYPE_ALIASES:
+        type_aliases = _build_type_aliases()
+        globals().update(type_aliases)
+        return type_aliases[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "API",
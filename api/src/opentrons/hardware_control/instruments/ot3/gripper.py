@@ -3,7 +3,7 @@ from __future__ import annotations
 """ Classes and functions for gripper state tracking
 """
 import logging
-from typing import Any, Optional, Set, Dict, Tuple, Final
+from typing import Any, Optional, Set, Dict, Tuple, Final, TYPE_CHECKING
 
 from opentrons.types import Point
 from opentrons.config import gripper_config
@@ -21,7 +21,6 @@ from .instrument_calibration import (
     save_gripper_calibration_offset,
 )
 from ..instrument_abc import AbstractInstrument
-from opentrons.hardware_control.dev_types import AttachedGripper, GripperDict
 from opentrons_shared_data.errors.exceptions import (
     CommandPreconditionViolated,
     MotionFailedError,
@@ -33,6 +32,9 @@ from opentrons_shared_data.gripper import (
     Geometry,
 )
 
+if TYPE_CHECKING:
+    from opentrons.hardware_control.dev_types import AttachedGripper, GripperDict
+
 RECONFIG_KEYS = {"quirks", "grip_force_profile"}
 
 MAX_ACCEPTABLE_JAW_DISPLACEMENT: Final = 20
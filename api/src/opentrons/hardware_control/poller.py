@@ -3,7 +3,6 @@ import contextlib
 import logging
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, List, Optional
-from opentrons.hardware_control.modules.errors import AbsorbanceReaderDisconnectedError
 from opentrons_shared_data.errors.exceptions import ModuleCommunicationError
 
 
@@ -90,6 +89,12 @@ class Poller:
 
     async def _poll_once(self) -> None:
         """Trigger a single read, notifying listeners of success or error."""
+        # Imported here to avoid a circular import with hardware_control.modules,
+        # whose module classes import this one.
+        from opentrons.hardware_control.modules.errors import (
+            AbsorbanceReaderDisconnectedError,
+        )
+
         previous_waiters = self._poll_waiters
         self._poll_waiters = []
 
@@ -68,6 +68,12 @@ class OrderedSet(Generic[_SetElementT]):
         """Remove all elements from the set."""
         self._elements.clear()
 
+    def copy(self) -> OrderedSet[_SetElementT]:
+        """Return a shallow copy of the set, with the same elements in the same order."""
+        result = OrderedSet[_SetElementT]()
+        result._elements = self._elements.copy()
+        return result
+
     @overload
     def head(self) -> _SetElementT:
         ...
@@ -32,6 +32,11 @@ class ChildThreadTransport:
 
     This class is responsible for doing the actual transformation from async `ProtocolEngine` calls
     to non-async ones, and doing it in a thread-safe way.
+
+    Each command is waited on before returning, rather than queued up and submitted in
+    batches. Almost every Protocol API call reads state right after submitting its
+    command, so a queue would rarely hold more than one, and errors would surface
+    at a later call instead of the one that caused them.
     """
 
     def __init__(self, engine: ProtocolEngine, loop: AbstractEventLoop) -> None:
@@ -23,8 +23,8 @@ class RunControlHandler:
         """Issue a PauseAction to the store, pausing the run."""
         if not self._state_store.config.ignore_pause:
             self._action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL))
-            await self._state_store.wait_for(
-                condition=self._state_store.commands.get_is_running
+            await self._state_store.wait_for_in(
+                {"commands"}, self._state_store.commands.get_is_running
             )
 
     async def wait_for_duration(self, seconds: float) -> None:
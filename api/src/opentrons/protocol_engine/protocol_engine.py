@@ -263,7 +263,8 @@ class ProtocolEngine:
 
         Will also return if the engine was stopped before it reached the command.
         """
-        await self._state_store.wait_for(
+        await self._state_store.wait_for_in(
+            {"commands"},
             self._state_store.commands.get_command_is_final,
             command_id=command_id,
         )
@@ -314,7 +315,8 @@ class ProtocolEngine:
         queued_command = self.add_command(request)
         await self.wait_for_command(command_id=queued_command.id)
         completed_command = self._state_store.commands.get(queued_command.id)
-        await self._state_store.wait_for_not(
+        await self._state_store.wait_for_not_in(
+            {"commands"},
             self.state_view.commands.get_recovery_in_progress_for_command,
             queued_command.id,
         )
@@ -391,8 +393,8 @@ class ProtocolEngine:
 
         If a command encountered a fatal error, it's raised as an exception.
         """
-        await self._state_store.wait_for(
-            condition=self._state_store.commands.get_all_commands_final
+        await self._state_store.wait_for_in(
+            {"commands"}, self._state_store.commands.get_all_commands_final
         )
         self._state_store.commands.raise_fatal_command_error()
 
@@ -6,6 +6,9 @@ abstract away rough edges until we can improve those underlying interfaces.
 import logging
 from anyio import to_thread
 
+from opentrons_shared_data.labware import load_validated_definition
+
+from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.protocols.labware import get_labware_definition
 
@@ -31,7 +34,8 @@ class LabwareDataProvider:
         """Get a labware definition given the labware's identification.
 
         Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        implications if it is called often. Standard definitions are cached
+        after the first time, so the returned definition must not be modified.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_labware_definition_sync,
@@ -44,6 +48,12 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
+        if namespace.lower() == OPENTRONS_NAMESPACE:
+            try:
+                return load_validated_definition(load_name.lower(), version)
+            except FileNotFoundError:
+                # Fall through for get_labware_definition()'s error message.
+                pass
         return LabwareDefinition.parse_obj(
             get_labware_definition(load_name, namespace, version)
         )
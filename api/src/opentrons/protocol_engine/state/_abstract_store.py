@@ -25,3 +25,28 @@ class HandlesActions(ABC):
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
         ...
+
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change this store's state.
+
+        The top-level `StateStore` skips substores that return False here, and
+        doesn't tell anyone watching them that their state changed, so this must
+        never return False for an action that `handle_action` reacts to.
+        Returning True for an action that turns out to change nothing is fine.
+
+        Stores that override this should have `handle_action` return early
+        when it's False, so that the two can't disagree.
+        """
+        return True
+
+    @abstractmethod
+    def unshare_state(self) -> None:
+        """Replace this store's state with a copy that it can modify freely.
+
+        The top-level `StateStore` calls this before handling an action if the
+        current state is part of a snapshot, so that the snapshot doesn't change.
+        Only the containers that `handle_action` modifies in place need to be
+        copied. Everything else should be shared with the snapshot, so that taking
+        a snapshot after every action stays cheap.
+        """
+        ...
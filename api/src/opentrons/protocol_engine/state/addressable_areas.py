@@ -1,4 +1,5 @@
 """Basic addressable area data state and store."""
+import dataclasses
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Dict, List, Optional, Set, Union
@@ -46,6 +47,16 @@ from .config import Config
 from ._abstract_store import HasState, HandlesActions
 
 
+# Results of the commands that `AddressableAreaStore` reacts to.
+_ADDRESSABLE_AREA_RESULTS = (
+    LoadLabwareResult,
+    MoveLabwareResult,
+    LoadModuleResult,
+    MoveToAddressableAreaResult,
+    MoveToAddressableAreaForDropTipResult,
+)
+
+
 @dataclass
 class AddressableAreaState:
     """State of all loaded addressable area resources."""
@@ -193,6 +204,8 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         if isinstance(action, SucceedCommandAction):
             self._handle_command(action.command)
         elif isinstance(action, AddAddressableAreaAction):
@@ -211,6 +224,26 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
                     )
                 )
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change addressable area state."""
+        if isinstance(action, SucceedCommandAction):
+            return isinstance(action.command.result, _ADDRESSABLE_AREA_RESULTS)
+        return isinstance(
+            action, (AddAddressableAreaAction, SetDeckConfigurationAction)
+        )
+
+    def unshare_state(self) -> None:
+        """Replace the addressable area state with a copy that can be modified freely."""
+        self._state = dataclasses.replace(
+            self._state,
+            loaded_addressable_areas_by_name=dict(
+                self._state.loaded_addressable_areas_by_name
+            ),
+            potential_cutout_fixtures_by_cutout_id=dict(
+                self._state.potential_cutout_fixtures_by_cutout_id
+            ),
+        )
+
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
         if isinstance(command.result, LoadLabwareResult):
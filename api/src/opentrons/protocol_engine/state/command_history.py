@@ -1,7 +1,14 @@
 """Protocol Engine CommandStore sub-state."""
-from collections import OrderedDict
+from __future__ import annotations
+
+import copy
+import os
+import pickle
+import tempfile
+import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import IO, Deque, Dict, List, Optional, Union
 
 from opentrons.ordered_set import OrderedSet
 from opentrons.protocol_engine.errors.exceptions import CommandDoesNotExistError
@@ -17,21 +24,110 @@ class CommandEntry:
     index: int
 
 
-@dataclass  # dataclass for __eq__() autogeneration.
+@dataclass(frozen=True)
+class _SpilledCommandEntry:
+    """A command entry whose command has been moved out of memory, to a spill file."""
+
+    index: int
+    offset: int
+    size: int
+
+
+class _CommandSpill:
+    """A temporary file holding finished commands that don't need to be in memory.
+
+    Shared by a history and all of its copies.
+    """
+
+    def __init__(self, max_finished_commands_in_memory: int) -> None:
+        self.max_finished_commands_in_memory = max_finished_commands_in_memory
+        self._file: Optional[IO[bytes]] = None
+        # State is read from the protocol thread while the event loop writes to it.
+        self._lock = threading.Lock()
+
+    def write(self, entry: CommandEntry) -> _SpilledCommandEntry:
+        """Append an entry's command to the file, returning where to find it."""
+        data = pickle.dumps(entry.command, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile()
+            offset = self._file.seek(0, os.SEEK_END)
+            self._file.write(data)
+        return _SpilledCommandEntry(index=entry.index, offset=offset, size=len(data))
+
+    def read(self, spilled_entry: _SpilledCommandEntry) -> CommandEntry:
+        """Read a spilled entry's command back from the file."""
+        with self._lock:
+            assert self._file is not None
+            self._file.seek(spilled_entry.offset)
+            data = self._file.read(spilled_entry.size)
+        return CommandEntry(command=pickle.loads(data), index=spilled_entry.index)
+
+
 class CommandHistory:
-    """Provides O(1) amortized access to commands of interest."""
+    """Provides O(1) amortized access to commands of interest.
+
+    Copying a history with `copy()` is cheap, too. The copy shares the append-only
+    parts of the history, and the entries of commands that have already
+    SUCCEEDED or FAILED, with the original. It only needs its own entries for
+    unfinished commands, and its own queues.
+
+    For very long runs, the history can be compacted by passing
+    `max_finished_commands_in_memory`. Then, only that many of the most recently
+    finished commands are kept in memory. Older finished commands are moved to a
+    temporary file, leaving small index entries in memory, and are read back from
+    the file whenever they're needed.
+    """
 
     _all_command_ids: List[str]
-    """All command IDs, in insertion order."""
+    """All command IDs, in insertion order.
+
+    This list may be shared with copies of this history, and may grow beyond the
+    commands in this history. Only the first `_length` IDs are part of it.
+    """
 
     _all_failed_command_ids: List[str]
-    """All failed command IDs, in insertion order."""
+    """All failed command IDs, in insertion order.
+
+    Shared like `_all_command_ids`. Only the first `_failed_length` are part of it.
+    """
 
     _all_command_ids_but_fixit_command_ids: List[str]
-    """All command IDs besides fixit command intents, in insertion order."""
+    """All command IDs besides fixit command intents, in insertion order.
+
+    Shared like `_all_command_ids`. Only the first `_non_fixit_length` are part of it.
+    """
+
+    _length: int
+    _failed_length: int
+    _non_fixit_length: int
+
+    _positions_by_id: Dict[str, int]
+    """Each command's position in `_all_command_ids`. Shared like that list."""
+
+    _finished_entries: List[Union[CommandEntry, _SpilledCommandEntry, None]]
+    """The entries of SUCCEEDED and FAILED commands, by position.
 
-    _commands_by_id: Dict[str, CommandEntry]
-    """All command resources, in insertion order, mapped by their unique IDs."""
+    Shared like `_all_command_ids`. Each element is only ever set once,
+    which is safe because the entries of finished commands don't change,
+    apart from being replaced by an equivalent `_SpilledCommandEntry`.
+    """
+
+    _spill: Optional[_CommandSpill]
+    """Where finished commands are moved out of memory to, if compacting."""
+
+    _unspilled_positions: Deque[int]
+    """Positions of the finished commands still in memory, oldest-finished first.
+
+    Only used if compacting. Not shared with copies, since each copy spills
+    the entries that it finishes on its own.
+    """
+
+    _unfinished_entries_by_id: Dict[str, CommandEntry]
+    """The entries of all other commands, which aren't shared with copies.
+
+    These take precedence over `_finished_entries`.
+    """
 
     _queued_command_ids: OrderedSet[str]
     """The IDs of queued commands, in FIFO order"""
@@ -48,41 +144,82 @@ class CommandHistory:
     _most_recently_completed_command_id: Optional[str]
     """ID of the most recent command that SUCCEEDED or FAILED, if any"""
 
-    def __init__(self) -> None:
+    def __init__(self, max_finished_commands_in_memory: Optional[int] = None) -> None:
         self._all_command_ids = []
         self._all_failed_command_ids = []
         self._all_command_ids_but_fixit_command_ids = []
+        self._length = 0
+        self._failed_length = 0
+        self._non_fixit_length = 0
+        self._positions_by_id = {}
+        self._finished_entries = []
+        self._spill = (
+            None
+            if max_finished_commands_in_memory is None
+            else _CommandSpill(max_finished_commands_in_memory)
+        )
+        self._unspilled_positions = deque()
+        self._unfinished_entries_by_id = {}
         self._queued_command_ids = OrderedSet()
         self._queued_setup_command_ids = OrderedSet()
         self._queued_fixit_command_ids = OrderedSet()
-        self._commands_by_id = OrderedDict()
         self._running_command_id = None
         self._most_recently_completed_command_id = None
 
+    def __eq__(self, other: object) -> bool:
+        """Return whether two histories have the same commands and queues."""
+        if not isinstance(other, CommandHistory):
+            return NotImplemented
+        return (
+            self.get_all_ids() == other.get_all_ids()
+            and self.get_filtered_command_ids(include_fixit_commands=False)
+            == other.get_filtered_command_ids(include_fixit_commands=False)
+            and self._get_failed_command_ids() == other._get_failed_command_ids()
+            and self._get_all_entries() == other._get_all_entries()
+            and self._queued_command_ids == other._queued_command_ids
+            and self._queued_setup_command_ids == other._queued_setup_command_ids
+            and self._queued_fixit_command_ids == other._queued_fixit_command_ids
+            and self._running_command_id == other._running_command_id
+            and self._most_recently_completed_command_id
+            == other._most_recently_completed_command_id
+        )
+
+    def copy(self) -> CommandHistory:
+        """Return a copy of this history that can be modified independently of it.
+
+        This takes time proportional to the number of unfinished commands, plus
+        `max_finished_commands_in_memory` if compacting, not to the number of
+        commands in the history.
+        """
+        result = copy.copy(self)
+        result._unspilled_positions = self._unspilled_positions.copy()
+        result._unfinished_entries_by_id = self._unfinished_entries_by_id.copy()
+        result._queued_command_ids = self._queued_command_ids.copy()
+        result._queued_setup_command_ids = self._queued_setup_command_ids.copy()
+        result._queued_fixit_command_ids = self._queued_fixit_command_ids.copy()
+        return result
+
     def length(self) -> int:
         """Get the length of all elements added to the history."""
-        return len(self._commands_by_id)
+        return self._length
 
     def has(self, command_id: str) -> bool:
         """Returns whether a command is in the history."""
-        return command_id in self._commands_by_id
+        return self._get_position(command_id) is not None
 
     def get(self, command_id: str) -> CommandEntry:
         """Get a command entry if present, otherwise raise an exception."""
-        try:
-            return self._commands_by_id[command_id]
-        except KeyError:
+        position = self._get_position(command_id)
+        if position is None:
             raise CommandDoesNotExistError(f"Command {command_id} does not exist")
+        return self._get_entry_at(position)
 
     def get_next(self, command_id: str) -> Optional[CommandEntry]:
         """Get the command which follows the command associated with the given ID, if any."""
         index = self.get(command_id).index
-        try:
-            return self._commands_by_id[self._all_command_ids[index + 1]]
-        except KeyError:
-            raise CommandDoesNotExistError(f"Command {command_id} does not exist")
-        except IndexError:
+        if index + 1 >= self._length:
             return None
+        return self._get_entry_at(index + 1)
 
     def get_prev(self, command_id: str) -> Optional[CommandEntry]:
         """Get the command which precedes the command associated with the given ID, if any.
@@ -90,61 +227,61 @@ class CommandHistory:
         Returns None if the command_id corresponds to the first element in the history.
         """
         index = self.get(command_id).index
-        try:
-            prev_command = self._commands_by_id[self._all_command_ids[index - 1]]
-            return prev_command if index != 0 else None
-        except KeyError:
-            raise CommandDoesNotExistError(f"Command {command_id} does not exist")
-        except IndexError:
+        if index == 0 or index > self._length:
             return None
+        return self._get_entry_at(index - 1)
 
     def get_all_commands(self) -> List[Command]:
         """Get all commands."""
-        return [
-            self._commands_by_id[command_id].command
-            for command_id in self._all_command_ids
-        ]
+        return [entry.command for entry in self._get_all_entries()]
 
     def get_all_failed_commands(self) -> List[Command]:
         """Get all failed commands."""
         return [
-            self._commands_by_id[command_id].command
-            for command_id in self._all_failed_command_ids
+            self.get(command_id).command
+            for command_id in self._get_failed_command_ids()
         ]
 
     def get_filtered_command_ids(self, include_fixit_commands: bool) -> List[str]:
         """Get all fixit command IDs."""
         if include_fixit_commands:
-            return self._all_command_ids
-        else:
+            return self.get_all_ids()
+        elif len(self._all_command_ids_but_fixit_command_ids) == self._non_fixit_length:
             return self._all_command_ids_but_fixit_command_ids
+        else:
+            return self._all_command_ids_but_fixit_command_ids[: self._non_fixit_length]
 
     def get_all_ids(self) -> List[str]:
         """Get all command IDs."""
-        return self._all_command_ids
+        if len(self._all_command_ids) == self._length:
+            return self._all_command_ids
+        else:
+            return self._all_command_ids[: self._length]
 
     def get_slice(
         self, start: int, stop: int, command_ids: Optional[list[str]] = None
     ) -> List[Command]:
-        """Get a list of commands between start and stop.""" """Get a list of commands between start and stop."""
-        commands = self._all_command_ids[start:stop]
-        selected_command_ids = (
-            command_ids if command_ids is not None else self._all_command_ids
-        )
-        commands = selected_command_ids[start:stop]
-        return [self._commands_by_id[command].command for command in commands]
+        """Get a list of commands between start and stop."""
+        if command_ids is not None:
+            return [
+                self.get(command_id).command for command_id in command_ids[start:stop]
+            ]
+        return [
+            self._get_entry_at(position).command
+            for position in range(self._length)[start:stop]
+        ]
 
     def get_tail_command(self) -> Optional[CommandEntry]:
         """Get the command most recently added."""
-        if self._commands_by_id:
-            return next(reversed(self._commands_by_id.values()))
+        if self._length > 0:
+            return self._get_entry_at(self._length - 1)
         else:
             return None
 
     def get_most_recently_completed_command(self) -> Optional[CommandEntry]:
         """Get the command most recently marked as SUCCEEDED or FAILED."""
         if self._most_recently_completed_command_id is not None:
-            return self._commands_by_id[self._most_recently_completed_command_id]
+            return self.get(self._most_recently_completed_command_id)
         else:
             return None
 
@@ -153,7 +290,7 @@ class CommandHistory:
         if self._running_command_id is None:
             return None
         else:
-            return self._commands_by_id[self._running_command_id]
+            return self.get(self._running_command_id)
 
     def get_queue_ids(self) -> OrderedSet[str]:
         """Get the IDs of all queued protocol commands, in FIFO order."""
@@ -253,15 +390,94 @@ class CommandHistory:
         self._remove_queue_id(command.id)
         self._remove_setup_queue_id(command.id)
         self._set_most_recently_completed_command_id(command.id)
+        if len(self._all_failed_command_ids) != self._failed_length:
+            self._all_failed_command_ids = self._get_failed_command_ids()
         self._all_failed_command_ids.append(command.id)
+        self._failed_length += 1
+
+    def _get_position(self, command_id: str) -> Optional[int]:
+        """Get a command's position in the history, if it's in the history."""
+        position = self._positions_by_id.get(command_id)
+        if position is None or position >= self._length:
+            return None
+        return position
+
+    def _get_entry_at(self, position: int) -> CommandEntry:
+        """Get the entry of the command at a position in the history."""
+        entry = self._unfinished_entries_by_id.get(self._all_command_ids[position])
+        if entry is not None:
+            return entry
+        finished_entry = self._finished_entries[position]
+        if isinstance(finished_entry, _SpilledCommandEntry):
+            assert self._spill is not None
+            return self._spill.read(finished_entry)
+        assert finished_entry is not None
+        return finished_entry
+
+    def _get_all_entries(self) -> List[CommandEntry]:
+        """Get all command entries, in insertion order."""
+        return [self._get_entry_at(position) for position in range(self._length)]
+
+    def _get_failed_command_ids(self) -> List[str]:
+        """Get all failed command IDs, in insertion order."""
+        return self._all_failed_command_ids[: self._failed_length]
 
     def _add(self, command_id: str, command_entry: CommandEntry) -> None:
         """Create or update a command entry."""
-        if command_id not in self._commands_by_id:
+        position = self._get_position(command_id)
+        if position is None:
+            self._stop_sharing_longer_lists()
+            position = self._length
             self._all_command_ids.append(command_id)
+            self._positions_by_id[command_id] = position
+            self._finished_entries.append(None)
+            self._length += 1
             if command_entry.command.intent != CommandIntent.FIXIT:
                 self._all_command_ids_but_fixit_command_ids.append(command_id)
-        self._commands_by_id[command_id] = command_entry
+                self._non_fixit_length += 1
+
+        if (
+            command_entry.command.status
+            in (CommandStatus.SUCCEEDED, CommandStatus.FAILED)
+            and self._finished_entries[position] is None
+        ):
+            self._finished_entries[position] = command_entry
+            self._unfinished_entries_by_id.pop(command_id, None)
+            if self._spill is not None:
+                self._spill_old_finished_entries(newly_finished_position=position)
+        else:
+            self._unfinished_entries_by_id[command_id] = command_entry
+
+    def _spill_old_finished_entries(self, newly_finished_position: int) -> None:
+        """Move finished commands out of memory, beyond the most recent few."""
+        assert self._spill is not None
+        unspilled_positions = self._unspilled_positions
+        unspilled_positions.append(newly_finished_position)
+        while len(unspilled_positions) > self._spill.max_finished_commands_in_memory:
+            position = unspilled_positions.popleft()
+            if position >= len(self._finished_entries):
+                # Only possible if this history stopped sharing its lists.
+                continue
+            entry = self._finished_entries[position]
+            if isinstance(entry, CommandEntry):
+                self._finished_entries[position] = self._spill.write(entry)
+
+    def _stop_sharing_longer_lists(self) -> None:
+        """Get our own copies of shared lists that another history has appended to.
+
+        This only happens if the original of a copied history is modified too.
+        """
+        if len(self._all_command_ids) != self._length:
+            self._all_command_ids = self._all_command_ids[: self._length]
+            self._finished_entries = self._finished_entries[: self._length]
+            self._positions_by_id = {
+                command_id: position
+                for position, command_id in enumerate(self._all_command_ids)
+            }
+        if len(self._all_command_ids_but_fixit_command_ids) != self._non_fixit_length:
+            self._all_command_ids_but_fixit_command_ids = self.get_filtered_command_ids(
+                include_fixit_commands=False
+            )
 
     def _add_to_queue(self, command_id: str) -> None:
         """Add new ID to the queued."""
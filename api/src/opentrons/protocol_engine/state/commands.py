@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import enum
+import dataclasses
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Union
@@ -238,6 +239,23 @@ class CommandState:
     """See `CommandView.get_error_recovery_policy()`."""
 
 
+# The actions that `CommandStore` reacts to.
+_COMMAND_ACTIONS = (
+    QueueCommandAction,
+    RunCommandAction,
+    SucceedCommandAction,
+    FailCommandAction,
+    PlayAction,
+    PauseAction,
+    ResumeFromRecoveryAction,
+    StopAction,
+    FinishAction,
+    HardwareStoppedAction,
+    DoorChangeAction,
+    SetErrorRecoveryPolicyAction,
+)
+
+
 class CommandStore(HasState[CommandState], HandlesActions):
     """Command state container for run-level command concerns."""
 
@@ -253,7 +271,9 @@ class CommandStore(HasState[CommandState], HandlesActions):
         """Initialize a CommandStore and its state."""
         self._config = config
         self._state = CommandState(
-            command_history=CommandHistory(),
+            command_history=CommandHistory(
+                max_finished_commands_in_memory=config.max_finished_commands_in_memory
+            ),
             queue_status=QueueStatus.SETUP,
             is_door_blocking=is_door_open and config.block_on_door_open,
             run_result=None,
@@ -272,6 +292,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         match action:
             case QueueCommandAction():
                 self._handle_queue_command_action(action)
@@ -300,6 +322,18 @@ class CommandStore(HasState[CommandState], HandlesActions):
             case _:
                 pass
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change command state."""
+        return isinstance(action, _COMMAND_ACTIONS)
+
+    def unshare_state(self) -> None:
+        """Replace the command state with a copy that can be modified freely."""
+        self._state = dataclasses.replace(
+            self._state,
+            command_history=self._state.command_history.copy(),
+            command_error_recovery_types=dict(self._state.command_error_recovery_types),
+        )
+
     def _handle_queue_command_action(self, action: QueueCommandAction) -> None:
         # TODO(mc, 2021-06-22): mypy has trouble with this automatic
         # request > command mapping, figure out how to type precisely
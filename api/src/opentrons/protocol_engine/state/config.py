@@ -1,5 +1,6 @@
 """Top-level ProtocolEngine configuration options."""
 from dataclasses import dataclass
+from typing import Optional
 
 from opentrons_shared_data.robot.types import RobotType
 
@@ -27,6 +28,9 @@ class Config:
             configuration instead of loading a provided configuration
         block_on_door_open: Protocol execution should pause if the
             front door is opened.
+        max_finished_commands_in_memory: If set, only keep this many of the
+            most recently finished commands fully in memory, and move older ones
+            to a temporary file, to bound memory use in very long runs.
     """
 
     robot_type: RobotType
@@ -37,3 +41,4 @@ class Config:
     use_virtual_gripper: bool = False
     use_simulated_deck_config: bool = False
     block_on_door_open: bool = False
+    max_finished_commands_in_memory: Optional[int] = None
@@ -28,9 +28,21 @@ class FileStore(HasState[FileState], HandlesActions):
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         if isinstance(action, SucceedCommandAction):
             self._handle_command(action.command)
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change file state."""
+        return isinstance(action, SucceedCommandAction) and isinstance(
+            action.command.result, absorbance_reader.ReadAbsorbanceResult
+        )
+
+    def unshare_state(self) -> None:
+        """Replace the file state with a copy that can be modified freely."""
+        self._state = FileState(file_ids=list(self._state.file_ids))
+
     def _handle_command(self, command: Command) -> None:
         if isinstance(command.result, absorbance_reader.ReadAbsorbanceResult):
             if command.result.fileIds is not None:
@@ -32,6 +32,10 @@ class FluidStack:
         """
         self._fluid_stack = _fluid_stack or []
 
+    def copy(self) -> "FluidStack":
+        """Return a copy of this stack that can be modified independently of it."""
+        return FluidStack(list(self._fluid_stack))
+
     def add_fluid(self, new: AspiratedFluid) -> None:
         """Add fluid to a stack.
 
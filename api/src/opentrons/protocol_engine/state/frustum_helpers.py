@@ -1,5 +1,9 @@
 """Helper functions for liquid-level related calculations inside a given frustum."""
-from typing import List, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar
+import numpy as np
+import numpy.typing as npt
 from numpy import pi, iscomplex, roots, real
 from math import isclose
 
@@ -14,6 +18,74 @@ from opentrons_shared_data.labware.labware_definition import (
     SquaredConeSegment,
 )
 
+_CachedT = TypeVar("_CachedT")
+
+# Labware definitions are loaded once and then shared, so results derived from
+# their geometry are cached by object identity. Caches are cleared when they get
+# this big, so they can't grow without bound in long-lived processes.
+_MAX_CACHE_ENTRIES = 1024
+
+
+def _cached_by_identity(
+    cache: Dict[int, Tuple[Any, _CachedT]],
+    key_object: object,
+    build: Callable[[], _CachedT],
+) -> _CachedT:
+    """Return the cached result of `build()` for `key_object`, building it if needed."""
+    entry = cache.get(id(key_object))
+    # Keeping a reference to the key object means its id can't be reused while cached.
+    if entry is not None and entry[0] is key_object:
+        return entry[1]
+    if len(cache) >= _MAX_CACHE_ENTRIES:
+        cache.clear()
+    result = build()
+    cache[id(key_object)] = (key_object, result)
+    return result
+
+
+@dataclass(frozen=True)
+class _SortedTable:
+    """A lookup table's keys in ascending order, for finding the closest one quickly."""
+
+    keys: List[float]
+    values: List[float]
+    insertion_order: List[int]
+
+
+_sorted_tables: Dict[int, Tuple[Any, _SortedTable]] = {}
+
+
+def _build_sorted_table(table: Dict[float, float]) -> _SortedTable:
+    entries = sorted(
+        (key, index, value) for index, (key, value) in enumerate(table.items())
+    )
+    return _SortedTable(
+        keys=[key for key, _, _ in entries],
+        values=[value for _, _, value in entries],
+        insertion_order=[index for _, index, _ in entries],
+    )
+
+
+def _closest_table_value(table: Dict[float, float], target: float) -> float:
+    """Get the value of the key in `table` closest to `target`.
+
+    Like `table[min(table, key=lambda k: abs(k - target))]`, including picking the
+    key inserted first on ties, but in logarithmic instead of linear time.
+    """
+    sorted_table = _cached_by_identity(
+        _sorted_tables, table, lambda: _build_sorted_table(table)
+    )
+    index = bisect_left(sorted_table.keys, target)
+    candidates = [i for i in (index - 1, index) if 0 <= i < len(sorted_table.keys)]
+    best = min(
+        candidates,
+        key=lambda i: (
+            abs(sorted_table.keys[i] - target),
+            sorted_table.insertion_order[i],
+        ),
+    )
+    return sorted_table.values[best]
+
 
 def _reject_unacceptable_heights(
     potential_heights: List[float], max_height: float
@@ -132,9 +204,7 @@ def _volume_from_height_squared_cone(
     target_height: float, segment: SquaredConeSegment
 ) -> float:
     """Find the volume given a height within a squared cone segment."""
-    heights = segment.height_to_volume_table.keys()
-    best_fit_height = min(heights, key=lambda x: abs(x - target_height))
-    return segment.height_to_volume_table[best_fit_height]
+    return _closest_table_value(segment.height_to_volume_table, target_height)
 
 
 def _height_from_volume_circular(
@@ -211,9 +281,7 @@ def _height_from_volume_squared_cone(
     target_volume: float, segment: SquaredConeSegment
 ) -> float:
     """Find the height given a volume within a squared cone segment."""
-    volumes = segment.volume_to_height_table.keys()
-    best_fit_volume = min(volumes, key=lambda x: abs(x - target_volume))
-    return segment.volume_to_height_table[best_fit_volume]
+    return _closest_table_value(segment.volume_to_height_table, target_volume)
 
 
 def _get_segment_capacity(segment: WellSegment) -> float:
@@ -278,6 +346,39 @@ def get_well_volumetric_capacity(
     return well_volume
 
 
+@dataclass(frozen=True)
+class _WellVolumeProfile:
+    """Everything about a well's geometry that volume and height lookups reuse."""
+
+    sorted_sections: List[WellSegment]
+    volumetric_capacity: List[Tuple[float, float]]
+    max_height: float
+    max_volume: float
+
+
+_well_volume_profiles: Dict[int, Tuple[Any, _WellVolumeProfile]] = {}
+
+
+def _build_well_volume_profile(well_geometry: InnerWellGeometry) -> _WellVolumeProfile:
+    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
+    return _WellVolumeProfile(
+        sorted_sections=sorted(
+            well_geometry.sections, key=lambda section: section.topHeight
+        ),
+        volumetric_capacity=volumetric_capacity,
+        max_height=volumetric_capacity[-1][0],
+        max_volume=sum(row[1] for row in volumetric_capacity),
+    )
+
+
+def _get_well_volume_profile(well_geometry: InnerWellGeometry) -> _WellVolumeProfile:
+    return _cached_by_identity(
+        _well_volume_profiles,
+        well_geometry,
+        lambda: _build_well_volume_profile(well_geometry),
+    )
+
+
 def height_at_volume_within_section(
     section: WellSegment,
     target_volume_relative: float,
@@ -390,8 +491,9 @@ def find_volume_at_well_height(
     target_height: float, well_geometry: InnerWellGeometry
 ) -> float:
     """Find the volume within a well, at a known height."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_height = volumetric_capacity[-1][0]
+    profile = _get_well_volume_profile(well_geometry)
+    volumetric_capacity = profile.volumetric_capacity
+    max_height = profile.max_height
     if target_height < 0 or target_height > max_height:
         raise InvalidLiquidHeightFound("Invalid target height.")
     # volumes in volumetric_capacity are relative to each frustum,
@@ -407,9 +509,8 @@ def find_volume_at_well_height(
             return closed_section_volume
     # find the section the target height is in and compute the volume
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
     partial_volume = _find_volume_in_partial_frustum(
-        sorted_well=sorted_well,
+        sorted_well=profile.sorted_sections,
         target_height=target_height,
     )
     return partial_volume + closed_section_volume
@@ -451,15 +552,133 @@ def find_height_at_well_volume(
     target_volume: float, well_geometry: InnerWellGeometry
 ) -> float:
     """Find the height within a well, at a known volume."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_volume = sum(row[1] for row in volumetric_capacity)
-    if target_volume < 0 or target_volume > max_volume:
+    profile = _get_well_volume_profile(well_geometry)
+    if target_volume < 0 or target_volume > profile.max_volume:
         raise InvalidLiquidHeightFound("Invalid target volume.")
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
     # find the section the target volume is in and compute the height
     return _find_height_in_partial_frustum(
-        sorted_well=sorted_well,
-        volumetric_capacity=volumetric_capacity,
+        sorted_well=profile.sorted_sections,
+        volumetric_capacity=profile.volumetric_capacity,
         target_volume=target_volume,
     )
+
+
+def _height_polynomial(
+    section: WellSegment, section_height: float
+) -> Tuple[float, float, float]:
+    """Get the coefficients that `height_at_volume_within_section` finds roots of."""
+    match section:
+        case SphericalSegment():
+            return -1 * pi / 3, pi * section.radiusOfCurvature, 0.0
+        case ConicalFrustum():
+            return _circular_frustum_polynomial_roots(
+                top_radius=(section.bottomDiameter / 2),
+                bottom_radius=(section.topDiameter / 2),
+                total_frustum_height=section_height,
+            )
+        case CuboidalFrustum():
+            return _rectangular_frustum_polynomial_roots(
+                total_frustum_height=section_height,
+                bottom_width=section.bottomXDimension,
+                bottom_length=section.bottomYDimension,
+                top_width=section.topXDimension,
+                top_length=section.topYDimension,
+            )
+        case _:
+            raise NotImplementedError(
+                "Height from volume calculation not yet implemented for this well shape."
+            )
+
+
+def _heights_from_volumes_polynomial(
+    coefficients: Tuple[float, float, float],
+    volumes: npt.NDArray[np.float64],
+    section_height: float,
+) -> npt.NDArray[np.float64]:
+    """Solve `a*h**3 + b*h**2 + c*h = volume` for many volumes at once.
+
+    This builds the same companion matrices that `numpy.roots` does, but finds all
+    of their eigenvalues in one call, so results match solving one at a time.
+    """
+    leading = np.trim_zeros(np.array(coefficients, dtype=np.float64), "f")
+    if len(leading) == 0 or np.any(volumes == 0):
+        # numpy.roots treats these specially, so solve them one at a time.
+        return np.array(
+            [
+                _reject_unacceptable_heights(
+                    potential_heights=list(roots((*coefficients, volume * -1))),
+                    max_height=section_height,
+                )
+                for volume in volumes
+            ]
+        )
+    degree = len(leading)
+    polynomials = np.empty((len(volumes), degree))
+    polynomials[:, :-1] = leading[1:]
+    polynomials[:, -1] = volumes * -1
+    companions = np.zeros((len(volumes), degree, degree))
+    companions[:, 0, :] = -polynomials / leading[0]
+    companions[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+    all_roots = np.linalg.eigvals(companions)
+    return np.array(
+        [
+            _reject_unacceptable_heights(
+                potential_heights=list(volume_roots), max_height=section_height
+            )
+            for volume_roots in all_roots
+        ]
+    )
+
+
+def find_heights_at_well_volumes(
+    target_volumes: Sequence[float], well_geometry: InnerWellGeometry
+) -> npt.NDArray[np.float64]:
+    """Find the heights within a well, at many known volumes.
+
+    This gives the same results as calling `find_height_at_well_volume` for each
+    volume, but solves every volume within a section of the well together, so it's
+    much faster for many wells with the same geometry, like a 96-well plate.
+    """
+    profile = _get_well_volume_profile(well_geometry)
+    volumes = np.asarray(target_volumes, dtype=np.float64)
+    if np.any(volumes < 0) or np.any(volumes > profile.max_volume):
+        raise InvalidLiquidHeightFound("Invalid target volume.")
+
+    heights = np.full(volumes.shape, np.nan)
+    bottom_section_volume = 0.0
+    for section, (_, section_volume) in zip(
+        profile.sorted_sections, profile.volumetric_capacity
+    ):
+        in_section = (
+            np.isnan(heights)
+            & (bottom_section_volume < volumes)
+            & (volumes < bottom_section_volume + section_volume)
+        )
+        if np.any(in_section):
+            relative_volumes = (
+                volumes[in_section] - bottom_section_volume
+            ) / section.count
+            section_height = section.topHeight - section.bottomHeight
+            if isinstance(section, SquaredConeSegment):
+                partial_heights = np.array(
+                    [
+                        _height_from_volume_squared_cone(volume, section)
+                        for volume in relative_volumes
+                    ]
+                )
+            else:
+                partial_heights = _heights_from_volumes_polynomial(
+                    _height_polynomial(section, section_height),
+                    relative_volumes,
+                    section_height,
+                )
+            heights[in_section] = partial_heights + section.bottomHeight
+        bottom_section_volume += section_volume
+
+    not_found = volumes[np.isnan(heights)]
+    if len(not_found) > 0:
+        raise InvalidLiquidHeightFound(
+            f"Unable to find height at given volume {not_found[0]}."
+        )
+    return heights
@@ -3,7 +3,18 @@
 import enum
 from numpy import array, dot, double as npdouble
 from numpy.typing import NDArray
-from typing import Optional, List, Tuple, Union, cast, TypeVar, Dict
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Optional,
+    List,
+    Tuple,
+    Union,
+    cast,
+    TypeVar,
+    Dict,
+)
 from dataclasses import dataclass
 from functools import cached_property
 
@@ -98,6 +109,7 @@ class _AbsoluteRobotExtents:
 
 
 _LabwareLocation = TypeVar("_LabwareLocation", bound=LabwareLocation)
+_MemoizedT = TypeVar("_MemoizedT")
 
 
 # TODO(mc, 2021-06-03): continue evaluation of which selectors should go here
@@ -113,8 +125,21 @@ class GeometryView:
         module_view: ModuleView,
         pipette_view: PipetteView,
         addressable_area_view: AddressableAreaView,
+        get_generation: Optional[Callable[[], Hashable]] = None,
     ) -> None:
-        """Initialize a GeometryView instance."""
+        """Initialize a GeometryView instance.
+
+        Arguments:
+            config: Top-level configuration.
+            labware_view: Labware state view.
+            well_view: Well state view.
+            module_view: Module state view.
+            pipette_view: Pipette state view.
+            addressable_area_view: Addressable area state view.
+            get_generation: Returns a value that changes whenever labware, module,
+                or addressable area state might have changed. If provided, the
+                results of expensive selectors are memoized until it changes.
+        """
         self._config = config
         self._labware = labware_view
         self._wells = well_view
@@ -122,6 +147,23 @@ class GeometryView:
         self._pipettes = pipette_view
         self._addressable_areas = addressable_area_view
         self._last_drop_tip_location_spot: Dict[str, _TipDropSection] = {}
+        self._get_generation = get_generation
+        self._memo_generation: Optional[Hashable] = None
+        self._memo: Dict[Hashable, Any] = {}
+
+    def _memoized(self, key: Hashable, compute: Callable[[], _MemoizedT]) -> _MemoizedT:
+        """Return `compute()`, reusing the result from earlier in the same generation."""
+        if self._get_generation is None:
+            return compute()
+        generation = self._get_generation()
+        if generation != self._memo_generation:
+            self._memo.clear()
+            self._memo_generation = generation
+        try:
+            return cast(_MemoizedT, self._memo[key])
+        except KeyError:
+            result = self._memo[key] = compute()
+            return result
 
     @cached_property
     def absolute_deck_extents(self) -> _AbsoluteRobotExtents:
@@ -149,12 +191,20 @@ class GeometryView:
 
     def get_labware_highest_z(self, labware_id: str) -> float:
         """Get the highest Z-point of a labware."""
-        labware_data = self._labware.get(labware_id)
-
-        return self._get_highest_z_from_labware_data(labware_data)
+        return self._memoized(
+            ("labware_highest_z", labware_id),
+            lambda: self._get_highest_z_from_labware_data(
+                self._labware.get(labware_id)
+            ),
+        )
 
     def get_all_obstacle_highest_z(self) -> float:
         """Get the highest Z-point across all obstacles that the instruments need to fly over."""
+        return self._memoized(
+            "all_obstacle_highest_z", self._get_all_obstacle_highest_z
+        )
+
+    def _get_all_obstacle_highest_z(self) -> float:
         highest_labware_z = max(
             (
                 self._get_highest_z_from_labware_data(lw_data)
@@ -396,6 +446,12 @@ class GeometryView:
 
     def get_labware_parent_position(self, labware_id: str) -> Point:
         """Get the calibrated position of the labware's parent slot (deck or module)."""
+        return self._memoized(
+            ("labware_parent_position", labware_id),
+            lambda: self._get_labware_parent_position(labware_id),
+        )
+
+    def _get_labware_parent_position(self, labware_id: str) -> Point:
         parent_pos = self.get_labware_parent_nominal_position(labware_id)
         labware_data = self._labware.get(labware_id)
         cal_offset = self._get_calibrated_module_offset(labware_data.location)
@@ -419,6 +475,12 @@ class GeometryView:
 
     def get_labware_position(self, labware_id: str) -> Point:
         """Get the calibrated origin of the labware."""
+        return self._memoized(
+            ("labware_position", labware_id),
+            lambda: self._get_labware_position(labware_id),
+        )
+
+    def _get_labware_position(self, labware_id: str) -> Point:
         origin_pos = self.get_labware_origin_position(labware_id)
         cal_offset = self._labware.get_labware_offset_vector(labware_id)
 
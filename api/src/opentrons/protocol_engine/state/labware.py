@@ -1,6 +1,7 @@
 """Basic labware data state and store."""
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -9,6 +10,7 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     NamedTuple,
     cast,
@@ -151,9 +153,13 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             labware_by_id=labware_by_id,
             deck_definition=deck_definition,
         )
+        # IDs of the labware whose `LoadedLabware` isn't shared with a snapshot.
+        self._unshared_labware_ids: Set[str] = set(labware_by_id)
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         for state_update in get_state_updates(action):
             self._add_loaded_labware(state_update)
             self._set_labware_location(state_update)
@@ -176,6 +182,30 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             )
             self._state.definitions_by_uri[uri] = action.definition
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change labware state."""
+        return isinstance(
+            action, (AddLabwareOffsetAction, AddLabwareDefinitionAction)
+        ) or any(
+            state_update.loaded_labware != update_types.NO_CHANGE
+            or state_update.labware_location != update_types.NO_CHANGE
+            for state_update in get_state_updates(action)
+        )
+
+    def unshare_state(self) -> None:
+        """Replace the labware state with a copy that can be modified freely.
+
+        Moving a labware modifies its `LoadedLabware` in place, so from now on,
+        each one is copied the first time that it's moved.
+        """
+        self._state = dataclasses.replace(
+            self._state,
+            labware_by_id=dict(self._state.labware_by_id),
+            labware_offsets_by_id=dict(self._state.labware_offsets_by_id),
+            definitions_by_uri=dict(self._state.definitions_by_uri),
+        )
+        self._unshared_labware_ids.clear()
+
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
 
@@ -220,14 +250,16 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 offsetId=loaded_labware_update.offset_id,
                 displayName=display_name,
             )
+            self._unshared_labware_ids.add(loaded_labware_update.labware_id)
 
     def _set_labware_location(self, state_update: update_types.StateUpdate) -> None:
         labware_location_update = state_update.labware_location
         if labware_location_update != update_types.NO_CHANGE:
             labware_id = labware_location_update.labware_id
             new_offset_id = labware_location_update.offset_id
+            labware = self._get_labware_to_modify(labware_id)
 
-            self._state.labware_by_id[labware_id].offsetId = new_offset_id
+            labware.offsetId = new_offset_id
 
             if labware_location_update.new_location:
                 new_location = labware_location_update.new_location
@@ -241,7 +273,16 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                     # If a labware has been moved into a waste chute it's been chuted away and is now technically off deck
                     new_location = OFF_DECK_LOCATION
 
-                self._state.labware_by_id[labware_id].location = new_location
+                labware.location = new_location
+
+    def _get_labware_to_modify(self, labware_id: str) -> LoadedLabware:
+        """Get a labware's `LoadedLabware`, copying it first if a snapshot shares it."""
+        if labware_id not in self._unshared_labware_ids:
+            self._state.labware_by_id[labware_id] = self._state.labware_by_id[
+                labware_id
+            ].copy()
+            self._unshared_labware_ids.add(labware_id)
+        return self._state.labware_by_id[labware_id]
 
 
 class LabwareView(HasState[LabwareState]):
@@ -36,12 +36,28 @@ class LiquidClassStore(HasState[LiquidClassState], HandlesActions):
 
     def handle_action(self, action: Action) -> None:
         """Update the state in response to the action."""
+        if not self.may_change_on(action):
+            return
         for state_update in get_state_updates(action):
             if state_update.liquid_class_loaded != update_types.NO_CHANGE:
                 self._handle_liquid_class_loaded_update(
                     state_update.liquid_class_loaded
                 )
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change liquid class state."""
+        return any(
+            state_update.liquid_class_loaded != update_types.NO_CHANGE
+            for state_update in get_state_updates(action)
+        )
+
+    def unshare_state(self) -> None:
+        """Replace the liquid class state with a copy that can be modified freely."""
+        self._state = LiquidClassState(
+            liquid_class_record_by_id=dict(self._state.liquid_class_record_by_id),
+            liquid_class_record_to_id=dict(self._state.liquid_class_record_to_id),
+        )
+
     def _handle_liquid_class_loaded_update(
         self, state_update: update_types.LiquidClassLoadedUpdate
     ) -> None:
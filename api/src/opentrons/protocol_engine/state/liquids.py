@@ -26,9 +26,19 @@ class LiquidStore(HasState[LiquidState], HandlesActions):
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         if isinstance(action, AddLiquidAction):
             self._add_liquid(action)
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change liquid state."""
+        return isinstance(action, AddLiquidAction)
+
+    def unshare_state(self) -> None:
+        """Replace the liquid state with a copy that can be modified freely."""
+        self._state = LiquidState(liquids_by_id=dict(self._state.liquids_by_id))
+
     def _add_liquid(self, action: AddLiquidAction) -> None:
         """Add liquid to protocol liquids."""
         self._state.liquids_by_id[action.liquid.id] = action.liquid
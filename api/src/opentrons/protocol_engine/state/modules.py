@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass
 from typing import (
     Dict,
@@ -91,6 +92,40 @@ from .config import Config
 
 ModuleSubStateT = TypeVar("ModuleSubStateT", bound=ModuleSubStateType)
 
+_HEATER_SHAKER_RESULTS = (
+    heater_shaker.SetTargetTemperatureResult,
+    heater_shaker.DeactivateHeaterResult,
+    heater_shaker.SetAndWaitForShakeSpeedResult,
+    heater_shaker.DeactivateShakerResult,
+    heater_shaker.OpenLabwareLatchResult,
+    heater_shaker.CloseLabwareLatchResult,
+)
+_TEMPERATURE_MODULE_RESULTS = (
+    temperature_module.SetTargetTemperatureResult,
+    temperature_module.DeactivateTemperatureResult,
+)
+_THERMOCYCLER_RESULTS = (
+    thermocycler.SetTargetBlockTemperatureResult,
+    thermocycler.DeactivateBlockResult,
+    thermocycler.SetTargetLidTemperatureResult,
+    thermocycler.DeactivateLidResult,
+    thermocycler.OpenLidResult,
+    thermocycler.CloseLidResult,
+)
+_ABSORBANCE_READER_RESULTS = (
+    absorbance_reader.InitializeResult,
+    absorbance_reader.ReadAbsorbanceResult,
+)
+# Results of every command that `ModuleStore` reacts to.
+_MODULE_COMMAND_RESULTS = (
+    LoadModuleResult,
+    CalibrateModuleResult,
+    *_HEATER_SHAKER_RESULTS,
+    *_TEMPERATURE_MODULE_RESULTS,
+    *_THERMOCYCLER_RESULTS,
+    *_ABSORBANCE_READER_RESULTS,
+)
+
 
 class SlotTransit(NamedTuple):
     """Class defining starting and ending slots in a pipette movement."""
@@ -223,6 +258,8 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         if isinstance(action, SucceedCommandAction):
             self._handle_command(action.command)
 
@@ -239,6 +276,33 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
         for state_update in get_state_updates(action):
             self._handle_state_update(state_update)
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change module state."""
+        if isinstance(action, AddModuleAction):
+            return True
+        if isinstance(action, SucceedCommandAction) and isinstance(
+            action.command.result, _MODULE_COMMAND_RESULTS
+        ):
+            return True
+        return any(
+            state_update.absorbance_reader_lid != update_types.NO_CHANGE
+            for state_update in get_state_updates(action)
+        )
+
+    def unshare_state(self) -> None:
+        """Replace the module state with a copy that can be modified freely."""
+        self._state = dataclasses.replace(
+            self._state,
+            slot_by_module_id=dict(self._state.slot_by_module_id),
+            additional_slots_occupied_by_module_id=dict(
+                self._state.additional_slots_occupied_by_module_id
+            ),
+            requested_model_by_id=dict(self._state.requested_model_by_id),
+            hardware_by_module_id=dict(self._state.hardware_by_module_id),
+            substate_by_module_id=dict(self._state.substate_by_module_id),
+            module_offset_by_serial=dict(self._state.module_offset_by_serial),
+        )
+
     def _handle_command(self, command: Command) -> None:
         # todo(mm, 2024-11-04): Delete this function. Port these isinstance()
         # checks to the update_types.StateUpdate mechanism.
@@ -261,48 +325,16 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 location=command.result.location,
             )
 
-        if isinstance(
-            command.result,
-            (
-                heater_shaker.SetTargetTemperatureResult,
-                heater_shaker.DeactivateHeaterResult,
-                heater_shaker.SetAndWaitForShakeSpeedResult,
-                heater_shaker.DeactivateShakerResult,
-                heater_shaker.OpenLabwareLatchResult,
-                heater_shaker.CloseLabwareLatchResult,
-            ),
-        ):
+        if isinstance(command.result, _HEATER_SHAKER_RESULTS):
             self._handle_heater_shaker_commands(command)
 
-        if isinstance(
-            command.result,
-            (
-                temperature_module.SetTargetTemperatureResult,
-                temperature_module.DeactivateTemperatureResult,
-            ),
-        ):
+        if isinstance(command.result, _TEMPERATURE_MODULE_RESULTS):
             self._handle_temperature_module_commands(command)
 
-        if isinstance(
-            command.result,
-            (
-                thermocycler.SetTargetBlockTemperatureResult,
-                thermocycler.DeactivateBlockResult,
-                thermocycler.SetTargetLidTemperatureResult,
-                thermocycler.DeactivateLidResult,
-                thermocycler.OpenLidResult,
-                thermocycler.CloseLidResult,
-            ),
-        ):
+        if isinstance(command.result, _THERMOCYCLER_RESULTS):
             self._handle_thermocycler_module_commands(command)
 
-        if isinstance(
-            command.result,
-            (
-                absorbance_reader.InitializeResult,
-                absorbance_reader.ReadAbsorbanceResult,
-            ),
-        ):
+        if isinstance(command.result, _ABSORBANCE_READER_RESULTS):
             self._handle_absorbance_reader_commands(command)
 
     def _handle_state_update(self, state_update: update_types.StateUpdate) -> None:
@@ -9,6 +9,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Set,
     Tuple,
     cast,
 )
@@ -146,6 +147,8 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             nozzle_configuration_by_id={},
             liquid_presence_detection_by_id={},
         )
+        # IDs of the pipettes whose `FluidStack` isn't shared with a snapshot.
+        self._unshared_contents_pipette_ids: Set[str] = set()
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
@@ -160,6 +163,27 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
         if isinstance(action, SetPipetteMovementSpeedAction):
             self._state.movement_speed_by_id[action.pipette_id] = action.speed
 
+    def unshare_state(self) -> None:
+        """Replace the pipette state with a copy that can be modified freely.
+
+        From now on, each pipette's `FluidStack` is copied the first time
+        that it's modified.
+        """
+        self._state = dataclasses.replace(
+            self._state,
+            pipettes_by_id=dict(self._state.pipettes_by_id),
+            pipette_contents_by_id=dict(self._state.pipette_contents_by_id),
+            attached_tip_by_id=dict(self._state.attached_tip_by_id),
+            movement_speed_by_id=dict(self._state.movement_speed_by_id),
+            static_config_by_id=dict(self._state.static_config_by_id),
+            flow_rates_by_id=dict(self._state.flow_rates_by_id),
+            nozzle_configuration_by_id=dict(self._state.nozzle_configuration_by_id),
+            liquid_presence_detection_by_id=dict(
+                self._state.liquid_presence_detection_by_id
+            ),
+        )
+        self._unshared_contents_pipette_ids.clear()
+
     def _set_load_pipette(self, state_update: update_types.StateUpdate) -> None:
         if state_update.loaded_pipette != update_types.NO_CHANGE:
             pipette_id = state_update.loaded_pipette.pipette_id
@@ -338,6 +362,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
 
     def _update_empty(self, update: update_types.PipetteEmptyFluidUpdate) -> None:
         self._state.pipette_contents_by_id[update.pipette_id] = fluid_stack.FluidStack()
+        self._unshared_contents_pipette_ids.add(update.pipette_id)
 
     def _update_unknown(self, update: update_types.PipetteUnknownFluidUpdate) -> None:
         self._state.pipette_contents_by_id[update.pipette_id] = None
@@ -347,6 +372,10 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
         if stack is None:
             LOG.error("Pipette state tried to alter an unknown-contents pipette")
             return fluid_stack.FluidStack()
+        if pipette_id not in self._unshared_contents_pipette_ids:
+            # A snapshot shares this stack, so modify a copy instead.
+            stack = self._state.pipette_contents_by_id[pipette_id] = stack.copy()
+            self._unshared_contents_pipette_ids.add(pipette_id)
         return stack
 
 
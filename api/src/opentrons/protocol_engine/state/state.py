@@ -2,7 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from typing_extensions import ParamSpec
 
 from opentrons_shared_data.deck.types import DeckDefinitionV5
@@ -39,6 +51,20 @@ from ..types import DeckConfigurationType
 _ParamsT = ParamSpec("_ParamsT")
 _ReturnT = TypeVar("_ReturnT")
 
+SubstoreName = Literal[
+    "commands",
+    "addressable_areas",
+    "labware",
+    "pipettes",
+    "modules",
+    "liquids",
+    "liquid_classes",
+    "tips",
+    "wells",
+    "files",
+]
+"""The name of a substore, matching its field in `State`."""
+
 
 @dataclass(frozen=True)
 class State:
@@ -140,14 +166,20 @@ class StateView(HasState[State]):
         return self._config
 
     def get_summary(self) -> StateSummary:
-        """Get protocol run data."""
+        """Get protocol run data.
+
+        The summary won't change as later actions are handled, so it can be kept
+        around, like when the run's summary is persisted. Its lists are its own,
+        and so are its `LoadedLabware`s, because moving labware modifies those
+        in place.
+        """
         error = self._commands.get_error()
         # TODO maybe add summary here for AA
         return StateSummary.construct(
             status=self._commands.get_status(),
             errors=[] if error is None else [error],
             pipettes=self._pipettes.get_all(),
-            labware=self._labware.get_all(),
+            labware=[labware.copy() for labware in self._labware.get_all()],
             labwareOffsets=self._labware.get_labware_offsets(),
             modules=self._modules.get_all(),
             completedAt=self._state.commands.run_completed_at,
@@ -155,7 +187,7 @@ class StateView(HasState[State]):
             liquids=self._liquid.get_all(),
             wells=self._wells.get_all(),
             hasEverEnteredErrorRecovery=self._commands.get_has_entered_recovery_mode(),
-            files=self._state.files.file_ids,
+            files=list(self._state.files.file_ids),
             liquidClasses=[
                 LiquidClassRecordWithId(
                     liquidClassId=liquid_class_id, **dict(liquid_class_record)
@@ -232,20 +264,27 @@ class StateStore(StateView, ActionHandler):
         self._well_store = WellStore()
         self._file_store = FileStore()
 
-        self._substores: List[HandlesActions] = [
-            self._command_store,
-            self._pipette_store,
-            self._addressable_area_store,
-            self._labware_store,
-            self._module_store,
-            self._liquid_store,
-            self._liquid_class_store,
-            self._tip_store,
-            self._well_store,
-            self._file_store,
-        ]
+        self._substores: Dict[SubstoreName, HandlesActions] = {
+            "commands": self._command_store,
+            "pipettes": self._pipette_store,
+            "addressable_areas": self._addressable_area_store,
+            "labware": self._labware_store,
+            "modules": self._module_store,
+            "liquids": self._liquid_store,
+            "liquid_classes": self._liquid_class_store,
+            "tips": self._tip_store,
+            "wells": self._well_store,
+            "files": self._file_store,
+        }
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
+        # Notifiers for waiters that only care about specific substores,
+        # created as waiters ask for them.
+        self._substore_change_notifiers: Dict[SubstoreName, ChangeNotifier] = {}
+        # How many times each substore has changed, for invalidating memoized selectors.
+        self._generations: Dict[SubstoreName, int] = dict.fromkeys(self._substores, 0)
+        # Substores whose current state is part of a snapshot from `get_snapshot()`.
+        self._snapshotted_substores: Set[SubstoreName] = set()
         self._notify_robot_server = notify_publishers
         self._initialize_state()
 
@@ -254,12 +293,34 @@ class StateStore(StateView, ActionHandler):
 
         Arguments:
             action: An action object representing a state change. Will be
-                passed to all substores so they can react accordingly.
+                passed to every substore that might react to it.
         """
-        for substore in self._substores:
-            substore.handle_action(action)
-
-        self._update_state_views()
+        changed_substores: List[SubstoreName] = []
+        for name, substore in self._substores.items():
+            if substore.may_change_on(action):
+                if name in self._snapshotted_substores:
+                    substore.unshare_state()
+                    self._snapshotted_substores.discard(name)
+                substore.handle_action(action)
+                changed_substores.append(name)
+
+        if changed_substores:
+            self._update_state_views(changed_substores)
+
+    def get_snapshot(self) -> State:
+        """Get the current state, which won't change as later actions are handled.
+
+        A snapshot shares all the data that later actions don't change with the
+        live state and with other snapshots. After a snapshot, the next action
+        that changes a substore makes shallow copies of its top-level dicts, and
+        nested objects, like a labware's wells, are only copied when they're
+        modified. Snapshots must not be modified.
+
+        Wrap a snapshot's substates in views, like `CommandView(snapshot.commands)`,
+        to query it.
+        """
+        self._snapshotted_substores.update(self._substores)
+        return self._state
 
     async def wait_for(
         self,
@@ -338,17 +399,82 @@ class StateStore(StateView, ActionHandler):
 
         return await self._wait_for(condition=predicate, truthiness_to_wait_for=False)
 
+    async def wait_for_in(
+        self,
+        substores: AbstractSet[SubstoreName],
+        condition: Callable[_ParamsT, _ReturnT],
+        *args: _ParamsT.args,
+        **kwargs: _ParamsT.kwargs,
+    ) -> _ReturnT:
+        """Like `wait_for()`, except only recheck when the given substores change.
+
+        Use this when `condition` only reads some substores, to avoid rechecking it
+        after every action. See the documentation in `wait_for()`, especially the
+        warning about condition design.
+
+        Arguments:
+            substores: The names of the substores that `condition` reads,
+                as in `{"commands"}`.
+            condition: A function that returns a truthy value when the `await`
+                should resolve.
+            *args: Positional arguments to pass to `condition`.
+            **kwargs: Named arguments to pass to `condition`.
+        """
+
+        def predicate() -> _ReturnT:
+            return condition(*args, **kwargs)
+
+        return await self._wait_for(
+            condition=predicate,
+            truthiness_to_wait_for=True,
+            change_notifier=self._get_change_notifier(substores),
+        )
+
+    async def wait_for_not_in(
+        self,
+        substores: AbstractSet[SubstoreName],
+        condition: Callable[_ParamsT, _ReturnT],
+        *args: _ParamsT.args,
+        **kwargs: _ParamsT.kwargs,
+    ) -> _ReturnT:
+        """Like `wait_for_in()`, except wait for the condition to become false."""
+
+        def predicate() -> _ReturnT:
+            return condition(*args, **kwargs)
+
+        return await self._wait_for(
+            condition=predicate,
+            truthiness_to_wait_for=False,
+            change_notifier=self._get_change_notifier(substores),
+        )
+
     async def _wait_for(
-        self, condition: Callable[[], _ReturnT], truthiness_to_wait_for: bool
+        self,
+        condition: Callable[[], _ReturnT],
+        truthiness_to_wait_for: bool,
+        change_notifier: Optional[ChangeNotifier] = None,
     ) -> _ReturnT:
+        notifier = change_notifier or self._change_notifier
         current_value = condition()
 
         while bool(current_value) != truthiness_to_wait_for:
-            await self._change_notifier.wait()
+            await notifier.wait()
             current_value = condition()
 
         return current_value
 
+    def _get_change_notifier(
+        self, substores: AbstractSet[SubstoreName]
+    ) -> ChangeNotifier:
+        if len(substores) != 1:
+            # Waiters on several substores share the notifier for all changes.
+            return self._change_notifier
+        (name,) = substores
+        notifier = self._substore_change_notifiers.get(name)
+        if notifier is None:
+            notifier = self._substore_change_notifiers[name] = ChangeNotifier()
+        return notifier
+
     def _get_next_state(self) -> State:
         """Get a new instance of the state value object."""
         return State(
@@ -380,6 +506,18 @@ class StateStore(StateView, ActionHandler):
         self._tips = TipView(state.tips)
         self._wells = WellView(state.wells)
         self._files = FileView(state.files)
+        self._views_by_substore: Dict[SubstoreName, HasState[Any]] = {
+            "commands": self._commands,
+            "addressable_areas": self._addressable_areas,
+            "labware": self._labware,
+            "pipettes": self._pipettes,
+            "modules": self._modules,
+            "liquids": self._liquid,
+            "liquid_classes": self._liquid_classes,
+            "tips": self._tips,
+            "wells": self._wells,
+            "files": self._files,
+        }
 
         # Derived states
         self._geometry = GeometryView(
@@ -389,6 +527,7 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
             pipette_view=self._pipettes,
             addressable_area_view=self._addressable_areas,
+            get_generation=self._get_geometry_generation,
         )
         self._motion = MotionView(
             config=self._config,
@@ -399,19 +538,23 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
-        """Update state view interfaces to use latest underlying values."""
-        next_state = self._get_next_state()
-        self._state = next_state
-        self._commands._state = next_state.commands
-        self._addressable_areas._state = next_state.addressable_areas
-        self._labware._state = next_state.labware
-        self._pipettes._state = next_state.pipettes
-        self._modules._state = next_state.modules
-        self._liquid._state = next_state.liquids
-        self._liquid_classes._state = next_state.liquid_classes
-        self._tips._state = next_state.tips
-        self._wells._state = next_state.wells
+    def _get_geometry_generation(self) -> Tuple[int, int, int]:
+        """Return a value that changes whenever geometry selectors' inputs might."""
+        return (
+            self._generations["labware"],
+            self._generations["modules"],
+            self._generations["addressable_areas"],
+        )
+
+    def _update_state_views(self, changed_substores: List[SubstoreName]) -> None:
+        """Update the views of changed substores and notify anyone watching them."""
+        self._state = self._get_next_state()
+        for name in changed_substores:
+            self._generations[name] += 1
+            self._views_by_substore[name]._state = getattr(self._state, name)
+            substore_notifier = self._substore_change_notifiers.get(name)
+            if substore_notifier is not None:
+                substore_notifier.notify()
         self._change_notifier.notify()
         if self._notify_robot_server is not None:
             self._notify_robot_server()
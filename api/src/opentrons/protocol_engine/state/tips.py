@@ -1,8 +1,8 @@
 """Tip state tracking."""
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, Optional, List, Union
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Dict, Optional, List, Set, Tuple
 
 from opentrons.types import NozzleMapInterface
 from opentrons.protocol_engine.state import update_types
@@ -14,14 +14,156 @@ from ..actions import Action, ResetTipsAction, get_state_updates
 from opentrons.hardware_control.nozzle_manager import NozzleMap
 
 
-class TipRackWellState(Enum):
-    """The state of a single tip in a tip rack's well."""
+@dataclass(frozen=True)
+class _TipCluster:
+    """A group of tips that a pipette configuration could pick up at once.
+
+    Masks have one bit per well, as numbered by `_TipRackLayout.bit_by_well_name`.
+    """
+
+    first_well: str
+    mask: int
+    final_column_mask: int
+    final_row_mask: int
+
+
+@dataclass(frozen=True, eq=False)
+class _TipRackLayout:
+    """Facts about a tip rack's well layout that never change, shared between racks.
+
+    Wells are numbered in the order of the definition's `ordering`, so a rack's tip
+    states fit in one integer: bit `n` is set if the `n`th well's tip is used.
+    Anything derived from the layout alone is computed once and cached here.
+    """
+
+    columns: List[List[str]]
+    well_names: List[str]
+    bit_by_well_name: Dict[str, int]
+    column_masks: List[int]
+    column_index_by_well_name: Dict[str, int]
+    _covered_masks: Dict[Tuple[str, int, int, str], int] = field(default_factory=dict)
+    _clusters: Dict[Tuple[str, int, int], List[_TipCluster]] = field(
+        default_factory=dict
+    )
+
+    @property
+    def full_mask(self) -> int:
+        return (1 << len(self.well_names)) - 1
+
+    def get_mask(self, wells: List[str]) -> int:
+        mask = 0
+        for well in wells:
+            mask |= 1 << self.bit_by_well_name[well]
+        return mask
+
+    def get_covered_mask(self, nozzle_map: NozzleMap, well_name: str) -> int:
+        """Get the tips that a pipette configuration picks up at `well_name`."""
+        key = (
+            nozzle_map.starting_nozzle,
+            len(nozzle_map.columns),
+            len(nozzle_map.rows),
+            well_name,
+        )
+        mask = self._covered_masks.get(key)
+        if mask is None:
+            mask = self._covered_masks[key] = self.get_mask(
+                list(wells_covered_dense(nozzle_map, well_name, self.columns))
+            )
+        return mask
+
+    def get_clusters(
+        self, entry_well: str, active_columns: int, active_rows: int
+    ) -> List[_TipCluster]:
+        """Get the tip clusters to try, in order, when searching from `entry_well`."""
+        key = (entry_well, active_columns, active_rows)
+        clusters = self._clusters.get(key)
+        if clusters is None:
+            clusters = self._clusters[key] = self._build_clusters(
+                entry_well, active_columns, active_rows
+            )
+        return clusters
+
+    def _build_clusters(
+        self, entry_well: str, active_columns: int, active_rows: int
+    ) -> List[_TipCluster]:
+        if entry_well not in ("A1", "A12", "H1", "H12"):
+            raise ValueError(
+                f"Invalid entry well {entry_well} for tip cluster identification."
+            )
+        # Searches move away from the entry well's column and row, so clusters
+        # extend back towards them from the critical column and row.
+        column_step = -1 if entry_well in ("A12", "H12") else 1
+        from_top = entry_well in ("A1", "A12")
+        columns = self.columns
+        clusters: List[_TipCluster] = []
+
+        critical_column = (
+            len(columns) - active_columns if column_step < 0 else active_columns - 1
+        )
+        while 0 <= critical_column < len(columns):
+            if from_top:
+                critical_rows = range(active_rows - 1, len(columns[0]))
+            else:
+                critical_rows = range(
+                    len(columns[critical_column]) - active_rows, -1, -1
+                )
+            for critical_row in critical_rows:
+                cluster_columns = [
+                    critical_column - column_step * i for i in range(active_columns)
+                ]
+                row_indices = [
+                    critical_row - j if from_top else critical_row + j
+                    for j in range(active_rows)
+                ]
+                if not all(0 <= c < len(columns) for c in cluster_columns) or not all(
+                    0 <= r < len(columns[c])
+                    for c in cluster_columns
+                    for r in row_indices
+                ):
+                    continue
+                clusters.append(
+                    _TipCluster(
+                        first_well=columns[critical_column][critical_row],
+                        mask=self.get_mask(
+                            [
+                                columns[c][r]
+                                for c in cluster_columns
+                                for r in row_indices
+                            ]
+                        ),
+                        final_column_mask=self.get_mask(
+                            [columns[cluster_columns[-1]][r] for r in row_indices]
+                        ),
+                        final_row_mask=self.get_mask(
+                            [columns[c][row_indices[-1]] for c in cluster_columns]
+                        ),
+                    )
+                )
+            critical_column += column_step
+        return clusters
+
 
-    CLEAN = "clean"
-    USED = "used"
+@lru_cache(maxsize=None)
+def _get_tip_rack_layout(ordering: Tuple[Tuple[str, ...], ...]) -> _TipRackLayout:
+    columns = [list(column) for column in ordering]
+    well_names = [well_name for column in columns for well_name in column]
+    bit_by_well_name = {well_name: bit for bit, well_name in enumerate(well_names)}
+    layout = _TipRackLayout(
+        columns=columns,
+        well_names=well_names,
+        bit_by_well_name=bit_by_well_name,
+        column_masks=[],
+        column_index_by_well_name={
+            well_name: index
+            for index, column in enumerate(columns)
+            for well_name in column
+        },
+    )
+    layout.column_masks.extend(layout.get_mask(column) for column in columns)
+    return layout
 
 
-TipRackStateByWellName = Dict[str, TipRackWellState]
+_NO_TIP_RACK = _get_tip_rack_layout(())
 
 
 # todo(mm, 2024-10-10): This info is duplicated between here and PipetteState because
@@ -40,8 +182,9 @@ class _PipetteInfo:
 class TipState:
     """State of all tips."""
 
-    tips_by_labware_id: Dict[str, TipRackStateByWellName]
-    column_by_labware_id: Dict[str, List[List[str]]]
+    layout_by_labware_id: Dict[str, _TipRackLayout]
+    used_tips_by_labware_id: Dict[str, int]
+    """Bitmasks of the used tips in each tip rack, numbered by the rack's layout."""
 
     pipette_info_by_pipette_id: Dict[str, _PipetteInfo]
 
@@ -54,23 +197,46 @@ class TipStore(HasState[TipState], HandlesActions):
     def __init__(self) -> None:
         """Initialize a liquid store and its state."""
         self._state = TipState(
-            tips_by_labware_id={},
-            column_by_labware_id={},
+            layout_by_labware_id={},
+            used_tips_by_labware_id={},
             pipette_info_by_pipette_id={},
         )
+        # IDs of the pipettes whose `_PipetteInfo` isn't shared with a snapshot.
+        self._unshared_pipette_ids: Set[str] = set()
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         for state_update in get_state_updates(action):
             self._handle_state_update(state_update)
 
         if isinstance(action, ResetTipsAction):
             labware_id = action.labware_id
+            if labware_id in self._state.used_tips_by_labware_id:
+                self._state.used_tips_by_labware_id[labware_id] = 0
+
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change tip state."""
+        return isinstance(action, ResetTipsAction) or any(
+            state_update.pipette_config != update_types.NO_CHANGE
+            or state_update.tips_used != update_types.NO_CHANGE
+            or state_update.pipette_nozzle_map != update_types.NO_CHANGE
+            or state_update.loaded_labware != update_types.NO_CHANGE
+            for state_update in get_state_updates(action)
+        )
+
+    def unshare_state(self) -> None:
+        """Replace the tip state with a copy that can be modified freely.
 
-            for well_name in self._state.tips_by_labware_id[labware_id].keys():
-                self._state.tips_by_labware_id[labware_id][
-                    well_name
-                ] = TipRackWellState.CLEAN
+        From now on, each pipette's info is copied the first time that it's modified.
+        """
+        self._state = TipState(
+            layout_by_labware_id=dict(self._state.layout_by_labware_id),
+            used_tips_by_labware_id=dict(self._state.used_tips_by_labware_id),
+            pipette_info_by_pipette_id=dict(self._state.pipette_info_by_pipette_id),
+        )
+        self._unshared_pipette_ids.clear()
 
     def _handle_state_update(self, state_update: update_types.StateUpdate) -> None:
         if state_update.pipette_config != update_types.NO_CHANGE:
@@ -81,6 +247,7 @@ class TipStore(HasState[TipState], HandlesActions):
                 active_channels=state_update.pipette_config.config.channels,
                 nozzle_map=state_update.pipette_config.config.nozzle_map,
             )
+            self._unshared_pipette_ids.add(state_update.pipette_config.pipette_id)
 
         if state_update.tips_used != update_types.NO_CHANGE:
             self._set_used_tips(
@@ -90,9 +257,9 @@ class TipStore(HasState[TipState], HandlesActions):
             )
 
         if state_update.pipette_nozzle_map != update_types.NO_CHANGE:
-            pipette_info = self._state.pipette_info_by_pipette_id[
+            pipette_info = self._get_pipette_info_to_modify(
                 state_update.pipette_nozzle_map.pipette_id
-            ]
+            )
             pipette_info.active_channels = (
                 state_update.pipette_nozzle_map.nozzle_map.tip_count
             )
@@ -102,21 +269,26 @@ class TipStore(HasState[TipState], HandlesActions):
             labware_id = state_update.loaded_labware.labware_id
             definition = state_update.loaded_labware.definition
             if definition.parameters.isTiprack:
-                self._state.tips_by_labware_id[labware_id] = {
-                    well_name: TipRackWellState.CLEAN
-                    for column in definition.ordering
-                    for well_name in column
-                }
-                self._state.column_by_labware_id[labware_id] = [
-                    column for column in definition.ordering
-                ]
+                self._state.layout_by_labware_id[labware_id] = _get_tip_rack_layout(
+                    tuple(tuple(column) for column in definition.ordering)
+                )
+                self._state.used_tips_by_labware_id[labware_id] = 0
+
+    def _get_pipette_info_to_modify(self, pipette_id: str) -> _PipetteInfo:
+        """Get a pipette's info, copying it first if a snapshot shares it."""
+        if pipette_id not in self._unshared_pipette_ids:
+            self._state.pipette_info_by_pipette_id[pipette_id] = replace(
+                self._state.pipette_info_by_pipette_id[pipette_id]
+            )
+            self._unshared_pipette_ids.add(pipette_id)
+        return self._state.pipette_info_by_pipette_id[pipette_id]
 
     def _set_used_tips(self, pipette_id: str, well_name: str, labware_id: str) -> None:
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
+        layout = self._state.layout_by_labware_id.get(labware_id, _NO_TIP_RACK)
         nozzle_map = self._state.pipette_info_by_pipette_id[pipette_id].nozzle_map
-        for well in wells_covered_dense(nozzle_map, well_name, columns):
-            wells[well] = TipRackWellState.USED
+        covered_mask = layout.get_covered_mask(nozzle_map, well_name)
+        if labware_id in self._state.used_tips_by_labware_id:
+            self._state.used_tips_by_labware_id[labware_id] |= covered_mask
 
 
 class TipView(HasState[TipState]):
@@ -140,187 +312,31 @@ class TipView(HasState[TipState]):
         nozzle_map: Optional[NozzleMapInterface],
     ) -> Optional[str]:
         """Get the next available clean tip. Does not support use of a starting tip if the pipette used is in a partial configuration."""
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-
-        # TODO(sf): I'm pretty sure this can be replaced with wells_covered_96 but I'm not quite sure how
-        def _identify_tip_cluster(
-            active_columns: int,
-            active_rows: int,
-            critical_column: int,
-            critical_row: int,
-            entry_well: str,
-        ) -> Optional[List[str]]:
-            tip_cluster: list[str] = []
-            for i in range(active_columns):
-                if entry_well == "A1" or entry_well == "H1":
-                    if critical_column - i >= 0:
-                        column = columns[critical_column - i]
-                    else:
-                        return None
-                elif entry_well == "A12" or entry_well == "H12":
-                    if critical_column + i < len(columns):
-                        column = columns[critical_column + i]
-                    else:
-                        return None
-                else:
-                    raise ValueError(
-                        f"Invalid entry well {entry_well} for tip cluster identification."
-                    )
-                for j in range(active_rows):
-                    if entry_well == "A1" or entry_well == "A12":
-                        if critical_row - j >= 0:
-                            well = column[critical_row - j]
-                        else:
-                            return None
-                    elif entry_well == "H1" or entry_well == "H12":
-                        if critical_row + j < len(column):
-                            well = column[critical_row + j]
-                        else:
-                            return None
-                    tip_cluster.append(well)
-
-            if any(well not in [*wells] for well in tip_cluster):
-                return None
-
-            return tip_cluster
-
-        def _validate_tip_cluster(
-            active_columns: int, active_rows: int, tip_cluster: List[str]
-        ) -> Union[str, int, None]:
-            if not any(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return tip_cluster[0]
-            elif all(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return None
-            else:
+        layout = self._state.layout_by_labware_id.get(labware_id, _NO_TIP_RACK)
+        used = self._state.used_tips_by_labware_id.get(labware_id, 0)
+        columns = layout.columns
+
+        # Search through the tiprack beginning at the entry well
+        def _cluster_search(
+            entry_well: str, active_columns: int, active_rows: int
+        ) -> Optional[str]:
+            for cluster in layout.get_clusters(entry_well, active_columns, active_rows):
+                used_in_cluster = used & cluster.mask
+                if used_in_cluster == 0:
+                    return cluster.first_well
+                elif used_in_cluster == cluster.mask:
+                    continue
                 # In the case of an 8ch pipette where a column has mixed state tips we may simply progress to the next column in our search
-                if nozzle_map is not None and nozzle_map.physical_nozzle_count == 8:
-                    return None
-
+                elif nozzle_map is not None and nozzle_map.physical_nozzle_count == 8:
+                    continue
                 # In the case of a 96ch we can attempt to index in by singular rows and columns assuming that indexed direction is safe
-                # The tip cluster list is ordered: Each row from a column in order by columns
-                tip_cluster_final_column: list[str] = []
-                for i in range(active_rows):
-                    tip_cluster_final_column.append(
-                        tip_cluster[((active_columns * active_rows) - 1) - i]
-                    )
-                tip_cluster_final_row: list[str] = []
-                for i in range(active_columns):
-                    tip_cluster_final_row.append(
-                        tip_cluster[(active_rows - 1) + (i * active_rows)]
-                    )
-                if all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_column
-                ):
-                    return None
-                elif all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_row
-                ):
-                    return None
+                elif used & cluster.final_column_mask == cluster.final_column_mask:
+                    continue
+                elif used & cluster.final_row_mask == cluster.final_row_mask:
+                    continue
                 else:
                     # Tiprack has no valid tip selection, cannot progress
-                    return -1
-
-        # Search through the tiprack beginning at A1
-        def _cluster_search_A1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = active_rows - 1
-
-            while critical_column < len(columns):
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column += 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at A12
-        def _cluster_search_A12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = active_rows - 1
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column -= 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at H1
-        def _cluster_search_H1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column <= len(columns):  # change to max size of labware
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column += 1
-                    if critical_column >= len(columns):
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
-            return None
-
-        # Search through the tiprack beginning at H12
-        def _cluster_search_H12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column -= 1
-                    if critical_column < 0:
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
+                    return None
             return None
 
         if starting_tip_name is None and nozzle_map is not None and columns:
@@ -335,21 +351,21 @@ class TipView(HasState[TipState]):
             #   The 96 channel will then progress towards the opposite corner, either going up or down, left or right depending on configuration.
 
             if num_channels == 1:
-                return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                return _cluster_search("A1", num_nozzle_cols, num_nozzle_rows)
             elif num_channels == 8:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search("H1", num_nozzle_cols, num_nozzle_rows)
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search("A1", num_nozzle_cols, num_nozzle_rows)
             elif num_channels == 96:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H12(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search("H12", num_nozzle_cols, num_nozzle_rows)
                 elif nozzle_map.starting_nozzle == "A12":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search("H1", num_nozzle_cols, num_nozzle_rows)
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A12(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search("A12", num_nozzle_cols, num_nozzle_rows)
                 elif nozzle_map.starting_nozzle == "H12":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search("A1", num_nozzle_cols, num_nozzle_rows)
                 else:
                     raise ValueError(
                         f"Nozzle {nozzle_map.starting_nozzle} is an invalid starting tip for automatic tip pickup."
@@ -360,37 +376,39 @@ class TipView(HasState[TipState]):
                 )
         else:
             if columns and num_tips == len(columns[0]):  # Get next tips for 8-channel
-                column_head = [column[0] for column in columns]
                 starting_column_index = 0
 
                 if starting_tip_name:
-                    for idx, column in enumerate(columns):
-                        if starting_tip_name in column:
-                            if starting_tip_name not in column_head:
-                                starting_column_index = idx + 1
-                            else:
-                                starting_column_index = idx
-
-                for column in columns[starting_column_index:]:
-                    if not any(wells[well] == TipRackWellState.USED for well in column):
-                        return column[0]
-
-            elif num_tips == len(wells.keys()):  # Get next tips for 96 channel
+                    column_index = layout.column_index_by_well_name.get(
+                        starting_tip_name
+                    )
+                    if column_index is not None:
+                        if starting_tip_name != columns[column_index][0]:
+                            starting_column_index = column_index + 1
+                        else:
+                            starting_column_index = column_index
+
+                for column_index in range(starting_column_index, len(columns)):
+                    if used & layout.column_masks[column_index] == 0:
+                        return columns[column_index][0]
+
+            elif num_tips == len(layout.well_names):  # Get next tips for 96 channel
                 if starting_tip_name and starting_tip_name != columns[0][0]:
                     return None
 
-                if not any(
-                    tip_state == TipRackWellState.USED for tip_state in wells.values()
-                ):
-                    return next(iter(wells))
+                if used == 0:
+                    return layout.well_names[0]
 
             else:  # Get next tips for single channel
+                clean = layout.full_mask & ~used
                 if starting_tip_name is not None:
-                    wells = _drop_wells_before_starting_tip(wells, starting_tip_name)
+                    starting_bit = layout.bit_by_well_name.get(starting_tip_name)
+                    if starting_bit is None:
+                        return None
+                    clean &= ~((1 << starting_bit) - 1)
 
-                for well_name, tip_state in wells.items():
-                    if tip_state == TipRackWellState.CLEAN:
-                        return well_name
+                if clean:
+                    return layout.well_names[(clean & -clean).bit_length() - 1]
         return None
 
     def get_pipette_channels(self, pipette_id: str) -> int:
@@ -423,21 +441,8 @@ class TipView(HasState[TipState]):
             True if the labware is a tip rack and the well has a clean tip,
             otherwise False.
         """
-        tip_rack = self._state.tips_by_labware_id.get(labware_id)
-        well_state = tip_rack.get(well_name) if tip_rack else None
-
-        return well_state == TipRackWellState.CLEAN
-
-
-def _drop_wells_before_starting_tip(
-    wells: TipRackStateByWellName, starting_tip_name: str
-) -> TipRackStateByWellName:
-    """Drop any wells that come before the starting tip and return the remaining ones after."""
-    seen_starting_well = False
-    remaining_wells = {}
-    for well_name, tip_state in wells.items():
-        if well_name == starting_tip_name:
-            seen_starting_well = True
-        if seen_starting_well:
-            remaining_wells[well_name] = tip_state
-    return remaining_wells
+        layout = self._state.layout_by_labware_id.get(labware_id)
+        bit = layout.bit_by_well_name.get(well_name) if layout else None
+        if bit is None:
+            return False
+        return not (self._state.used_tips_by_labware_id[labware_id] >> bit) & 1
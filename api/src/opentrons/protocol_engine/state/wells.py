@@ -1,7 +1,17 @@
 """Basic well data state and store."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Union, Iterator, Optional, Tuple, overload, TypeVar
+from typing import (
+    Dict,
+    List,
+    Union,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    overload,
+    TypeVar,
+)
 
 from opentrons.protocol_engine.types import (
     ProbedHeightInfo,
@@ -38,9 +48,15 @@ class WellStore(HasState[WellState], HandlesActions):
     def __init__(self) -> None:
         """Initialize a well store and its state."""
         self._state = WellState(loaded_volumes={}, probed_heights={}, probed_volumes={})
+        # IDs of the labware whose well dicts aren't shared with a snapshot.
+        self._unshared_loaded_volumes: Set[LabwareId] = set()
+        self._unshared_probed_heights: Set[LabwareId] = set()
+        self._unshared_probed_volumes: Set[LabwareId] = set()
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        if not self.may_change_on(action):
+            return
         for state_update in get_state_updates(action):
             if state_update.liquid_loaded != update_types.NO_CHANGE:
                 self._handle_liquid_loaded_update(state_update.liquid_loaded)
@@ -49,14 +65,40 @@ class WellStore(HasState[WellState], HandlesActions):
             if state_update.liquid_operated != update_types.NO_CHANGE:
                 self._handle_liquid_operated_update(state_update.liquid_operated)
 
+    def may_change_on(self, action: Action) -> bool:
+        """Return whether handling the action could change well state."""
+        return any(
+            state_update.liquid_loaded != update_types.NO_CHANGE
+            or state_update.liquid_probed != update_types.NO_CHANGE
+            or state_update.liquid_operated != update_types.NO_CHANGE
+            for state_update in get_state_updates(action)
+        )
+
+    def unshare_state(self) -> None:
+        """Replace the well state with a copy that can be modified freely.
+
+        From now on, each labware's well dicts are copied the first time
+        that they're modified.
+        """
+        self._state = WellState(
+            loaded_volumes=dict(self._state.loaded_volumes),
+            probed_heights=dict(self._state.probed_heights),
+            probed_volumes=dict(self._state.probed_volumes),
+        )
+        self._unshared_loaded_volumes.clear()
+        self._unshared_probed_heights.clear()
+        self._unshared_probed_volumes.clear()
+
     def _handle_liquid_loaded_update(
         self, state_update: update_types.LiquidLoadedUpdate
     ) -> None:
-        labware_id = state_update.labware_id
-        if labware_id not in self._state.loaded_volumes:
-            self._state.loaded_volumes[labware_id] = {}
+        loaded_volumes = _get_wells_to_modify(
+            self._state.loaded_volumes,
+            state_update.labware_id,
+            self._unshared_loaded_volumes,
+        )
         for well, volume in state_update.volumes.items():
-            self._state.loaded_volumes[labware_id][well] = LoadedVolumeInfo(
+            loaded_volumes[well] = LoadedVolumeInfo(
                 volume=_none_from_clear(volume),
                 last_loaded=state_update.last_loaded,
                 operations_since_load=0,
@@ -67,15 +109,15 @@ class WellStore(HasState[WellState], HandlesActions):
     ) -> None:
         labware_id = state_update.labware_id
         well_name = state_update.well_name
-        if labware_id not in self._state.probed_heights:
-            self._state.probed_heights[labware_id] = {}
-        if labware_id not in self._state.probed_volumes:
-            self._state.probed_volumes[labware_id] = {}
-        self._state.probed_heights[labware_id][well_name] = ProbedHeightInfo(
+        _get_wells_to_modify(
+            self._state.probed_heights, labware_id, self._unshared_probed_heights
+        )[well_name] = ProbedHeightInfo(
             height=_none_from_clear(state_update.height),
             last_probed=state_update.last_probed,
         )
-        self._state.probed_volumes[labware_id][well_name] = ProbedVolumeInfo(
+        _get_wells_to_modify(
+            self._state.probed_volumes, labware_id, self._unshared_probed_volumes
+        )[well_name] = ProbedVolumeInfo(
             volume=_none_from_clear(state_update.volume),
             last_probed=state_update.last_probed,
             operations_since_probe=0,
@@ -99,12 +141,15 @@ class WellStore(HasState[WellState], HandlesActions):
             labware_id in self._state.loaded_volumes
             and well_name in self._state.loaded_volumes[labware_id]
         ):
+            loaded_volumes = _get_wells_to_modify(
+                self._state.loaded_volumes, labware_id, self._unshared_loaded_volumes
+            )
             if volume_added is update_types.CLEAR:
-                del self._state.loaded_volumes[labware_id][well_name]
+                del loaded_volumes[well_name]
             else:
-                prev_loaded_vol_info = self._state.loaded_volumes[labware_id][well_name]
+                prev_loaded_vol_info = loaded_volumes[well_name]
                 assert prev_loaded_vol_info.volume is not None
-                self._state.loaded_volumes[labware_id][well_name] = LoadedVolumeInfo(
+                loaded_volumes[well_name] = LoadedVolumeInfo(
                     volume=prev_loaded_vol_info.volume + volume_added,
                     last_loaded=prev_loaded_vol_info.last_loaded,
                     operations_since_load=prev_loaded_vol_info.operations_since_load
@@ -114,20 +159,25 @@ class WellStore(HasState[WellState], HandlesActions):
             labware_id in self._state.probed_heights
             and well_name in self._state.probed_heights[labware_id]
         ):
-            del self._state.probed_heights[labware_id][well_name]
+            del _get_wells_to_modify(
+                self._state.probed_heights, labware_id, self._unshared_probed_heights
+            )[well_name]
         if (
             labware_id in self._state.probed_volumes
             and well_name in self._state.probed_volumes[labware_id]
         ):
+            probed_volumes = _get_wells_to_modify(
+                self._state.probed_volumes, labware_id, self._unshared_probed_volumes
+            )
             if volume_added is update_types.CLEAR:
-                del self._state.probed_volumes[labware_id][well_name]
+                del probed_volumes[well_name]
             else:
-                prev_probed_vol_info = self._state.probed_volumes[labware_id][well_name]
+                prev_probed_vol_info = probed_volumes[well_name]
                 if prev_probed_vol_info.volume is None:
                     new_vol_info: float | None = None
                 else:
                     new_vol_info = prev_probed_vol_info.volume + volume_added
-                self._state.probed_volumes[labware_id][well_name] = ProbedVolumeInfo(
+                probed_volumes[well_name] = ProbedVolumeInfo(
                     volume=new_vol_info,
                     last_probed=prev_probed_vol_info.last_probed,
                     operations_since_probe=prev_probed_vol_info.operations_since_probe
@@ -235,6 +285,24 @@ def _height_from_info(info: Optional[ProbedHeightInfo]) -> Optional[float]:
     return info.height
 
 
+_WellInfoT = TypeVar("_WellInfoT")
+
+
+def _get_wells_to_modify(
+    wells_by_labware_id: Dict[LabwareId, Dict[WellName, _WellInfoT]],
+    labware_id: LabwareId,
+    unshared_labware_ids: Set[LabwareId],
+) -> Dict[WellName, _WellInfoT]:
+    """Get a labware's wells, copying them first if a snapshot shares them.
+
+    Adds an empty dict for the labware if it doesn't have one yet.
+    """
+    if labware_id not in unshared_labware_ids:
+        wells_by_labware_id[labware_id] = dict(wells_by_labware_id.get(labware_id, {}))
+        unshared_labware_ids.add(labware_id)
+    return wells_by_labware_id[labware_id]
+
+
 MaybeClear = TypeVar("MaybeClear")
 
 
@@ -443,10 +443,11 @@ class RunOrchestrator:
         while True:
             try:
                 # TODO(tz, 6-26-2024): avoid using private accessor in a follow up pr.
-                command_id = await self._protocol_engine._state_store.wait_for(
-                    condition=self._protocol_engine.state_view.commands.get_next_to_execute
+                command_id = await self._protocol_engine._state_store.wait_for_in(
+                    {"commands"},
+                    self._protocol_engine.state_view.commands.get_next_to_execute,
                 )
-                # Assert for type hinting. This is valid because the wait_for() above
+                # Assert for type hinting. This is valid because the wait_for_in() above
                 # only returns when the value is truthy.
                 assert command_id is not None
                 yield command_id
@@ -9,6 +9,7 @@ from typing import Any, AnyStr, Dict, Optional, Union
 import jsonschema  # type: ignore
 
 from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons_shared_data.labware import load_standard_definition
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE,
     CUSTOM_NAMESPACE,
@@ -207,9 +208,12 @@ def _get_standard_labware_definition(
         )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
+        if namespace == OPENTRONS_NAMESPACE:
+            # This can come from shared data's packed index, without a file of its own.
+            return load_standard_definition(load_name, checked_version)
+        def_path = _get_path_to_labware(load_name, namespace, checked_version)
         with open(def_path, "rb") as f:
             labware_def = json.loads(f.read().decode("utf-8"))
     except FileNotFoundError:
@@ -3,15 +3,20 @@
 This module has functions that provide a console entrypoint for simulating
 a protocol from the command line.
 """
+from __future__ import annotations
+
 import argparse
 import asyncio
 import atexit
-from contextlib import ExitStack, contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager, redirect_stdout
+import json
 import sys
 import logging
 import os
 import pathlib
 import queue
+import time
 from typing import (
     TYPE_CHECKING,
     Generator,
@@ -19,6 +24,7 @@ from typing import (
     Dict,
     List,
     Mapping,
+    Sequence,
     TextIO,
     Tuple,
     BinaryIO,
@@ -31,55 +37,32 @@ from opentrons_shared_data.robot.types import RobotType
 
 import opentrons
 from opentrons import should_use_ot3
-from opentrons.hardware_control import (
-    API as OT2API,
-    ThreadManager,
-    ThreadManagedHardware,
-)
-from opentrons.hardware_control.types import HardwareFeatureFlags
-
-from opentrons.hardware_control.simulator_setup import load_simulator
-from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
-from opentrons.protocol_api.protocol_context import ProtocolContext
-from opentrons.protocol_engine.create_protocol_engine import (
-    create_protocol_engine_in_thread,
-    create_protocol_engine,
-)
-from opentrons.protocol_engine import error_recovery_policy
-from opentrons.protocol_engine.state.config import Config
-from opentrons.protocol_engine.types import DeckType, EngineStatus, PostRunHardwareState
-from opentrons.protocol_reader.protocol_source import ProtocolSource
-from opentrons.protocol_runner.protocol_runner import create_protocol_runner, LiveRunner
-from opentrons.protocol_runner import RunOrchestrator
-from opentrons.protocols.duration import DurationEstimator
-from opentrons.protocols.execution import execute
-from opentrons.legacy_broker import LegacyBroker
 from opentrons.config import IS_ROBOT
-from opentrons import protocol_api
-from opentrons.legacy_commands import types as command_types
-
-from opentrons.protocols import parse, bundle
 from opentrons.protocols.types import (
     ApiDeprecationError,
     Protocol,
     PythonProtocol,
     BundleContents,
 )
-from opentrons.protocols.api_support.deck_type import (
-    for_simulation as deck_type_for_simulation,
-    should_load_fixed_trash,
-    should_load_fixed_trash_labware_for_python_protocol,
-)
 from opentrons.protocols.api_support.types import APIVersion
-from opentrons_shared_data.labware.labware_definition import LabwareDefinition
-
-from .util import entrypoint_util
 
+# Most of this module's dependencies are imported by the functions that use them,
+# not up here. Importing them loads the Protocol Engine, its command models, and the
+# hardware controller, which takes seconds on a robot, and things like
+# `opentrons_simulate --help` shouldn't have to wait for that.
 if TYPE_CHECKING:
     from opentrons_shared_data.labware.types import (
         LabwareDefinition as LabwareDefinitionDict,
     )
 
+    from opentrons import protocol_api
+    from opentrons.hardware_control import ThreadManagedHardware
+    from opentrons.legacy_broker import LegacyBroker
+    from opentrons.protocol_api.protocol_context import ProtocolContext
+    from opentrons.protocol_engine.state.config import Config
+    from opentrons.protocol_engine.types import PrimitiveRunTimeParamValuesType
+    from opentrons.protocol_reader.protocol_source import ProtocolSource
+    from opentrons.protocols.duration import DurationEstimator
 
 # See Jira RCORE-535.
 _JSON_TOO_NEW_MESSAGE = (
@@ -169,6 +152,8 @@ class _CommandScraper:
         """While this context manager is open, scrape the broker for commands and integrate log
         messages with them. The accumulated commands will be accessible through `.commands`.
         """
+        from opentrons.legacy_commands import types as command_types
+
         log_queue: "queue.Queue[object]" = queue.Queue()
 
         depth = 0
@@ -268,6 +253,13 @@ def get_protocol_api(
         lower level hardware simulator.
     :return: The protocol context.
     """
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+    from opentrons.protocols import parse
+    from opentrons.protocols.api_support.deck_type import (
+        for_simulation as deck_type_for_simulation,
+    )
+    from .util import entrypoint_util
+
     if isinstance(version, str):
         checked_version = parse.version_from_string(version)
     elif not isinstance(version, APIVersion):
@@ -343,6 +335,9 @@ def get_protocol_api(
 def _make_hardware_simulator(
     override: Optional[ThreadManagedHardware], robot_type: RobotType
 ) -> ThreadManagedHardware:
+    from opentrons.hardware_control import API as OT2API, ThreadManager
+    from opentrons.hardware_control.types import HardwareFeatureFlags
+
     if override:
         return override
     elif robot_type == "OT-3 Standard":
@@ -364,6 +359,9 @@ def _make_hardware_simulator(
 def _make_hardware_simulator_cm(
     config_file_path: Optional[pathlib.Path], robot_type: RobotType
 ) -> Generator[ThreadManagedHardware, None, None]:
+    from opentrons.hardware_control import ThreadManager
+    from opentrons.hardware_control.simulator_setup import load_simulator
+
     if config_file_path is not None:
         result = ThreadManager(
             load_simulator,
@@ -408,18 +406,17 @@ def _validate_can_simulate_for_robot_type(robot_type: RobotType) -> None:
 
 
 def bundle_from_sim(
-    protocol: PythonProtocol, context: opentrons.protocol_api.ProtocolContext
+    protocol: PythonProtocol, context: ProtocolContext
 ) -> BundleContents:
     """
     From a protocol, and the context that has finished simulating that
     protocol, determine what needs to go in a bundle for the protocol.
     """
+    from opentrons.protocol_api.labware import Labware
+
     bundled_labware: Dict[str, "LabwareDefinitionDict"] = {}
     for lw in context.loaded_labwares.values():
-        if (
-            isinstance(lw, opentrons.protocol_api.labware.Labware)
-            and lw.uri not in bundled_labware
-        ):
+        if isinstance(lw, Labware) and lw.uri not in bundled_labware:
             bundled_labware[lw.uri] = lw._core.get_definition()
 
     return BundleContents(
@@ -439,6 +436,7 @@ def simulate(
     hardware_simulator_file_path: Optional[str] = None,
     duration_estimator: Optional[DurationEstimator] = None,
     log_level: str = "warning",
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None,
 ) -> _SimulateResult:
     """
     Simulate the protocol itself.
@@ -508,12 +506,20 @@ def simulate(
     :param log_level: The level of logs to capture in the run log:
         ``"debug"``, ``"info"``, ``"warning"``, or ``"error"``.
         Defaults to ``"warning"``.
+    :param run_time_param_values: Values to override the defaults of the protocol's
+        runtime parameters, keyed by each parameter's ``variable_name``.
+        Only supported for protocols with apiLevel 2.18 or newer.
+        If this is ``None`` (the default), every parameter keeps its default value.
     :returns: A tuple of a run log for user output, and possibly the required
         data to write to a bundle to bundle this protocol. The bundle is
         only emitted if bundling is allowed
         and this is an unbundled Protocol API
         v2 python protocol. In other cases it is None.
     """
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+    from opentrons.protocols import parse
+    from .util import entrypoint_util
+
     stack_logger = logging.getLogger("opentrons")
     stack_logger.propagate = propagate_logs
     # _CommandScraper will set the level of this logger.
@@ -561,6 +567,11 @@ def simulate(
         robot_type=protocol.robot_type,
     ) as hardware_simulator:
         if protocol.api_level < ENGINE_CORE_API_VERSION:
+            if run_time_param_values:
+                raise NotImplementedError(
+                    "The run_time_param_values argument is not supported for protocols"
+                    f" with apiLevel older than {ENGINE_CORE_API_VERSION}."
+                )
             return _run_file_non_pe(
                 protocol=protocol,
                 hardware_api=hardware_simulator,
@@ -583,6 +594,7 @@ def simulate(
                 hardware_api=hardware_simulator,
                 stack_logger=stack_logger,
                 log_level=log_level,
+                run_time_param_values=run_time_param_values,
             )
 
 
@@ -608,6 +620,154 @@ def format_runlog(runlog: List[Mapping[str, Any]]) -> str:
     return "\n".join(to_ret)
 
 
+def _simulate_batch(
+    protocol_paths: Sequence[str],
+    run_time_param_value_sets: Sequence[PrimitiveRunTimeParamValuesType],
+    max_workers: Optional[int],
+    custom_labware_paths: List[str],
+    custom_data_paths: List[str],
+    hardware_simulator_file_path: Optional[str],
+    log_level: str,
+) -> List[Dict[str, Any]]:
+    """Simulate many protocols in parallel, in a pool of worker processes.
+
+    Each protocol is simulated once with each set of runtime parameter values,
+    or once with its default values if there are no sets.
+
+    Each worker is reused for many simulations, so the cost of starting Python
+    and importing this package is paid once per worker instead of once per protocol.
+
+    Returns a JSON-serializable summary of each simulation, in the order that
+    the protocols were given. A simulation whose worker process failed, for
+    example because the protocol killed it, is summarized as failed without
+    a duration.
+    """
+    value_sets = run_time_param_value_sets or [{}]
+    jobs = [
+        (protocol_path, run_time_param_values)
+        for protocol_path in protocol_paths
+        for run_time_param_values in value_sets
+    ]
+    summaries: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _simulate_batch_item,
+                protocol_path=protocol_path,
+                run_time_param_values=run_time_param_values,
+                custom_labware_paths=custom_labware_paths,
+                custom_data_paths=custom_data_paths,
+                hardware_simulator_file_path=hardware_simulator_file_path,
+                log_level=log_level,
+            )
+            for protocol_path, run_time_param_values in jobs
+        ]
+        for (protocol_path, run_time_param_values), future in zip(jobs, futures):
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                summaries.append(
+                    _batch_summary(
+                        protocol_path=protocol_path,
+                        run_time_param_values=run_time_param_values,
+                        duration_seconds=None,
+                        command_count=None,
+                        error=_batch_error(e),
+                    )
+                )
+    return summaries
+
+
+def _simulate_batch_item(
+    protocol_path: str,
+    run_time_param_values: PrimitiveRunTimeParamValuesType,
+    custom_labware_paths: List[str],
+    custom_data_paths: List[str],
+    hardware_simulator_file_path: Optional[str],
+    log_level: str,
+) -> Dict[str, Any]:
+    """Simulate one protocol of a batch, in a worker process, and summarize it."""
+    start_time = time.perf_counter()
+    command_count: Optional[int] = None
+    error: Optional[Dict[str, str]] = None
+    try:
+        # Anything that the protocol prints would get mixed into the batch summary.
+        with open(protocol_path, "rb") as protocol_file, redirect_stdout(sys.stderr):
+            runlog, _ = simulate(
+                protocol_file=protocol_file,
+                file_name=protocol_path,
+                custom_labware_paths=custom_labware_paths,
+                custom_data_paths=custom_data_paths,
+                hardware_simulator_file_path=hardware_simulator_file_path,
+                log_level=log_level,
+                run_time_param_values=run_time_param_values,
+            )
+        command_count = len(runlog)
+    except KeyboardInterrupt:
+        raise
+    except BaseException as e:
+        # Catch SystemExit too, in case the protocol calls sys.exit().
+        error = _batch_error(e)
+
+    return _batch_summary(
+        protocol_path=protocol_path,
+        run_time_param_values=run_time_param_values,
+        duration_seconds=time.perf_counter() - start_time,
+        command_count=command_count,
+        error=error,
+    )
+
+
+def _batch_error(error: BaseException) -> Dict[str, str]:
+    """Describe why a simulation in a batch failed."""
+    from .util import entrypoint_util
+
+    return {
+        "errorType": type(error).__name__,
+        "detail": (
+            error.to_stderr_string()
+            if isinstance(error, entrypoint_util.ProtocolEngineExecuteError)
+            else str(error)
+        ),
+    }
+
+
+def _batch_summary(
+    protocol_path: str,
+    run_time_param_values: PrimitiveRunTimeParamValuesType,
+    duration_seconds: Optional[float],
+    command_count: Optional[int],
+    error: Optional[Dict[str, str]],
+) -> Dict[str, Any]:
+    """Summarize one simulation of a batch."""
+    return {
+        "protocol": protocol_path,
+        "runTimeParameterValues": dict(run_time_param_values),
+        "status": "succeeded" if error is None else "failed",
+        "durationSeconds": duration_seconds,
+        "commandCount": command_count,
+        "error": error,
+    }
+
+
+def _run_time_param_values(serialized: str) -> PrimitiveRunTimeParamValuesType:
+    """Parse the value of a --rtp-values argument."""
+    try:
+        values = json.loads(serialized)
+    except json.JSONDecodeError as error:
+        raise argparse.ArgumentTypeError(f"JSON decode error: {error}")
+    if not isinstance(values, dict):
+        raise argparse.ArgumentTypeError(
+            "Runtime parameter values must be a JSON object."
+        )
+    for value in values.values():
+        if not isinstance(value, (bool, int, float, str)):
+            raise argparse.ArgumentTypeError(
+                f"Runtime parameter '{value}' is not of allowed type boolean, integer, float or string"
+            )
+    return values
+
+
 def _get_bundle_args(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     parser.add_argument(
         "-b",
@@ -730,10 +890,42 @@ def get_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     parser.add_argument(
         "protocol",
         metavar="PROTOCOL",
+        nargs="?",
         type=argparse.FileType("rb"),
         help="The protocol file to simulate. If you pass '-', you can pipe "
         "the protocol via stdin; this could be useful if you want to use this "
-        "utility as part of an automated workflow.",
+        "utility as part of an automated workflow. Required unless --batch "
+        "is specified.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="PROTOCOL",
+        nargs="+",
+        default=None,
+        help="Simulate many protocol files in parallel, instead of a single "
+        "PROTOCOL. Each file is simulated once with each set of values passed "
+        "with --rtp-values. Instead of the run log, this prints a JSON list with "
+        "a summary of each simulation: the protocol, the runtime parameter "
+        "values, whether it succeeded, how long it took, how many commands it "
+        "ran, and any error.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="How many protocols to simulate at once with --batch. "
+        "Defaults to the number of processors on this machine.",
+    )
+    parser.add_argument(
+        "--rtp-values",
+        action="append",
+        type=_run_time_param_values,
+        default=[],
+        help="Serialized JSON of runtime parameter variable names to values. "
+        "Parameters that are not given keep their default values. With --batch, "
+        "you can specify this argument multiple times to simulate every protocol "
+        "with each set of values.",
     )
     parser.add_argument(
         "-v",
@@ -784,6 +976,9 @@ def _create_live_context_non_pe(
 
     This controls the robot through the older infrastructure, instead of through Protocol Engine.
     """
+    from opentrons import protocol_api
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+
     assert api_version < ENGINE_CORE_API_VERSION
     return protocol_api.create_protocol_context(
         api_version=api_version,
@@ -805,6 +1000,19 @@ def _create_live_context_pe(
     use_pe_virtual_hardware: bool = True,
 ) -> ProtocolContext:
     """Return a live ProtocolContext that controls the robot through ProtocolEngine."""
+    from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+
+    from opentrons import protocol_api
+    from opentrons.protocol_api.core.engine import ENGINE_CORE_API_VERSION
+    from opentrons.protocol_engine import error_recovery_policy
+    from opentrons.protocol_engine.create_protocol_engine import (
+        create_protocol_engine_in_thread,
+    )
+    from opentrons.protocol_engine.types import PostRunHardwareState
+    from opentrons.protocols.api_support.deck_type import (
+        should_load_fixed_trash_labware_for_python_protocol,
+    )
+
     assert api_version >= ENGINE_CORE_API_VERSION
     hardware_api_wrapped = hardware_api.wrapped()
     global _LIVE_PROTOCOL_ENGINE_CONTEXTS
@@ -855,6 +1063,12 @@ def _run_file_non_pe(
     duration_estimator: Optional[DurationEstimator],
 ) -> _SimulateResult:
     """Run a protocol file without Protocol Engine, with the older infrastructure instead."""
+    from opentrons.legacy_commands import types as command_types
+    from opentrons.protocols.api_support.deck_type import (
+        for_simulation as deck_type_for_simulation,
+    )
+    from opentrons.protocols.execution import execute
+
     if isinstance(protocol, PythonProtocol):
         extra_labware = protocol.extra_labware
         bundled_labware = protocol.bundled_labware
@@ -911,9 +1125,21 @@ def _run_file_pe(
     hardware_api: ThreadManagedHardware,
     stack_logger: logging.Logger,
     log_level: str,
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None,
 ) -> _SimulateResult:
     """Run a protocol file with Protocol Engine."""
-    # TODO (spp, 2024-03-18): use run-time param overrides once enabled for cli protocol simulation.
+    from opentrons.protocol_engine import error_recovery_policy
+    from opentrons.protocol_engine.create_protocol_engine import create_protocol_engine
+    from opentrons.protocol_engine.types import EngineStatus
+    from opentrons.protocol_runner import RunOrchestrator
+    from opentrons.protocol_runner.protocol_runner import (
+        create_protocol_runner,
+        LiveRunner,
+    )
+    from opentrons.protocols.api_support.deck_type import should_load_fixed_trash
+    from .util import entrypoint_util
+
+    # TODO (spp, 2024-03-18): support CSV run-time param files for cli protocol simulation.
 
     async def run(protocol_source: ProtocolSource) -> _SimulateResult:
         hardware_api_wrapped = hardware_api.wrapped()
@@ -961,6 +1187,7 @@ def _run_file_pe(
                 # the Protocol Engine config specifies use_simulated_deck_config=True.
                 deck_configuration=[],
                 protocol_source=protocol_source,
+                run_time_param_values=run_time_param_values,
             )
 
         if result.state_summary.status != EngineStatus.SUCCEEDED:
@@ -983,6 +1210,12 @@ def _get_protocol_engine_config(
     robot_type: RobotType, use_pe_virtual_hardware: bool
 ) -> Config:
     """Return a Protocol Engine config to execute protocols on this device."""
+    from opentrons.protocol_engine.state.config import Config
+    from opentrons.protocol_engine.types import DeckType
+    from opentrons.protocols.api_support.deck_type import (
+        for_simulation as deck_type_for_simulation,
+    )
+
     return Config(
         robot_type=robot_type,
         deck_type=DeckType(deck_type_for_simulation(robot_type)),
@@ -1000,6 +1233,37 @@ def _clear_live_protocol_engine_contexts() -> None:
     _LIVE_PROTOCOL_ENGINE_CONTEXTS.close()
 
 
+def _check_protocol_args(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    """Exit with a usage error if the arguments don't describe one mode of running."""
+    if args.batch:
+        if args.protocol is not None:
+            parser.error("PROTOCOL cannot be combined with --batch")
+        if args.estimate_duration:
+            parser.error("--estimate-duration cannot be combined with --batch")
+    else:
+        if args.protocol is None:
+            parser.error("the following arguments are required: PROTOCOL")
+        if len(args.rtp_values) > 1:
+            parser.error("--rtp-values can only be specified once without --batch")
+
+
+def _main_batch(args: argparse.Namespace) -> int:
+    """Run the simulation of every protocol passed with --batch."""
+    summaries = _simulate_batch(
+        protocol_paths=args.batch,
+        run_time_param_value_sets=args.rtp_values,
+        max_workers=args.jobs,
+        custom_labware_paths=args.custom_labware_path,
+        custom_data_paths=(args.custom_data_path + args.custom_data_file),
+        hardware_simulator_file_path=getattr(args, "custom_hardware_simulator_file"),
+        log_level=args.log_level,
+    )
+    print(json.dumps(summaries, indent=2))
+    return 0 if all(summary["error"] is None for summary in summaries) else 1
+
+
 # Note - this script is also set up as a setuptools entrypoint and thus does
 # an absolute minimum of work since setuptools does something odd generating
 # the scripts
@@ -1013,6 +1277,14 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    _check_protocol_args(parser, args)
+    if args.batch:
+        return _main_batch(args)
+
+    from opentrons.protocols import bundle
+    from opentrons.protocols.duration import DurationEstimator
+    from .util import entrypoint_util
+
     # TODO(mm, 2022-12-01): Configure the DurationEstimator with the correct deck type.
     duration_estimator = DurationEstimator() if args.estimate_duration else None
 
@@ -1027,6 +1299,7 @@ def main() -> int:
                 args, "custom_hardware_simulator_file"
             ),
             log_level=args.log_level,
+            run_time_param_values=args.rtp_values[0] if args.rtp_values else None,
         )
     except entrypoint_util.ProtocolEngineExecuteError as error:
         print(error.to_stderr_string(), file=sys.stderr)
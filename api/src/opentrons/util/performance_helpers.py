@@ -12,7 +12,12 @@ from opentrons.config import (
 )
 
 if typing.TYPE_CHECKING:
-    from performance_metrics import RobotActivityState, SupportsTracking
+    from performance_metrics import (
+        ActivityAggregate,
+        RobotActivityState,
+        SupportsTracking,
+        TrackingMode,
+    )
 
 
 _UnderlyingFunctionParameters = typing.ParamSpec("_UnderlyingFunctionParameters")
@@ -22,15 +27,21 @@ _UnderlyingFunction = typing.Callable[
 ]
 
 
-_should_track = ff.enable_performance_metrics(
-    RobotTypeEnum.robot_literal_to_enum(robot_configs.load().model)
-)
+_robot_type = RobotTypeEnum.robot_literal_to_enum(robot_configs.load().model)
+_should_track = ff.enable_performance_metrics(_robot_type)
+_use_compact_storage = ff.enable_compact_performance_metrics(_robot_type)
 
 
 class _StubbedTracker:
     """A stubbed tracker that does nothing."""
 
-    def __init__(self, storage_location: Path, should_track: bool) -> None:
+    def __init__(
+        self,
+        storage_location: Path,
+        should_track: bool,
+        use_binary_storage: bool = False,
+        mode: "TrackingMode" = "raw",
+    ) -> None:
         """Initialize the stubbed tracker."""
         pass
 
@@ -59,6 +70,14 @@ class _StubbedTracker:
         """Do nothing."""
         pass
 
+    def get_aggregates(self) -> typing.List["ActivityAggregate"]:
+        """Return no aggregates."""
+        return []
+
+    def close(self) -> None:
+        """Do nothing."""
+        pass
+
 
 # Ensure that _StubbedTracker implements SupportsTracking
 # but do not create a runtime dependency on performance_metrics
@@ -94,11 +113,34 @@ def _get_robot_activity_tracker() -> "SupportsTracking":
     global _robot_activity_tracker
     if _robot_activity_tracker is None:
         _robot_activity_tracker = _package_to_use(
-            get_performance_metrics_data_dir(), _should_track
+            get_performance_metrics_data_dir(),
+            _should_track,
+            use_binary_storage=_use_compact_storage,
+            mode="aggregate" if _use_compact_storage else "raw",
         )
     return _robot_activity_tracker
 
 
+def close_robot_activity_tracker() -> None:
+    """Store any buffered robot activity data and close its files.
+
+    Call this when shutting down. Anything tracked afterwards is tracked by a new
+    tracker, which stores to the same directory.
+    """
+    global _robot_activity_tracker
+    if _robot_activity_tracker is not None:
+        _robot_activity_tracker.close()
+        _robot_activity_tracker = None
+
+
+def get_activity_aggregates() -> typing.List["ActivityAggregate"]:
+    """Return live duration aggregates for every robot activity state tracked so far.
+
+    This is empty if performance metrics are disabled or not installed.
+    """
+    return _get_robot_activity_tracker().get_aggregates()
+
+
 def _track_a_function(
     state_name: "RobotActivityState",
     func: _UnderlyingFunction[_UnderlyingFunctionParameters, _UnderlyingFunctionReturn],
@@ -106,7 +148,9 @@ def _track_a_function(
     """Wrap a passed function with RobotActivityTracker.track.
 
     This function is a decorator that will track the given state for the
-    decorated function.
+    decorated function. Each call is tracked by whichever tracker is current
+    at the time, so calls after `close_robot_activity_tracker()` aren't
+    recorded into the closed tracker.
 
     Args:
         state_name: The state to annotate the tracked function with.
@@ -115,14 +159,14 @@ def _track_a_function(
     Returns:
         The decorated function.
     """
-    tracker: SupportsTracking = _get_robot_activity_tracker()
-    wrapped = tracker.track(state=state_name)(func)
 
     @functools.wraps(func)
     def wrapper(
         *args: _UnderlyingFunctionParameters.args,
         **kwargs: _UnderlyingFunctionParameters.kwargs
     ) -> _UnderlyingFunctionReturn:
+        tracker: SupportsTracking = _get_robot_activity_tracker()
+        wrapped = tracker.track(state=state_name)(func)
         try:
             return wrapped(*args, **kwargs)
         finally:
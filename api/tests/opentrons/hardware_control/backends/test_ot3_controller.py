@@ -18,6 +18,7 @@ from typing import (
     Iterator,
     AsyncIterator,
     ContextManager,
+    Collection,
 )
 
 from opentrons.hardware_control.backends.ot3controller import OT3Controller
@@ -43,6 +44,7 @@ from opentrons.config.types import (
 from opentrons.config.robot_configs import build_config_ot3
 from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
+    MessageId,
     NodeId,
     PipetteName as FirmwarePipetteName,
     USBTarget,
@@ -117,9 +119,25 @@ class MockCanMessageNotifier:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Collection[MessageId]] = None,
+        node_ids: Optional[Collection[NodeId]] = None,
     ) -> None:
         """Add listener."""
-        self._listeners.append((listener, filter))
+
+        def _filter(arbitration_id: ArbitrationId) -> bool:
+            if (
+                message_ids is not None
+                and arbitration_id.parts.message_id not in message_ids
+            ):
+                return False
+            if (
+                node_ids is not None
+                and arbitration_id.parts.originating_node_id not in node_ids
+            ):
+                return False
+            return filter is None or filter(arbitration_id)
+
+        self._listeners.append((listener, _filter))
 
     def notify(self, message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
         """Notify."""
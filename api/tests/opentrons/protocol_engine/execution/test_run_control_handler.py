@@ -55,8 +55,8 @@ async def test_pause(
     await subject.wait_for_resume()
     decoy.verify(
         mock_action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
-        await mock_state_store.wait_for(
-            condition=mock_state_store.commands.get_is_running
+        await mock_state_store.wait_for_in(
+            {"commands"}, mock_state_store.commands.get_is_running
         ),
     )
 
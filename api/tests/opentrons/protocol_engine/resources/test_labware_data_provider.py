@@ -25,6 +25,20 @@ async def test_labware_data_gets_standard_definition() -> None:
     assert result == LabwareDefinition.parse_obj(expected)
 
 
+async def test_labware_data_caches_standard_definition() -> None:
+    """It should only validate each "standard" labware definition once."""
+    result = await LabwareDataProvider().get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+    assert result is await LabwareDataProvider().get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+
+
 async def test_labware_hash_match() -> None:
     """Labware dict vs Pydantic model hashing should match.
 
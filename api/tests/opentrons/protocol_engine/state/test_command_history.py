@@ -317,3 +317,86 @@ def test_get_slice_with_filtered_list(command_history: CommandHistory) -> None:
     assert command_history.get_slice(1, 3, command_ids=filtered_list) == [
         command_entry_2.command,
     ]
+
+
+def test_copy(command_history: CommandHistory) -> None:
+    """It should make copies that don't change when either history is modified."""
+    queued_command = create_queued_command(command_id="0")
+    running_command = queued_command.copy(update={"status": CommandStatus.RUNNING})
+    command_history.append_queued_command(queued_command)
+    original = command_history.copy()
+
+    command_history.set_command_running(running_command)
+    command_history.append_queued_command(create_queued_command(command_id="1"))
+    copy = command_history.copy()
+    assert original.get_all_commands() == [queued_command]
+    assert original.get_queue_ids() == OrderedSet(["0"])
+    assert original.get_running_command() is None
+    assert not original.has("1")
+    assert copy == command_history
+
+    original.append_queued_command(create_queued_command(command_id="2"))
+    assert original.get_all_ids() == ["0", "2"]
+    assert command_history.get_all_ids() == ["0", "1"]
+    assert copy.get_all_commands() == [
+        running_command,
+        create_queued_command(command_id="1"),
+    ]
+
+
+def test_compaction() -> None:
+    """It should move older finished commands out of memory, but still return them."""
+    subject = CommandHistory(max_finished_commands_in_memory=1)
+    succeeded_commands = []
+    for command_id in ["0", "1", "2"]:
+        queued_command = create_queued_command(command_id=command_id)
+        subject.append_queued_command(queued_command)
+        subject.set_command_running(
+            queued_command.copy(update={"status": CommandStatus.RUNNING})
+        )
+        succeeded_command = queued_command.copy(
+            update={"status": CommandStatus.SUCCEEDED}
+        )
+        subject.set_command_succeeded(succeeded_command)
+        succeeded_commands.append(succeeded_command)
+    subject.append_queued_command(create_queued_command(command_id="3"))
+
+    assert [isinstance(entry, CommandEntry) for entry in subject._finished_entries] == [
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert subject.get("0") == CommandEntry(command=succeeded_commands[0], index=0)
+    assert subject.get_all_commands() == succeeded_commands + [
+        create_queued_command(command_id="3")
+    ]
+    assert subject.get_slice(1, 3) == succeeded_commands[1:]
+    assert subject.get_prev("2") == CommandEntry(command=succeeded_commands[1], index=1)
+
+
+def test_compaction_of_copies() -> None:
+    """A history and its copy should each keep their own recent finished commands."""
+
+    def finish(history: CommandHistory, command_id: str) -> None:
+        queued_command = create_queued_command(command_id=command_id)
+        history.append_queued_command(queued_command)
+        history.set_command_running(
+            queued_command.copy(update={"status": CommandStatus.RUNNING})
+        )
+        history.set_command_succeeded(
+            queued_command.copy(update={"status": CommandStatus.SUCCEEDED})
+        )
+
+    subject = CommandHistory(max_finished_commands_in_memory=1)
+    finish(subject, "0")
+    subject_copy = subject.copy()
+    finish(subject_copy, "1")
+    finish(subject, "2")
+
+    for history in (subject, subject_copy):
+        assert [
+            isinstance(entry, CommandEntry) for entry in history._finished_entries
+        ] == [False, True]
+    assert subject.get_all_ids() == ["0", "2"]
+    assert subject_copy.get_all_ids() == ["0", "1"]
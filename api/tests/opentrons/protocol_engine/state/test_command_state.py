@@ -83,6 +83,20 @@ def test_queue_command_action() -> None:
     assert subject_view.get_all() == [expected_command]
 
 
+def test_may_change_on() -> None:
+    """It should only expect to change on actions that the command store handles."""
+    subject = CommandStore(
+        is_door_open=False,
+        config=_make_config(),
+        error_recovery_policy=_placeholder_error_recovery_policy,
+    )
+
+    assert subject.may_change_on(
+        PlayAction(requested_at=datetime(year=2021, month=1, day=1))
+    )
+    assert not subject.may_change_on(actions.ResetTipsAction(labware_id="labware-id"))
+
+
 def test_latest_protocol_command_hash() -> None:
     """It should return the latest protocol command's hash."""
     subject = CommandStore(
@@ -703,6 +703,39 @@ def test_get_all_obstacle_highest_z_no_equipment(
     assert result == 0
 
 
+def test_get_all_obstacle_highest_z_memoized(
+    decoy: Decoy,
+    state_config: Config,
+    mock_labware_view: LabwareView,
+    mock_well_view: WellView,
+    mock_module_view: ModuleView,
+    mock_pipette_view: PipetteView,
+    mock_addressable_area_view: AddressableAreaView,
+) -> None:
+    """It should reuse selector results until the state generation changes."""
+    generation = 0
+    subject = GeometryView(
+        config=state_config,
+        labware_view=mock_labware_view,
+        well_view=mock_well_view,
+        module_view=mock_module_view,
+        pipette_view=mock_pipette_view,
+        addressable_area_view=mock_addressable_area_view,
+        get_generation=lambda: generation,
+    )
+    decoy.when(mock_module_view.get_all()).then_return([])
+    decoy.when(mock_labware_view.get_all()).then_return([])
+    decoy.when(mock_addressable_area_view.get_all()).then_return([])
+
+    assert subject.get_all_obstacle_highest_z() == 0
+    assert subject.get_all_obstacle_highest_z() == 0
+    decoy.verify(mock_labware_view.get_all(), times=1)
+
+    generation = 1
+    assert subject.get_all_obstacle_highest_z() == 0
+    decoy.verify(mock_labware_view.get_all(), times=2)
+
+
 def test_get_all_obstacle_highest_z(
     decoy: Decoy,
     well_plate_def: LabwareDefinition,
@@ -336,3 +336,47 @@ def test_handles_move_labware_off_deck(
     )
     assert subject.state.labware_by_id["my-labware-id"].location == OFF_DECK_LOCATION
     assert subject.state.labware_by_id["my-labware-id"].offsetId is None
+
+
+def test_unshare_state_keeps_moved_labware(
+    subject: LabwareStore,
+    well_plate_def: LabwareDefinition,
+) -> None:
+    """Moving labware after unsharing state should not change the earlier state."""
+    subject.handle_action(
+        SucceedCommandAction(
+            command=create_comment_command(),
+            state_update=update_types.StateUpdate(
+                loaded_labware=update_types.LoadedLabwareUpdate(
+                    labware_id="my-labware-id",
+                    definition=well_plate_def,
+                    offset_id=None,
+                    display_name="display-name",
+                    new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+                ),
+            ),
+        )
+    )
+    earlier_state = subject.state
+
+    subject.unshare_state()
+    subject.handle_action(
+        SucceedCommandAction(
+            command=create_comment_command(command_id="my-command-id"),
+            state_update=update_types.StateUpdate(
+                labware_location=update_types.LabwareLocationUpdate(
+                    labware_id="my-labware-id",
+                    offset_id="my-new-offset",
+                    new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_2),
+                ),
+            ),
+        )
+    )
+
+    assert earlier_state.labware_by_id["my-labware-id"].location == DeckSlotLocation(
+        slotName=DeckSlotName.SLOT_1
+    )
+    assert earlier_state.labware_by_id["my-labware-id"].offsetId is None
+    assert subject.state.labware_by_id["my-labware-id"].location == DeckSlotLocation(
+        slotName=DeckSlotName.SLOT_2
+    )
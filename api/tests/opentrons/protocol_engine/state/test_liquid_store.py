@@ -1,8 +1,9 @@
 """Liquid state store tests."""
 import pytest
+from datetime import datetime
 from opentrons.protocol_engine.state.liquids import LiquidStore
 from opentrons.protocol_engine import Liquid
-from opentrons.protocol_engine.actions.actions import AddLiquidAction
+from opentrons.protocol_engine.actions.actions import AddLiquidAction, PlayAction
 
 
 @pytest.fixture
@@ -25,3 +26,13 @@ def test_handles_add_liquid(subject: LiquidStore) -> None:
     assert len(subject.state.liquids_by_id) == 1
 
     assert subject.state.liquids_by_id["water-id"] == expected_liquid
+
+
+def test_may_change_on(subject: LiquidStore) -> None:
+    """It should only expect to change on liquid additions."""
+    assert subject.may_change_on(
+        AddLiquidAction(
+            Liquid(id="water-id", displayName="water", description="water-desc")
+        )
+    )
+    assert not subject.may_change_on(PlayAction(requested_at=datetime(2021, 1, 1)))
@@ -1,5 +1,6 @@
 """Tests for the top-level StateStore/StateView."""
-from typing import Any, Callable, Union
+import asyncio
+from typing import Any, Callable, List, Union
 from datetime import datetime
 
 import pytest
@@ -8,10 +9,10 @@ from decoy import Decoy
 from opentrons_shared_data.deck.types import DeckDefinitionV5
 from opentrons.util.change_notifier import ChangeNotifier
 
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.actions import AddLiquidAction, PlayAction
 from opentrons.protocol_engine.state.config import Config
 from opentrons.protocol_engine.state.state import State, StateStore
-from opentrons.protocol_engine.types import DeckType
+from opentrons.protocol_engine.types import DeckType, Liquid
 
 
 @pytest.fixture
@@ -91,6 +92,67 @@ def test_notify_on_state_change(
     decoy.verify(change_notifier.notify(), times=1)
 
 
+def test_substores_not_changed_keep_state(subject: StateStore) -> None:
+    """It should only pass actions to substores that might change."""
+    liquid_state = subject.state.liquids
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    assert subject.state.liquids is liquid_state
+    assert subject.liquid.get_all() == []
+
+    liquid = Liquid(id="liquid-id", displayName="water", description="")
+    subject.handle_action(AddLiquidAction(liquid=liquid))
+    assert subject.liquid.get_all() == [liquid]
+
+
+def test_snapshots_do_not_change(subject: StateStore) -> None:
+    """It should keep snapshots as they were, sharing substates that didn't change."""
+    water = Liquid(id="water-id", displayName="water", description="")
+    oil = Liquid(id="oil-id", displayName="oil", description="")
+    subject.handle_action(AddLiquidAction(liquid=water))
+
+    snapshot_1 = subject.get_snapshot()
+    subject.handle_action(AddLiquidAction(liquid=oil))
+    snapshot_2 = subject.get_snapshot()
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    snapshot_3 = subject.get_snapshot()
+
+    assert snapshot_1.liquids.liquids_by_id == {"water-id": water}
+    assert snapshot_2.liquids.liquids_by_id == {"water-id": water, "oil-id": oil}
+    assert snapshot_3.liquids is snapshot_2.liquids
+    assert snapshot_2.labware is snapshot_1.labware
+    assert snapshot_3.commands.run_started_at == datetime(year=2021, month=1, day=1)
+    assert snapshot_2.commands.run_started_at is None
+    assert subject.liquid.get_all() == [water, oil]
+
+
+async def test_wait_for_in(subject: StateStore) -> None:
+    """It should only recheck the condition when watched substores change."""
+    checked: List[int] = []
+
+    def check_condition() -> int:
+        checked.append(len(subject.liquid.get_all()))
+        return checked[-1]
+
+    task = asyncio.create_task(subject.wait_for_in({"liquids"}, check_condition))
+    await asyncio.sleep(0)
+    assert checked == [0]
+
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    await asyncio.sleep(0)
+    assert checked == [0]
+
+    subject.handle_action(
+        AddLiquidAction(
+            liquid=Liquid(id="liquid-id", displayName="water", description="")
+        )
+    )
+    assert await task == 1
+    assert checked == [0, 1]
+
+    result = await subject.wait_for_not_in({"liquids"}, lambda: 0)
+    assert result == 0
+
+
 async def test_wait_for(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
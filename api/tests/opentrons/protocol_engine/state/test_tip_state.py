@@ -877,6 +877,97 @@ def test_reset_tips(
     assert get_result() == "A1"
 
 
+def test_tip_racks_with_same_definition_tracked_separately(
+    subject: TipStore,
+    labware_definition: LabwareDefinition,
+    load_labware_action: actions.SucceedCommandAction,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    """It should keep separate tip state for racks loaded from the same definition."""
+    subject.handle_action(load_labware_action)
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            command=_dummy_command(),
+            state_update=update_types.StateUpdate(
+                loaded_labware=update_types.LoadedLabwareUpdate(
+                    labware_id="other-labware",
+                    definition=labware_definition,
+                    new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_A2),
+                    display_name=None,
+                    offset_id=None,
+                )
+            ),
+        )
+    )
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            command=_dummy_command(),
+            state_update=update_types.StateUpdate(
+                pipette_config=update_types.PipetteConfigUpdate(
+                    pipette_id="pipette-id",
+                    serial_number="pipette-serial",
+                    config=LoadedStaticPipetteData(
+                        channels=1,
+                        max_volume=15,
+                        min_volume=3,
+                        model="gen a",
+                        display_name="display name",
+                        flow_rates=FlowRates(
+                            default_aspirate={},
+                            default_dispense={},
+                            default_blow_out={},
+                        ),
+                        tip_configuration_lookup_table={15: supported_tip_fixture},
+                        nominal_tip_overlap={},
+                        nozzle_offset_z=1.23,
+                        home_position=4.56,
+                        nozzle_map=get_default_nozzle_map(
+                            PipetteNameType.P300_SINGLE_GEN2
+                        ),
+                        back_left_corner_offset=Point(x=1, y=2, z=3),
+                        front_right_corner_offset=Point(x=4, y=5, z=6),
+                        pipette_lld_settings={},
+                        plunger_positions={
+                            "top": 0.0,
+                            "bottom": 5.0,
+                            "blow_out": 19.0,
+                            "drop_tip": 20.0,
+                        },
+                        shaft_ul_per_mm=5.0,
+                        available_sensors=available_sensors,
+                    ),
+                )
+            ),
+        )
+    )
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            command=_dummy_command(),
+            state_update=update_types.StateUpdate(
+                tips_used=update_types.TipsUsedUpdate(
+                    pipette_id="pipette-id",
+                    labware_id="cool-labware",
+                    well_name="A1",
+                )
+            ),
+        )
+    )
+
+    view = TipView(subject.state)
+    assert view.has_clean_tip("cool-labware", "A1") is False
+    assert view.has_clean_tip("other-labware", "A1") is True
+    assert (
+        view.get_next_tip(
+            labware_id="other-labware",
+            num_tips=1,
+            starting_tip_name=None,
+            nozzle_map=None,
+        )
+        == "A1"
+    )
+
+
 def test_handle_pipette_config_action(
     subject: TipStore,
     supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
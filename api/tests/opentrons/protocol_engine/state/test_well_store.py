@@ -228,3 +228,72 @@ def test_handles_liquid_probe_and_aspirate(subject: WellStore) -> None:
     assert (
         subject.state.probed_volumes[labware_id][well_name].operations_since_probe == 1
     )
+
+
+def test_may_change_on(subject: WellStore) -> None:
+    """It should only expect to change on actions that update wells."""
+    load_liquid = create_load_liquid_command(
+        labware_id="labware-id", volume_by_well={"A1": 30}
+    )
+    assert subject.may_change_on(
+        SucceedCommandAction(
+            command=load_liquid,
+            state_update=update_types.StateUpdate(
+                liquid_loaded=update_types.LiquidLoadedUpdate(
+                    labware_id="labware-id",
+                    volumes={"A1": 30},
+                    last_loaded=datetime(year=2020, month=1, day=2),
+                )
+            ),
+        )
+    )
+    assert not subject.may_change_on(
+        SucceedCommandAction(
+            command=load_liquid, state_update=update_types.StateUpdate()
+        )
+    )
+
+
+def test_unshare_state_copies_only_modified_wells(subject: WellStore) -> None:
+    """After unsharing state, it should only copy the wells of labware it modifies."""
+    timestamp = datetime(year=2020, month=1, day=2)
+    load_liquid = create_load_liquid_command(
+        labware_id="labware-id", volume_by_well={"A1": 30}
+    )
+    for labware_id in ("labware-id", "other-labware-id"):
+        subject.handle_action(
+            SucceedCommandAction(
+                command=load_liquid,
+                state_update=update_types.StateUpdate(
+                    liquid_loaded=update_types.LiquidLoadedUpdate(
+                        labware_id=labware_id,
+                        volumes={"A1": 30},
+                        last_loaded=timestamp,
+                    )
+                ),
+            )
+        )
+    earlier_state = subject.state
+
+    subject.unshare_state()
+    subject.handle_action(
+        SucceedCommandAction(
+            command=create_aspirate_command(
+                pipette_id="pipette-id", volume=10, flow_rate=1
+            ),
+            state_update=update_types.StateUpdate(
+                liquid_operated=update_types.LiquidOperatedUpdate(
+                    labware_id="labware-id",
+                    well_names=["A1"],
+                    volume_added=-10,
+                )
+            ),
+        )
+    )
+
+    assert earlier_state.loaded_volumes["labware-id"]["A1"].volume == 30
+    assert subject.state.loaded_volumes["labware-id"]["A1"].volume == 20
+    assert (
+        subject.state.loaded_volumes["other-labware-id"]
+        is earlier_state.loaded_volumes["other-labware-id"]
+    )
@@ -442,8 +442,9 @@ async def test_add_and_execute_command(
     ).then_do(_stub_queued)
 
     decoy.when(
-        await state_store.wait_for(
-            condition=state_store.commands.get_command_is_final,
+        await state_store.wait_for_in(
+            {"commands"},
+            state_store.commands.get_command_is_final,
             command_id="command-id",
         ),
     ).then_do(_stub_completed)
@@ -530,8 +531,9 @@ async def test_add_and_execute_command_wait_for_recovery(
     ).then_do(_stub_queued)
 
     decoy.when(
-        await state_store.wait_for(
-            condition=state_store.commands.get_command_is_final,
+        await state_store.wait_for_in(
+            {"commands"},
+            state_store.commands.get_command_is_final,
             command_id="command-id",
         ),
     ).then_do(_stub_completed)
@@ -539,7 +541,8 @@ async def test_add_and_execute_command_wait_for_recovery(
     result = await subject.add_and_execute_command_wait_for_recovery(original_request)
     assert result == completed
     decoy.verify(
-        await state_store.wait_for_not(
+        await state_store.wait_for_not_in(
+            {"commands"},
             state_store.commands.get_recovery_in_progress_for_command,
             "command-id",
         )
@@ -902,8 +905,8 @@ async def test_wait_until_complete(
     await subject.wait_until_complete()
 
     decoy.verify(
-        await state_store.wait_for(
-            condition=state_store.commands.get_all_commands_final
+        await state_store.wait_for_in(
+            {"commands"}, state_store.commands.get_all_commands_final
         ),
         state_store.commands.raise_fatal_command_error(),
     )
@@ -514,8 +514,8 @@ async def test_command_generator(
     decoy.when(mock_protocol_engine._state_store).then_return(mock_state_store)
 
     decoy.when(
-        await mock_protocol_engine._state_store.wait_for(
-            condition=mock_protocol_engine.state_view.commands.get_next_to_execute
+        await mock_protocol_engine._state_store.wait_for_in(
+            {"commands"}, mock_protocol_engine.state_view.commands.get_next_to_execute
         )
     ).then_do(lambda *args, **kwargs: next(get_next_to_execute_results))
 
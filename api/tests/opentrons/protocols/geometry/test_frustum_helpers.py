@@ -5,9 +5,11 @@ from typing import Any, List
 from opentrons_shared_data.labware.labware_definition import (
     ConicalFrustum,
     CuboidalFrustum,
+    InnerWellGeometry,
     SphericalSegment,
 )
 from opentrons.protocol_engine.state.frustum_helpers import (
+    _closest_table_value,
     _cross_section_area_rectangular,
     _cross_section_area_circular,
     _reject_unacceptable_heights,
@@ -21,6 +23,9 @@ from opentrons.protocol_engine.state.frustum_helpers import (
     _height_from_volume_spherical,
     height_at_volume_within_section,
     _get_segment_capacity,
+    find_height_at_well_volume,
+    find_heights_at_well_volumes,
+    get_well_volumetric_capacity,
 )
 from opentrons.protocol_engine.errors.exceptions import InvalidLiquidHeightFound
 
@@ -338,3 +343,38 @@ def test_height_at_volume_within_section(well: List[Any]) -> None:
             segment, _get_segment_capacity(segment), segment_height
         )
         assert isclose(height, segment_height)
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+def test_find_heights_at_well_volumes(well: List[Any]) -> None:
+    """It should find the same heights in a batch as one at a time."""
+    well_geometry = InnerWellGeometry(sections=well)
+    max_volume = sum(
+        volume for _, volume in get_well_volumetric_capacity(well_geometry)
+    )
+    volumes = []
+    expected_heights = []
+    for volume in (max_volume * fraction / 20 for fraction in range(1, 20)):
+        try:
+            expected_heights.append(find_height_at_well_volume(volume, well_geometry))
+        except InvalidLiquidHeightFound:
+            with pytest.raises(InvalidLiquidHeightFound):
+                find_heights_at_well_volumes([volume], well_geometry)
+        else:
+            volumes.append(volume)
+
+    assert list(find_heights_at_well_volumes(volumes, well_geometry)) == (
+        expected_heights
+    )
+    with pytest.raises(InvalidLiquidHeightFound):
+        find_heights_at_well_volumes(volumes + [max_volume + 1], well_geometry)
+
+
+@pytest.mark.parametrize(
+    ["target", "expected_value"],
+    [(-1.0, 10.0), (0.4, 10.0), (0.5, 10.0), (0.6, 20.0), (1.5, 20.0), (9.0, 30.0)],
+)
+def test_closest_table_value(target: float, expected_value: float) -> None:
+    """It should look up the closest key, preferring the earliest on ties."""
+    table = {0.0: 10.0, 1.0: 20.0, 2.0: 30.0}
+    assert _closest_table_value(table, target) == expected_value
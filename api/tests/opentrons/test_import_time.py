@@ -0,0 +1,77 @@
+"""Guard against regressions in how long it takes to import our entry points.
+
+Each test imports a module in a fresh interpreter with `python -X importtime`,
+which reports every module imported along the way. This only checks which
+modules get imported, which doesn't depend on how fast the machine is. To
+check how long the imports take, run scripts/benchmark_import_time.py.
+"""
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+
+# Heavy modules that each entry point should only import once it's actually used.
+DEFERRED_IMPORTS = {
+    "opentrons": [
+        "opentrons.hardware_control.api",
+        "opentrons.drivers.smoothie_drivers",
+        "opentrons.protocol_engine",
+    ],
+    "opentrons.simulate": [
+        "opentrons.hardware_control.api",
+        "opentrons.protocol_api",
+        "opentrons.protocol_engine",
+    ],
+    "opentrons.execute": [
+        "opentrons.hardware_control.api",
+        "opentrons.protocol_api",
+        "opentrons.protocol_engine",
+    ],
+}
+
+
+def _imported_modules(module: str) -> List[str]:
+    """Import `module` in a fresh interpreter and return every module it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported: List[str] = []
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            # Everything but the header line.
+            imported.append(name.strip())
+    return imported
+
+
+@pytest.mark.parametrize(("module", "deferred"), DEFERRED_IMPORTS.items())
+def test_heavy_imports_are_deferred(module: str, deferred: List[str]) -> None:
+    """Importing an entry point should not import its heavy dependencies."""
+    imported = _imported_modules(module)
+    assert module in imported
+    for heavy_module in deferred:
+        assert [
+            name
+            for name in imported
+            if name == heavy_module or name.startswith(f"{heavy_module}.")
+        ] == []
+
+
+def test_lazy_hardware_control_exports() -> None:
+    """The names that hardware_control loads on demand should still be importable."""
+    import opentrons.hardware_control as hardware_control
+    from opentrons.hardware_control.api import API
+
+    assert hardware_control.API is API
+    for name in hardware_control.__all__:
+        assert getattr(hardware_control, name) is not None
+    with pytest.raises(AttributeError):
+        getattr(hardware_control, "NotARealName")
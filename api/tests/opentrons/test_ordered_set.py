@@ -123,6 +123,17 @@ def test_clear() -> None:
     assert list(subject) == []
 
 
+def test_copy() -> None:
+    """A copy should have the same elements, and be independent of the original."""
+    subject = OrderedSet([3, 1, 2])
+    result = subject.copy()
+    assert result == subject
+    result.add(4)
+    subject.discard(3)
+    assert list(subject) == [1, 2]
+    assert list(result) == [3, 1, 2, 4]
+
+
 def test_head() -> None:
     """It should return the head of the set."""
     subject = OrderedSet([1, 2])
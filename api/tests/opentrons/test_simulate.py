@@ -165,6 +165,137 @@ def test_simulate_function_v1(protocol: Protocol, protocol_file: str) -> None:
         simulate.simulate(protocol.filelike, "testosaur.py")
 
 
+@pytest.mark.parametrize("protocol_file", ["testosaur_with_rtp.py"])
+def test_simulate_run_time_param_values(protocol: Protocol, protocol_file: str) -> None:
+    """Test `simulate()` with overridden runtime parameter values."""
+    run_log, _ = simulate.simulate(
+        protocol.filelike,
+        protocol.filename,
+        run_time_param_values={"sample_count": 1, "mount": "right"},
+    )
+    assert [item["payload"]["text"] for item in run_log] == [
+        "Picking up tip from A1 of Opentrons OT-2 96 Tip Rack 300 µL on slot 8",
+        "Aspirating 50.0 uL from A1 of NEST 12 Well Reservoir 15 mL on slot 1 at 92.86 uL/sec",
+        "Dispensing 50.0 uL into A1 of Corning 96 Well Plate 360 µL Flat on slot 2 at 92.86 uL/sec",
+        "Returning tip",
+        "Dropping tip into A1 of Opentrons OT-2 96 Tip Rack 300 µL on slot 8",
+    ]
+
+
+def test_simulate_batch(tmp_path: Path) -> None:
+    """Test simulating many protocols in parallel."""
+    broken_protocol = tmp_path / "broken.py"
+    broken_protocol.write_text(
+        textwrap.dedent(
+            """\
+            requirements = {"apiLevel": "2.18"}
+            def run(protocol):
+                print("This should not go to stdout.")
+                raise RuntimeError("oh no")
+            """
+        )
+    )
+    protocol_paths = [
+        str(HERE / "data" / "testosaur_with_rtp.py"),
+        str(broken_protocol),
+    ]
+
+    summaries = simulate._simulate_batch(
+        protocol_paths=protocol_paths,
+        run_time_param_value_sets=[{}, {"sample_count": 1}],
+        max_workers=2,
+        custom_labware_paths=[],
+        custom_data_paths=[],
+        hardware_simulator_file_path=None,
+        log_level="warning",
+    )
+
+    assert [
+        (summary["protocol"], summary["runTimeParameterValues"], summary["status"])
+        for summary in summaries
+    ] == [
+        (protocol_paths[0], {}, "succeeded"),
+        (protocol_paths[0], {"sample_count": 1}, "succeeded"),
+        (protocol_paths[1], {}, "failed"),
+        (protocol_paths[1], {"sample_count": 1}, "failed"),
+    ]
+    assert summaries[0]["commandCount"] > summaries[1]["commandCount"]
+    assert summaries[0]["error"] is None
+    assert all(summary["durationSeconds"] > 0 for summary in summaries)
+    assert summaries[2]["error"]["errorType"] == "ProtocolEngineExecuteError"
+    assert "oh no" in summaries[2]["error"]["detail"]
+
+
+def test_simulate_batch_worker_failures(tmp_path: Path) -> None:
+    """Test that a batch summarizes protocols that exit or kill their worker."""
+    exiting_protocol = tmp_path / "exiting.py"
+    exiting_protocol.write_text(
+        textwrap.dedent(
+            """\
+            import sys
+            requirements = {"apiLevel": "2.18"}
+            def run(protocol):
+                sys.exit(3)
+            """
+        )
+    )
+    crashing_protocol = tmp_path / "crashing.py"
+    crashing_protocol.write_text(
+        textwrap.dedent(
+            """\
+            import os
+            requirements = {"apiLevel": "2.18"}
+            def run(protocol):
+                os._exit(1)
+            """
+        )
+    )
+
+    summaries = simulate._simulate_batch(
+        protocol_paths=[str(exiting_protocol), str(crashing_protocol)],
+        run_time_param_value_sets=[],
+        max_workers=1,
+        custom_labware_paths=[],
+        custom_data_paths=[],
+        hardware_simulator_file_path=None,
+        log_level="warning",
+    )
+
+    assert [summary["status"] for summary in summaries] == ["failed", "failed"]
+    assert summaries[0]["error"]["errorType"] == "SystemExit"
+    assert summaries[1]["protocol"] == str(crashing_protocol)
+    assert summaries[1]["error"]["errorType"] == "BrokenProcessPool"
+    assert summaries[1]["durationSeconds"] is None
+
+
+def test_main_batch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that `opentrons_simulate --batch` prints a JSON summary."""
+    protocol_path = str(HERE / "data" / "testosaur_with_rtp.py")
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "opentrons_simulate",
+            "-L",
+            str(tmp_path),
+            "--batch",
+            protocol_path,
+            "--rtp-values",
+            '{"mount": "right"}',
+        ],
+    )
+
+    assert simulate.main() == 0
+    summaries = json.loads(capsys.readouterr().out)
+    assert len(summaries) == 1
+    assert summaries[0]["protocol"] == protocol_path
+    assert summaries[0]["runTimeParameterValues"] == {"mount": "right"}
+    assert summaries[0]["status"] == "succeeded"
+
+
 @pytest.mark.parametrize("protocol_file", ["bug_aspirate_tip.py"])
 def test_simulate_aspirate_tip(
     protocol: Protocol,
@@ -1,9 +1,16 @@
 """Tests for performance_helpers."""
 
 from pathlib import Path
+
+import pytest
+from decoy import Decoy
+
+from opentrons.util import performance_helpers
 from opentrons.util.performance_helpers import (
     _StubbedTracker,
     _get_robot_activity_tracker,
+    _track_a_function,
+    close_robot_activity_tracker,
 )
 
 
@@ -22,3 +29,35 @@ def test_singleton_tracker() -> None:
     tracker = _get_robot_activity_tracker()
     tracker2 = _get_robot_activity_tracker()
     assert tracker is tracker2
+
+
+def test_close_tracker() -> None:
+    """Test that closing the tracker makes the next one a new tracker."""
+    tracker = _get_robot_activity_tracker()
+    close_robot_activity_tracker()
+    assert _get_robot_activity_tracker() is not tracker
+
+
+def test_tracked_function_uses_current_tracker(
+    decoy: Decoy, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a tracked function doesn't keep using a closed tracker."""
+    closed_tracker = decoy.mock(cls=_StubbedTracker)
+    current_tracker = decoy.mock(cls=_StubbedTracker)
+    decoy.when(current_tracker.track(state="ANALYZING_PROTOCOL")).then_return(
+        lambda func: func
+    )
+
+    monkeypatch.setattr(performance_helpers, "_robot_activity_tracker", closed_tracker)
+    tracked = _track_a_function("ANALYZING_PROTOCOL", lambda: 42)
+    monkeypatch.setattr(performance_helpers, "_robot_activity_tracker", current_tracker)
+
+    assert tracked() == 42
+    decoy.verify(current_tracker.store(), times=1)
+    decoy.verify(closed_tracker.store(), times=0)
+
+
+def test_stubbed_tracker_has_no_aggregates() -> None:
+    """Test that _StubbedTracker reports no aggregates."""
+    tracker = _StubbedTracker(Path("/path/to/storage"), True)
+    assert tracker.get_aggregates() == []
@@ -1,6 +1,7 @@
 """The can bus transport."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import Sequence
 from opentrons_hardware.firmware_bindings import CanMessage
 
 
@@ -19,6 +20,20 @@ class AbstractCanDriver(ABC):
         """
         ...
 
+    async def send_many(self, messages: Sequence[CanMessage]) -> None:
+        """Send can messages in order.
+
+        Drivers that can write several frames in one pass should override this.
+
+        Args:
+            messages: The messages to send.
+
+        Returns:
+            None
+        """
+        for message in messages:
+            await self.send(message)
+
     @abstractmethod
     async def read(self) -> CanMessage:
         """Read a message.
@@ -1,6 +1,9 @@
 """Can messenger class."""
 from __future__ import annotations
 import asyncio
+import bisect
+import time
+from dataclasses import dataclass, field
 from inspect import Traceback
 from typing import (
     Optional,
@@ -13,6 +16,9 @@ from typing import (
     TypeVar,
     Type,
     Set,
+    Sequence,
+    Collection,
+    FrozenSet,
 )
 
 import logging
@@ -65,6 +71,43 @@ _Gripper_SubNodes: List[NodeId] = [NodeId.gripper_g, NodeId.gripper_z]
 _Head_SubNodes: List[NodeId] = [NodeId.head_l, NodeId.head_r]
 
 
+LATENCY_BUCKETS_SEC: Tuple[float, ...] = (
+    10e-6,
+    20e-6,
+    50e-6,
+    100e-6,
+    200e-6,
+    500e-6,
+    1e-3,
+    2e-3,
+    5e-3,
+    10e-3,
+)
+"""Upper bounds of the message handling latency histogram buckets.
+
+The histogram has one more bucket than this for latencies above the last bound.
+"""
+
+
+@dataclass
+class MessageStatistics:
+    """How many messages with one message id were received and how long they took."""
+
+    count: int = 0
+    latency_histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_SEC) + 1)
+    )
+    """Messages per latency bucket, from reading the frame to the last listener."""
+
+
+@dataclass(frozen=True)
+class _ListenerEntry:
+    listener: MessageListenerCallback
+    filter: Optional[MessageListenerCallbackFilter]
+    message_ids: Optional[FrozenSet[int]]
+    node_ids: Optional[FrozenSet[int]]
+
+
 class AcknowledgeListener:
     """Helper class for CanMessenger to listen for Acks back from commands."""
 
@@ -135,12 +178,7 @@ class AcknowledgeListener:
     async def send_and_verify_recieved(self) -> ErrorCode:
         """Send the message and wait for an Ack."""
         try:
-            self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
-            )
+            self._can_messenger.add_listener(self, message_ids=_AckIdFilter)
             self._event.clear()
             if self._exclusive:
                 await self._can_messenger.send_exclusive(self._node_id, self._message)
@@ -186,10 +224,11 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
-        ] = {}
+        self._listeners: Dict[MessageListenerCallback, _ListenerEntry] = {}
+        # The listeners that may want each message id, in the order they were
+        # added. Rebuilt lazily whenever a listener is added or removed.
+        self._dispatch_table: Dict[int, List[_ListenerEntry]] = {}
+        self._statistics: Dict[int, MessageStatistics] = {}
         self._task: Optional[asyncio.Task[None]] = None
         self._access_lock = asyncio.Lock()
         self._exclusive_condvar = asyncio.Condition(self._access_lock)
@@ -213,7 +252,30 @@ class CanMessenger:
         """Send while the exclusive ock is held."""
         return await self._send(node_id, message)
 
-    async def _send(self, node_id: NodeId, message: MessageDefinition) -> None:
+    async def send_batch(
+        self, messages: Sequence[Tuple[NodeId, MessageDefinition]]
+    ) -> None:
+        """Send messages in order, serializing them all up front.
+
+        The exclusive lock is taken once for the whole batch and the driver
+        writes every frame in one pass.
+        """
+        can_messages = [
+            self._build_can_message(node_id, message) for node_id, message in messages
+        ]
+        async with self._exclusive_lock:
+            try:
+                await self._drive.send_many(can_messages)
+            except EnumeratedError:
+                raise
+            except Exception as exc:
+                log.exception("Exception in CAN send")
+                raise CanbusCommunicationError(
+                    message="Exception in canbus.send", wrapping=[PythonException(exc)]
+                )
+
+    @staticmethod
+    def _build_can_message(node_id: NodeId, message: MessageDefinition) -> CanMessage:
         func = (
             FunctionCode.error
             if message.message_id == MessageId.error_message
@@ -230,13 +292,15 @@ class CanMessenger:
         )
         data = message.payload.serialize()
         log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
+            "Sending -->\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            message.payload,
         )
+        return CanMessage(arbitration_id=arbitration_id, data=data)
+
+    async def _send(self, node_id: NodeId, message: MessageDefinition) -> None:
         try:
-            await self._drive.send(
-                message=CanMessage(arbitration_id=arbitration_id, data=data)
-            )
+            await self._drive.send(message=self._build_can_message(node_id, message))
         except EnumeratedError:
             raise
         except Exception as exc:
@@ -344,14 +408,76 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Collection[MessageId]] = None,
+        node_ids: Optional[Collection[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: Called with each accepted message.
+            filter: Optional function that accepts or rejects each message.
+            message_ids: If set, only messages with these ids are offered to
+                the listener. Prefer this to checking the id in a filter, since
+                the read loop never looks at listeners for other ids.
+            node_ids: If set, only messages from these originating nodes are
+                offered to the listener.
+        """
+        self._listeners[listener] = _ListenerEntry(
+            listener=listener,
+            filter=filter,
+            message_ids=frozenset(message_ids) if message_ids is not None else None,
+            node_ids=frozenset(node_ids) if node_ids is not None else None,
+        )
+        self._dispatch_table.clear()
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
         if listener in self._listeners:
             self._listeners.pop(listener)
+            self._dispatch_table.clear()
+
+    def get_message_statistics(self) -> Dict[MessageId, MessageStatistics]:
+        """Get the count and handling latency of each received message id."""
+        return {
+            MessageId(message_id): MessageStatistics(
+                count=stats.count, latency_histogram=list(stats.latency_histogram)
+            )
+            for message_id, stats in self._statistics.items()
+        }
+
+    def _get_dispatch_entries(self, message_id: int) -> List[_ListenerEntry]:
+        entries = self._dispatch_table.get(message_id)
+        if entries is None:
+            entries = [
+                entry
+                for entry in self._listeners.values()
+                if entry.message_ids is None or message_id in entry.message_ids
+            ]
+            self._dispatch_table[message_id] = entries
+        return entries
+
+    def _dispatch(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> bool:
+        """Call the listeners that accept the message. Returns whether any did."""
+        handled = False
+        node_id = arbitration_id.parts.originating_node_id
+        for entry in self._get_dispatch_entries(arbitration_id.parts.message_id):
+            if entry.node_ids is not None and node_id not in entry.node_ids:
+                continue
+            if entry.filter and not entry.filter(arbitration_id):
+                continue
+            entry.listener(message, arbitration_id)
+            handled = True
+        return handled
+
+    def _record_statistics(self, message_id: int, received_at: float) -> None:
+        stats = self._statistics.get(message_id)
+        if stats is None:
+            stats = self._statistics[message_id] = MessageStatistics()
+        stats.count += 1
+        latency = time.perf_counter() - received_at
+        stats.latency_histogram[bisect.bisect_left(LATENCY_BUCKETS_SEC, latency)] += 1
 
     async def _read_task_shield(self) -> None:
         while True:
@@ -366,34 +492,31 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
+            received_at = time.perf_counter()
+            arbitration_id = message.arbitration_id
+            message_id = arbitration_id.parts.message_id
+            message_definition = get_definition(MessageId(message_id))
             if message_definition:
                 try:
                     build = message_definition.payload_type.build(message.data)
                     log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
+                        "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+                        arbitration_id,
+                        build,
+                    )
+                    handled = self._dispatch(
+                        message_definition(payload=build), arbitration_id  # type: ignore[arg-type]
                     )
-                    handled = False
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                        handled = True
                     if not handled:
-                        if (
-                            message.arbitration_id.parts.message_id
-                            == MessageId.error_message
-                        ):
-                            log.error(f"Asynchronous error message ignored: {message}")
+                        if message_id == MessageId.error_message:
+                            log.error("Asynchronous error message ignored: %s", message)
                         else:
-                            log.info(f"Message ignored: {message}")
+                            log.info("Message ignored: %s", message)
                 except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
+                    log.exception("Failed to build from %s", message)
+                self._record_statistics(message_id, received_at)
             else:
-                log.error(f"Message {message} is not recognized.")
+                log.error("Message %s is not recognized.", message)
 
     @property
     def exclusive_writer(self) -> asyncio.Lock:
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import logging
 import asyncio
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Sequence, List
 import concurrent.futures
 
 from opentrons_shared_data.errors.exceptions import CANBusBusError
@@ -89,13 +89,37 @@ class CanDriver(AbstractCanDriver):
         Returns:
             None
         """
-        m = Message(
+        await self._loop.run_in_executor(
+            self._executor, self._bus.send, self._to_bus_message(message)
+        )
+
+    async def send_many(self, messages: Sequence[CanMessage]) -> None:
+        """Send can messages in order with a single executor job.
+
+        Args:
+            messages: The messages to send.
+
+        Returns:
+            None
+        """
+        await self._loop.run_in_executor(
+            self._executor,
+            self._send_bus_messages,
+            [self._to_bus_message(message) for message in messages],
+        )
+
+    def _send_bus_messages(self, messages: List[Message]) -> None:
+        for m in messages:
+            self._bus.send(m)
+
+    @staticmethod
+    def _to_bus_message(message: CanMessage) -> Message:
+        return Message(
             arbitration_id=message.arbitration_id.id,
             is_extended_id=True,
             is_fd=True,
             data=message.data,
         )
-        await self._loop.run_in_executor(self._executor, self._bus.send, m)
 
     async def read(self) -> CanMessage:
         """Read a message.
@@ -4,6 +4,7 @@ from typing_extensions import Final
 import logging
 import struct
 import asyncio
+from typing import Sequence
 
 from opentrons_shared_data.errors.exceptions import CanbusCommunicationError
 
@@ -49,13 +50,20 @@ class SocketDriver(AbstractCanDriver):
 
     async def send(self, message: CanMessage) -> None:
         """Send a message."""
-        data = struct.pack(
+        self._writer.write(self._pack(message))
+
+    async def send_many(self, messages: Sequence[CanMessage]) -> None:
+        """Send messages in order with a single write."""
+        self._writer.write(b"".join(self._pack(message) for message in messages))
+
+    @staticmethod
+    def _pack(message: CanMessage) -> bytes:
+        return struct.pack(
             f">LL{len(message.data)}s",
             message.arbitration_id.id,
             len(message.data),
             message.data,
         )
-        self._writer.write(data)
 
     async def read(self) -> CanMessage:
         """Read a message."""
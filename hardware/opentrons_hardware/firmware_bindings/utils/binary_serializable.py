@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type, Optional, Dict, Any, Sequence
+from dataclasses import dataclass, fields
+from typing import (
+    TypeVar,
+    Generic,
+    Type,
+    Optional,
+    Dict,
+    Any,
+    Sequence,
+    Tuple,
+    Callable,
+)
 
 from opentrons_shared_data.errors.exceptions import (
     InternalMessageFormatError,
@@ -166,6 +176,20 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+@dataclass(frozen=True)
+class _Codec:
+    """The compiled struct and field layout of a BinarySerializable class."""
+
+    struct: struct.Struct
+    names: Tuple[str, ...]
+    builders: Tuple[Callable[[Any], BinaryFieldBase[Any]], ...]
+    init_positions: Tuple[int, ...]
+    non_init_positions: Tuple[Tuple[str, int], ...]
+
+
+_codecs: Dict[Type[BinarySerializable], _Codec] = {}
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -185,10 +209,11 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(
+                *(getattr(self, name).value for name in codec.names)
+            )
         except struct.error as e:
             raise SerializationException(e)
 
@@ -209,32 +234,43 @@ class BinarySerializable:
         Returns:
             cls
         """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
-            # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
-            args = {
-                v.name: v.type.build(b[i])
-                for i, v in enumerate(fields(cls))
-                if not (v.name == "message_index")
-            }
-            message_index = next(
-                (
-                    v.type.build(b[i])
-                    for i, v in enumerate(fields(cls))
-                    if v.name == "message_index"
-                ),
-                None,
-            )
-            ret_instance = cls(**args)
-            if message_index is not None:
-                ret_instance.message_index = message_index  # type: ignore[attr-defined]
-            return ret_instance
+            b = codec.struct.unpack_from(data)
         except struct.error as e:
             raise InvalidFieldException("Bad data for field", data, e)
+        values = [build(v) for build, v in zip(codec.builders, b)]
+        ret_instance = cls(*(values[i] for i in codec.init_positions))
+        # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
+        # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
+        for name, i in codec.non_init_positions:
+            setattr(ret_instance, name, values[i])
+        return ret_instance
+
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the codec for this class, compiling it on first use.
+
+        This can't happen in `__init_subclass__` because the dataclass fields
+        only exist once the `dataclass` decorator has run on the subclass.
+        """
+        codec = _codecs.get(cls)
+        if codec is None:
+            dataclass_fields = fields(cls)
+            codec = _Codec(
+                struct=struct.Struct(cls._get_format_string()),
+                names=tuple(v.name for v in dataclass_fields),
+                builders=tuple(v.type.build for v in dataclass_fields),
+                init_positions=tuple(
+                    i for i, v in enumerate(dataclass_fields) if v.init
+                ),
+                non_init_positions=tuple(
+                    (v.name, i) for i, v in enumerate(dataclass_fields) if not v.init
+                ),
+            )
+            _codecs[cls] = codec
+        return codec
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -258,7 +294,7 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().struct.size
 
 
 class LittleEndianMixIn:
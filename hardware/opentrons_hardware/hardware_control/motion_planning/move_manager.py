@@ -1,6 +1,10 @@
 """Move manager."""
 import logging
-from typing import List, Tuple, Generic
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Set, Tuple, Generic
+
+import numpy as np
+
 from opentrons_hardware.hardware_control.motion_planning import move_utils
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
@@ -13,18 +17,33 @@ from opentrons_hardware.hardware_control.motion_planning.types import (
 
 log = logging.getLogger(__name__)
 
+DEFAULT_PLAN_CACHE_SIZE = 128
+
 
 class MoveManager(Generic[AxisKey]):
     """A manager that handles a list of moves for the hardware control system."""
 
-    def __init__(self, constraints: SystemConstraints[AxisKey]) -> None:
+    def __init__(
+        self,
+        constraints: SystemConstraints[AxisKey],
+        plan_cache_size: int = DEFAULT_PLAN_CACHE_SIZE,
+    ) -> None:
         """Constructor.
 
         Args:
             constraints: system contraints
+            plan_cache_size: how many planned motions to keep for reuse. A plan
+                only depends on the targets relative to the origin, the target
+                speeds and the constraints, so repeated motions like moving
+                between the same wells of different columns are only planned
+                once. 0 disables the cache.
         """
         self._constraints = constraints
         self._blend_log: List[List[Move[AxisKey]]] = []
+        self._plan_cache_size = plan_cache_size
+        self._plan_cache: "OrderedDict[Hashable, Tuple[bool, List[List[Move[AxisKey]]]]]" = (
+            OrderedDict()
+        )
 
     def update_constraints(self, constraints: SystemConstraints[AxisKey]) -> None:
         """Update system constraints when instruments are changed."""
@@ -57,39 +76,108 @@ class MoveManager(Generic[AxisKey]):
         end_move = Move.build_dummy(move_list[0].unit_vector.keys())
         return [start_move] + move_list + [end_move]
 
+    def _plan_cache_key(
+        self,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        iteration_limit: int,
+    ) -> Optional[Hashable]:
+        """Key a motion plan by everything that the planned moves depend on.
+
+        The axes are ordered the way targets_to_moves orders them and the
+        displacements are worked out with the same float operations, so equal
+        keys always give identical plans.
+        """
+        all_axes: Set[AxisKey] = set()
+        for target in target_list:
+            all_axes.update(set(target.position.keys()))
+        if any(axis not in self._constraints for axis in all_axes):
+            return None
+        axes = tuple(all_axes)
+
+        values = []
+        previous = np.array([np.float64(origin.get(k, 0)) for k in axes])
+        for target in target_list:
+            position = np.array([np.float64(target.position.get(k, 0)) for k in axes])
+            values.append(position - previous)
+            values.append(np.array([target.max_speed], dtype=np.float64))
+            previous = position
+        for axis in axes:
+            axis_constraints = self._constraints[axis]
+            values.append(
+                np.array(
+                    [
+                        axis_constraints.max_acceleration,
+                        axis_constraints.max_speed_discont,
+                        axis_constraints.max_direction_change_speed_discont,
+                        axis_constraints.max_speed,
+                    ],
+                    dtype=np.float64,
+                )
+            )
+        return axes, iteration_limit, np.concatenate(values).tobytes()
+
     def plan_motion(
         self,
         origin: Coordinates[AxisKey, CoordinateValue],
         target_list: List[MoveTarget[AxisKey]],
         iteration_limit: int = 10,
     ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
-        """Create and blend moves from targets."""
+        """Create and blend moves from targets.
+
+        Plans are cached, so the returned moves may be shared with earlier and
+        later calls and must not be modified.
+        """
+        key = (
+            self._plan_cache_key(origin, target_list, iteration_limit)
+            if self._plan_cache_size > 0
+            else None
+        )
+        if key is not None and key in self._plan_cache:
+            self._plan_cache.move_to_end(key)
+            converged, blend_log = self._plan_cache[key]
+            self._blend_log = [list(moves) for moves in blend_log]
+            return converged, self._blend_log
+
+        converged, blend_log = self._blend(origin, target_list, iteration_limit)
+        if key is not None:
+            self._plan_cache[key] = (
+                converged,
+                [list(moves) for moves in blend_log],
+            )
+            if len(self._plan_cache) > self._plan_cache_size:
+                self._plan_cache.popitem(last=False)
+        return converged, blend_log
+
+    def _build_moves(self, to_blend: List[Move[AxisKey]]) -> List[Move[AxisKey]]:
+        """Build every move between the dummy start and end moves."""
+        if len(to_blend) > 3:
+            return move_utils.build_moves_vectorized(to_blend, self._constraints)
+        # the array set up costs more than it saves for a single move
+        return [
+            move_utils.build_move(
+                to_blend[1], to_blend[0], to_blend[2], self._constraints
+            )
+        ]
+
+    def _blend(
+        self,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        iteration_limit: int,
+    ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
         self._clear_blend_log()
         to_blend = self._get_initial_moves_from_targets(origin, target_list)
         assert to_blend, "Check target list"
         for i in range(iteration_limit):
-            log.debug(f"Motion blending iteration: {i}")
-            blend_log = []
-            moveiter = iter(to_blend)
-            first = next(moveiter)
-            middle = next(moveiter)
-            while True:
-                try:
-                    last = next(moveiter)
-                    blend_log.append(
-                        move_utils.build_move(middle, first, last, self._constraints)
-                    )
-                    first = middle
-                    middle = last
-                except StopIteration:
-                    if blend_log:
-                        self._blend_log.append(blend_log)
-                    break
-            if move_utils.all_blended(self._constraints, self._blend_log[i]):
+            log.debug("Motion blending iteration: %d", i)
+            self._blend_log.append(self._build_moves(to_blend))
+            if move_utils.all_blended_vectorized(self._constraints, self._blend_log[i]):
                 log.debug(
-                    f"built {len(self._blend_log[i])} moves with "
-                    f"{sum(list(m.nonzero_blocks for m in self._blend_log[i]))} "
-                    f"non-zero blocks after {i+1} iteration(s)"
+                    "built %d moves with %d non-zero blocks after %d iteration(s)",
+                    len(self._blend_log[i]),
+                    sum(m.nonzero_blocks for m in self._blend_log[i]),
+                    i + 1,
                 )
                 return True, self._blend_log
             else:
@@ -214,7 +214,7 @@ def targets_to_moves(
             m = _unit_vector_to_move(
                 unit_vector, distance, target.max_speed, constraints
             )
-            log.debug(f"Built move from {initial} to {target} as {m}")
+            log.debug("Built move from %s to %s as %s", initial, target, m)
             yield m
         initial_checked = position
 
@@ -424,14 +424,6 @@ def build_blocks(
     - have at most one constant deceleration phase to meet our final speed
     - have at most one 0 acceleration coast phase at our max speed
     """
-    log = logging.getLogger("build_blocks")
-    assert abs(initial_speed) <= max_speed or np.isclose(
-        abs(initial_speed), max_speed
-    ), f"initial speed {initial_speed} exceeds max speed {max_speed}"
-    assert abs(final_speed) <= max_speed or np.isclose(
-        abs(final_speed), max_speed
-    ), f"final speed {final_speed} exceeds max speed {max_speed}"
-
     max_acc: np.typing.NDArray[np.float64] = np.array(
         [
             constraints[axis].max_acceleration if unit_vector[axis] else 0.0
@@ -445,6 +437,25 @@ def build_blocks(
         if abs(a_i) > max_acc_i:
             acc_v *= max_acc_i / a_i
     max_acceleration = np.linalg.norm(acc_v)
+    return _build_blocks_for_acceleration(
+        initial_speed, final_speed, distance, max_speed, max_acceleration
+    )
+
+
+def _build_blocks_for_acceleration(
+    initial_speed: np.float64,
+    final_speed: np.float64,
+    distance: np.float64,
+    max_speed: np.float64,
+    max_acceleration: np.float64,
+) -> Tuple[Block, Block, Block]:
+    log = logging.getLogger("build_blocks")
+    assert abs(initial_speed) <= max_speed or np.isclose(
+        abs(initial_speed), max_speed
+    ), f"initial speed {initial_speed} exceeds max speed {max_speed}"
+    assert abs(final_speed) <= max_speed or np.isclose(
+        abs(final_speed), max_speed
+    ), f"final speed {final_speed} exceeds max speed {max_speed}"
 
     initial_speed_sq = initial_speed**2
     final_speed_sq = final_speed**2
@@ -456,9 +467,14 @@ def build_blocks(
     max_speed_sq = max_speed**2
 
     log.debug(
-        f"{initial_speed} mm/s to {final_speed} mm/s in {distance} mm "
-        f"with {max_acceleration} mm/s2 max a "
-        f"gives {max_achievable_speed} mm/s limited to {max_speed} mm/s"
+        "%s mm/s to %s mm/s in %s mm with %s mm/s2 max a "
+        "gives %s mm/s limited to %s mm/s",
+        initial_speed,
+        final_speed,
+        distance,
+        max_acceleration,
+        max_achievable_speed,
+        max_speed,
     )
 
     first = Block(
@@ -538,7 +554,7 @@ def build_move(
             constraints,
         ),
     )
-    log.debug(f"applied constraints to {move} generating {m}")
+    log.debug("applied constraints to %s generating %s", move, m)
     return m
 
 
@@ -620,6 +636,249 @@ def all_blended(
             return True
 
 
+def _row_norms(rows: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    # The norm of a copy of each row rather than a norm along an axis, so that
+    # each value is rounded exactly like the norm of a single move's vector.
+    return np.array([np.linalg.norm(row.copy()) for row in rows], dtype=np.float64)
+
+
+def _axis_constraint_values(
+    constraints: SystemConstraints[AxisKey], axes: List[AxisKey]
+) -> Tuple["NDArray[np.float64]", "NDArray[np.float64]", "NDArray[np.float64]"]:
+    axis_constraints = [constraints[axis] for axis in axes]
+    return (
+        np.array([c.max_acceleration for c in axis_constraints], dtype=np.float64),
+        np.array([c.max_speed_discont for c in axis_constraints], dtype=np.float64),
+        np.array(
+            [c.max_direction_change_speed_discont for c in axis_constraints],
+            dtype=np.float64,
+        ),
+    )
+
+
+def _junction_speed_limits(
+    discont: "NDArray[np.float64]",
+    direction_change_discont: "NDArray[np.float64]",
+    components: "NDArray[np.float64]",
+    neighbour_components: "NDArray[np.float64]",
+    neighbour_speeds: "NDArray[np.float64]",
+) -> Tuple["NDArray[np.float64]", "NDArray[np.bool_]"]:
+    """Array version of initial_speed_limit_from_axis and final_speed_limit_from_axis.
+
+    The limits are found for every move and axis at once, from the unit vector
+    components and junction speeds of the neighbouring moves. Also returns which
+    entries fit none of the cases, which the scalar versions fail an assertion on.
+    """
+    stopped = (neighbour_components == 0) | (neighbour_speeds == 0)
+    directions = neighbour_components * components
+    same_direction = directions > 0
+    changed_direction = directions < 0
+    limits = np.where(
+        stopped,
+        abs(discont / components),
+        np.where(
+            same_direction,
+            abs(
+                np.maximum(abs(neighbour_speeds * neighbour_components), discont)
+                / components
+            ),
+            abs(direction_change_discont / components),
+        ),
+    )
+    return limits, ~(stopped | same_direction | changed_direction)
+
+
+def _limit_speeds(
+    speeds: "NDArray[np.float64]",
+    components: "NDArray[np.float64]",
+    limits: "NDArray[np.float64]",
+    failed: "NDArray[np.bool_]",
+    message: str,
+) -> "NDArray[np.float64]":
+    """Lower each speed to the limit of every axis that is moving, in axis order."""
+    check_failed = failed.any()
+    for i in range(components.shape[1]):
+        moving = ~(abs(components[:, i] * speeds) < FLOAT_THRESHOLD)
+        if check_failed:
+            assert not (moving & failed[:, i]).any(), message
+        speeds = np.where(moving, np.minimum(limits[:, i], speeds), speeds)
+    return speeds
+
+
+def build_moves_vectorized(
+    moves: List[Move[AxisKey]], constraints: SystemConstraints[AxisKey]
+) -> List[Move[AxisKey]]:
+    """Build every move in the list except the first and last one.
+
+    This gives the same moves as calling build_move on each move with its
+    neighbours, but finds the junction speeds and accelerations of all the moves
+    at once with array operations instead of going through per-axis dicts one
+    move at a time.
+    """
+    axes = list(moves[0].unit_vector.keys())
+    max_acc, discont, direction_change_discont = _axis_constraint_values(
+        constraints, axes
+    )
+    unit_vectors = np.array(
+        [[m.unit_vector[axis] for axis in axes] for m in moves], dtype=np.float64
+    )
+    distances = np.array([m.distance for m in moves], dtype=np.float64)
+    move_initial_speeds = np.array([m.initial_speed for m in moves], dtype=np.float64)
+    move_final_speeds = np.array([m.final_speed for m in moves], dtype=np.float64)
+
+    components = unit_vectors[1:-1]
+    move_distances = distances[1:-1]
+    prev_components = np.where(
+        (distances[:-2] > FLOAT_THRESHOLD)[:, np.newaxis], unit_vectors[:-2], 0.0
+    )
+    next_components = np.where(
+        (distances[2:] > FLOAT_THRESHOLD)[:, np.newaxis], unit_vectors[2:], 0.0
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        initial_limits, initial_failed = _junction_speed_limits(
+            discont,
+            direction_change_discont,
+            components,
+            prev_components,
+            move_final_speeds[:-2, np.newaxis],
+        )
+        initial_speeds = _limit_speeds(
+            move_initial_speeds[1:-1],
+            components,
+            initial_limits,
+            initial_failed,
+            "planning initial speed failed",
+        )
+        final_limits, final_failed = _junction_speed_limits(
+            discont,
+            direction_change_discont,
+            components,
+            next_components,
+            move_initial_speeds[2:, np.newaxis],
+        )
+        final_speeds = _limit_speeds(
+            move_final_speeds[1:-1],
+            components,
+            final_limits,
+            final_failed,
+            "planning final speed failed",
+        )
+
+        # using the equation v_f^2  = v_i^2 + 2as, as in achievable_final
+        axis_final_speeds = (
+            np.sqrt(
+                (initial_speeds[:, np.newaxis] * components) ** 2
+                + 2 * max_acc * move_distances[:, np.newaxis]
+            )
+            / components
+        )
+        for i in range(len(axes)):
+            max_axis_final_velocity = (
+                np.copysign(axis_final_speeds[:, i], final_speeds - initial_speeds)
+                + initial_speeds
+            )
+            final_speeds = np.where(
+                components[:, i] != 0,
+                np.copysign(
+                    np.minimum(abs(max_axis_final_velocity), abs(final_speeds)),
+                    final_speeds,
+                ),
+                final_speeds,
+            )
+
+        # the largest acceleration along each move that keeps every axis under
+        # its limit, as in build_blocks
+        axis_max_acc = np.where(components != 0, max_acc, 0.0)
+        acc_v = _row_norms(axis_max_acc)[:, np.newaxis] * components
+        for i in range(len(axes)):
+            a_i = acc_v[:, i]
+            acc_v = np.where(
+                (abs(a_i) > axis_max_acc[:, i])[:, np.newaxis],
+                acc_v * (axis_max_acc[:, i] / a_i)[:, np.newaxis],
+                acc_v,
+            )
+        max_accelerations = _row_norms(acc_v)
+
+    return [
+        Move(
+            unit_vector=move.unit_vector,
+            distance=move.distance,
+            max_speed=move.max_speed,
+            blocks=_build_blocks_for_acceleration(
+                initial_speed,
+                final_speed,
+                move.distance,
+                move.max_speed,
+                max_acceleration,
+            ),
+        )
+        for move, initial_speed, final_speed, max_acceleration in zip(
+            moves[1:-1], initial_speeds, final_speeds, max_accelerations
+        )
+    ]
+
+
+def _check_less_or_close(
+    constraints: "NDArray[np.float64]", inputs: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    return (abs(inputs) <= constraints) | np.isclose(inputs, constraints)
+
+
+def all_blended_vectorized(
+    constraints: SystemConstraints[AxisKey], moves: List[Move[AxisKey]]
+) -> bool:
+    """Check if the moves in the list are all blended.
+
+    This gives the same answer as all_blended, but checks every junction at once
+    with array operations.
+    """
+    if len(moves) < 2:
+        return True
+    axes = list(moves[0].unit_vector.keys())
+    _, discont, direction_change_discont = _axis_constraint_values(constraints, axes)
+    distances = np.array([m.distance for m in moves], dtype=np.float64)
+    block_distances = np.array(
+        [[b.distance for b in m.blocks] for m in moves], dtype=np.float64
+    )
+    # have these actually had their blocks built?
+    distance_sums = block_distances[:, 0] + block_distances[:, 1]
+    distance_sums = distance_sums + block_distances[:, 2]
+    if np.any(abs(distance_sums - distances) > FLOAT_THRESHOLD) or not np.all(
+        np.isclose(distance_sums, distances)
+    ):
+        return False
+
+    # do their junction velocities match constraints?
+    unit_vectors = np.array(
+        [[m.unit_vector[axis] for axis in axes] for m in moves], dtype=np.float64
+    )
+    first_components = unit_vectors[:-1]
+    second_components = unit_vectors[1:]
+    final_speeds = (
+        np.array([m.blocks[-1].final_speed for m in moves[:-1]], dtype=np.float64)[
+            :, np.newaxis
+        ]
+        * first_components
+    )
+    initial_speeds = (
+        np.array([m.blocks[0].initial_speed for m in moves[1:]], dtype=np.float64)[
+            :, np.newaxis
+        ]
+        * second_components
+    )
+    same_direction = first_components * second_components > 0
+    discont_limits = np.where(same_direction, discont, direction_change_discont)
+    matched = same_direction & (abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+    return bool(
+        np.all(
+            matched
+            | _check_less_or_close(discont_limits, final_speeds)
+            | _check_less_or_close(discont_limits, initial_speeds)
+        )
+    )
+
+
 def unit_vector_multiplication(
     unit_vector: Coordinates[AxisKey, np.float64], value: np.float64
 ) -> Coordinates[AxisKey, np.float64]:
@@ -24,6 +24,7 @@ from opentrons_hardware.firmware_bindings.constants import (
     GearMotorId,
     MoveAckId,
     MotorDriverErrorCode,
+    MessageId,
 )
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
@@ -89,6 +90,12 @@ log = logging.getLogger(__name__)
 _AcceptableMoves = Union[MoveCompleted, TipActionResponse]
 _CompletionPacket = Tuple[ArbitrationId, _AcceptableMoves]
 _Completions = List[_CompletionPacket]
+_MoveSchedulerMessageIds = [
+    MessageId.move_completed,
+    MessageId.do_self_contained_tip_action_response,
+    MessageId.error_message,
+    MessageId.read_motor_driver_error_status_response,
+]
 
 
 class MoveGroupRunner:
@@ -257,15 +264,16 @@ class MoveGroupRunner:
 
     async def _send_groups(self, can_messenger: CanMessenger) -> None:
         """Send commands to set up the message groups."""
-        for group_i, group in enumerate(self._move_groups):
-            for seq_i, sequence in enumerate(group):
-                for node, step in sequence.items():
-                    await can_messenger.send(
-                        node_id=node,
-                        message=self._get_message_type(
-                            step, group_i + self._start_at_index, seq_i
-                        ),
-                    )
+        await can_messenger.send_batch(self._get_group_messages())
+
+    def _get_group_messages(self) -> List[Tuple[NodeId, MessageDefinition]]:
+        """Get the messages that set up the move groups, in sending order."""
+        return [
+            (node, self._get_message_type(step, group_i + self._start_at_index, seq_i))
+            for group_i, group in enumerate(self._move_groups)
+            for seq_i, sequence in enumerate(group)
+            for node, step in sequence.items()
+        ]
 
     def _convert_velocity(
         self, velocity: Union[float, np.float64], interrupts: int
@@ -404,7 +412,7 @@ class MoveGroupRunner:
         """Run all the move groups."""
         scheduler = MoveScheduler(self._move_groups, start_at_index)
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(scheduler, message_ids=_MoveSchedulerMessageIds)
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
@@ -0,0 +1,126 @@
+"""Benchmark the time from sending a move group set to the start of motion.
+
+This sets up move groups over a virtual CAN bus and times how long it takes
+until a stand-in for the firmware receives the execute request, sending the
+set up messages either one at a time or in one batch.
+
+Usage: python -m opentrons_hardware.scripts.benchmark_move_group_send [sequences]
+"""
+import asyncio
+import sys
+import threading
+import time
+from typing import Optional
+
+from can import Bus
+from numpy import float64
+
+from opentrons_hardware.drivers.can_bus import CanDriver, CanMessenger
+from opentrons_hardware.firmware_bindings import ArbitrationId
+from opentrons_hardware.firmware_bindings.constants import MessageId, NodeId
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    ExecuteMoveGroupRequest,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    ExecuteMoveGroupRequestPayload,
+)
+from opentrons_hardware.firmware_bindings.utils import UInt8Field
+from opentrons_hardware.hardware_control.motion import (
+    MoveGroups,
+    MoveGroupSingleAxisStep,
+)
+from opentrons_hardware.hardware_control.move_group_runner import MoveGroupRunner
+
+_CHANNEL = "benchmark_move_group_send"
+_NODES = [
+    NodeId.gantry_x,
+    NodeId.gantry_y,
+    NodeId.head_l,
+    NodeId.head_r,
+    NodeId.pipette_left,
+]
+_TRIALS = 20
+
+
+class _FirmwareStandIn:
+    """Receives frames on the virtual bus and notes when motion would start."""
+
+    def __init__(self) -> None:
+        self._bus = Bus(_CHANNEL, interface="virtual")
+        self.motion_started_at: Optional[float] = None
+        self.frames = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            message = self._bus.recv()
+            if message is None:
+                continue
+            self.frames += 1
+            message_id = ArbitrationId(id=message.arbitration_id).parts.message_id
+            if message_id == MessageId.execute_move_group_request:
+                self.motion_started_at = time.perf_counter()
+                return
+
+    def wait(self) -> None:
+        self._thread.join()
+        self._bus.shutdown()
+
+
+def _move_groups(sequences: int) -> MoveGroups:
+    step = MoveGroupSingleAxisStep(
+        distance_mm=float64(1),
+        velocity_mm_sec=float64(10),
+        duration_sec=float64(0.1),
+        acceleration_mm_sec_sq=float64(100),
+    )
+    return [[{node: step for node in _NODES} for _ in range(sequences)]]
+
+
+async def _time_to_first_motion(
+    messenger: CanMessenger, runner: MoveGroupRunner, batched: bool
+) -> float:
+    firmware = _FirmwareStandIn()
+    start = time.perf_counter()
+    if batched:
+        await runner._send_groups(messenger)
+    else:
+        for node_id, message in runner._get_group_messages():
+            await messenger.send(node_id, message)
+    await messenger.send(
+        NodeId.broadcast,
+        ExecuteMoveGroupRequest(
+            payload=ExecuteMoveGroupRequestPayload(
+                group_id=UInt8Field(0),
+                start_trigger=UInt8Field(0),
+                cancel_trigger=UInt8Field(0),
+            )
+        ),
+    )
+    await asyncio.get_running_loop().run_in_executor(None, firmware.wait)
+    assert firmware.motion_started_at is not None
+    return firmware.motion_started_at - start
+
+
+async def main(sequences: int) -> None:
+    """Print the median time to first motion with and without batching."""
+    driver = await CanDriver.build(channel=_CHANNEL, interface="virtual", bitrate=0)
+    messenger = CanMessenger(driver)
+    runner = MoveGroupRunner(move_groups=_move_groups(sequences))
+    frames = len(runner._get_group_messages()) + 1
+    print(f"{sequences} sequences, {frames} frames")
+    for batched in (False, True):
+        times = sorted(
+            [
+                await _time_to_first_motion(messenger, runner, batched)
+                for _ in range(_TRIALS)
+            ]
+        )
+        label = "batched" if batched else "one at a time"
+        print(f"{label:<15} {times[len(times) // 2] * 1e3:>8.2f} ms")
+    driver.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 30))
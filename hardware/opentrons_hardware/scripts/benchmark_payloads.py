@@ -0,0 +1,53 @@
+"""Microbenchmark building and serializing every CAN message payload.
+
+Usage: python -m opentrons_hardware.scripts.benchmark_payloads [iterations]
+"""
+import inspect
+import sys
+import time
+from typing import List, Type
+
+from opentrons_shared_data.errors.exceptions import EnumeratedError
+
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.utils import BinarySerializable
+
+
+def _payload_classes() -> List[Type[BinarySerializable]]:
+    return [
+        cls
+        for _, cls in sorted(vars(payloads).items())
+        if inspect.isclass(cls) and issubclass(cls, BinarySerializable)
+    ]
+
+
+def main(iterations: int) -> None:
+    """Print the build and serialize time of each payload, and in total."""
+    total_build = 0.0
+    total_serialize = 0.0
+    print(f"{'payload':<50} {'build (us)':>11} {'serialize (us)':>15}")
+    for cls in _payload_classes():
+        # Every payload fits in a 64 byte CANFD frame.
+        data = bytes(64)
+        try:
+            payload = cls.build(data)
+            payload.serialize()
+        except (EnumeratedError, ValueError):
+            print(f"{cls.__name__[:50]:<50} {'skipped':>11}")
+            continue
+        start = time.perf_counter()
+        for _ in range(iterations):
+            cls.build(data)
+        build = (time.perf_counter() - start) / iterations
+        start = time.perf_counter()
+        for _ in range(iterations):
+            payload.serialize()
+        serialize = (time.perf_counter() - start) / iterations
+        total_build += build
+        total_serialize += serialize
+        print(f"{cls.__name__[:50]:<50} {build * 1e6:>11.2f} {serialize * 1e6:>15.2f}")
+    print(f"{'total':<50} {total_build * 1e6:>11.2f} {total_serialize * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -16,6 +16,7 @@ from opentrons_hardware.firmware_bindings.messages import (
     MessageDefinition,
 )
 from opentrons_hardware.firmware_bindings.constants import (
+    MessageId,
     SensorOutputBinding,
     SensorThresholdMode,
 )
@@ -255,7 +256,15 @@ class LogListener:
 
     async def __aenter__(self) -> None:
         """Start logging sensor readings."""
-        self.messenger.add_listener(self, None)
+        self.messenger.add_listener(
+            self,
+            message_ids=[
+                MessageId.read_sensor_response,
+                MessageId.batch_read_sensor_response,
+                MessageId.acknowledgement,
+            ],
+            node_ids=[self.tool],
+        )
         self.start_time = time.time()
         SENSOR_LOG.info(f"Data capture for {self.tool.name} started {self.start_time}")
 
@@ -48,7 +48,7 @@ from opentrons_hardware.firmware_bindings.utils import (
     Int32Field,
 )
 
-from typing import List
+from typing import List, Optional, Tuple
 
 
 @pytest.fixture
@@ -123,6 +123,45 @@ async def test_send(
     )
 
 
+async def test_send_batch(
+    subject: CanMessenger,
+    mock_driver: AsyncMock,
+) -> None:
+    """It should build every can message and send them with one driver call."""
+    messages: List[Tuple[NodeId, MessageDefinition]] = [
+        (NodeId.head, HeartbeatRequest()),
+        (
+            NodeId.gantry_x,
+            ExecuteMoveGroupRequest(
+                payload=ExecuteMoveGroupRequestPayload(
+                    group_id=UInt8Field(1),
+                    start_trigger=UInt8Field(0),
+                    cancel_trigger=UInt8Field(0),
+                )
+            ),
+        ),
+    ]
+    async with subject:
+        await subject.send_batch(messages)
+    mock_driver.send.assert_not_called()
+    mock_driver.send_many.assert_called_once_with(
+        [
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message.message_id,
+                        node_id=node_id,
+                        function_code=0,
+                        originating_node_id=NodeId.host,
+                    )
+                ),
+                data=message.payload.serialize(),
+            )
+            for node_id, message in messages
+        ]
+    )
+
+
 @pytest.mark.parametrize(
     "node_id,message",
     [
@@ -436,6 +475,54 @@ async def test_filter_messages(
     listener.assert_not_called()
 
 
+@pytest.mark.parametrize(
+    "message_ids,node_ids,expected_call",
+    [
+        [None, None, True],
+        [[MessageId.get_move_group_request], None, True],
+        [[MessageId.get_move_group_request], [NodeId.gantry_x], True],
+        [None, [NodeId.gantry_x, NodeId.gantry_y], True],
+        [[MessageId.move_completed], None, False],
+        [[MessageId.get_move_group_request], [NodeId.gantry_y], False],
+    ],
+)
+async def test_listen_by_message_id_and_node(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+    message_ids: Optional[List[MessageId]],
+    node_ids: Optional[List[NodeId]],
+    expected_call: bool,
+) -> None:
+    """It should only call listeners registered for the message id and node."""
+    incoming_messages.put_nowait(
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=MessageId.get_move_group_request,
+                    node_id=0,
+                    function_code=0,
+                    originating_node_id=NodeId.gantry_x,
+                )
+            ),
+            data=b"\x00\x00\x00\x01\1",
+        )
+    )
+
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=message_ids, node_ids=node_ids)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    subject.remove_listener(listener)
+    await subject.stop()
+
+    assert listener.called == expected_call
+    stats = subject.get_message_statistics()
+    assert stats[MessageId.get_move_group_request].count == 1
+    assert sum(stats[MessageId.get_move_group_request].latency_histogram) == 1
+
+
 async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
@@ -0,0 +1,80 @@
+"""Tests for BinarySerializable."""
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.utils.binary_serializable import (
+    SerializationException,
+)
+from opentrons_hardware.firmware_bindings.messages import payloads
+
+
+@dataclass
+class _Payload(utils.BinarySerializable):
+    a: utils.UInt16Field
+    b: utils.Int8Field
+
+
+@dataclass
+class _ExtendedPayload(_Payload):
+    c: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndianPayload(utils.LittleEndianBinarySerializable):
+    a: utils.UInt16Field
+
+
+@dataclass
+class _ListPayload(utils.BinarySerializable):
+    a: List[utils.UInt8Field]
+
+
+def test_build_and_serialize() -> None:
+    """It should round trip through bytes, ignoring trailing bytes."""
+    payload = _Payload.build(b"\x01\x02\xff\x00\x00")
+    assert payload == _Payload(a=utils.UInt16Field(0x0102), b=utils.Int8Field(-1))
+    assert payload.serialize() == b"\x01\x02\xff"
+    assert _Payload.get_size() == 3
+
+
+def test_subclasses_have_their_own_layout() -> None:
+    """It should not share a layout between a class and its subclasses."""
+    assert _Payload.get_size() == 3
+    assert _ExtendedPayload.get_size() == 7
+    assert _ExtendedPayload.build(b"\x00\x01\x02\x00\x00\x00\x03") == (
+        _ExtendedPayload(
+            a=utils.UInt16Field(1), b=utils.Int8Field(2), c=utils.UInt32Field(3)
+        )
+    )
+    assert _LittleEndianPayload.build(b"\x01\x00\x00") == _LittleEndianPayload(
+        a=utils.UInt16Field(1)
+    )
+
+
+def test_build_message_index() -> None:
+    """It should set fields that are not init arguments."""
+    payload = payloads.MoveCompletedPayload.build(bytes(range(16)))
+    assert isinstance(payload, payloads.MoveCompletedPayload)
+    assert payload.message_index == utils.UInt32Field(0x00010203)
+    assert payload.serialize() == bytes(range(16))
+
+
+def test_build_too_short() -> None:
+    """It should raise if there are not enough bytes for all fields."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Payload.build(b"\x01\x02")
+
+
+def test_serialize_out_of_range() -> None:
+    """It should raise if a value doesn't fit in its field."""
+    with pytest.raises(SerializationException):
+        _Payload(a=utils.UInt16Field(0x10000), b=utils.Int8Field(0)).serialize()
+
+
+def test_non_binary_field() -> None:
+    """It should raise if a field is not a BinaryFieldBase."""
+    with pytest.raises(utils.InvalidFieldException):
+        _ListPayload.get_size()
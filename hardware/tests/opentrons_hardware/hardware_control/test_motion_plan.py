@@ -8,6 +8,7 @@ from opentrons_hardware.hardware_control.motion_planning import move_manager
 from opentrons_hardware.hardware_control.motion_planning.types import (
     AxisConstraints,
     Coordinates,
+    Move,
     MoveTarget,
     SystemConstraints,
     vectorize,
@@ -267,3 +268,58 @@ def test_pipette_high_speed_motion() -> None:
             top_set_axis_speed = unit_vector[set_axis_kind] * block.final_speed
             if top_set_axis_speed != 0:
                 assert abs(top_set_axis_speed) == dummy_em_pipette_max_speed
+
+
+def test_plan_cache() -> None:
+    """Motions with the same relative targets should reuse the cached plan."""
+    constraints: SystemConstraints[str] = {
+        axis: AxisConstraints.build(
+            max_acceleration=1000,
+            max_speed_discont=40,
+            max_direction_change_speed_discont=20,
+            max_speed=500,
+        )
+        for axis in ["X", "Y", "Z"]
+    }
+    manager = move_manager.MoveManager(constraints=constraints, plan_cache_size=2)
+    uncached = move_manager.MoveManager(constraints=constraints, plan_cache_size=0)
+
+    def _plan(
+        manager: move_manager.MoveManager[str], x: float, speed: float = 100
+    ) -> Tuple[bool, List[List[Move[str]]]]:
+        return manager.plan_motion(
+            origin={"X": x, "Y": 0, "Z": 0},
+            target_list=[
+                MoveTarget.build({"X": x + 10, "Y": 20, "Z": 0}, speed),
+                MoveTarget.build({"X": x + 10, "Y": 20, "Z": 30}, speed),
+            ],
+        )
+
+    first = _plan(manager, 0)
+    shifted = _plan(manager, 100)
+    assert shifted == first
+    assert shifted[1][-1][0] is first[1][-1][0]
+    assert shifted == _plan(uncached, 100)
+
+    slower = _plan(manager, 0, speed=50)
+    assert slower != first
+    assert slower == _plan(uncached, 0, speed=50)
+
+    manager.update_constraints(
+        {
+            axis: AxisConstraints.build(
+                max_acceleration=500,
+                max_speed_discont=40,
+                max_direction_change_speed_discont=20,
+                max_speed=500,
+            )
+            for axis in ["X", "Y", "Z"]
+        }
+    )
+    assert _plan(manager, 0) != first
+
+    # the least recently used plan is dropped to stay within the cache size
+    small = move_manager.MoveManager(constraints=constraints, plan_cache_size=1)
+    first = _plan(small, 0)
+    _plan(small, 0, speed=50)
+    assert _plan(small, 0)[1][-1][0] is not first[1][-1][0]
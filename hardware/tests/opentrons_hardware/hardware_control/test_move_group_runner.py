@@ -1,6 +1,6 @@
 """Tests for the move scheduler."""
 import pytest
-from typing import List, Any
+from typing import List, Any, Tuple
 from numpy import float64, float32, int32
 from mock import AsyncMock, call, MagicMock, patch
 from opentrons_shared_data.errors.exceptions import (
@@ -99,6 +99,17 @@ def calc_acceleration(step: MoveGroupSingleAxisStep) -> int:
     )
 
 
+def sent_messages(
+    mock_can_messenger: AsyncMock,
+) -> List[Tuple[NodeId, MessageDefinition]]:
+    """Get the messages sent in batches, in order."""
+    return [
+        message
+        for batch in mock_can_messenger.send_batch.call_args_list
+        for message in batch.args[0]
+    ]
+
+
 @pytest.fixture
 def mock_can_messenger() -> AsyncMock:
     """Mock communication."""
@@ -299,6 +310,7 @@ async def test_no_groups_do_nothing(mock_can_messenger: AsyncMock) -> None:
     subject = MoveGroupRunner(move_groups=[])
     position = await subject.run(mock_can_messenger)
     mock_can_messenger.send.assert_not_called()
+    mock_can_messenger.send_batch.assert_not_called()
     assert position == {}
 
 
@@ -351,9 +363,9 @@ async def test_home(
     await subject.prep(can_messenger=mock_can_messenger)
     step = move_group_home_single[0][0].get(NodeId.head)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.head,
-        message=HomeRequest(
+    assert (
+        NodeId.head,
+        HomeRequest(
             payload=HomeRequestPayload(
                 group_id=UInt8Field(0),
                 seq_id=UInt8Field(0),
@@ -361,7 +373,7 @@ async def test_home(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
 
 async def test_single_send_setup_commands(
@@ -372,9 +384,9 @@ async def test_single_send_setup_commands(
     await subject.prep(can_messenger=mock_can_messenger)
     step = move_group_single[0][0].get(NodeId.head)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.head,
-        message=AddLinearMoveRequest(
+    assert (
+        NodeId.head,
+        AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
                 group_id=UInt8Field(0),
                 seq_id=UInt8Field(0),
@@ -384,7 +396,7 @@ async def test_single_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
 
 @pytest.mark.parametrize(
@@ -420,9 +432,9 @@ async def test_send_ignore_stalls_requests(
     request_stop_condition = MoveStopConditionField(
         stop_condition.value + MoveStopCondition.ignore_stalls.value
     )
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.head,
-        message=AddLinearMoveRequest(
+    assert (
+        NodeId.head,
+        AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
                 group_id=UInt8Field(0),
                 seq_id=UInt8Field(0),
@@ -432,7 +444,7 @@ async def test_send_ignore_stalls_requests(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
 
 async def test_multi_send_setup_commands(
@@ -445,9 +457,9 @@ async def test_multi_send_setup_commands(
     # Group 0
     step = move_group_multiple[0][0].get(NodeId.head)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.head,
-        message=AddLinearMoveRequest(
+    assert (
+        NodeId.head,
+        AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
                 group_id=UInt8Field(0),
                 seq_id=UInt8Field(0),
@@ -457,14 +469,14 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
     # Group 1
     step = move_group_multiple[1][0].get(NodeId.gantry_x)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.gantry_x,
-        message=AddLinearMoveRequest(
+    assert (
+        NodeId.gantry_x,
+        AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
                 group_id=UInt8Field(1),
                 seq_id=UInt8Field(0),
@@ -474,13 +486,13 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
     step = move_group_multiple[1][0].get(NodeId.gantry_y)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.gantry_y,
-        message=AddLinearMoveRequest(
+    assert (
+        NodeId.gantry_y,
+        AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
                 group_id=UInt8Field(1),
                 seq_id=UInt8Field(0),
@@ -490,14 +502,14 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
     # Group 2
     step = move_group_multiple[2][0].get(NodeId.pipette_left)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.pipette_left,
-        message=AddLinearMoveRequest(
+    assert (
+        NodeId.pipette_left,
+        AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
                 group_id=UInt8Field(2),
                 seq_id=UInt8Field(0),
@@ -507,13 +519,13 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
     step = move_group_multiple[2][1].get(NodeId.pipette_left)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
-        node_id=NodeId.pipette_left,
-        message=AddLinearMoveRequest(
+    assert (
+        NodeId.pipette_left,
+        AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
                 group_id=UInt8Field(2),
                 seq_id=UInt8Field(1),
@@ -523,7 +535,7 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in sent_messages(mock_can_messenger)
 
 
 async def test_move() -> None:
@@ -10,6 +10,9 @@ from opentrons_hardware.hardware_control.motion_planning.move_utils import (
     find_final_speed,
     targets_to_moves,
     all_blended,
+    all_blended_vectorized,
+    build_move,
+    build_moves_vectorized,
     get_unit_vector,
     FLOAT_THRESHOLD,
     limit_max_speed,
@@ -691,6 +694,39 @@ def test_blend_motion() -> None:
     assert all_blended(CONSTRAINTS, blend_log[-1])
 
 
+def test_build_moves_vectorized() -> None:
+    """Building all moves at once should match building them one by one."""
+    origin = {axis: np.float64(0) for axis in SIXAXES}
+    target_list = [
+        MoveTarget.build(
+            position={"X": 10, "Y": 0, "Z": 0, "A": 0, "B": 0, "C": 0}, max_speed=30
+        ),
+        MoveTarget.build(
+            position={"X": 10, "Y": 10, "Z": 0, "A": 0, "B": 0, "C": 0}, max_speed=20
+        ),
+        MoveTarget.build(
+            position={"X": 10, "Y": 10, "Z": 15, "A": 10, "B": 0, "C": 0}, max_speed=10
+        ),
+        MoveTarget.build(
+            position={"X": 0, "Y": 10, "Z": 15, "A": 10, "B": 0, "C": 0}, max_speed=30
+        ),
+    ]
+    dummy = Move.build_dummy(SIXAXES)
+    to_blend = [dummy] + list(targets_to_moves(origin, target_list, CONSTRAINTS))
+    to_blend.append(dummy)
+    for _ in range(3):
+        built = build_moves_vectorized(to_blend, CONSTRAINTS)
+        expected = [
+            build_move(to_blend[i], to_blend[i - 1], to_blend[i + 1], CONSTRAINTS)
+            for i in range(1, len(to_blend) - 1)
+        ]
+        assert built == expected
+        assert all_blended_vectorized(CONSTRAINTS, built) == all_blended(
+            CONSTRAINTS, built
+        )
+        to_blend = [dummy] + built + [dummy]
+
+
 coords = st.lists(st.floats(min_value=0, max_value=1e64), min_size=4, max_size=4)
 
 
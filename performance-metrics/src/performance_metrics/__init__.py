@@ -1,11 +1,14 @@
 """Opentrons performance metrics library."""
 
 from ._robot_activity_tracker import RobotActivityTracker
-from ._types import RobotActivityState, SupportsTracking
+from ._data_shapes import ActivityAggregate
+from ._types import RobotActivityState, SupportsTracking, TrackingMode
 
 
 __all__ = [
     "RobotActivityTracker",
     "RobotActivityState",
     "SupportsTracking",
+    "TrackingMode",
+    "ActivityAggregate",
 ]
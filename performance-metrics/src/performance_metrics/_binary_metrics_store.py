@@ -0,0 +1,326 @@
+"""Interface for storing performance metrics data to rotating binary files.
+
+This is a lower-overhead alternative to `MetricsStore`, meant to stay on during
+production runs:
+
+- Rows are packed with a precompiled `struct` format instead of formatted as quoted
+  CSV, and appended to a file that's kept open between flushes.
+- Buffered rows can be flushed periodically from a background thread, so callers
+  never pay for disk I/O.
+- Data is split into segment files that rotate by size and age, and only the most
+  recent segments are kept, so disk usage is bounded.
+
+Each segment starts with a header describing its columns, so it can be converted to
+CSV on demand with `export_to_csv` without knowing which data class wrote it.
+"""
+
+import csv
+import dataclasses
+import json
+import logging
+import struct
+import threading
+import time
+import typing
+from collections import deque
+from pathlib import Path
+
+from ._data_shapes import MetricsMetadata, CSVStorageBase
+from ._logging_config import LOGGER_NAME
+from ._types import StorableData
+
+logger = logging.getLogger(LOGGER_NAME)
+
+T = typing.TypeVar("T", bound=CSVStorageBase)
+
+_MAGIC = b"OTPM"
+_FORMAT_VERSION = 1
+# Magic, format version, length of the JSON column description that follows.
+_SEGMENT_HEADER = struct.Struct("<4sBH")
+
+# Column kinds, as stored in segment headers.
+_INT = "q"
+_FLOAT = "d"
+_STR = "s"
+
+DEFAULT_MAX_SEGMENT_BYTES = 1024 * 1024
+DEFAULT_MAX_SEGMENT_AGE = 60.0 * 60.0
+DEFAULT_MAX_SEGMENTS = 10
+
+
+def _column_kind(annotation: typing.Any) -> str:
+    """Map a data class field's annotation to how its values are packed."""
+    if annotation is int:
+        return _INT
+    if annotation is float:
+        return _FLOAT
+    if annotation is str:
+        return _STR
+    if typing.get_origin(annotation) is typing.Literal and all(
+        isinstance(arg, str) for arg in typing.get_args(annotation)
+    ):
+        return _STR
+    raise TypeError(f"Cannot store fields of type {annotation} in binary format.")
+
+
+def column_kinds(data_type: typing.Type[CSVStorageBase]) -> str:
+    """Return the column kinds of a data class, one character per field."""
+    hints = typing.get_type_hints(data_type)
+    return "".join(
+        _column_kind(hints[field.name]) for field in dataclasses.fields(data_type)
+    )
+
+
+class _RowCodec:
+    """Packs rows into bytes and back.
+
+    A packed row is every numeric column, then the byte length of every string
+    column, in one fixed-size struct, followed by the UTF-8 bytes of every string
+    column.
+    """
+
+    def __init__(self, kinds: str) -> None:
+        self._kinds = kinds
+        self._numeric_indices = [i for i, k in enumerate(kinds) if k != _STR]
+        self._string_indices = [i for i, k in enumerate(kinds) if k == _STR]
+        self._fixed = struct.Struct(
+            "<"
+            + "".join(kinds[i] for i in self._numeric_indices)
+            # 4-byte lengths, since strings like process command lines can be long.
+            + "I" * len(self._string_indices)
+        )
+
+    def encode(self, row: typing.Sequence[StorableData]) -> bytes:
+        strings = [str(row[i]).encode("utf-8") for i in self._string_indices]
+        fixed = self._fixed.pack(
+            *(row[i] for i in self._numeric_indices), *(len(s) for s in strings)
+        )
+        return fixed + b"".join(strings)
+
+    def decode_all(
+        self, buffer: bytes, offset: int
+    ) -> typing.Iterator[typing.Tuple[StorableData, ...]]:
+        """Decode every complete row in `buffer` from `offset` on.
+
+        A truncated row at the end, as left by a crash mid-write, is ignored.
+        """
+        numeric_count = len(self._numeric_indices)
+        while offset + self._fixed.size <= len(buffer):
+            fixed = self._fixed.unpack_from(buffer, offset)
+            string_lengths = fixed[numeric_count:]
+            end = offset + self._fixed.size + sum(string_lengths)
+            if end > len(buffer):
+                return
+            row: typing.List[StorableData] = [0] * len(self._kinds)
+            for index, value in zip(self._numeric_indices, fixed):
+                row[index] = value
+            position = offset + self._fixed.size
+            for index, length in zip(self._string_indices, string_lengths):
+                row[index] = buffer[position : position + length].decode("utf-8")
+                position += length
+            yield tuple(row)
+            offset = end
+
+
+class BinaryMetricsStore(typing.Generic[T]):
+    """Store data for tracking robot activity in rotating binary segment files."""
+
+    def __init__(
+        self,
+        metadata: MetricsMetadata,
+        data_type: typing.Type[T],
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_segment_age: float = DEFAULT_MAX_SEGMENT_AGE,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the metrics store.
+
+        Args:
+            metadata: Where and under which name to store data.
+            data_type: The data class being stored. Its fields must be ints,
+                floats, or strings.
+            max_segment_bytes: Start a new segment once the current one is this big.
+            max_segment_age: Start a new segment once the current one is this many
+                seconds old.
+            max_segments: How many segments to keep. Older ones are deleted.
+            clock: Returns the current time in seconds. Overridable for testing.
+        """
+        assert max_segments > 0, f"max_segments must be above 0 but was {max_segments}"
+        self.metadata = metadata
+        self._kinds = column_kinds(data_type)
+        self._codec = _RowCodec(self._kinds)
+        self._max_segment_bytes = max_segment_bytes
+        self._max_segment_age = max_segment_age
+        self._max_segments = max_segments
+        self._clock = clock
+        # A deque, so the flush thread can drain it while other threads append.
+        self._data_store: typing.Deque[T] = deque()
+        self._write_lock = threading.Lock()
+        self._segment: typing.Optional[typing.BinaryIO] = None
+        self._segment_size = 0
+        self._segment_opened_at = 0.0
+        self._next_segment_number = 0
+        self._flush_thread: typing.Optional[threading.Thread] = None
+        self._stop_flushing = threading.Event()
+
+    def add(self, data: T) -> None:
+        """Add data to the store."""
+        self._data_store.append(data)
+
+    def add_all(self, data: typing.Iterable[T]) -> None:
+        """Add data to the store."""
+        self._data_store.extend(data)
+
+    def setup(self) -> None:
+        """Set up the data store."""
+        logger.info(
+            f"Setting up binary metrics store for {self.metadata.name} at {self.metadata.storage_dir}"
+        )
+        self.metadata.storage_dir.mkdir(parents=True, exist_ok=True)
+        existing = segment_paths(self.metadata.storage_dir, self.metadata.name)
+        if existing:
+            self._next_segment_number = _segment_number(existing[-1]) + 1
+
+    def store(self) -> None:
+        """Write buffered data to the current segment, rotating it if necessary."""
+        with self._write_lock:
+            pending = len(self._data_store)
+            if pending == 0:
+                return
+            encode = self._codec.encode
+            packed = b"".join(
+                encode(self._data_store.popleft().csv_row()) for _ in range(pending)
+            )
+            segment = self._get_writable_segment()
+            logger.debug(f"Writing {pending} rows to {segment.name}")
+            segment.write(packed)
+            segment.flush()
+            self._segment_size += len(packed)
+
+    def start_periodic_flush(self, interval: float) -> None:
+        """Call `store()` every `interval` seconds from a background thread."""
+        if self._flush_thread is not None:
+            return
+        self._stop_flushing.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically,
+            args=(interval,),
+            name=f"{self.metadata.name}-flush",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def close(self) -> None:
+        """Stop periodic flushing, write any buffered data, and close the segment."""
+        if self._flush_thread is not None:
+            self._stop_flushing.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.store()
+        with self._write_lock:
+            self._close_segment()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop_flushing.wait(interval):
+            try:
+                self.store()
+            except Exception:
+                logger.exception(f"Failed to flush {self.metadata.name} metrics")
+
+    def _get_writable_segment(self) -> typing.BinaryIO:
+        if self._segment is not None and (
+            self._segment_size >= self._max_segment_bytes
+            or self._clock() - self._segment_opened_at >= self._max_segment_age
+        ):
+            self._close_segment()
+        if self._segment is None:
+            self._open_segment()
+            self._delete_old_segments()
+        assert self._segment is not None
+        return self._segment
+
+    def _open_segment(self) -> None:
+        path = self.metadata.storage_dir / _segment_name(
+            self.metadata.name, self._next_segment_number
+        )
+        self._next_segment_number += 1
+        description = json.dumps(
+            {"headers": list(self.metadata.headers), "kinds": self._kinds}
+        ).encode("utf-8")
+        header = (
+            _SEGMENT_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(description))
+            + description
+        )
+        self._segment = open(path, "xb")
+        self._segment.write(header)
+        self._segment_size = len(header)
+        self._segment_opened_at = self._clock()
+
+    def _close_segment(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def _delete_old_segments(self) -> None:
+        segments = segment_paths(self.metadata.storage_dir, self.metadata.name)
+        for path in segments[: -self._max_segments]:
+            logger.debug(f"Deleting old metrics segment {path}")
+            path.unlink(missing_ok=True)
+
+
+def _segment_name(name: str, number: int) -> str:
+    return f"{name}.{number:06d}.bin"
+
+
+def _segment_number(path: Path) -> int:
+    return int(path.suffixes[-2].lstrip("."))
+
+
+def segment_paths(storage_dir: Path, name: str) -> typing.List[Path]:
+    """Return the paths of every segment stored under `name`, oldest first."""
+    return sorted(storage_dir.glob(f"{name}.[0-9][0-9][0-9][0-9][0-9][0-9].bin"))
+
+
+def read_segment(
+    path: Path,
+) -> typing.Tuple[typing.Tuple[str, ...], typing.List[typing.Tuple[StorableData, ...]]]:
+    """Return the headers and rows of one segment file."""
+    buffer = path.read_bytes()
+    magic, version, description_length = _SEGMENT_HEADER.unpack_from(buffer, 0)
+    if magic != _MAGIC or version != _FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {_FORMAT_VERSION} metrics segment.")
+    description_start = _SEGMENT_HEADER.size
+    description_end = description_start + description_length
+    description = json.loads(buffer[description_start:description_end])
+    codec = _RowCodec(description["kinds"])
+    return tuple(description["headers"]), list(
+        codec.decode_all(buffer, description_end)
+    )
+
+
+def export_to_csv(storage_dir: Path, name: str, destination: Path) -> int:
+    """Convert every segment stored under `name` to a single CSV file.
+
+    The CSV file has a header row, followed by the rows of every segment, oldest
+    first, quoted like `MetricsStore` quotes them.
+
+    Returns:
+        The number of data rows written.
+    """
+    row_count = 0
+    with open(destination, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file, quoting=csv.QUOTE_ALL)
+        written_headers: typing.Optional[typing.Tuple[str, ...]] = None
+        for path in segment_paths(storage_dir, name):
+            headers, rows = read_segment(path)
+            if written_headers is None:
+                writer.writerow(headers)
+                written_headers = headers
+            elif headers != written_headers:
+                raise ValueError(
+                    f"{path} has headers {headers}, expected {written_headers}."
+                )
+            writer.writerows(rows)
+            row_count += len(rows)
+    return row_count
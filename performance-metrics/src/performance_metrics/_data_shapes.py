@@ -44,6 +44,29 @@ class RawActivityData(CSVStorageBase):
     duration: int
 
 
+@dataclasses.dataclass(frozen=True)
+class ActivityAggregate(CSVStorageBase):
+    """Represents aggregated duration data for one activity state.
+
+    Attributes:
+    - state (RobotActivityStates): The activity state the durations belong to.
+    - recorded_at (int): When the aggregate was taken.
+    - count (int): How many times the activity was tracked.
+    - total_duration (int): The sum of all durations, in nanoseconds.
+    - p50 (int): The estimated median duration, in nanoseconds.
+    - p95 (int): The estimated 95th percentile duration, in nanoseconds.
+    - p99 (int): The estimated 99th percentile duration, in nanoseconds.
+    """
+
+    state: RobotActivityState
+    recorded_at: int
+    count: int
+    total_duration: int  # nanoseconds
+    p50: int  # nanoseconds
+    p95: int  # nanoseconds
+    p99: int  # nanoseconds
+
+
 @dataclasses.dataclass(frozen=True)
 class ProcessResourceUsageSnapshot(CSVStorageBase):
     """Represents process resource usage data.
@@ -0,0 +1,87 @@
+"""Fixed-size histograms of durations, for cheap percentile estimates."""
+
+import math
+import typing
+
+# Buckets per doubling of duration. Percentile estimates are within
+# 2 ** (1 / _SUB_BUCKETS) - 1, about 9%, of the true value.
+_SUB_BUCKETS = 8
+# Enough buckets for durations up to 2 ** 63 nanoseconds, plus one for 0.
+_BUCKET_COUNT = 63 * _SUB_BUCKETS + 1
+
+
+def _bucket_index(duration: int) -> int:
+    """Return the bucket for `duration`.
+
+    Bucket 0 holds durations below 1. Bucket `i` above 0 holds durations `d` with
+    `(i - 1) / _SUB_BUCKETS <= log2(d) < i / _SUB_BUCKETS`.
+    """
+    if duration < 1:
+        return 0
+    return min(int(math.log2(duration) * _SUB_BUCKETS) + 1, _BUCKET_COUNT - 1)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index == 0:
+        return 0
+    return math.ceil(2 ** (index / _SUB_BUCKETS))
+
+
+class DurationHistogram:
+    """Counts of durations in logarithmically sized buckets.
+
+    Memory use is fixed no matter how many durations are recorded. Counts, totals,
+    minimums, and maximums are exact. Percentiles are estimates.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._buckets: typing.List[int] = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.minimum = 0
+        self.maximum = 0
+
+    def record(self, duration: int) -> None:
+        """Add one duration to the histogram."""
+        self._buckets[_bucket_index(duration)] += 1
+        if self.count == 0:
+            self.minimum = self.maximum = duration
+        else:
+            self.minimum = min(self.minimum, duration)
+            self.maximum = max(self.maximum, duration)
+        self.count += 1
+        self.total += duration
+
+    def merge(self, other: "DurationHistogram") -> None:
+        """Add every duration recorded in `other` to this histogram."""
+        if other.count == 0:
+            return
+        for index, bucket_count in enumerate(other._buckets):
+            self._buckets[index] += bucket_count
+        if self.count == 0:
+            self.minimum, self.maximum = other.minimum, other.maximum
+        else:
+            self.minimum = min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, fraction: float) -> int:
+        """Estimate the duration that `fraction` of the recorded durations are at or below.
+
+        Args:
+            fraction: Between 0 and 1. For example, 0.95 for the 95th percentile.
+
+        Returns:
+            The estimate, or 0 if nothing was recorded.
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return max(self.minimum, min(self.maximum, _bucket_upper_bound(index)))
+        return self.maximum
@@ -1,15 +1,23 @@
 """Module for tracking robot activity and execution duration for different operations."""
 
 import inspect
+import threading
 from pathlib import Path
 
 from functools import wraps
-from time import perf_counter_ns
+from time import monotonic, perf_counter_ns
 import typing
 
 from ._metrics_store import MetricsStore
-from ._data_shapes import RawActivityData, MetricsMetadata
-from ._types import SupportsTracking, RobotActivityState
+from ._binary_metrics_store import BinaryMetricsStore
+from ._data_shapes import (
+    ActivityAggregate,
+    CSVStorageBase,
+    RawActivityData,
+    MetricsMetadata,
+)
+from ._duration_histogram import DurationHistogram
+from ._types import SupportsTracking, RobotActivityState, TrackingMode
 from ._util import get_timing_function
 
 _UnderlyingFunctionParameters = typing.ParamSpec("_UnderlyingFunctionParameters")
@@ -18,9 +26,30 @@ _UnderlyingFunction = typing.Callable[
     _UnderlyingFunctionParameters, _UnderlyingFunctionReturn
 ]
 
+_StoredData = typing.TypeVar("_StoredData", bound=CSVStorageBase)
+
 
 _timing_function = get_timing_function()
 
+# How often binary storage flushes in the background, in seconds.
+_BINARY_FLUSH_INTERVAL = 5.0
+
+
+def _make_store(
+    name: str,
+    storage_location: Path,
+    data_type: typing.Type[_StoredData],
+    use_binary_storage: bool,
+) -> typing.Union[MetricsStore[_StoredData], BinaryMetricsStore[_StoredData]]:
+    metadata = MetricsMetadata(
+        name=name,
+        storage_dir=storage_location,
+        headers=data_type.headers(),
+    )
+    if use_binary_storage:
+        return BinaryMetricsStore(metadata, data_type)
+    return MetricsStore[_StoredData](metadata)
+
 
 class RobotActivityTracker(SupportsTracking):
     """Tracks and stores robot activity and execution duration for different operations."""
@@ -28,20 +57,57 @@ class RobotActivityTracker(SupportsTracking):
     METADATA_NAME: typing.Final[
         typing.Literal["robot_activity_data"]
     ] = "robot_activity_data"
+    AGGREGATES_METADATA_NAME: typing.Final[
+        typing.Literal["robot_activity_aggregates"]
+    ] = "robot_activity_aggregates"
 
-    def __init__(self, storage_location: Path, should_track: bool) -> None:
-        """Initializes the RobotActivityTracker with an empty storage list."""
-        self._store = MetricsStore[RawActivityData](
-            MetricsMetadata(
-                name=self.METADATA_NAME,
-                storage_dir=storage_location,
-                headers=RawActivityData.headers(),
-            )
+    def __init__(
+        self,
+        storage_location: Path,
+        should_track: bool,
+        use_binary_storage: bool = False,
+        mode: TrackingMode = "raw",
+        aggregate_flush_interval: float = 60.0,
+    ) -> None:
+        """Initializes the RobotActivityTracker with an empty storage list.
+
+        If `use_binary_storage` is set, data is stored in rotating binary segment
+        files that are flushed in the background, instead of in a CSV file.
+        See `_binary_metrics_store.export_to_csv` to convert them.
+
+        In both modes, the tracker keeps a fixed-size duration histogram per state,
+        available from `get_aggregates()`. In `"raw"` mode, it also stores a row per
+        tracked call. In `"aggregate"` mode, it only stores a row of aggregates per
+        state, at most every `aggregate_flush_interval` seconds, which keeps it cheap
+        enough for frequently called functions.
+        """
+        self._store = _make_store(
+            self.METADATA_NAME, storage_location, RawActivityData, use_binary_storage
+        )
+        self._aggregate_store = _make_store(
+            self.AGGREGATES_METADATA_NAME,
+            storage_location,
+            ActivityAggregate,
+            use_binary_storage,
         )
         self._should_track = should_track
+        self._mode = mode
+        self._aggregate_flush_interval = aggregate_flush_interval
+        self._last_aggregate_flush: typing.Optional[float] = None
+        # Each thread records into its own histograms, so that tracked calls never
+        # wait on a lock. `get_aggregates()` merges them.
+        self._thread_local = threading.local()
+        self._histograms_by_thread: typing.List[
+            typing.Dict[RobotActivityState, DurationHistogram]
+        ] = []
+        self._histograms_by_thread_lock = threading.Lock()
+
+        self._used_store = self._store if mode == "raw" else self._aggregate_store
 
         if self._should_track:
-            self._store.setup()
+            self._used_store.setup()
+            if isinstance(self._used_store, BinaryMetricsStore):
+                self._used_store.start_periodic_flush(_BINARY_FLUSH_INTERVAL)
 
     def track(
         self,
@@ -89,12 +155,10 @@ class RobotActivityTracker(SupportsTracking):
                     finally:
                         duration_end_time = perf_counter_ns()
 
-                        self._store.add(
-                            RawActivityData(
-                                func_start=function_start_time,
-                                duration=duration_end_time - duration_start_time,
-                                state=state,
-                            )
+                        self._record(
+                            state,
+                            function_start_time,
+                            duration_end_time - duration_start_time,
                         )
 
                     return result  # type: ignore
@@ -115,12 +179,10 @@ class RobotActivityTracker(SupportsTracking):
                     finally:
                         duration_end_time = perf_counter_ns()
 
-                        self._store.add(
-                            RawActivityData(
-                                func_start=function_start_time,
-                                duration=duration_end_time - duration_start_time,
-                                state=state,
-                            )
+                        self._record(
+                            state,
+                            function_start_time,
+                            duration_end_time - duration_start_time,
                         )
 
                     return result
@@ -129,8 +191,81 @@ class RobotActivityTracker(SupportsTracking):
 
         return inner_decorator
 
+    def get_aggregates(self) -> typing.List[ActivityAggregate]:
+        """Returns live aggregates of every state tracked so far.
+
+        Calls that other threads are recording at the same time might be
+        partly included.
+        """
+        recorded_at = _timing_function()
+        with self._histograms_by_thread_lock:
+            histograms_by_thread = list(self._histograms_by_thread)
+        merged: typing.Dict[RobotActivityState, DurationHistogram] = {}
+        for histograms in histograms_by_thread:
+            for state, histogram in list(histograms.items()):
+                merged.setdefault(state, DurationHistogram()).merge(histogram)
+        return [
+            ActivityAggregate(
+                state=state,
+                recorded_at=recorded_at,
+                count=histogram.count,
+                total_duration=histogram.total,
+                p50=histogram.percentile(0.5),
+                p95=histogram.percentile(0.95),
+                p99=histogram.percentile(0.99),
+            )
+            for state, histogram in merged.items()
+        ]
+
     def store(self) -> None:
         """Returns the stored activity data and clears the storage list."""
         if not self._should_track:
             return
-        self._store.store()
+        if self._mode == "raw":
+            self._store.store()
+            return
+        now = monotonic()
+        if (
+            self._last_aggregate_flush is not None
+            and now - self._last_aggregate_flush < self._aggregate_flush_interval
+        ):
+            return
+        self._last_aggregate_flush = now
+        self._aggregate_store.add_all(self.get_aggregates())
+        self._aggregate_store.store()
+
+    def close(self) -> None:
+        """Store any buffered data and close storage files, before shutting down.
+
+        In `"aggregate"` mode, this stores aggregates even if the flush interval
+        hasn't passed.
+        """
+        if not self._should_track:
+            return
+        self._last_aggregate_flush = None
+        self.store()
+        if isinstance(self._used_store, BinaryMetricsStore):
+            self._used_store.close()
+
+    def _record(
+        self, state: RobotActivityState, func_start: int, duration: int
+    ) -> None:
+        histograms: typing.Optional[
+            typing.Dict[RobotActivityState, DurationHistogram]
+        ] = getattr(self._thread_local, "histograms", None)
+        if histograms is None:
+            histograms = self._thread_local.histograms = {}
+            with self._histograms_by_thread_lock:
+                self._histograms_by_thread.append(histograms)
+        histogram = histograms.get(state)
+        if histogram is None:
+            histogram = histograms[state] = DurationHistogram()
+        histogram.record(duration)
+        if self._mode == "raw":
+            self._store.add(
+                RawActivityData(
+                    func_start=func_start,
+                    duration=duration,
+                    state=state,
+                )
+            )
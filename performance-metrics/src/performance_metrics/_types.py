@@ -3,6 +3,9 @@
 import typing
 from pathlib import Path
 
+if typing.TYPE_CHECKING:
+    from ._data_shapes import ActivityAggregate
+
 _UnderlyingFunctionParameters = typing.ParamSpec("_UnderlyingFunctionParameters")
 _UnderlyingFunctionReturn = typing.TypeVar("_UnderlyingFunctionReturn")
 _UnderlyingFunction = typing.Callable[
@@ -19,11 +22,20 @@ RobotActivityState = typing.Literal[
     "ROBOT_SHUTTING_DOWN",
 ]
 
+TrackingMode = typing.Literal["raw", "aggregate"]
+"""Whether to store a row per tracked call, or only aggregates per state."""
+
 
 class SupportsTracking(typing.Protocol):
     """Protocol for classes that support tracking of robot activity."""
 
-    def __init__(self, storage_location: Path, should_track: bool) -> None:
+    def __init__(
+        self,
+        storage_location: Path,
+        should_track: bool,
+        use_binary_storage: bool = False,
+        mode: TrackingMode = "raw",
+    ) -> None:
         """Initialize the tracker."""
         ...
 
@@ -41,5 +53,13 @@ class SupportsTracking(typing.Protocol):
         """Store the tracked data."""
         ...
 
+    def get_aggregates(self) -> typing.List["ActivityAggregate"]:
+        """Return live aggregates of every state tracked so far."""
+        ...
+
+    def close(self) -> None:
+        """Store any buffered data and release storage, before shutting down."""
+        ...
+
 
 StorableData = typing.Union[int, float, str]
@@ -0,0 +1,237 @@
+"""Tests for the binary metrics store."""
+
+import csv
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from performance_metrics._binary_metrics_store import (
+    BinaryMetricsStore,
+    column_kinds,
+    export_to_csv,
+    read_segment,
+    segment_paths,
+)
+from performance_metrics._data_shapes import (
+    MetricsMetadata,
+    ProcessResourceUsageSnapshot,
+    RawActivityData,
+)
+from performance_metrics._robot_activity_tracker import RobotActivityTracker
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _metadata(tmp_path: Path) -> MetricsMetadata:
+    return MetricsMetadata(
+        name="activity", storage_dir=tmp_path, headers=RawActivityData.headers()
+    )
+
+
+def _rows(count: int) -> List[RawActivityData]:
+    return [
+        RawActivityData(state="CALIBRATING", func_start=i, duration=i * 10)
+        for i in range(count)
+    ]
+
+
+def test_column_kinds() -> None:
+    """It should derive column kinds from data class annotations."""
+    assert column_kinds(RawActivityData) == "sqq"
+    assert column_kinds(ProcessResourceUsageSnapshot) == "qsdddd"
+
+
+def test_store_and_read_back(tmp_path: Path) -> None:
+    """It should round-trip rows through a segment file."""
+    store = BinaryMetricsStore(_metadata(tmp_path), RawActivityData)
+    store.setup()
+    store.add_all(_rows(3))
+    store.store()
+    store.add(RawActivityData(state="RUNNING_PROTOCOL", func_start=-5, duration=7))
+    store.close()
+
+    [segment] = segment_paths(tmp_path, "activity")
+    headers, rows = read_segment(segment)
+    assert headers == RawActivityData.headers()
+    assert [RawActivityData.from_csv_row(row) for row in rows] == _rows(3) + [
+        RawActivityData(state="RUNNING_PROTOCOL", func_start=-5, duration=7)
+    ]
+
+
+def test_store_long_strings(tmp_path: Path) -> None:
+    """It should round-trip strings that are longer than 64 KiB."""
+    snapshot = ProcessResourceUsageSnapshot(
+        query_time=1,
+        command="python " + "x" * 100_000,
+        running_since=2.0,
+        user_cpu_time=3.0,
+        system_cpu_time=4.0,
+        memory_percent=5.0,
+    )
+    store = BinaryMetricsStore(
+        MetricsMetadata(
+            name="resources",
+            storage_dir=tmp_path,
+            headers=ProcessResourceUsageSnapshot.headers(),
+        ),
+        ProcessResourceUsageSnapshot,
+    )
+    store.setup()
+    store.add(snapshot)
+    store.close()
+
+    [segment] = segment_paths(tmp_path, "resources")
+    [row] = read_segment(segment)[1]
+    assert ProcessResourceUsageSnapshot.from_csv_row(row) == snapshot
+
+
+def test_ignores_truncated_row(tmp_path: Path) -> None:
+    """It should skip a partially written row at the end of a segment."""
+    store = BinaryMetricsStore(_metadata(tmp_path), RawActivityData)
+    store.setup()
+    store.add_all(_rows(2))
+    store.close()
+
+    [segment] = segment_paths(tmp_path, "activity")
+    segment.write_bytes(segment.read_bytes()[:-3])
+    _, rows = read_segment(segment)
+    assert [RawActivityData.from_csv_row(row) for row in rows] == _rows(1)
+
+
+def test_rotates_by_size_and_keeps_newest(tmp_path: Path) -> None:
+    """It should start new segments once they're too big, deleting the oldest."""
+    store = BinaryMetricsStore(
+        _metadata(tmp_path), RawActivityData, max_segment_bytes=1, max_segments=2
+    )
+    store.setup()
+    for row in _rows(4):
+        store.add(row)
+        store.store()
+    store.close()
+
+    segments = segment_paths(tmp_path, "activity")
+    assert [path.name for path in segments] == [
+        "activity.000002.bin",
+        "activity.000003.bin",
+    ]
+    assert [
+        RawActivityData.from_csv_row(row)
+        for path in segments
+        for row in read_segment(path)[1]
+    ] == _rows(4)[2:]
+
+
+def test_rotates_by_age(tmp_path: Path) -> None:
+    """It should start a new segment once the current one is too old."""
+    clock = _FakeClock()
+    store = BinaryMetricsStore(
+        _metadata(tmp_path), RawActivityData, max_segment_age=60, clock=clock
+    )
+    store.setup()
+    store.add_all(_rows(1))
+    store.store()
+    clock.now = 59
+    store.add_all(_rows(1))
+    store.store()
+    assert len(segment_paths(tmp_path, "activity")) == 1
+
+    clock.now = 60
+    store.add_all(_rows(1))
+    store.store()
+    store.close()
+    assert len(segment_paths(tmp_path, "activity")) == 2
+
+
+def test_continues_numbering_after_restart(tmp_path: Path) -> None:
+    """It should never append to a segment written by an earlier store."""
+    for _ in range(2):
+        store = BinaryMetricsStore(_metadata(tmp_path), RawActivityData)
+        store.setup()
+        store.add_all(_rows(1))
+        store.close()
+
+    assert [path.name for path in segment_paths(tmp_path, "activity")] == [
+        "activity.000000.bin",
+        "activity.000001.bin",
+    ]
+
+
+def test_periodic_flush(tmp_path: Path) -> None:
+    """It should write buffered rows from a background thread."""
+    store = BinaryMetricsStore(_metadata(tmp_path), RawActivityData)
+    store.setup()
+    store.start_periodic_flush(interval=0.01)
+    store.add_all(_rows(2))
+    store.close()
+
+    [segment] = segment_paths(tmp_path, "activity")
+    assert len(read_segment(segment)[1]) == 2
+
+
+def test_export_to_csv(tmp_path: Path) -> None:
+    """It should convert every segment to one CSV file with a header row."""
+    store = BinaryMetricsStore(
+        _metadata(tmp_path), RawActivityData, max_segment_bytes=1
+    )
+    store.setup()
+    for row in _rows(3):
+        store.add(row)
+        store.store()
+    store.close()
+
+    destination = tmp_path / "activity.csv"
+    assert export_to_csv(tmp_path, "activity", destination) == 3
+    with open(destination, newline="") as csv_file:
+        lines = list(csv.reader(csv_file))
+    assert tuple(lines[0]) == RawActivityData.headers()
+    assert lines[1:] == [
+        ["CALIBRATING", "0", "0"],
+        ["CALIBRATING", "1", "10"],
+        ["CALIBRATING", "2", "20"],
+    ]
+
+
+def test_rejects_unsupported_fields(tmp_path: Path) -> None:
+    """It should refuse data classes it can't pack."""
+    with pytest.raises(TypeError):
+        BinaryMetricsStore(_metadata(tmp_path), MetricsMetadata)  # type: ignore[type-var]
+
+
+async def test_robot_activity_tracker_binary_storage(tmp_path: Path) -> None:
+    """It should let RobotActivityTracker store to binary segments."""
+    tracker = RobotActivityTracker(tmp_path, should_track=True, use_binary_storage=True)
+
+    @tracker.track("ANALYZING_PROTOCOL")
+    def analyzing_protocol() -> None:
+        pass
+
+    analyzing_protocol()
+    tracker.store()
+
+    [segment] = segment_paths(tmp_path, RobotActivityTracker.METADATA_NAME)
+    [row] = read_segment(segment)[1]
+    assert RawActivityData.from_csv_row(row).state == "ANALYZING_PROTOCOL"  # type: ignore[attr-defined]
+
+
+def test_robot_activity_tracker_close(tmp_path: Path) -> None:
+    """It should write buffered rows and stop flushing when the tracker is closed."""
+    tracker = RobotActivityTracker(tmp_path, should_track=True, use_binary_storage=True)
+
+    @tracker.track("CALIBRATING")
+    def calibrating() -> None:
+        pass
+
+    calibrating()
+    tracker.close()
+
+    [segment] = segment_paths(tmp_path, RobotActivityTracker.METADATA_NAME)
+    [row] = read_segment(segment)[1]
+    assert RawActivityData.from_csv_row(row).state == "CALIBRATING"  # type: ignore[attr-defined]
+    assert tracker._store._flush_thread is None  # type: ignore[union-attr]
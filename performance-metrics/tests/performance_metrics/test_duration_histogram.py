@@ -0,0 +1,67 @@
+"""Tests for the duration histogram."""
+
+import pytest
+
+from performance_metrics._duration_histogram import DurationHistogram
+
+
+def test_empty_histogram() -> None:
+    """It should report zeros before anything is recorded."""
+    histogram = DurationHistogram()
+    assert histogram.count == 0
+    assert histogram.total == 0
+    assert histogram.percentile(0.5) == 0
+
+
+def test_exact_counters() -> None:
+    """It should count, sum, and bound durations exactly."""
+    histogram = DurationHistogram()
+    for duration in [5, 0, 1000, 20]:
+        histogram.record(duration)
+    assert histogram.count == 4
+    assert histogram.total == 1025
+    assert histogram.minimum == 0
+    assert histogram.maximum == 1000
+
+
+@pytest.mark.parametrize("fraction", [0.5, 0.95, 0.99])
+def test_percentile_estimates(fraction: float) -> None:
+    """It should estimate percentiles within the bucket resolution."""
+    histogram = DurationHistogram()
+    durations = [1000 * i for i in range(1, 1001)]
+    for duration in durations:
+        histogram.record(duration)
+
+    expected = durations[int(fraction * len(durations)) - 1]
+    assert histogram.percentile(fraction) == pytest.approx(expected, rel=0.1)
+
+
+def test_percentile_of_single_value() -> None:
+    """It should clamp estimates to the recorded range."""
+    histogram = DurationHistogram()
+    histogram.record(12345)
+    assert histogram.percentile(0.5) == 12345
+    assert histogram.percentile(0.99) == 12345
+
+
+def test_merge() -> None:
+    """It should combine the durations of two histograms."""
+    histogram = DurationHistogram()
+    other = DurationHistogram()
+    expected = DurationHistogram()
+    for duration in [5, 1000]:
+        histogram.record(duration)
+        expected.record(duration)
+    for duration in [0, 20]:
+        other.record(duration)
+        expected.record(duration)
+
+    histogram.merge(other)
+    histogram.merge(DurationHistogram())
+
+    assert histogram.count == 4
+    assert histogram.total == 1025
+    assert histogram.minimum == 0
+    assert histogram.maximum == 1000
+    for fraction in [0.25, 0.5, 0.75, 1.0]:
+        assert histogram.percentile(fraction) == expected.percentile(fraction)
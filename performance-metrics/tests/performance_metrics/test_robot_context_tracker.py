@@ -1,6 +1,7 @@
 """Tests for the RobotActivityTracker class in performance_metrics._robot_activity_tracker."""
 
 import asyncio
+import threading
 from pathlib import Path
 import pytest
 from performance_metrics._robot_activity_tracker import RobotActivityTracker
@@ -303,3 +304,86 @@ def test_using_non_linux_time_functions(tmp_path: Path) -> None:
         data.duration > 0 for data in storage
     ), "All duration times should be greater than 0."
     assert len(storage) == 2, "Both operations should be tracked."
+
+
+def test_get_aggregates(robot_activity_tracker: RobotActivityTracker) -> None:
+    """Tests that live aggregates are kept per state."""
+
+    @robot_activity_tracker.track(state="CALIBRATING")
+    def calibrating_robot() -> None:
+        pass
+
+    @robot_activity_tracker.track(state="ANALYZING_PROTOCOL")
+    def analyzing_protocol() -> None:
+        pass
+
+    calibrating_robot()
+    calibrating_robot()
+    analyzing_protocol()
+
+    aggregates = {
+        aggregate.state: aggregate
+        for aggregate in robot_activity_tracker.get_aggregates()
+    }
+    assert aggregates.keys() == {"CALIBRATING", "ANALYZING_PROTOCOL"}
+    assert aggregates["CALIBRATING"].count == 2
+    assert aggregates["ANALYZING_PROTOCOL"].count == 1
+    assert (
+        aggregates["CALIBRATING"].p50
+        <= aggregates["CALIBRATING"].p99
+        <= aggregates["CALIBRATING"].total_duration
+    )
+
+
+def test_get_aggregates_from_threads(
+    robot_activity_tracker: RobotActivityTracker,
+) -> None:
+    """Tests that aggregates include calls tracked in every thread."""
+
+    @robot_activity_tracker.track(state="CALIBRATING")
+    def calibrating_robot() -> None:
+        pass
+
+    calibrating_robot()
+    threads = [threading.Thread(target=calibrating_robot) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    [aggregate] = robot_activity_tracker.get_aggregates()
+    assert aggregate.state == "CALIBRATING"
+    assert aggregate.count == 4
+
+
+def test_aggregate_mode(tmp_path: Path) -> None:
+    """Tests that aggregate mode stores aggregates instead of a row per call."""
+    robot_activity_tracker = RobotActivityTracker(
+        storage_location=tmp_path,
+        should_track=True,
+        mode="aggregate",
+        aggregate_flush_interval=3600,
+    )
+
+    @robot_activity_tracker.track(state="RUNNING_PROTOCOL")
+    def running_protocol() -> None:
+        pass
+
+    for _ in range(100):
+        running_protocol()
+
+    assert len(robot_activity_tracker._store._data_store) == 0
+
+    robot_activity_tracker.store()
+    running_protocol()
+    # Within the flush interval, so nothing new is written.
+    robot_activity_tracker.store()
+
+    aggregates_file = (
+        robot_activity_tracker._aggregate_store.metadata.data_file_location
+    )
+    lines = aggregates_file.read_text().splitlines()
+    assert len(lines) == 1
+    assert lines[0].startswith('"RUNNING_PROTOCOL",')
+    assert lines[0].split(",")[2] == '"100"'
+    assert not robot_activity_tracker._store.metadata.data_file_location.exists()
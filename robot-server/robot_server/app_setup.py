@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from opentrons import __version__
+from opentrons.util.performance_helpers import close_robot_activity_tracker
 
 from .errors.exception_handlers import exception_handlers
 from .hardware import (
@@ -48,6 +49,9 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         initialize_logging()
 
+        # Registered first so it runs last, after anything that it might track.
+        exit_stack.callback(close_robot_activity_tracker)
+
         await exit_stack.enter_async_context(set_up_task_runner(app.state))
 
         blinker = FrontButtonLightBlinker()
@@ -81,7 +85,11 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         exit_stack.push_async_callback(clean_up_persistence, app.state)
 
-        exit_stack.enter_context(set_up_notification_client(app.state))
+        exit_stack.enter_context(
+            set_up_notification_client(
+                app.state, coalesce_window=settings.notification_coalesce_window
+            )
+        )
         initialize_pe_publisher_notifier(app.state)
 
         yield  # Start handling HTTP requests.
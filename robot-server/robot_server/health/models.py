@@ -121,3 +121,80 @@ class Health(BaseResponseBody):
         examples=["OT2CEP20190604A02"],
     )
     links: HealthLinks
+
+
+class CacheStats(BaseModel):
+    """Counters describing an in-memory cache."""
+
+    hits: int = Field(..., description="Lookups that were served from the cache.")
+    misses: int = Field(..., description="Lookups that were not in the cache.")
+    evictions: int = Field(
+        ..., description="Entries removed to keep the cache within its limits."
+    )
+    entries: int = Field(..., description="Entries currently in the cache.")
+    sizeBytes: int = Field(
+        ..., description="Approximate total size of the entries currently cached."
+    )
+
+
+class AnalysisCacheHealth(BaseResponseBody):
+    """Information about the server's in-memory caches of completed analyses."""
+
+    analyses: CacheStats = Field(
+        ..., description="The cache of parsed analyses, used by most analysis routes."
+    )
+    documents: CacheStats = Field(
+        ...,
+        description="The cache of pre-serialized analysis documents,"
+        " used by `GET /protocols/{protocolId}/analyses/{analysisId}/asDocument`.",
+    )
+
+
+class AnalysisQueueHealth(BaseResponseBody):
+    """Information about the server's queue of protocol analyses."""
+
+    queued: int = Field(..., description="Analyses waiting for their turn to run.")
+    running: int = Field(..., description="Analyses currently running.")
+    maxConcurrent: int = Field(
+        ..., description="The most analyses the server will run at once."
+    )
+
+
+class NotificationHealth(BaseResponseBody):
+    """Information about the server's MQTT notifications."""
+
+    published: int = Field(..., description="Notifications sent to the broker.")
+    suppressed: int = Field(
+        ...,
+        description="Notifications not sent because an identical notification"
+        " on the same topic was sent or scheduled moments before.",
+    )
+
+
+class RobotActivityAggregate(BaseModel):
+    """Aggregated durations of one kind of tracked robot activity."""
+
+    state: str = Field(..., description="The kind of activity.")
+    count: int = Field(..., description="How many times the activity was tracked.")
+    totalDurationNs: int = Field(
+        ..., description="The sum of all tracked durations, in nanoseconds."
+    )
+    p50DurationNs: int = Field(
+        ..., description="The estimated median duration, in nanoseconds."
+    )
+    p95DurationNs: int = Field(
+        ..., description="The estimated 95th percentile duration, in nanoseconds."
+    )
+    p99DurationNs: int = Field(
+        ..., description="The estimated 99th percentile duration, in nanoseconds."
+    )
+
+
+class RobotActivityHealth(BaseResponseBody):
+    """Live performance metrics of tracked robot activity."""
+
+    activities: typing.List[RobotActivityAggregate] = Field(
+        ...,
+        description="One entry per kind of activity tracked since the server started."
+        " Empty if performance metrics are disabled.",
+    )
@@ -7,6 +7,7 @@ import json
 
 from opentrons import __version__, config, protocol_api
 from opentrons.hardware_control import HardwareControlAPI
+from opentrons.util import performance_helpers
 
 from server_utils.util import call_once
 
@@ -14,11 +15,31 @@ from robot_server.hardware import get_hardware, get_robot_type
 from robot_server.persistence.fastapi_dependencies import (
     get_sql_engine as ensure_sql_engine_is_ready,
 )
+from robot_server.protocols.analysis_memcache import MemoryCacheStats
+from robot_server.protocols.analyses_manager import AnalysesManager
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.dependencies import (
+    get_analyses_manager,
+    get_analysis_store,
+)
 from robot_server.service.legacy.models import V1BasicResponse
+from robot_server.service.notifications import (
+    NotificationClient,
+    get_notification_client,
+)
 
 from opentrons_shared_data.robot.types import RobotType
 
-from .models import Health, HealthLinks
+from .models import (
+    AnalysisCacheHealth,
+    AnalysisQueueHealth,
+    CacheStats,
+    Health,
+    HealthLinks,
+    NotificationHealth,
+    RobotActivityAggregate,
+    RobotActivityHealth,
+)
 
 _log = logging.getLogger(__name__)
 
@@ -170,3 +191,104 @@ async def get_health(
         links=health_links,
         robot_serial=(await hardware.get_serial_number()),
     )
+
+
+@health_router.get(
+    path="/health/analysisCache",
+    summary="Get analysis cache statistics",
+    description=(
+        "Get hit, miss, and eviction counters for the server's in-memory caches"
+        " of completed protocol analyses. This is meant for diagnostics."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=AnalysisCacheHealth,
+)
+async def get_analysis_cache_health(
+    analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
+) -> AnalysisCacheHealth:
+    """Get statistics about the in-memory caches of completed analyses."""
+    stats = analysis_store.get_cache_stats()
+    return AnalysisCacheHealth(
+        analyses=_cache_stats_to_model(stats.analyses),
+        documents=_cache_stats_to_model(stats.documents),
+    )
+
+
+@health_router.get(
+    path="/health/analysisQueue",
+    summary="Get analysis queue status",
+    description=(
+        "Get how many protocol analyses are waiting to run and how many are running."
+        " This is meant for diagnostics."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=AnalysisQueueHealth,
+)
+async def get_analysis_queue_health(
+    analyses_manager: Annotated[AnalysesManager, Depends(get_analyses_manager)],
+) -> AnalysisQueueHealth:
+    """Get the depth of the protocol analysis queue."""
+    queue_status = analyses_manager.get_queue_status()
+    return AnalysisQueueHealth(
+        queued=queue_status.queued,
+        running=queue_status.running,
+        maxConcurrent=queue_status.max_concurrent,
+    )
+
+
+@health_router.get(
+    path="/health/notifications",
+    summary="Get notification statistics",
+    description=(
+        "Get how many MQTT notifications the server has published, and how many"
+        " it has coalesced away. This is meant for diagnostics."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=NotificationHealth,
+)
+async def get_notification_health(
+    notification_client: Annotated[
+        NotificationClient, Depends(get_notification_client)
+    ],
+) -> NotificationHealth:
+    """Get counters for published and coalesced notifications."""
+    stats = notification_client.get_stats()
+    return NotificationHealth(published=stats.published, suppressed=stats.suppressed)
+
+
+@health_router.get(
+    path="/health/robotActivity",
+    summary="Get robot activity performance metrics",
+    description=(
+        "Get live duration aggregates of the robot activities tracked by the"
+        " performance metrics system, such as protocol analysis."
+        " This is meant for diagnostics."
+    ),
+    status_code=status.HTTP_200_OK,
+    response_model=RobotActivityHealth,
+)
+async def get_robot_activity_health() -> RobotActivityHealth:
+    """Get live duration aggregates of tracked robot activity."""
+    return RobotActivityHealth(
+        activities=[
+            RobotActivityAggregate(
+                state=aggregate.state,
+                count=aggregate.count,
+                totalDurationNs=aggregate.total_duration,
+                p50DurationNs=aggregate.p50,
+                p95DurationNs=aggregate.p95,
+                p99DurationNs=aggregate.p99,
+            )
+            for aggregate in performance_helpers.get_activity_aggregates()
+        ]
+    )
+
+
+def _cache_stats_to_model(stats: MemoryCacheStats) -> CacheStats:
+    return CacheStats(
+        hits=stats.hits,
+        misses=stats.misses,
+        evictions=stats.evictions,
+        entries=stats.entries,
+        sizeBytes=stats.size_bytes,
+    )
@@ -0,0 +1,52 @@
+"""Migrate the persistence directory from schema 8 to 9.
+
+Summary of changes from schema 8:
+
+- Adds a nullable, indexed cache_key column to the analysis table, so a completed
+  analysis can be reused for identical inputs. Existing analyses get a null key,
+  so they are never reused.
+"""
+
+from pathlib import Path
+from contextlib import ExitStack
+import shutil
+
+from ..database import sql_engine_ctx
+from ..tables import schema_9
+from .._folder_migrator import Migration
+from ._util import add_column
+
+from ..file_and_directory_names import (
+    DB_FILE,
+)
+
+
+class Migration8to9(Migration):  # noqa: D101
+    def migrate(self, source_dir: Path, dest_dir: Path) -> None:
+        """Migrate the persistence directory from schema 8 to 9."""
+        # Copy over all existing directories and files to new version
+        for item in source_dir.iterdir():
+            if item.is_dir():
+                shutil.copytree(src=item, dst=dest_dir / item.name)
+            else:
+                shutil.copy(src=item, dst=dest_dir / item.name)
+
+        dest_db_file = dest_dir / DB_FILE
+
+        with ExitStack() as exit_stack:
+            dest_engine = exit_stack.enter_context(sql_engine_ctx(dest_db_file))
+
+            add_column(
+                dest_engine,
+                schema_9.analysis_table.name,
+                schema_9.analysis_table.c.cache_key,
+            )
+
+            dest_transaction = exit_stack.enter_context(dest_engine.begin())
+
+            cache_key_index = next(
+                index
+                for index in schema_9.analysis_table.indexes
+                if index.name == "ix_analysis_cache_key"
+            )
+            cache_key_index.create(dest_transaction)
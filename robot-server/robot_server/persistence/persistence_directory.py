@@ -11,7 +11,15 @@ from typing_extensions import Final
 from anyio import Path as AsyncPath, to_thread
 
 from ._folder_migrator import MigrationOrchestrator
-from ._migrations import up_to_3, v3_to_v4, v4_to_v5, v5_to_v6, v6_to_v7, v7_to_v8
+from ._migrations import (
+    up_to_3,
+    v3_to_v4,
+    v4_to_v5,
+    v5_to_v6,
+    v6_to_v7,
+    v7_to_v8,
+    v8_to_v9,
+)
 from .file_and_directory_names import LATEST_VERSION_DIRECTORY
 
 _TEMP_PERSISTENCE_DIR_PREFIX: Final = "opentrons-robot-server-"
@@ -60,7 +68,8 @@ def make_migration_orchestrator(prepared_root: Path) -> MigrationOrchestrator:
             # schema that was never released to the public. It may be present on
             # internal robots.
             v6_to_v7.Migration6to7(subdirectory="7.1"),
-            v7_to_v8.Migration7to8(subdirectory=LATEST_VERSION_DIRECTORY),
+            v7_to_v8.Migration7to8(subdirectory="8"),
+            v8_to_v9.Migration8to9(subdirectory=LATEST_VERSION_DIRECTORY),
         ],
         temp_file_prefix="temp-",
     )
@@ -0,0 +1,98 @@
+"""Code that runs in a worker subprocess to simulate protocols for analysis."""
+
+
+# fmt: off
+
+# We keep a list of all the modules that this file imports
+# so we can preload them when launching the subprocesses.
+from types import ModuleType
+_imports: "list[ModuleType]" = []
+
+import asyncio  # noqa: E402
+import typing  # noqa: E402
+from multiprocessing import connection  # noqa: E402
+_imports.extend([asyncio, typing, connection])
+
+from opentrons import protocol_reader, protocol_runner  # noqa: E402
+from opentrons.protocol_engine import types as pe_types  # noqa: E402
+from opentrons.protocol_runner import (  # noqa: E402
+    create_simulating_orchestrator as simulating_runner,
+    run_orchestrator,
+)
+_imports.extend(
+    [protocol_reader, protocol_runner, pe_types, simulating_runner, run_orchestrator]
+)
+
+# fmt: on
+
+
+imports: typing.List[str] = [m.__name__ for m in _imports]
+"""The names of all modules imported by this module, e.g. "foo.bar.baz"."""
+
+
+def simulate_and_send_result(
+    result_connection: connection.Connection,
+    protocol_source: protocol_reader.ProtocolSource,
+    run_time_param_values: typing.Optional[pe_types.PrimitiveRunTimeParamValuesType],
+    run_time_param_paths: typing.Optional[pe_types.CSVRuntimeParamPaths],
+    deck_configuration: pe_types.DeckConfigurationType,
+) -> None:
+    """Simulate a protocol, and send the result or the raised exception to the parent.
+
+    This is the target of the worker subprocess.
+    """
+    result: object
+    try:
+        result = simulate_protocol(
+            protocol_source=protocol_source,
+            run_time_param_values=run_time_param_values,
+            run_time_param_paths=run_time_param_paths,
+            deck_configuration=deck_configuration,
+        )
+    except Exception as error:
+        result = error
+    try:
+        result_connection.send(result)
+    except Exception as error:
+        # The exception that the simulation raised might not be picklable.
+        result_connection.send(
+            RuntimeError(f"Could not send the analysis result: {error!r}")
+        )
+    finally:
+        result_connection.close()
+
+
+def simulate_protocol(
+    protocol_source: protocol_reader.ProtocolSource,
+    run_time_param_values: typing.Optional[pe_types.PrimitiveRunTimeParamValuesType],
+    run_time_param_paths: typing.Optional[pe_types.CSVRuntimeParamPaths],
+    deck_configuration: pe_types.DeckConfigurationType,
+) -> protocol_runner.RunResult:
+    """Load a protocol into a simulating orchestrator and run it to completion."""
+    return asyncio.run(
+        _simulate_protocol(
+            protocol_source=protocol_source,
+            run_time_param_values=run_time_param_values,
+            run_time_param_paths=run_time_param_paths,
+            deck_configuration=deck_configuration,
+        )
+    )
+
+
+async def _simulate_protocol(
+    protocol_source: protocol_reader.ProtocolSource,
+    run_time_param_values: typing.Optional[pe_types.PrimitiveRunTimeParamValuesType],
+    run_time_param_paths: typing.Optional[pe_types.CSVRuntimeParamPaths],
+    deck_configuration: pe_types.DeckConfigurationType,
+) -> protocol_runner.RunResult:
+    orchestrator = await simulating_runner.create_simulating_orchestrator(
+        robot_type=protocol_source.robot_type,
+        protocol_config=protocol_source.config,
+    )
+    await orchestrator.load(
+        protocol_source=protocol_source,
+        parse_mode=run_orchestrator.ParseMode.NORMAL,
+        run_time_param_values=run_time_param_values,
+        run_time_param_paths=run_time_param_paths,
+    )
+    return await orchestrator.run(deck_configuration=deck_configuration)
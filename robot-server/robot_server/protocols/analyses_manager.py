@@ -13,10 +13,13 @@ from robot_server.protocols.analysis_models import (
     AnalysisStatus,
     AnalysisSummary,
 )
-from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_scheduler import (
+    AnalysisQueueStatus,
+    AnalysisScheduler,
+)
+from robot_server.protocols.analysis_store import AnalysisIsPendingError, AnalysisStore
 from robot_server.protocols import protocol_analyzer
 from robot_server.protocols.protocol_store import ProtocolResource
-from robot_server.service.task_runner import TaskRunner
 import robot_server.errors.error_mappers as em
 
 
@@ -31,9 +34,11 @@ class FailedToInitializeAnalyzer(Exception):
 class AnalysesManager:
     """A Collaborator that manages and provides an interface to Protocol Analyzers."""
 
-    def __init__(self, analysis_store: AnalysisStore, task_runner: TaskRunner) -> None:
+    def __init__(
+        self, analysis_store: AnalysisStore, analysis_scheduler: AnalysisScheduler
+    ) -> None:
         self._analysis_store = analysis_store
-        self._task_runner = task_runner
+        self._analysis_scheduler = analysis_scheduler
 
     async def initialize_analyzer(
         self,
@@ -85,20 +90,65 @@ class AnalysesManager:
         self,
         analysis_id: str,
         analyzer: protocol_analyzer.ProtocolAnalyzer,
+        use_cache: bool = True,
     ) -> AnalysisSummary:
-        """Start an analysis of the given protocol resource with verified run time parameters."""
+        """Start an analysis of the given protocol resource with verified run time parameters.
+
+        If `use_cache` is True and some stored analysis, of any protocol, had exactly
+        the same inputs, its result is copied instead of running a new simulation,
+        and the returned summary is already completed.
+
+        Otherwise, the analysis is queued to run in the background. If the protocol
+        already had an analysis queued, that one is superseded: it's dropped without
+        ever running.
+
+        Raises:
+            AnalysisIsPendingError: The protocol already has an analysis that's
+                currently running.
+        """
+        protocol_id = analyzer.protocol_resource.protocol_id
+        running_analysis_id = self._analysis_scheduler.get_running_analysis_id(
+            protocol_id
+        )
+        if running_analysis_id is not None:
+            raise AnalysisIsPendingError(running_analysis_id)
+        superseded_analysis_id = self._analysis_scheduler.cancel_queued(protocol_id)
+        if superseded_analysis_id is not None:
+            self._analysis_store.remove_pending(superseded_analysis_id)
+
+        if use_cache:
+            cached_summary = await self._analysis_store.add_from_cache(
+                protocol_id=protocol_id,
+                analysis_id=analysis_id,
+                cache_key=analyzer.get_cache_key(),
+            )
+            if cached_summary is not None:
+                return cached_summary
+
         run_time_parameters = analyzer.get_verified_run_time_parameters()
         self._analysis_store.add_pending(
-            protocol_id=analyzer.protocol_resource.protocol_id,
+            protocol_id=protocol_id,
             analysis_id=analysis_id,
             run_time_parameters=run_time_parameters,
         )
-        self._task_runner.run(
-            analyzer.analyze,
+        self._analysis_scheduler.schedule(
+            protocol_id=protocol_id,
             analysis_id=analysis_id,
+            analyze=analyzer.analyze,
         )
         return AnalysisSummary(
             id=analysis_id,
             status=AnalysisStatus.PENDING,
             runTimeParameters=run_time_parameters,
         )
+
+    def prioritize(self, protocol_id: str) -> None:
+        """Run the given protocol's queued analysis, if any, before other queued ones.
+
+        Call this when a client shows interest in the protocol.
+        """
+        self._analysis_scheduler.prioritize(protocol_id)
+
+    def get_queue_status(self) -> AnalysisQueueStatus:
+        """Return how many analyses are waiting and running."""
+        return self._analysis_scheduler.get_status()
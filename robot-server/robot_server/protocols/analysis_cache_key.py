@@ -0,0 +1,58 @@
+"""Keys identifying everything that determines a protocol analysis's result."""
+import json
+from hashlib import sha256
+from typing import List
+
+from opentrons import __version__ as _software_version
+from opentrons.protocol_engine.types import (
+    CSVParameter,
+    DeckConfigurationType,
+    RunTimeParameter,
+)
+from opentrons.protocol_reader import JsonProtocolConfig, ProtocolSource
+
+
+def compute_analysis_cache_key(
+    protocol_source: ProtocolSource,
+    run_time_parameters: List[RunTimeParameter],
+    deck_configuration: DeckConfigurationType,
+) -> str:
+    """Return a key that's equal for analyses that are guaranteed to be equal.
+
+    Analysis is a deterministic simulation, so two analyses with the same key can share
+    a result, even if they belong to different protocol IDs.
+
+    Params:
+        protocol_source: The protocol being analyzed. Its files are identified by
+            their content hash, so this is independent of where they're stored.
+        run_time_parameters: The validated run-time parameters, as returned by the
+            orchestrator after loading the protocol. CSV parameters are identified
+            by data file ID, which is unique per file content.
+        deck_configuration: The deck configuration the analysis runs against.
+    """
+    if isinstance(protocol_source.config, JsonProtocolConfig):
+        protocol_version = f"json-{protocol_source.config.schema_version}"
+    else:
+        protocol_version = f"python-{protocol_source.config.api_version}"
+
+    parameter_values = {
+        parameter.variableName: (
+            parameter.file.id if parameter.file is not None else None
+        )
+        if isinstance(parameter, CSVParameter)
+        else parameter.value
+        for parameter in run_time_parameters
+    }
+
+    key_document = json.dumps(
+        {
+            "softwareVersion": _software_version,
+            "contentHash": protocol_source.content_hash,
+            "robotType": protocol_source.robot_type,
+            "protocolVersion": protocol_version,
+            "runTimeParameters": parameter_values,
+            "deckConfiguration": deck_configuration,
+        },
+        sort_keys=True,
+    )
+    return sha256(key_document.encode("utf-8")).hexdigest()
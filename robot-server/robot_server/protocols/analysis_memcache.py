@@ -1,76 +1,129 @@
 """A simple size-limited memory cache used for large resources."""
-from typing import Generic, TypeVar, Deque, Type, Dict
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar, Type, Tuple
 from logging import getLogger
 
-from collections import deque
-
 _log = getLogger(__name__)
 
 K = TypeVar("K")
 V = TypeVar("V")
 
 
+@dataclass(frozen=True)
+class MemoryCacheStats:
+    """Counters describing how well a `MemoryCache` is doing."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
 class MemoryCache(Generic[K, V]):
-    """A cache of some resource V by some key K."""
+    """A least-recently-used cache of some resource V by some key K.
 
-    _cache: Dict[K, V]
-    _cache_order: Deque[K]
-    _cache_size: int
+    The cache is bounded by a number of entries and, optionally, by the approximate
+    total size in bytes of its entries, as reported by callers on insert. Whichever
+    limit is hit first causes the least-recently-used entries to be evicted.
+    """
 
-    def __init__(self, size_limit: int, _keyhint: Type[K], _valhint: Type[V]) -> None:
+    # Maps each key to its value and approximate size, least recently used first.
+    _cache: "OrderedDict[K, Tuple[V, int]]"
+    _cache_size: int
+    _byte_limit: Optional[int]
+    _size_bytes: int
+
+    def __init__(
+        self,
+        size_limit: int,
+        _keyhint: Type[K],
+        _valhint: Type[V],
+        byte_limit: Optional[int] = None,
+    ) -> None:
         assert size_limit > 0, f"Cache size must be above 0 but was {size_limit}"
+        assert (
+            byte_limit is None or byte_limit > 0
+        ), f"Cache byte limit must be above 0 but was {byte_limit}"
         _, _ = _keyhint, _valhint
-        self._cache = {}
-        self._cache_order = deque()
+        self._cache = OrderedDict()
         self._cache_size = size_limit
+        self._byte_limit = byte_limit
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def contains(self, key: K) -> bool:
-        """Returns True if the key is cached."""
+        """Returns True if the key is cached.
+
+        This does not count as a use of the element.
+        """
         return key in self._cache
 
     def get(self, key: K) -> V:
-        """Get a cache element, raising KeyError if it is not cached."""
-        return self._cache[key]
+        """Get a cache element, raising KeyError if it is not cached.
 
-    def _pop_eldest(self, key: K) -> None:
-        if len(self._cache) < self._cache_size:
-            return
-        if key in self._cache:
-            return
-
-        try:
-            eldest = self._cache_order.pop()
-        except IndexError:
-            _log.error(
-                f"cache order queue was empty with {len(self._cache)} elements in cache"
-            )
-            raise
+        This marks the element as the most recently used.
+        """
         try:
-            del self._cache[eldest]
+            value, _ = self._cache[key]
         except KeyError:
-            _log.error(f"oldest-cached analysis id {eldest} was not present")
+            self._misses += 1
             raise
+        self._hits += 1
+        self._cache.move_to_end(key)
+        return value
 
-    def insert(self, key: K, value: V) -> None:
+    def insert(self, key: K, value: V, size_bytes: int = 0) -> None:
         """Insert a cache element by its key.
 
-        If this cache element would make the cache larger than its size limit, the oldest entry
-        will be removed.
+        `size_bytes` is the approximate size of the element, for the cache's byte limit.
 
-        If this cache element has the same key as another, the cache will not change and neither will
-        the age of the element.
+        If this cache element would make the cache exceed its limits, the least recently
+        used entries will be removed. If the element alone is bigger than the byte limit,
+        it is not cached.
+
+        If this cache element has the same key as another, it replaces it and becomes
+        the most recently used.
         """
-        self._pop_eldest(key)
-        self._cache[key] = value
-        self._cache_order.appendleft(key)
+        self._discard(key)
+        if self._byte_limit is not None and size_bytes > self._byte_limit:
+            _log.debug(
+                f"Not caching {key}: {size_bytes} bytes exceeds the cache's"
+                f" limit of {self._byte_limit} bytes"
+            )
+            return
+        self._cache[key] = (value, size_bytes)
+        self._size_bytes += size_bytes
+        while len(self._cache) > self._cache_size or (
+            self._byte_limit is not None and self._size_bytes > self._byte_limit
+        ):
+            _, (_, evicted_size) = self._cache.popitem(last=False)
+            self._size_bytes -= evicted_size
+            self._evictions += 1
 
     def remove(self, key: K) -> None:
         """Remove the cached element specified by the key.
 
         If no such element exists in cache, then simply no-op.
         """
+        self._discard(key)
+
+    def stats(self) -> MemoryCacheStats:
+        """Return the cache's hit/miss/eviction counters and current occupancy."""
+        return MemoryCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._cache),
+            size_bytes=self._size_bytes,
+        )
+
+    def _discard(self, key: K) -> None:
         try:
-            self._cache.pop(key)
-            self._cache_order.remove(key)  # O(n) operation, use sparingly
+            _, size_bytes = self._cache.pop(key)
         except KeyError:
-            pass
+            return
+        self._size_bytes -= size_bytes
@@ -0,0 +1,113 @@
+"""Queueing and concurrency control for protocol analyses."""
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Dict, Optional
+
+from robot_server.service.task_runner import TaskFunc, TaskRunner
+
+_log = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AnalysisQueueStatus:
+    """How many analyses are waiting and running."""
+
+    queued: int
+    running: int
+    max_concurrent: int
+
+
+@dataclass(frozen=True)
+class _Job:
+    protocol_id: str
+    analysis_id: str
+    analyze: TaskFunc
+
+
+class AnalysisScheduler:
+    """Run protocol analyses in the background, a bounded number at a time.
+
+    Each analysis simulates its protocol in its own subprocess (see
+    `analysis_subprocess`), which takes CPU time and memory away from the rest of
+    the robot. So instead of starting every analysis immediately, we queue them and
+    only run `max_concurrent` at once.
+
+    Queued analyses start in the order they were scheduled, except that a protocol
+    can be prioritized (for example, because a client is looking at it) to move its
+    analysis to the front of the queue.
+
+    There's at most one queued analysis per protocol, mirroring `AnalysisStore`,
+    which allows at most one pending analysis per protocol.
+    """
+
+    def __init__(self, task_runner: TaskRunner, max_concurrent: int) -> None:
+        assert (
+            max_concurrent > 0
+        ), f"max_concurrent must be above 0 but was {max_concurrent}"
+        self._task_runner = task_runner
+        self._max_concurrent = max_concurrent
+        # Queued jobs by protocol ID, next to start first.
+        self._queued: "OrderedDict[str, _Job]" = OrderedDict()
+        # Analysis IDs of running jobs, by protocol ID.
+        self._running: Dict[str, str] = {}
+
+    def schedule(self, protocol_id: str, analysis_id: str, analyze: TaskFunc) -> None:
+        """Queue an analysis, starting it right away if there's room.
+
+        Params:
+            protocol_id: The protocol being analyzed.
+                Must not already have a queued or running analysis.
+            analysis_id: The ID of the analysis, passed to `analyze`.
+            analyze: An async function that runs the analysis and stores its result.
+                It's called with a single `analysis_id` keyword argument.
+        """
+        assert (
+            protocol_id not in self._queued and protocol_id not in self._running
+        ), "Protocol must not already have a scheduled analysis."
+        self._queued[protocol_id] = _Job(
+            protocol_id=protocol_id, analysis_id=analysis_id, analyze=analyze
+        )
+        self._start_queued_jobs()
+
+    def prioritize(self, protocol_id: str) -> None:
+        """Move the protocol's queued analysis, if any, to the front of the queue."""
+        if protocol_id in self._queued:
+            self._queued.move_to_end(protocol_id, last=False)
+
+    def cancel_queued(self, protocol_id: str) -> Optional[str]:
+        """Drop the protocol's queued analysis, if it hasn't started yet.
+
+        Returns:
+            The ID of the dropped analysis, or None if there was nothing to drop.
+        """
+        job = self._queued.pop(protocol_id, None)
+        if job is None:
+            return None
+        _log.info(f'Cancelled queued analysis "{job.analysis_id}".')
+        return job.analysis_id
+
+    def get_running_analysis_id(self, protocol_id: str) -> Optional[str]:
+        """Return the ID of the protocol's analysis that's currently running, if any."""
+        return self._running.get(protocol_id)
+
+    def get_status(self) -> AnalysisQueueStatus:
+        """Return how many analyses are waiting and running."""
+        return AnalysisQueueStatus(
+            queued=len(self._queued),
+            running=len(self._running),
+            max_concurrent=self._max_concurrent,
+        )
+
+    def _start_queued_jobs(self) -> None:
+        while self._queued and len(self._running) < self._max_concurrent:
+            _, job = self._queued.popitem(last=False)
+            self._running[job.protocol_id] = job.analysis_id
+            self._task_runner.run(self._run_job, job=job)
+
+    async def _run_job(self, job: _Job) -> None:
+        try:
+            await job.analyze(analysis_id=job.analysis_id)
+        finally:
+            del self._running[job.protocol_id]
+            self._start_queued_jobs()
@@ -32,7 +32,11 @@ from .analysis_models import (
     AnalysisStatus,
 )
 
-from .completed_analysis_store import CompletedAnalysisStore, CompletedAnalysisResource
+from .completed_analysis_store import (
+    CompletedAnalysisCacheStats,
+    CompletedAnalysisStore,
+    CompletedAnalysisResource,
+)
 from .analysis_memcache import MemoryCache
 from .rtp_resources import PrimitiveParameterResource, CSVParameterResource
 
@@ -65,6 +69,11 @@ _log = getLogger(__name__)
 _CURRENT_ANALYZER_VERSION: Final = "2"
 # We have a reasonable limit for a memory cache of analyses.
 _CACHE_MAX_SIZE: Final = 32
+# Approximate limits, in bytes of serialized JSON, on how much of the completed
+# analyses the caches will hold. Parsed analyses take several times more memory
+# than their JSON, so their limit is lower.
+_CACHE_MAX_BYTES: Final = 16 * 1024 * 1024
+_DOCUMENT_CACHE_MAX_BYTES: Final = 32 * 1024 * 1024
 
 
 class AnalysisNotFoundError(ValueError):
@@ -114,8 +123,16 @@ class AnalysisStore:
         self._pending_store = _PendingAnalysisStore()
         self._completed_store = completed_store or CompletedAnalysisStore(
             sql_engine=sql_engine,
-            memory_cache=MemoryCache(_CACHE_MAX_SIZE, str, CompletedAnalysisResource),
+            memory_cache=MemoryCache(
+                _CACHE_MAX_SIZE,
+                str,
+                CompletedAnalysisResource,
+                byte_limit=_CACHE_MAX_BYTES,
+            ),
             current_analyzer_version=_CURRENT_ANALYZER_VERSION,
+            document_memory_cache=MemoryCache(
+                _CACHE_MAX_SIZE, str, str, byte_limit=_DOCUMENT_CACHE_MAX_BYTES
+            ),
         )
 
     def add_pending(
@@ -142,6 +159,15 @@ class AnalysisStore:
             run_time_parameters=run_time_parameters or [],
         )
 
+    def remove_pending(self, analysis_id: str) -> None:
+        """Remove a pending analysis that will never be completed.
+
+        Args:
+            analysis_id: The ID of the analysis to remove.
+                Must point to a valid pending analysis.
+        """
+        self._pending_store.remove(analysis_id=analysis_id)
+
     async def update(
         self,
         analysis_id: str,
@@ -154,6 +180,7 @@ class AnalysisStore:
         errors: List[ErrorOccurrence],
         liquids: List[Liquid],
         liquidClasses: List[LiquidClassRecordWithId],
+        cache_key: Optional[str] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -171,6 +198,8 @@ class AnalysisStore:
             liquids: See `CompletedAnalysis.liquids`.
             liquidClasses: See `CompletedAnalysis.liquidClasses`.
             robot_type: See `CompletedAnalysis.robotType`.
+            cache_key: See `analysis_cache_key`. If provided, future analyses with
+                the same key can reuse this result via `add_from_cache()`.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -211,6 +240,7 @@ class AnalysisStore:
             protocol_id=protocol_id,
             analyzer_version=_CURRENT_ANALYZER_VERSION,
             completed_analysis=completed_analysis,
+            cache_key=cache_key,
         )
         primitive_rtp_resources = self._extract_primitive_run_time_params(
             completed_analysis
@@ -224,6 +254,61 @@ class AnalysisStore:
 
         self._pending_store.remove(analysis_id=analysis_id)
 
+    async def add_from_cache(
+        self,
+        protocol_id: str,
+        analysis_id: str,
+        cache_key: str,
+    ) -> Optional[AnalysisSummary]:
+        """Add a completed analysis by copying a stored one with the same cache key.
+
+        The stored analysis may belong to any protocol.
+
+        Args:
+            protocol_id: The protocol to add the new analysis to.
+                Must point to a valid protocol that does not have a pending analysis.
+            analysis_id: The ID of the new analysis.
+                Must be unique across *all* protocols, not just this one.
+            cache_key: See `analysis_cache_key`.
+
+        Returns:
+            A summary of the just-added analysis, or None if no stored analysis
+            has a matching cache key, in which case nothing was added.
+        """
+        cached_analysis_id = self._completed_store.get_id_by_cache_key(cache_key)
+        if cached_analysis_id is None:
+            return None
+        cached_resource = await self._completed_store.get_by_id(cached_analysis_id)
+        if cached_resource is None:
+            return None
+
+        completed_analysis = cached_resource.completed_analysis.copy(
+            update={"id": analysis_id}
+        )
+        completed_analysis_resource = CompletedAnalysisResource(
+            id=analysis_id,
+            protocol_id=protocol_id,
+            analyzer_version=_CURRENT_ANALYZER_VERSION,
+            completed_analysis=completed_analysis,
+            cache_key=cache_key,
+        )
+        await self._completed_store.make_room_and_add(
+            completed_analysis_resource=completed_analysis_resource,
+            primitive_rtp_resources=self._extract_primitive_run_time_params(
+                completed_analysis
+            ),
+            csv_rtp_resources=self._extract_csv_run_time_params(completed_analysis),
+        )
+        _log.info(
+            f'Reused analysis "{cached_analysis_id}" as "{analysis_id}"'
+            f" for identical inputs."
+        )
+        return AnalysisSummary(
+            id=analysis_id,
+            status=AnalysisStatus.COMPLETED,
+            runTimeParameters=completed_analysis.runTimeParameters,
+        )
+
     async def save_initialization_failed_analysis(
         self,
         protocol_id: str,
@@ -330,6 +415,10 @@ class AnalysisStore:
         else:
             return completed_analyses + [pending_analysis]
 
+    def get_cache_stats(self) -> CompletedAnalysisCacheStats:
+        """Return the hit/miss/eviction counters of the completed analysis caches."""
+        return self._completed_store.get_cache_stats()
+
     @staticmethod
     def _extract_primitive_run_time_params(
         completed_analysis: CompletedAnalysis,
@@ -0,0 +1,92 @@
+"""Simulate protocols for analysis in subprocesses, away from the server's event loop."""
+import asyncio
+import multiprocessing
+from functools import lru_cache
+from logging import getLogger
+from multiprocessing.context import ForkServerContext
+from typing import Optional
+
+from opentrons.protocol_engine.types import (
+    CSVRuntimeParamPaths,
+    DeckConfigurationType,
+    PrimitiveRunTimeParamValuesType,
+)
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import RunResult
+
+from . import _analysis_worker
+
+_log = getLogger(__name__)
+
+
+class AnalysisProcessError(RuntimeError):
+    """Raised when an analysis subprocess exits without sending back a result."""
+
+    def __init__(self, exit_code: Optional[int]) -> None:
+        """Initialize the error's message from the subprocess's exit code."""
+        super().__init__(
+            f"The analysis process exited unexpectedly with code {exit_code}."
+        )
+
+
+@lru_cache(maxsize=1)
+def _get_context() -> ForkServerContext:
+    # Launching each subprocess by forking a server that has already imported
+    # the Protocol Engine is much faster than starting a fresh interpreter,
+    # and forking the server process itself isn't safe because of its threads.
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(_analysis_worker.imports)
+    return context
+
+
+async def simulate_protocol(
+    protocol_source: ProtocolSource,
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+    run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    deck_configuration: DeckConfigurationType,
+) -> RunResult:
+    """Simulate a protocol in a new subprocess and return the result of the run.
+
+    The simulation doesn't compete with request handling for this process's
+    event loop, and if this is cancelled, the subprocess is terminated.
+
+    Raises:
+        AnalysisProcessError: The subprocess died before sending back a result.
+        Exception: Whatever the simulation raised.
+    """
+    context = _get_context()
+    result_receiver, result_sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_analysis_worker.simulate_and_send_result,
+        kwargs={
+            "result_connection": result_sender,
+            "protocol_source": protocol_source,
+            "run_time_param_values": run_time_param_values,
+            "run_time_param_paths": run_time_param_paths,
+            "deck_configuration": deck_configuration,
+        },
+        # Don't let a running analysis hold up the server's shutdown.
+        daemon=True,
+    )
+    process.start()
+    # Only the subprocess sends results, so close our copy of its end of the pipe.
+    # Then, if the subprocess dies, receiving raises EOFError.
+    result_sender.close()
+    try:
+        result = await asyncio.to_thread(result_receiver.recv)
+    except EOFError:
+        await asyncio.to_thread(process.join)
+        raise AnalysisProcessError(process.exitcode) from None
+    except BaseException:
+        # Most likely, we were cancelled. The thread that's receiving will see EOF
+        # once the subprocess is gone, so leave our end of the pipe open for it.
+        _log.info("Terminating an unfinished analysis process.")
+        process.terminate()
+        raise
+    result_receiver.close()
+    await asyncio.to_thread(process.join)
+
+    if isinstance(result, BaseException):
+        raise result
+    assert isinstance(result, RunResult)
+    return result
@@ -19,7 +19,7 @@ from robot_server.persistence.tables import (
 from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
 
 from .analysis_models import CompletedAnalysis
-from .analysis_memcache import MemoryCache
+from .analysis_memcache import MemoryCache, MemoryCacheStats
 from .rtp_resources import PrimitiveParameterResource, CSVParameterResource
 
 _log = getLogger(__name__)
@@ -38,6 +38,8 @@ class CompletedAnalysisResource:
     protocol_id: str
     analyzer_version: str
     completed_analysis: CompletedAnalysis
+    cache_key: Optional[str] = None
+    """See `analysis_cache_key`. None if this analysis's result must not be reused."""
 
     async def to_sql_values(self) -> Dict[str, object]:
         """Return this data as a dict that can be passed to a SQLALchemy insert.
@@ -64,6 +66,7 @@ class CompletedAnalysisResource:
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
             "completed_analysis": serialized_analysis,
+            "cache_key": self.cache_key,
         }
 
     @classmethod
@@ -91,6 +94,9 @@ class CompletedAnalysisResource:
         protocol_id = sql_row.protocol_id
         assert isinstance(protocol_id, str)
 
+        cache_key = sql_row.cache_key
+        assert isinstance(cache_key, (str, type(None)))
+
         def parse_completed_analysis() -> CompletedAnalysis:
             return json_to_pydantic(CompletedAnalysis, sql_row.completed_analysis)
 
@@ -106,9 +112,21 @@ class CompletedAnalysisResource:
             protocol_id=protocol_id,
             analyzer_version=analyzer_version,
             completed_analysis=completed_analysis,
+            cache_key=cache_key,
         )
 
 
+@dataclass(frozen=True)
+class CompletedAnalysisCacheStats:
+    """Counters for the in-memory caches of a `CompletedAnalysisStore`."""
+
+    analyses: MemoryCacheStats
+    """The cache of parsed `CompletedAnalysisResource`s."""
+
+    documents: MemoryCacheStats
+    """The cache of pre-serialized JSON analysis documents."""
+
+
 class CompletedAnalysisStore:
     """A SQL-persistent and memory-cached store of protocol analyses that are completed.
 
@@ -125,6 +143,11 @@ class CompletedAnalysisStore:
     # Caching it can speed up the overall HTTP response time by ~10x (after the first request).
     _memcache: MemoryCache[str, CompletedAnalysisResource]
 
+    # Analyses are also fetched as pre-serialized JSON documents, which are cheap to
+    # produce but can still be tens of megabytes that we'd otherwise read from SQLite
+    # on every request. Entries in both caches are sized by their JSON length.
+    _document_memcache: MemoryCache[str, str]
+
     # This is a lock for performance, not correctness.
     #
     # If multiple clients request the same resources all at once, we want to handle the requests
@@ -142,10 +165,12 @@ class CompletedAnalysisStore:
         sql_engine: sqlalchemy.engine.Engine,
         memory_cache: MemoryCache[str, CompletedAnalysisResource],
         current_analyzer_version: str,
+        document_memory_cache: MemoryCache[str, str],
     ) -> None:
         self._sql_engine = sql_engine
         self._current_analyzer_version = current_analyzer_version
         self._memcache = memory_cache
+        self._document_memcache = document_memory_cache
         self._memcache_lock = asyncio.Lock()
 
     async def get_by_id(self, analysis_id: str) -> Optional[CompletedAnalysisResource]:
@@ -168,7 +193,7 @@ class CompletedAnalysisStore:
             resource = await CompletedAnalysisResource.from_sql_row(
                 result, self._current_analyzer_version
             )
-            self._memcache.insert(resource.id, resource)
+            self._memcache.insert(resource.id, resource, len(result.completed_analysis))
 
             return resource
 
@@ -178,6 +203,11 @@ class CompletedAnalysisStore:
         This is like `get_by_id()`, except it returns the analysis as a pre-serialized JSON
         document.
         """
+        try:
+            return self._document_memcache.get(analysis_id)
+        except KeyError:
+            pass
+
         statement = sqlalchemy.select(analysis_table.c.completed_analysis).where(
             analysis_table.c.id == analysis_id
         )
@@ -189,6 +219,7 @@ class CompletedAnalysisStore:
                 # No analysis with this ID.
                 return None
 
+        self._document_memcache.insert(analysis_id, document, len(document))
         return document
 
     async def get_by_protocol(
@@ -242,7 +273,9 @@ class CompletedAnalysisStore:
                         r, self._current_analyzer_version
                     )
                     local_memcache[resource.id] = resource
-                    self._memcache.insert(resource.id, resource)
+                    self._memcache.insert(
+                        resource.id, resource, len(r.completed_analysis)
+                    )
 
             # note: we want to iterate through ordered_analyseS_for_protocol rather than
             # just the local_memcache dict to preserve total ordering
@@ -268,6 +301,25 @@ class CompletedAnalysisStore:
 
         return result_ids
 
+    def get_id_by_cache_key(self, cache_key: str) -> Optional[str]:
+        """Return the ID of the latest analysis with the given cache key, if any.
+
+        Analyses from other analyzer versions are not considered.
+        """
+        statement = (
+            sqlalchemy.select(analysis_table.c.id)
+            .where(
+                analysis_table.c.cache_key == cache_key,
+                analysis_table.c.analyzer_version == self._current_analyzer_version,
+            )
+            .order_by(sqlite_rowid.desc())
+            .limit(1)
+        )
+        with self._sql_engine.begin() as transaction:
+            analysis_id = transaction.execute(statement).scalar_one_or_none()
+        assert isinstance(analysis_id, (str, type(None)))
+        return analysis_id
+
     def get_primitive_rtps_by_analysis_id(
         self, analysis_id: str
     ) -> Dict[str, PrimitiveAllowedTypes]:
@@ -329,6 +381,7 @@ class CompletedAnalysisStore:
         analyses_to_delete = analyses_ids[: -MAX_ANALYSES_TO_STORE + 1]
         for analysis_id in analyses_to_delete:
             self._memcache.remove(analysis_id)
+            self._document_memcache.remove(analysis_id)
 
         # Delete the RTP table rows that reference the analyses being deleted
         delete_primitive_rtp_statement = (
@@ -343,9 +396,10 @@ class CompletedAnalysisStore:
             analysis_table.c.id.in_(analyses_to_delete)
         )
 
-        insert_statement = analysis_table.insert().values(
-            await completed_analysis_resource.to_sql_values()
-        )
+        analysis_sql_values = await completed_analysis_resource.to_sql_values()
+        document = analysis_sql_values["completed_analysis"]
+        assert isinstance(document, str)
+        insert_statement = analysis_table.insert().values(analysis_sql_values)
         insert_rtp_statement = analysis_primitive_type_rtp_table.insert()
         insert_csv_rtp_statement = analysis_csv_rtp_table.insert()
 
@@ -365,5 +419,14 @@ class CompletedAnalysisStore:
                     csv_param.to_sql_values(),
                 )
         self._memcache.insert(
-            completed_analysis_resource.id, completed_analysis_resource
+            completed_analysis_resource.id, completed_analysis_resource, len(document)
+        )
+        self._document_memcache.insert(
+            completed_analysis_resource.id, document, len(document)
+        )
+
+    def get_cache_stats(self) -> CompletedAnalysisCacheStats:
+        """Return the hit/miss/eviction counters of this store's in-memory caches."""
+        return CompletedAnalysisCacheStats(
+            analyses=self._memcache.stats(), documents=self._document_memcache.stats()
         )
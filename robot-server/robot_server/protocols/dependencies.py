@@ -23,9 +23,13 @@ from robot_server.persistence.fastapi_dependencies import (
     get_sql_engine,
     get_active_persistence_directory,
 )
-from robot_server.persistence.file_and_directory_names import PROTOCOLS_DIRECTORY
+from robot_server.persistence.file_and_directory_names import (
+    PROTOCOLS_DIRECTORY,
+    PROTOCOL_SOURCE_CACHE_FILE,
+)
 from robot_server.settings import get_settings
 from .analyses_manager import AnalysesManager
+from .analysis_scheduler import AnalysisScheduler
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
@@ -79,6 +83,7 @@ async def get_protocol_store(
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
     protocol_directory: Annotated[Path, Depends(get_protocol_directory)],
     protocol_reader: Annotated[ProtocolReader, Depends(get_protocol_reader)],
+    persistence_directory: Annotated[Path, Depends(get_active_persistence_directory)],
 ) -> ProtocolStore:
     """Get a singleton ProtocolStore to keep track of created protocols."""
     async with _protocol_store_init_lock:
@@ -88,6 +93,7 @@ async def get_protocol_store(
                 sql_engine=sql_engine,
                 protocols_directory=protocol_directory,
                 protocol_reader=protocol_reader,
+                source_cache_file=persistence_directory / PROTOCOL_SOURCE_CACHE_FILE,
             )
             _protocol_store_accessor.set_on(app_state, protocol_store)
 
@@ -118,7 +124,11 @@ async def get_analyses_manager(
 
     if analyses_manager is None:
         analyses_manager = AnalysesManager(
-            analysis_store=analysis_store, task_runner=task_runner
+            analysis_store=analysis_store,
+            analysis_scheduler=AnalysisScheduler(
+                task_runner=task_runner,
+                max_concurrent=get_settings().maximum_concurrent_analyses,
+            ),
         )
         _analyses_manager_accessor.set_on(app_state, analyses_manager)
 
@@ -1,6 +1,5 @@
 """Protocol analysis module."""
 import logging
-import asyncio
 from typing import Optional, List
 
 from opentrons_shared_data.robot.types import RobotType
@@ -9,14 +8,12 @@ import opentrons.protocol_runner.create_simulating_orchestrator as simulating_ru
 from opentrons.protocol_engine.errors import ErrorOccurrence
 from opentrons.util.performance_helpers import TrackingFunctions
 from opentrons.protocol_engine.types import (
+    DeckConfigurationType,
     PrimitiveRunTimeParamValuesType,
     RunTimeParameter,
     CSVRuntimeParamPaths,
 )
 import opentrons.util.helpers as datetime_helper
-from opentrons.protocol_runner import (
-    RunOrchestrator,
-)
 from opentrons.protocol_runner.run_orchestrator import ParseMode
 
 
@@ -24,9 +21,14 @@ import robot_server.errors.error_mappers as em
 
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_cache_key import compute_analysis_cache_key
+from robot_server.protocols import analysis_subprocess
 
 log = logging.getLogger(__name__)
 
+# Analysis doesn't account for the robot's actual deck configuration yet.
+_ANALYSIS_DECK_CONFIGURATION: DeckConfigurationType = []
+
 
 class ProtocolAnalyzer:
     """A collaborator to perform an analysis of a protocol and store the result."""
@@ -39,7 +41,9 @@ class ProtocolAnalyzer:
         """Initialize the analyzer and its dependencies."""
         self._analysis_store = analysis_store
         self._protocol_resource = protocol_resource
-        self._orchestrator: Optional[RunOrchestrator] = None
+        self._run_time_parameters: List[RunTimeParameter] = []
+        self._run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None
+        self._run_time_param_paths: Optional[CSVRuntimeParamPaths] = None
 
     @property
     def protocol_resource(self) -> ProtocolResource:
@@ -48,8 +52,18 @@ class ProtocolAnalyzer:
 
     def get_verified_run_time_parameters(self) -> List[RunTimeParameter]:
         """Get the validated RTPs with values set by the client."""
-        assert self._orchestrator is not None
-        return self._orchestrator.get_run_time_parameters()
+        return self._run_time_parameters
+
+    def get_cache_key(self) -> str:
+        """Get a key identifying this analysis's inputs. See `analysis_cache_key`.
+
+        This should only be called after `load_orchestrator()`.
+        """
+        return compute_analysis_cache_key(
+            protocol_source=self._protocol_resource.source,
+            run_time_parameters=self.get_verified_run_time_parameters(),
+            deck_configuration=_ANALYSIS_DECK_CONFIGURATION,
+        )
 
     async def load_orchestrator(
         self,
@@ -58,18 +72,27 @@ class ProtocolAnalyzer:
     ) -> None:
         """Load runner with the protocol and run time parameter values.
 
-        Returns: The RunOrchestrator instance.
+        This validates the run time parameters. The orchestrator is only needed for
+        that, so it's stopped right away, keeping just the validated parameters.
+        The analysis itself is simulated by a separate orchestrator, in a
+        subprocess; see `analyze()`.
         """
-        self._orchestrator = await simulating_runner.create_simulating_orchestrator(
+        self._run_time_param_values = run_time_param_values
+        self._run_time_param_paths = run_time_param_paths
+        orchestrator = await simulating_runner.create_simulating_orchestrator(
             robot_type=self._protocol_resource.source.robot_type,
             protocol_config=self._protocol_resource.source.config,
         )
-        await self._orchestrator.load(
-            protocol_source=self._protocol_resource.source,
-            parse_mode=ParseMode.NORMAL,
-            run_time_param_values=run_time_param_values,
-            run_time_param_paths=run_time_param_paths,
-        )
+        try:
+            await orchestrator.load(
+                protocol_source=self._protocol_resource.source,
+                parse_mode=ParseMode.NORMAL,
+                run_time_param_values=run_time_param_values,
+                run_time_param_paths=run_time_param_paths,
+            )
+        finally:
+            self._run_time_parameters = orchestrator.get_run_time_parameters()
+            await orchestrator.stop()
 
     @TrackingFunctions.track_analysis
     async def analyze(
@@ -78,20 +101,25 @@ class ProtocolAnalyzer:
     ) -> None:
         """Analyze a given protocol, storing the analysis when complete.
 
-        This method should only be called once the run orchestrator is loaded.
+        The protocol is simulated in a subprocess, so that it doesn't compete with
+        the server's request handling. This method should only be called after
+        `load_orchestrator()`.
         """
         assert self._protocol_resource is not None
-        assert self._orchestrator is not None
+        cache_key = self.get_cache_key()
         try:
-            result = await self._orchestrator.run(
-                deck_configuration=[],
+            result = await analysis_subprocess.simulate_protocol(
+                protocol_source=self._protocol_resource.source,
+                run_time_param_values=self._run_time_param_values,
+                run_time_param_paths=self._run_time_param_paths,
+                deck_configuration=_ANALYSIS_DECK_CONFIGURATION,
             )
         except BaseException as error:
             await self.update_to_failed_analysis(
                 analysis_id=analysis_id,
                 protocol_robot_type=self._protocol_resource.source.robot_type,
                 error=error,
-                run_time_parameters=self._orchestrator.get_run_time_parameters(),
+                run_time_parameters=self._run_time_parameters,
             )
             return
 
@@ -108,6 +136,7 @@ class ProtocolAnalyzer:
             errors=result.state_summary.errors,
             liquids=result.state_summary.liquids,
             liquidClasses=result.state_summary.liquidClasses,
+            cache_key=cache_key,
         )
 
     async def update_to_failed_analysis(
@@ -140,24 +169,6 @@ class ProtocolAnalyzer:
             liquidClasses=[],
         )
 
-    def __del__(self) -> None:
-        """Stop the simulating run orchestrator.
-
-        Once the analyzer is no longer in use- either because analysis completed
-        or was not required, stop the orchestrator so that all its background tasks
-        are stopped timely and do not block server shutdown.
-        """
-        if self._orchestrator is not None:
-            if self._orchestrator.get_is_okay_to_clear():
-                asyncio.run_coroutine_threadsafe(
-                    self._orchestrator.stop(), asyncio.get_running_loop()
-                )
-            else:
-                log.warning(
-                    "Analyzer is no longer in use but orchestrator is busy. "
-                    "Cannot stop the orchestrator currently."
-                )
-
 
 def create_protocol_analyzer(
     analysis_store: AnalysisStore,
@@ -0,0 +1,211 @@
+"""A persisted cache of `ProtocolSource`s, to speed up rehydrating the protocol store.
+
+Computing a `ProtocolSource` means reading and parsing every file of a protocol.
+Doing that for every stored protocol on every boot makes startup time grow with the
+number of stored protocols. Instead, we save what we computed to a single JSON file
+and, on the next boot, reuse the entries whose files haven't changed.
+
+The cache is purely an optimization. If it's missing, unreadable, from a different
+software version, or stale for some protocol, we fall back to computing the source.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from anyio import Path as AsyncPath, to_thread
+
+from opentrons import __version__ as _software_version
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    PythonProtocolConfig,
+)
+from opentrons.protocols.api_support.types import APIVersion
+
+
+_log = getLogger(__name__)
+
+# Bump this if the format of the cache file changes.
+_FORMAT_VERSION = 1
+
+Fingerprint = List[Tuple[str, int, int]]
+"""The name, size, and modification time of each file of a protocol, sorted by name."""
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    fingerprint: Fingerprint
+    source: ProtocolSource
+
+
+async def compute_fingerprint(protocol_subdirectory: AsyncPath) -> Fingerprint:
+    """Return a cheap fingerprint of a protocol's files, without reading them."""
+    fingerprint: Fingerprint = []
+    async for file in protocol_subdirectory.iterdir():
+        stat = await file.stat()
+        fingerprint.append((file.name, stat.st_size, stat.st_mtime_ns))
+    return sorted(fingerprint)
+
+
+class ProtocolSourceCache:
+    """The `ProtocolSource` of each stored protocol, as of its last computation."""
+
+    def __init__(self, cache_file: Path, protocols_directory: Path) -> None:
+        """Initialize the cache.
+
+        Params:
+            cache_file: Where the cache is persisted.
+            protocols_directory: The directory containing one subdirectory per
+                protocol, named by protocol ID.
+        """
+        self._cache_file = cache_file
+        self._protocols_directory = protocols_directory
+        self._entries: Dict[str, _CacheEntry] = {}
+
+    async def load(self) -> None:
+        """Load the persisted cache, discarding it if it can't be used."""
+        try:
+            contents = await AsyncPath(self._cache_file).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        try:
+            self._entries = await to_thread.run_sync(self._parse, contents)
+        except Exception:
+            _log.warning(
+                f"Ignoring unreadable protocol source cache {self._cache_file}.",
+                exc_info=True,
+            )
+            self._entries = {}
+
+    def get(
+        self, protocol_id: str, fingerprint: Fingerprint
+    ) -> Optional[ProtocolSource]:
+        """Return the cached source for the protocol, if its files haven't changed."""
+        entry = self._entries.get(protocol_id)
+        if entry is None or entry.fingerprint != fingerprint:
+            return None
+        return entry.source
+
+    def set(
+        self, protocol_id: str, fingerprint: Fingerprint, source: ProtocolSource
+    ) -> None:
+        """Record a freshly computed source. Call `save()` to persist it."""
+        self._entries[protocol_id] = _CacheEntry(fingerprint=fingerprint, source=source)
+
+    def retain_only(self, protocol_ids: List[str]) -> None:
+        """Forget every protocol not in `protocol_ids`."""
+        self._entries = {
+            protocol_id: entry
+            for protocol_id, entry in self._entries.items()
+            if protocol_id in protocol_ids
+        }
+
+    async def save(self) -> None:
+        """Persist the cache, atomically replacing the previous file."""
+        contents = await to_thread.run_sync(self._serialize)
+        temp_file = AsyncPath(
+            self._cache_file.with_name(self._cache_file.name + ".tmp")
+        )
+        await temp_file.write_text(contents, encoding="utf-8")
+        await temp_file.replace(self._cache_file)
+
+    def _parse(self, contents: str) -> Dict[str, _CacheEntry]:
+        document = json.loads(contents)
+        if (
+            document.get("formatVersion") != _FORMAT_VERSION
+            or document.get("softwareVersion") != _software_version
+        ):
+            # A different version of ProtocolReader might have computed
+            # something different from the same files.
+            return {}
+        return {
+            protocol_id: _CacheEntry(
+                fingerprint=[tuple(f) for f in entry["fingerprint"]],
+                source=_source_from_json(
+                    entry["source"], self._protocols_directory / protocol_id
+                ),
+            )
+            for protocol_id, entry in document["protocols"].items()
+        }
+
+    def _serialize(self) -> str:
+        protocols: Dict[str, object] = {}
+        for protocol_id, entry in self._entries.items():
+            source_json = _source_to_json(entry.source)
+            if source_json is not None:
+                protocols[protocol_id] = {
+                    "fingerprint": entry.fingerprint,
+                    "source": source_json,
+                }
+        return json.dumps(
+            {
+                "formatVersion": _FORMAT_VERSION,
+                "softwareVersion": _software_version,
+                "protocols": protocols,
+            }
+        )
+
+
+def _source_to_json(source: ProtocolSource) -> Optional[Dict[str, Any]]:
+    try:
+        metadata_json = json.dumps(source.metadata)
+    except (TypeError, ValueError):
+        return None
+    if json.loads(metadata_json) != source.metadata:
+        # The metadata wouldn't survive a round trip unchanged
+        # (for example, it contains tuples). Don't cache it.
+        return None
+
+    config: Dict[str, Any]
+    if isinstance(source.config, JsonProtocolConfig):
+        config = {"protocolType": "json", "schemaVersion": source.config.schema_version}
+    else:
+        config = {
+            "protocolType": "python",
+            "apiVersion": [
+                source.config.api_version.major,
+                source.config.api_version.minor,
+            ],
+        }
+
+    return {
+        "mainFile": source.main_file.name,
+        "contentHash": source.content_hash,
+        "files": [{"name": f.path.name, "role": f.role.value} for f in source.files],
+        "metadata": source.metadata,
+        "robotType": source.robot_type,
+        "config": config,
+    }
+
+
+def _source_from_json(
+    source_json: Dict[str, Any], protocol_subdirectory: Path
+) -> ProtocolSource:
+    config_json = source_json["config"]
+    config: Union[JsonProtocolConfig, PythonProtocolConfig]
+    if config_json["protocolType"] == "json":
+        config = JsonProtocolConfig(schema_version=config_json["schemaVersion"])
+    else:
+        major, minor = config_json["apiVersion"]
+        config = PythonProtocolConfig(api_version=APIVersion(major, minor))
+
+    return ProtocolSource(
+        directory=protocol_subdirectory,
+        main_file=protocol_subdirectory / source_json["mainFile"],
+        content_hash=source_json["contentHash"],
+        files=[
+            ProtocolSourceFile(
+                path=protocol_subdirectory / f["name"], role=ProtocolFileRole(f["role"])
+            )
+            for f in source_json["files"]
+        ],
+        metadata=source_json["metadata"],
+        robot_type=source_json["robotType"],
+        config=config,
+    )
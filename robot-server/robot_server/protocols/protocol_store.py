@@ -9,7 +9,7 @@ from logging import getLogger
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
-from anyio import Path as AsyncPath, create_task_group
+from anyio import CapacityLimiter, Path as AsyncPath, create_task_group
 import sqlalchemy
 
 from opentrons.protocols.parse import PythonParseMode
@@ -28,6 +28,10 @@ from robot_server.persistence.tables import (
     ProtocolKindSQLEnum,
 )
 from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_source_cache import (
+    ProtocolSourceCache,
+    compute_fingerprint,
+)
 
 
 _CACHE_ENTRIES = 32
@@ -35,6 +39,8 @@ _CACHE_ENTRIES = 32
 
 _log = getLogger(__name__)
 
+_MAX_CONCURRENT_SOURCE_COMPUTATIONS = 4
+
 
 @dataclass(frozen=True)
 class ProtocolResource:
@@ -130,6 +136,7 @@ class ProtocolStore:
         sql_engine: sqlalchemy.engine.Engine,
         protocols_directory: Path,
         protocol_reader: ProtocolReader,
+        source_cache_file: Optional[Path] = None,
     ) -> ProtocolStore:
         """Return a new ProtocolStore, picking up where a former one left off.
 
@@ -148,6 +155,9 @@ class ProtocolStore:
                 named after its protocol ID.
             protocol_reader: An interface to compute `ProtocolSource`s from protocol
                 files while rehydrating.
+            source_cache_file: Where to persist computed `ProtocolSource`s so the
+                next rehydration can skip re-reading protocols whose files haven't
+                changed. If omitted, every protocol is read.
         """
         # The SQL database is the canonical source of which protocols
         # have been added successfully.
@@ -155,12 +165,24 @@ class ProtocolStore:
             r.protocol_id for r in cls._sql_get_all_from_engine(sql_engine=sql_engine)
         )
 
+        source_cache = None
+        if source_cache_file is not None:
+            source_cache = ProtocolSourceCache(
+                cache_file=source_cache_file, protocols_directory=protocols_directory
+            )
+            await source_cache.load()
+
         sources_by_id = await _compute_protocol_sources(
             expected_protocol_ids=expected_ids,
             protocols_directory=AsyncPath(protocols_directory),
             protocol_reader=protocol_reader,
+            source_cache=source_cache,
         )
 
+        if source_cache is not None:
+            source_cache.retain_only(list(sources_by_id))
+            await source_cache.save()
+
         return ProtocolStore(
             _sql_engine=sql_engine,
             _sources_by_id=sources_by_id,
@@ -459,6 +481,7 @@ async def _compute_protocol_sources(
     expected_protocol_ids: Set[str],
     protocols_directory: AsyncPath,
     protocol_reader: ProtocolReader,
+    source_cache: Optional[ProtocolSourceCache] = None,
 ) -> Dict[str, ProtocolSource]:
     """Compute `ProtocolSource` objects from protocol source files.
 
@@ -473,6 +496,8 @@ async def _compute_protocol_sources(
         protocols_directory: A directory containing one subdirectory per protocol
             named by protocol ID. Scanned for files to pass to `protocol_reader`.
         protocol_reader: An interface to use to compute `ProtocolSource`s.
+        source_cache: Previously computed `ProtocolSource`s to reuse for protocols
+            whose files haven't changed. Freshly computed sources are added to it.
 
     Returns:
         A map from protocol ID to computed `ProtocolSource`.
@@ -514,14 +539,27 @@ async def _compute_protocol_sources(
         #  * Nobody has tampered with file the storage.
         #  * We don't try to compute the source of any protocol whose insertion
         #    failed halfway through and left files behind.
-        protocol_files = [Path(f) async for f in protocol_subdirectory.iterdir()]
-        protocol_source = await protocol_reader.read_saved(
-            files=protocol_files,
-            directory=Path(protocol_subdirectory),
-            files_are_prevalidated=True,
-            python_parse_mode=PythonParseMode.ALLOW_LEGACY_METADATA_AND_REQUIREMENTS,
-        )
+        if source_cache is not None:
+            fingerprint = await compute_fingerprint(protocol_subdirectory)
+            cached_source = source_cache.get(protocol_id, fingerprint)
+            if cached_source is not None:
+                sources_by_id[protocol_id] = cached_source
+                return
+
+        async with limiter:
+            protocol_files = [Path(f) async for f in protocol_subdirectory.iterdir()]
+            protocol_source = await protocol_reader.read_saved(
+                files=protocol_files,
+                directory=Path(protocol_subdirectory),
+                files_are_prevalidated=True,
+                python_parse_mode=PythonParseMode.ALLOW_LEGACY_METADATA_AND_REQUIREMENTS,
+            )
         sources_by_id[protocol_id] = protocol_source
+        if source_cache is not None:
+            source_cache.set(protocol_id, fingerprint, protocol_source)
+
+    # Parsing is CPU- and memory-heavy, so don't start all of them at once.
+    limiter = CapacityLimiter(_MAX_CONCURRENT_SOURCE_COMPUTATIONS)
 
     async with create_task_group() as task_group:
         # Use a TaskGroup instead of asyncio.gather() so,
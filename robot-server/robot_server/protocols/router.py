@@ -466,9 +466,14 @@ async def _start_new_analysis_if_necessary(
     protocol_resource: ProtocolResource,
     analysis_store: AnalysisStore,
     analyses_manager: AnalysesManager,
+    use_cached_analysis: bool = True,
 ) -> Tuple[List[AnalysisSummary], bool]:
     """Check RTP values and start a new analysis if necessary.
 
+    If `use_cached_analysis` is True, the new analysis may be completed immediately
+    by reusing the result of a stored analysis with identical inputs.
+    See `AnalysesManager.start_analysis()`.
+
     Returns a tuple of the latest list of analysis summaries (including any newly
     started analysis) and whether a new analysis was started.
     """
@@ -505,12 +510,18 @@ async def _start_new_analysis_if_necessary(
             )
         ):
             started_new_analysis = True
-            analyses.append(
-                await analyses_manager.start_analysis(
-                    analysis_id=analysis_id,
-                    analyzer=analyzer,
-                )
+            new_analysis_summary = await analyses_manager.start_analysis(
+                analysis_id=analysis_id,
+                analyzer=analyzer,
+                use_cache=use_cached_analysis,
             )
+            # If the protocol had a queued analysis, the new one superseded it.
+            analyses = [
+                analysis
+                for analysis in analyses
+                if analysis.status != AnalysisStatus.PENDING
+            ]
+            analyses.append(new_analysis_summary)
 
     return analyses, started_new_analysis
 
@@ -614,6 +625,7 @@ async def get_protocol_by_id(
     protocolId: str,
     protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
     analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
+    analyses_manager: Annotated[AnalysesManager, Depends(get_analyses_manager)],
 ) -> PydanticResponse[Body[Protocol, ProtocolLinks]]:
     """Get an uploaded protocol by ID.
 
@@ -621,12 +633,17 @@ async def get_protocol_by_id(
         protocolId: Protocol identifier to fetch, pulled from URL.
         protocol_store: In-memory database of protocol resources.
         analysis_store: In-memory database of protocol analyses.
+        analyses_manager: Protocol analysis managing interface.
     """
     try:
         resource = protocol_store.get(protocol_id=protocolId)
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
+    # A client is probably showing this protocol to a user,
+    # so its analysis is more urgent than other protocols'.
+    analyses_manager.prioritize(protocolId)
+
     analyses = analysis_store.get_summaries_by_protocol(protocol_id=protocolId)
     referencing_run_ids = protocol_store.get_referencing_run_ids(protocolId)
 
@@ -753,6 +770,7 @@ async def create_protocol_analysis(
             status.HTTP_422_UNPROCESSABLE_ENTITY
         )
 
+    force_reanalyze = request_body.data.forceReAnalyze if request_body else False
     try:
         (
             analysis_summaries,
@@ -760,12 +778,14 @@ async def create_protocol_analysis(
         ) = await _start_new_analysis_if_necessary(
             protocol_id=protocolId,
             analysis_id=analysis_id,
-            force_analyze=request_body.data.forceReAnalyze if request_body else False,
+            force_analyze=force_reanalyze,
             rtp_values=request_body.data.runTimeParameterValues if request_body else {},
             rtp_files=rtp_paths,
             protocol_resource=protocol_store.get(protocol_id=protocolId),
             analysis_store=analysis_store,
             analyses_manager=analyses_manager,
+            # A client forcing re-analysis wants the simulation to really run again.
+            use_cached_analysis=not force_reanalyze,
         )
     except AnalysisIsPendingError as error:
         raise LastAnalysisPending(detail=str(error)).as_error(
@@ -130,7 +130,10 @@ async def get_run_orchestrator_store(
 
     if run_orchestrator_store is None:
         run_orchestrator_store = RunOrchestratorStore(
-            hardware_api=hardware_api, robot_type=robot_type, deck_type=deck_type
+            hardware_api=hardware_api,
+            robot_type=robot_type,
+            deck_type=deck_type,
+            max_finished_commands_in_memory=get_settings().maximum_finished_commands_in_memory,
         )
         _run_orchestrator_store_accessor.set_on(app_state, run_orchestrator_store)
         # Provide the engine store to the light controller
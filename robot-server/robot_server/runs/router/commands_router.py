@@ -1,8 +1,9 @@
 """Router for /runs commands endpoints."""
 import textwrap
-from typing import Annotated, Final, Literal, Optional, Union
+from typing import Annotated, Final, Iterator, Literal, Optional, Union
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from opentrons.protocol_engine import (
     CommandPointer,
@@ -44,6 +45,8 @@ from .base_router import RunNotFound, RunStopped
 
 _DEFAULT_COMMAND_LIST_LENGTH: Final = 20
 
+_NDJSON_MEDIA_TYPE: Final = "application/x-ndjson"
+
 commands_router = APIRouter()
 
 
@@ -407,6 +410,65 @@ async def get_run_commands_as_pre_serialized_list(
     )
 
 
+@commands_router.get(
+    path="/runs/{runId}/commandsAsNDJSON",
+    summary="Stream all commands of a completed run as newline-delimited JSON",
+    description=(
+        "Get all commands of a completed run as newline-delimited JSON"
+        " (one serialized command per line)."
+        "**Warning:** This endpoint is experimental. We may change or remove it without warning."
+        "\n\n"
+        "Like `GET /runs/{runId}/commandsAsPreSerializedList`, this is only available"
+        " after a run has completed and its data has been committed to the database."
+        " Unlike that endpoint, the response is streamed as it's read from the database,"
+        " so the robot never holds the whole run's commands in memory at once."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {_NDJSON_MEDIA_TYPE: {}}},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": ErrorBody[PreSerializedCommandsNotAvailable]
+        },
+    },
+)
+async def get_run_commands_as_ndjson(
+    runId: str,
+    run_data_manager: Annotated[RunDataManager, Depends(get_run_data_manager)],
+    includeFixitCommands: bool = Query(
+        True,
+        description="If `true`, return all commands (protocol, setup, fixit)."
+        " If `false`, only return safe commands (protocol, setup).",
+    ),
+) -> StreamingResponse:
+    """Stream all commands of a completed run as newline-delimited JSON.
+
+    Arguments:
+        runId: Requested run ID, from the URL
+        run_data_manager: Run data retrieval interface.
+        includeFixitCommands: If `true`, return all commands."
+            " If `false`, only return safe commands.
+    """
+    try:
+        commands = run_data_manager.get_all_commands_as_preserialized_stream(
+            run_id=runId, include_fixit_commands=includeFixitCommands
+        )
+    except RunNotFoundError as e:
+        raise RunNotFound.from_exc(e).as_error(status.HTTP_404_NOT_FOUND) from e
+    except PreSerializedCommandsNotAvailableError as e:
+        raise PreSerializedCommandsNotAvailable.from_exc(e).as_error(
+            status.HTTP_503_SERVICE_UNAVAILABLE
+        ) from e
+    # StreamingResponse iterates a sync iterator in a worker thread,
+    # so the database reads don't block the event loop.
+    return StreamingResponse(_to_ndjson_lines(commands), media_type=_NDJSON_MEDIA_TYPE)
+
+
+def _to_ndjson_lines(commands: Iterator[str]) -> Iterator[str]:
+    for command in commands:
+        yield command + "\n"
+
+
 @PydanticResponse.wrap_route(
     commands_router.get,
     path="/runs/{runId}/commands/{commandId}",
@@ -1,7 +1,7 @@
 """Manage current and historical run data."""
 
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Union, Mapping
+from typing import Dict, Iterator, List, Optional, Callable, Union, Mapping
 
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons_shared_data.errors.exceptions import InvalidStoredData, EnumeratedError
@@ -544,6 +544,21 @@ class RunDataManager:
             run_id, include_fixit_commands
         )
 
+    def get_all_commands_as_preserialized_stream(
+        self, run_id: str, include_fixit_commands: bool
+    ) -> Iterator[str]:
+        """Get all commands of a run as an iterator of serialized json commands."""
+        if (
+            run_id == self._run_orchestrator_store.current_run_id
+            and not self._run_orchestrator_store.get_is_run_terminal()
+        ):
+            raise PreSerializedCommandsNotAvailableError(
+                "Pre-serialized commands are only available after a run has ended."
+            )
+        return self._run_store.get_all_commands_as_preserialized_stream(
+            run_id, include_fixit_commands
+        )
+
     def set_error_recovery_rules(
         self, run_id: str, rules: List[ErrorRecoveryRule]
     ) -> None:
@@ -124,6 +124,7 @@ class RunOrchestratorStore:
         hardware_api: HardwareControlAPI,
         robot_type: RobotType,
         deck_type: DeckType,
+        max_finished_commands_in_memory: Optional[int] = None,
     ) -> None:
         """Initialize a run orchestrator storage interface.
 
@@ -132,10 +133,13 @@ class RunOrchestratorStore:
                 construction.
             robot_type: Passed along to `opentrons.protocol_engine.Config`.
             deck_type: Passed along to `opentrons.protocol_engine.Config`.
+            max_finished_commands_in_memory: Passed along to
+                `opentrons.protocol_engine.Config`.
         """
         self._hardware_api = hardware_api
         self._robot_type = robot_type
         self._deck_type = deck_type
+        self._max_finished_commands_in_memory = max_finished_commands_in_memory
         self._run_orchestrator: Optional[RunOrchestrator] = None
         self._default_run_orchestrator: Optional[RunOrchestrator] = None
         hardware_api.register_callback(_get_estop_listener(self))
@@ -177,6 +181,7 @@ class RunOrchestratorStore:
                     robot_type=self._robot_type,
                     deck_type=self._deck_type,
                     block_on_door_open=False,
+                    max_finished_commands_in_memory=self._max_finished_commands_in_memory,
                 ),
                 # Error recovery mode would not make sense outside the context of a run--
                 # for example, there would be no equivalent to the `POST /runs/{id}/actions`
@@ -236,6 +241,7 @@ class RunOrchestratorStore:
                 block_on_door_open=feature_flags.enable_door_safety_switch(
                     RobotTypeEnum.robot_literal_to_enum(self._robot_type)
                 ),
+                max_finished_commands_in_memory=self._max_finished_commands_in_memory,
             ),
             error_recovery_policy=initial_error_recovery_policy,
             load_fixed_trash=load_fixed_trash,
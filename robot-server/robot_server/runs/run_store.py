@@ -4,7 +4,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Literal, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Literal, Tuple, Union
 
 import sqlalchemy
 from sqlalchemy import and_
@@ -51,6 +51,13 @@ log = logging.getLogger(__name__)
 
 _CACHE_ENTRIES = 32
 
+_SETTLED_COMMAND_STATUSES = (CommandStatus.SUCCEEDED, CommandStatus.FAILED)
+
+# How many commands to read from the database at a time when streaming a run's commands.
+# Each batch is read in its own short transaction, so a slow client doesn't hold
+# the database open for the whole duration of the response.
+_PRESERIALIZED_STREAM_BATCH_SIZE = 1000
+
 
 @dataclass(frozen=True)
 class RunResource:
@@ -104,6 +111,50 @@ class CSVParameterRunResource:
     file_id: Optional[str]
 
 
+@dataclass(frozen=True)
+class _CommandCounts:
+    total: int
+    fixit: int
+
+    def get(self, include_fixit_commands: bool) -> int:
+        return self.total if include_fixit_commands else self.total - self.fixit
+
+
+@dataclass(frozen=True)
+class _PersistedCommands:
+    """What was last written for a run's commands.
+
+    A command can't change once it has succeeded or failed, so the leading run of
+    finished commands that was written last time doesn't need to be written again.
+    """
+
+    settled_count: int
+    """How many leading commands had finished when they were written."""
+
+    last_settled_id: Optional[str]
+    """The ID of the last of those commands, to check that they're still the same."""
+
+    @classmethod
+    def from_commands(cls, commands: List[Command]) -> "_PersistedCommands":
+        settled_count = 0
+        for command in commands:
+            if command.status not in _SETTLED_COMMAND_STATUSES:
+                break
+            settled_count += 1
+        return cls(
+            settled_count=settled_count,
+            last_settled_id=commands[settled_count - 1].id if settled_count else None,
+        )
+
+    def is_prefix_of(self, commands: List[Command]) -> bool:
+        if self.settled_count == 0:
+            return True
+        return (
+            len(commands) >= self.settled_count
+            and commands[self.settled_count - 1].id == self.last_settled_id
+        )
+
+
 class CommandNotFoundError(ValueError):
     """Error raised when a given command ID is not found in the store."""
 
@@ -121,6 +172,11 @@ class RunStore:
     ) -> None:
         """Initialize a RunStore with sql engine and notification client."""
         self._sql_engine = sql_engine
+        # Command counts per run, maintained as commands are written so that paging
+        # through a run's commands doesn't need a COUNT(*) per page.
+        self._command_counts: Dict[str, _CommandCounts] = {}
+        # Which commands don't need rewriting the next time each run is persisted.
+        self._persisted_commands: Dict[str, _PersistedCommands] = {}
 
     def update_run_state(
         self,
@@ -131,6 +187,11 @@ class RunStore:
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
+        If this store already persisted the run, the leading commands that had
+        finished by then are left as they are, and only the rest are rewritten.
+        Persisting a run again then costs time proportional to what could have
+        changed, not to the length of the run.
+
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
@@ -156,11 +217,6 @@ class RunStore:
             )
         )
 
-        delete_existing_commands = sqlalchemy.delete(run_command_table).where(
-            run_command_table.c.run_id == run_id
-        )
-        insert_command = sqlalchemy.insert(run_command_table)
-
         select_run_resource = sqlalchemy.select(*_run_columns).where(
             run_table.c.id == run_id
         )
@@ -175,31 +231,35 @@ class RunStore:
                 raise RunNotFoundError(run_id=run_id)
 
             transaction.execute(update_run)
-            transaction.execute(delete_existing_commands)
-            for command_index, command in enumerate(commands):
-                transaction.execute(
-                    insert_command,
-                    {
-                        "run_id": run_id,
-                        "index_in_run": command_index,
-                        "command_id": command.id,
-                        "command": pydantic_to_json(command),
-                        "command_intent": str(command.intent.value)
-                        if command.intent
-                        else CommandIntent.PROTOCOL,
-                        "command_error": pydantic_to_json(command.error)
-                        if command.error
-                        else None,
-                        "command_status": _convert_commands_status_to_sql_command_status(
-                            command.status
-                        ),
-                    },
+            persisted = self._persisted_commands.get(run_id)
+            first_index = (
+                persisted.settled_count
+                if persisted is not None and persisted.is_prefix_of(commands)
+                else 0
+            )
+            transaction.execute(
+                sqlalchemy.delete(run_command_table).where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= first_index,
                 )
+            )
+            _insert_commands(
+                run_id=run_id,
+                indexed_commands=enumerate(commands[first_index:], start=first_index),
+                connection=transaction,
+            )
 
             run_row = transaction.execute(select_run_resource).one()
             action_rows = transaction.execute(select_actions).all()
 
         self._clear_caches()
+        self._persisted_commands[run_id] = _PersistedCommands.from_commands(commands)
+        self._command_counts[run_id] = _CommandCounts(
+            total=len(commands),
+            fixit=sum(
+                1 for command in commands if command.intent == CommandIntent.FIXIT
+            ),
+        )
         maybe_run_resource = _convert_row_to_run(row=run_row, action_rows=action_rows)
         if not maybe_run_resource.ok:
             raise maybe_run_resource.error
@@ -471,18 +531,9 @@ class RunStore:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
 
-            if include_fixit_commands:
-                select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
-                    run_command_table.c.run_id == run_id
-                )
-            else:
-                select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
-                    and_(
-                        run_command_table.c.run_id == run_id,
-                        run_command_table.c.command_intent != "fixit",
-                    )
-                )
-            count_result: int = transaction.execute(select_count).scalar_one()
+            count_result = self._get_command_counts(run_id, transaction).get(
+                include_fixit_commands
+            )
 
             actual_cursor = cursor if cursor is not None else count_result - length
             # Clamp to [0, count_result).
@@ -551,6 +602,23 @@ class RunStore:
             commands_result = transaction.scalars(select_commands).all()
         return commands_result
 
+    def get_all_commands_as_preserialized_stream(
+        self, run_id: str, include_fixit_commands: bool
+    ) -> Iterator[str]:
+        """Get all commands of the run as an iterator of strings of json command objects.
+
+        Unlike `get_all_commands_as_preserialized_list()`, this only keeps a bounded
+        number of commands in memory at a time, no matter how long the run is.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found. This is raised
+                immediately, not when the returned iterator is consumed.
+        """
+        with self._sql_engine.begin() as transaction:
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
+        return self._iter_preserialized_commands(run_id, include_fixit_commands)
+
     def get_command_errors_count(self, run_id: str) -> int:
         """Get run commands errors count from the store.
 
@@ -711,6 +779,53 @@ class RunStore:
             raise RunNotFoundError(run_id)
 
         self._clear_caches()
+        self._command_counts.pop(run_id, None)
+        self._persisted_commands.pop(run_id, None)
+
+    def _iter_preserialized_commands(
+        self, run_id: str, include_fixit_commands: bool
+    ) -> Iterator[str]:
+        select_commands = (
+            sqlalchemy.select(
+                run_command_table.c.index_in_run, run_command_table.c.command
+            )
+            .where(run_command_table.c.run_id == run_id)
+            .order_by(run_command_table.c.index_in_run)
+            .limit(_PRESERIALIZED_STREAM_BATCH_SIZE)
+        )
+        if not include_fixit_commands:
+            select_commands = select_commands.where(
+                run_command_table.c.command_intent != "fixit"
+            )
+
+        select_batch = select_commands
+        while True:
+            with self._sql_engine.begin() as transaction:
+                batch = transaction.execute(select_batch).all()
+            for row in batch:
+                yield row.command
+            if len(batch) < _PRESERIALIZED_STREAM_BATCH_SIZE:
+                return
+            select_batch = select_commands.where(
+                run_command_table.c.index_in_run > batch[-1].index_in_run
+            )
+
+    def _get_command_counts(
+        self, run_id: str, connection: sqlalchemy.engine.Connection
+    ) -> _CommandCounts:
+        """Return the run's command counts, querying them only if not already known."""
+        counts = self._command_counts.get(run_id)
+        if counts is None:
+            select_counts = sqlalchemy.select(
+                sqlalchemy.func.count(),
+                sqlalchemy.func.count().filter(
+                    run_command_table.c.command_intent == "fixit"
+                ),
+            ).where(run_command_table.c.run_id == run_id)
+            total, fixit = connection.execute(select_counts).one()
+            counts = _CommandCounts(total=total, fixit=fixit)
+            self._command_counts[run_id] = counts
+        return counts
 
     def _run_exists(
         self, run_id: str, connection: sqlalchemy.engine.Connection
@@ -829,6 +944,40 @@ def _convert_state_to_sql_values(
     }
 
 
+def _insert_commands(
+    run_id: str,
+    indexed_commands: Iterable[Tuple[int, Command]],
+    connection: sqlalchemy.engine.Connection,
+) -> None:
+    values = [
+        _convert_command_to_sql_values(
+            run_id=run_id, index_in_run=index, command=command
+        )
+        for index, command in indexed_commands
+    ]
+    if values:
+        # A single executemany() is much faster than one execute() per row.
+        connection.execute(sqlalchemy.insert(run_command_table), values)
+
+
+def _convert_command_to_sql_values(
+    run_id: str, index_in_run: int, command: Command
+) -> Dict[str, object]:
+    return {
+        "run_id": run_id,
+        "index_in_run": index_in_run,
+        "command_id": command.id,
+        "command": pydantic_to_json(command),
+        "command_intent": str(command.intent.value)
+        if command.intent
+        else CommandIntent.PROTOCOL,
+        "command_error": pydantic_to_json(command.error) if command.error else None,
+        "command_status": _convert_commands_status_to_sql_command_status(
+            command.status
+        ),
+    }
+
+
 def _convert_commands_status_to_sql_command_status(
     status: CommandStatus,
 ) -> CommandStatusSQLEnum:
@@ -8,6 +8,7 @@ from typing import Annotated, Any, Dict, Generator, Optional
 from enum import Enum
 
 
+from .notification_coalescer import NotificationCoalescer, NotificationStats
 from .topics import TopicName
 from ..json_api import NotifyRefetchBody, NotifyUnsubscribeBody
 from server_utils.fastapi_utils.app_state import (
@@ -41,6 +42,8 @@ class NotificationClient:
         protocol_version: MQTT protocol version.
         default_qos: Default quality of service. QOS 1 is "at least once".
         retain_message: Whether the broker should hold a copy of the message for new clients.
+        coalesce_window: Seconds within which identical messages on the same topic
+            are coalesced. See `NotificationCoalescer`. 0 disables coalescing.
     """
 
     def __init__(
@@ -51,6 +54,7 @@ class NotificationClient:
         protocol_version: int = mqtt.MQTTv5,
         default_qos: MQTT_QOS = MQTT_QOS.QOS_1,
         retain_message: bool = False,
+        coalesce_window: float = 0.1,
     ) -> None:
         """Returns a configured MQTT client."""
         self._host = host
@@ -66,6 +70,9 @@ class NotificationClient:
         )
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
+        self._coalescer = NotificationCoalescer(
+            publish=self._publish, window=coalesce_window
+        )
 
     def connect(self) -> None:
         """Connect the client to the MQTT broker."""
@@ -79,6 +86,7 @@ class NotificationClient:
 
     def disconnect(self) -> None:
         """Disconnect the client from the MQTT broker."""
+        self._coalescer.flush_all()
         self._client.loop_stop()
         self._client.disconnect()
 
@@ -93,12 +101,7 @@ class NotificationClient:
         """
         message = NotifyRefetchBody.construct()
         payload = message.json()
-        self._client.publish(
-            topic=topic,
-            payload=payload,
-            qos=self._default_qos,
-            retain=self._retain_message,
-        )
+        self._coalescer.submit(topic=topic, payload=payload)
 
     def publish_advise_unsubscribe(
         self,
@@ -111,6 +114,13 @@ class NotificationClient:
         """
         message = NotifyUnsubscribeBody.construct()
         payload = message.json()
+        self._coalescer.submit(topic=topic, payload=payload)
+
+    def get_stats(self) -> NotificationStats:
+        """Return how many messages were published and how many were coalesced away."""
+        return self._coalescer.get_stats()
+
+    def _publish(self, topic: TopicName, payload: str) -> None:
         self._client.publish(
             topic=topic,
             payload=payload,
@@ -167,7 +177,9 @@ _notification_client_accessor: AppStateAccessor[NotificationClient] = AppStateAc
 
 
 @contextlib.contextmanager
-def set_up_notification_client(app_state: AppState) -> Generator[None, None, None]:
+def set_up_notification_client(
+    app_state: AppState, coalesce_window: float
+) -> Generator[None, None, None]:
     """Set up the server's singleton `NotificationClient`.
 
     When this context manager is entered, the `NotificationClient` is initialized
@@ -175,8 +187,14 @@ def set_up_notification_client(app_state: AppState) -> Generator[None, None, Non
     `get_notification_client()`.
 
     When this context manager is exited, the `NotificationClient` is cleaned up.
+
+    Args:
+        app_state: Where to put the `NotificationClient`.
+        coalesce_window: Passed along to `NotificationClient`.
     """
-    notification_client: NotificationClient = NotificationClient()
+    notification_client: NotificationClient = NotificationClient(
+        coalesce_window=coalesce_window
+    )
     _notification_client_accessor.set_on(app_state, notification_client)
 
     try:
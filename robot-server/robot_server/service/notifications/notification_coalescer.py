@@ -0,0 +1,140 @@
+"""Debouncing of notifications, so bursts of identical notifications cost one publish."""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from .topics import TopicName
+
+# Stop remembering quiet topics once we're tracking this many,
+# since topics like runs/{runId} come and go.
+_MAX_TRACKED_TOPICS = 256
+
+
+@dataclass(frozen=True)
+class NotificationStats:
+    """Counters describing how much a `NotificationCoalescer` has saved."""
+
+    published: int
+    """Notifications actually sent to the broker."""
+
+    suppressed: int
+    """Notifications folded into another notification with the same payload."""
+
+
+@dataclass
+class _TopicState:
+    last_published_at: float
+    last_payload: str
+    pending_payload: Optional[str] = None
+    pending_handle: Optional[asyncio.TimerHandle] = None
+
+
+class NotificationCoalescer:
+    """Coalesce bursts of identical notifications on each topic.
+
+    Refetch notifications only tell clients that something changed, so when the
+    same notification is submitted many times in quick succession, publishing it
+    once at the start and once at the end of the burst tells clients just as much.
+
+    Per topic:
+
+    * A notification submitted when the topic has been quiet for `window` seconds
+      is published immediately.
+    * An identical notification submitted within `window` seconds of the last publish
+      is deferred until `window` seconds after that publish. Further identical
+      notifications submitted in the meantime are suppressed.
+    * A notification with a different payload first flushes any deferred one, so
+      clients always see payloads in the order they were submitted.
+
+    Deferral needs a running asyncio event loop. Without one, every notification
+    is published immediately.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[TopicName, str], None],
+        window: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            publish: Sends a payload on a topic to the broker.
+            window: Seconds within which identical notifications on a topic coalesce.
+                0 disables coalescing.
+            clock: Returns the current time in seconds. Overridable for testing.
+        """
+        self._publish = publish
+        self._window = window
+        self._clock = clock
+        self._topics: Dict[TopicName, _TopicState] = {}
+        self._published = 0
+        self._suppressed = 0
+
+    def submit(self, topic: TopicName, payload: str) -> None:
+        """Publish a payload on a topic, now or later, or fold it into another."""
+        now = self._clock()
+        state = self._topics.get(topic)
+
+        if state is not None and state.pending_payload is not None:
+            if state.pending_payload == payload:
+                self._suppressed += 1
+                return
+            self.flush(topic)
+        elif (
+            state is not None
+            and state.last_payload == payload
+            and now - state.last_published_at < self._window
+        ):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                state.pending_payload = payload
+                state.pending_handle = loop.call_later(
+                    state.last_published_at + self._window - now,
+                    self.flush,
+                    topic,
+                )
+                return
+
+        self._publish_now(topic, payload)
+
+    def flush(self, topic: TopicName) -> None:
+        """Publish the topic's deferred notification, if any, right now."""
+        state = self._topics.get(topic)
+        if state is None or state.pending_payload is None:
+            return
+        payload = state.pending_payload
+        if state.pending_handle is not None:
+            state.pending_handle.cancel()
+        state.pending_payload = None
+        state.pending_handle = None
+        self._publish_now(topic, payload)
+
+    def flush_all(self) -> None:
+        """Publish every deferred notification right now."""
+        for topic in list(self._topics):
+            self.flush(topic)
+
+    def get_stats(self) -> NotificationStats:
+        """Return how many notifications were published and suppressed."""
+        return NotificationStats(published=self._published, suppressed=self._suppressed)
+
+    def _publish_now(self, topic: TopicName, payload: str) -> None:
+        self._publish(topic, payload)
+        self._published += 1
+        now = self._clock()
+        self._topics[topic] = _TopicState(last_published_at=now, last_payload=payload)
+        if len(self._topics) > _MAX_TRACKED_TOPICS:
+            self._forget_quiet_topics(now)
+
+    def _forget_quiet_topics(self, now: float) -> None:
+        self._topics = {
+            topic: state
+            for topic, state in self._topics.items()
+            if state.pending_payload is not None
+            or now - state.last_published_at < self._window
+        }
@@ -28,6 +28,7 @@ class TaskRunner:
         """Initialize the TaskRunner"""
 
         self._running_tasks: Set[asyncio.Task[None]] = set()
+        self._cleaning_up = False
 
     def run(self, func: TaskFunc, **kwargs: Any) -> None:
         """Run an async function in the background.
@@ -41,6 +42,12 @@ class TaskRunner:
         """
         func_name = func.__qualname__
 
+        if self._cleaning_up:
+            # A task being cancelled can try to start a follow-up task.
+            # Don't let it, or we'd never finish cleaning up.
+            log.debug(f"Not starting background task {func_name} while cleaning up.")
+            return
+
         async def wrapper() -> None:
             current_task = asyncio.current_task()
             assert current_task is not None
@@ -59,7 +66,9 @@ class TaskRunner:
         """Cancel any ongoing background tasks and wait for them to stop.
 
         Intended to be called just once, when the server shuts down.
+        After this is called, `run()` does nothing.
         """
+        self._cleaning_up = True
         for task in self._running_tasks:
             task.cancel()
         await asyncio.gather(*self._running_tasks, return_exceptions=True)
@@ -111,5 +111,35 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    maximum_concurrent_analyses: int = Field(
+        default=2,
+        gt=0,
+        description=(
+            "The maximum number of protocol analyses to run at once."
+            " Each one runs in its own subprocess."
+            " Further analyses wait in a queue."
+        ),
+    )
+
+    maximum_finished_commands_in_memory: typing.Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "If set, only keep this many of a run's most recently finished commands"
+            " fully in memory, and move older ones to a temporary file,"
+            " to bound memory use in very long runs."
+            " If unset, keep all of them in memory."
+        ),
+    )
+
+    notification_coalesce_window: float = Field(
+        default=0.1,
+        ge=0,
+        description=(
+            "The number of seconds within which identical MQTT notifications on the"
+            " same topic are coalesced into one. 0 disables coalescing."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark how long protocol analysis takes.
+
+This analyzes each protocol the same way `opentrons.cli analyze` does and prints
+the time per protocol and per command. Protocols that need run-time parameter
+values or that fail to load are skipped.
+
+Usage: python scripts/benchmark_analysis.py [protocol_file_or_directory ...]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner.create_simulating_orchestrator import (
+    create_simulating_orchestrator,
+)
+from opentrons.protocol_runner.run_orchestrator import ParseMode
+
+_DEFAULT_PROTOCOLS = (
+    Path(__file__).parent.parent.parent
+    / "analyses-snapshot-testing"
+    / "files"
+    / "protocols"
+)
+
+
+def _find_protocols(paths: List[Path]) -> List[Path]:
+    found: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            found.extend(sorted(path.glob("*.py")) + sorted(path.glob("*.json")))
+        else:
+            found.append(path)
+    return found
+
+
+async def _time_analysis(path: Path) -> Optional[Tuple[float, int]]:
+    protocol_source = await ProtocolReader().read_saved(files=[path], directory=None)
+    orchestrator = await create_simulating_orchestrator(
+        robot_type=protocol_source.robot_type, protocol_config=protocol_source.config
+    )
+    try:
+        await orchestrator.load(
+            protocol_source=protocol_source,
+            parse_mode=ParseMode.NORMAL,
+            run_time_param_values={},
+            run_time_param_paths={},
+        )
+    except Exception:
+        return None
+    start = time.perf_counter()
+    result = await orchestrator.run(deck_configuration=[])
+    return time.perf_counter() - start, len(result.commands)
+
+
+async def main(paths: List[Path]) -> None:
+    """Print analysis times for each protocol, and in total."""
+    total_seconds = 0.0
+    total_commands = 0
+    print(f"{'protocol':<60} {'commands':>9} {'time (s)':>9} {'us/command':>11}")
+    for path in _find_protocols(paths):
+        try:
+            timing = await _time_analysis(path)
+        except Exception:
+            timing = None
+        if timing is None:
+            print(f"{path.name[:60]:<60} {'skipped':>9}")
+            continue
+        seconds, command_count = timing
+        total_seconds += seconds
+        total_commands += command_count
+        per_command = seconds / max(command_count, 1) * 1e6
+        print(
+            f"{path.name[:60]:<60} {command_count:>9} {seconds:>9.3f} {per_command:>11.1f}"
+        )
+    per_command = total_seconds / max(total_commands, 1) * 1e6
+    print(
+        f"{'total':<60} {total_commands:>9} {total_seconds:>9.3f} {per_command:>11.1f}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main([Path(arg) for arg in sys.argv[1:]] or [_DEFAULT_PROTOCOLS]))
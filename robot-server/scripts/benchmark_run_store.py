@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark how long RunStore takes to persist long runs.
+
+For each run length, this persists a run of that many commands, appends a
+small batch of new commands, and persists again. The second persist is timed
+once with a fresh RunStore, which has to rewrite every command, and once with
+the RunStore that persisted the run before, which only writes the new ones.
+The second time should track the size of the appended batch, not the length
+of the run.
+
+Usage: python scripts/benchmark_run_store.py [run_length ...]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from opentrons.protocol_engine import EngineStatus, StateSummary, commands
+
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.tables import metadata
+from robot_server.runs.run_store import RunStore
+
+_DEFAULT_RUN_LENGTHS = [1_000, 10_000, 50_000]
+_APPENDED_COMMANDS = 100
+
+
+def _make_commands(count: int) -> List[commands.Command]:
+    return [
+        commands.WaitForResume(
+            id=f"command-{index}",
+            key=f"key-{index}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2024, month=1, day=1, tzinfo=timezone.utc),
+            params=commands.WaitForResumeParams(message=f"message {index}"),
+            result=commands.WaitForResumeResult(),
+        )
+        for index in range(count)
+    ]
+
+
+def _make_summary() -> StateSummary:
+    return StateSummary(
+        status=EngineStatus.RUNNING,
+        errors=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        labwareOffsets=[],
+        liquids=[],
+        wells=[],
+        hasEverEnteredErrorRecovery=False,
+    )
+
+
+def _time_persist(run_length: int, same_store: bool) -> float:
+    all_commands = _make_commands(run_length + _APPENDED_COMMANDS)
+    summary = _make_summary()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with sql_engine_ctx(Path(tmp_dir) / "benchmark.db") as sql_engine:
+            metadata.create_all(sql_engine)
+            subject = RunStore(sql_engine=sql_engine)
+            subject.insert(
+                run_id="run-id",
+                protocol_id=None,
+                created_at=datetime.now(tz=timezone.utc),
+            )
+            subject.update_run_state(
+                run_id="run-id",
+                summary=summary,
+                commands=all_commands[:run_length],
+                run_time_parameters=[],
+            )
+            if not same_store:
+                subject = RunStore(sql_engine=sql_engine)
+            start = time.perf_counter()
+            subject.update_run_state(
+                run_id="run-id",
+                summary=summary,
+                commands=all_commands,
+                run_time_parameters=[],
+            )
+            return time.perf_counter() - start
+
+
+def main(run_lengths: List[int]) -> None:
+    """Print persist times for each run length."""
+    print(f"Time to persist {_APPENDED_COMMANDS} new commands onto a run of N:")
+    print(f"{'N':>8} {'fresh store (s)':>16} {'same store (s)':>15}")
+    for run_length in run_lengths:
+        fresh = _time_persist(run_length, same_store=False)
+        same = _time_persist(run_length, same_store=True)
+        print(f"{run_length:>8} {fresh:>16.3f} {same:>15.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or _DEFAULT_RUN_LENGTHS)
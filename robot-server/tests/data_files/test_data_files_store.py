@@ -55,7 +55,12 @@ def completed_analysis_store(
     sql_engine: SQLEngine,
 ) -> CompletedAnalysisStore:
     """Get a `CompletedAnalysisStore` linked to the same database as the subject under test."""
-    return CompletedAnalysisStore(sql_engine, decoy.mock(cls=MemoryCache), "2")
+    return CompletedAnalysisStore(
+        sql_engine,
+        decoy.mock(cls=MemoryCache),
+        "2",
+        document_memory_cache=decoy.mock(cls=MemoryCache),
+    )
 
 
 @pytest.fixture
@@ -1,12 +1,42 @@
 """Tests for the /health router."""
 import pytest
 from typing import Dict, Iterator
+from decoy import Decoy
 from mock import MagicMock, patch
 from starlette.testclient import TestClient
 
 from opentrons.protocol_api import MAX_SUPPORTED_VERSION, MIN_SUPPORTED_VERSION
+from opentrons.util import performance_helpers
+from performance_metrics import ActivityAggregate
 
-from robot_server.health.router import ComponentVersions, get_versions, _get_version
+from robot_server.health.models import (
+    AnalysisCacheHealth,
+    AnalysisQueueHealth,
+    CacheStats,
+    NotificationHealth,
+    RobotActivityAggregate,
+    RobotActivityHealth,
+)
+from robot_server.health.router import (
+    ComponentVersions,
+    get_analysis_cache_health,
+    get_analysis_queue_health,
+    get_notification_health,
+    get_robot_activity_health,
+    get_versions,
+    _get_version,
+)
+from robot_server.protocols.analyses_manager import AnalysesManager
+from robot_server.protocols.analysis_memcache import MemoryCacheStats
+from robot_server.protocols.analysis_scheduler import AnalysisQueueStatus
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.service.notifications import NotificationClient
+from robot_server.service.notifications.notification_coalescer import (
+    NotificationStats,
+)
+from robot_server.protocols.completed_analysis_store import (
+    CompletedAnalysisCacheStats,
+)
 
 
 def test_get_health(
@@ -179,3 +209,83 @@ async def test_version_dependency(
     mock_config_version.return_value = config_system_version
     mock_api_version.return_value = api_version
     assert (await get_versions()) == computed_version
+
+
+async def test_get_analysis_cache_health(decoy: Decoy) -> None:
+    """It should report the completed analysis caches' counters."""
+    analysis_store = decoy.mock(cls=AnalysisStore)
+    decoy.when(analysis_store.get_cache_stats()).then_return(
+        CompletedAnalysisCacheStats(
+            analyses=MemoryCacheStats(
+                hits=1, misses=2, evictions=3, entries=4, size_bytes=5
+            ),
+            documents=MemoryCacheStats(
+                hits=6, misses=7, evictions=8, entries=9, size_bytes=10
+            ),
+        )
+    )
+
+    result = await get_analysis_cache_health(analysis_store=analysis_store)
+
+    assert result == AnalysisCacheHealth(
+        analyses=CacheStats(hits=1, misses=2, evictions=3, entries=4, sizeBytes=5),
+        documents=CacheStats(hits=6, misses=7, evictions=8, entries=9, sizeBytes=10),
+    )
+
+
+async def test_get_analysis_queue_health(decoy: Decoy) -> None:
+    """It should report the analysis queue's depth."""
+    analyses_manager = decoy.mock(cls=AnalysesManager)
+    decoy.when(analyses_manager.get_queue_status()).then_return(
+        AnalysisQueueStatus(queued=3, running=2, max_concurrent=2)
+    )
+
+    result = await get_analysis_queue_health(analyses_manager=analyses_manager)
+
+    assert result == AnalysisQueueHealth(queued=3, running=2, maxConcurrent=2)
+
+
+async def test_get_notification_health(decoy: Decoy) -> None:
+    """It should report the notification client's counters."""
+    notification_client = decoy.mock(cls=NotificationClient)
+    decoy.when(notification_client.get_stats()).then_return(
+        NotificationStats(published=10, suppressed=90)
+    )
+
+    result = await get_notification_health(notification_client=notification_client)
+
+    assert result == NotificationHealth(published=10, suppressed=90)
+
+
+async def test_get_robot_activity_health(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It should report the robot activity tracker's live aggregates."""
+    monkeypatch.setattr(
+        performance_helpers,
+        "get_activity_aggregates",
+        lambda: [
+            ActivityAggregate(
+                state="ANALYZING_PROTOCOL",
+                recorded_at=123,
+                count=4,
+                total_duration=400,
+                p50=90,
+                p95=150,
+                p99=160,
+            )
+        ],
+    )
+
+    result = await get_robot_activity_health()
+
+    assert result == RobotActivityHealth(
+        activities=[
+            RobotActivityAggregate(
+                state="ANALYZING_PROTOCOL",
+                count=4,
+                totalDurationNs=400,
+                p50DurationNs=90,
+                p95DurationNs=150,
+                p99DurationNs=160,
+            )
+        ]
+    )
@@ -20,9 +20,9 @@ from robot_server.protocols.analysis_models import (
     AnalysisSummary,
     AnalysisStatus,
 )
-from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_scheduler import AnalysisScheduler
+from robot_server.protocols.analysis_store import AnalysisIsPendingError, AnalysisStore
 from robot_server.protocols.protocol_store import ProtocolResource
-from robot_server.service.task_runner import TaskRunner
 import robot_server.errors.error_mappers as em
 
 
@@ -33,9 +33,9 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
 
 
 @pytest.fixture
-def task_runner(decoy: Decoy) -> TaskRunner:
-    """Get a mocked out TaskRunner."""
-    return decoy.mock(cls=TaskRunner)
+def analysis_scheduler(decoy: Decoy) -> AnalysisScheduler:
+    """Get a mocked out AnalysisScheduler."""
+    return decoy.mock(cls=AnalysisScheduler)
 
 
 @pytest.fixture(autouse=True)
@@ -57,15 +57,19 @@ def patch_mock_map_unexpected_error(
 
 
 @pytest.fixture
-def subject(analysis_store: AnalysisStore, task_runner: TaskRunner) -> AnalysesManager:
+def subject(
+    analysis_store: AnalysisStore, analysis_scheduler: AnalysisScheduler
+) -> AnalysesManager:
     """Get the Analyses Manager with mocked out dependencies."""
-    return AnalysesManager(analysis_store=analysis_store, task_runner=task_runner)
+    return AnalysesManager(
+        analysis_store=analysis_store, analysis_scheduler=analysis_scheduler
+    )
 
 
 async def test_initialize_analyzer(
     decoy: Decoy,
     analysis_store: AnalysisStore,
-    task_runner: TaskRunner,
+    analysis_scheduler: AnalysisScheduler,
     subject: AnalysesManager,
 ) -> None:
     """It should create analyzer and load its orchestrator."""
@@ -110,7 +114,7 @@ async def test_initialize_analyzer(
 async def test_raises_error_and_saves_result_if_initialization_errors(
     decoy: Decoy,
     analysis_store: AnalysisStore,
-    task_runner: TaskRunner,
+    analysis_scheduler: AnalysisScheduler,
     subject: AnalysesManager,
 ) -> None:
     """It should save the result to analysis store and re-raise error when analyzer initialization errors out."""
@@ -179,7 +183,7 @@ async def test_raises_error_and_saves_result_if_initialization_errors(
 async def test_start_analysis(
     decoy: Decoy,
     analysis_store: AnalysisStore,
-    task_runner: TaskRunner,
+    analysis_scheduler: AnalysisScheduler,
     subject: AnalysesManager,
 ) -> None:
     """It should start protocol analysis and return summary with run time parameters."""
@@ -223,8 +227,208 @@ async def test_start_analysis(
             analysis_id="analysis-id",
             run_time_parameters=[bool_parameter],
         ),
-        task_runner.run(
-            analyzer.analyze,
+        analysis_scheduler.schedule(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            analyze=analyzer.analyze,
+        ),
+    )
+
+
+async def test_start_analysis_reuses_cached_result(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_scheduler: AnalysisScheduler,
+    subject: AnalysesManager,
+) -> None:
+    """It should not run a simulation if an analysis with the same inputs exists."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-3 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    cached_summary = AnalysisSummary(
+        id="analysis-id", status=AnalysisStatus.COMPLETED, runTimeParameters=[]
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_cache_key()).then_return("cache-key")
+    decoy.when(
+        await analysis_store.add_from_cache(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            cache_key="cache-key",
+        )
+    ).then_return(cached_summary)
+
+    result = await subject.start_analysis(
+        analysis_id="analysis-id",
+        analyzer=analyzer,
+    )
+
+    assert result == cached_summary
+    decoy.verify(
+        analysis_store.add_pending(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            run_time_parameters=matchers.Anything(),
+        ),
+        times=0,
+    )
+    decoy.verify(
+        analysis_scheduler.schedule(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            analyze=analyzer.analyze,
+        ),
+        times=0,
+    )
+
+
+async def test_start_analysis_without_cache(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_scheduler: AnalysisScheduler,
+    subject: AnalysesManager,
+) -> None:
+    """It should not look for a cached result if told not to."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-3 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return([])
+
+    result = await subject.start_analysis(
+        analysis_id="analysis-id",
+        analyzer=analyzer,
+        use_cache=False,
+    )
+
+    assert result.status == AnalysisStatus.PENDING
+    decoy.verify(
+        await analysis_store.add_from_cache(
+            protocol_id=matchers.Anything(),
+            analysis_id=matchers.Anything(),
+            cache_key=matchers.Anything(),
+        ),
+        times=0,
+    )
+    decoy.verify(
+        analysis_scheduler.schedule(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            analyze=analyzer.analyze,
+        )
+    )
+
+
+async def test_start_analysis_supersedes_queued_analysis(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_scheduler: AnalysisScheduler,
+    subject: AnalysesManager,
+) -> None:
+    """It should drop the protocol's queued analysis in favor of the new one."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-3 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return([])
+    decoy.when(analysis_scheduler.cancel_queued("protocol-id")).then_return(
+        "old-analysis-id"
+    )
+
+    await subject.start_analysis(
+        analysis_id="analysis-id", analyzer=analyzer, use_cache=False
+    )
+
+    decoy.verify(
+        analysis_store.remove_pending("old-analysis-id"),
+        analysis_store.add_pending(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            run_time_parameters=[],
+        ),
+        analysis_scheduler.schedule(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            analyze=analyzer.analyze,
+        ),
+    )
+
+
+async def test_start_analysis_while_running_raises(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_scheduler: AnalysisScheduler,
+    subject: AnalysesManager,
+) -> None:
+    """It should refuse to start an analysis while the protocol's last one runs."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-3 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analysis_scheduler.get_running_analysis_id("protocol-id")).then_return(
+        "running-analysis-id"
+    )
+
+    with pytest.raises(AnalysisIsPendingError):
+        await subject.start_analysis(analysis_id="analysis-id", analyzer=analyzer)
+
+    decoy.verify(
+        analysis_scheduler.schedule(
+            protocol_id="protocol-id",
             analysis_id="analysis-id",
+            analyze=analyzer.analyze,
         ),
+        times=0,
     )
@@ -0,0 +1,114 @@
+"""Tests for robot_server.protocols.analysis_cache_key."""
+from pathlib import Path
+
+from opentrons.protocol_engine.types import BooleanParameter, CSVParameter, FileInfo
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolSource,
+    PythonProtocolConfig,
+)
+from opentrons.protocols.api_support.types import APIVersion
+
+from robot_server.protocols.analysis_cache_key import compute_analysis_cache_key
+
+
+def _make_source(
+    directory: Path = Path("/protocols/protocol-id"),
+    content_hash: str = "abc123",
+    api_version: APIVersion = APIVersion(2, 18),
+) -> ProtocolSource:
+    return ProtocolSource(
+        directory=directory,
+        main_file=directory / "main.py",
+        files=[],
+        metadata={},
+        robot_type="OT-3 Standard",
+        content_hash=content_hash,
+        config=PythonProtocolConfig(api_version=api_version),
+    )
+
+
+def _make_bool_param(value: bool) -> BooleanParameter:
+    return BooleanParameter(
+        displayName="Foo", variableName="foo", default=True, value=value
+    )
+
+
+def test_same_inputs_same_key() -> None:
+    """It should not depend on where the protocol is stored or on its protocol ID."""
+    key_1 = compute_analysis_cache_key(
+        protocol_source=_make_source(directory=Path("/protocols/protocol-id-1")),
+        run_time_parameters=[_make_bool_param(False)],
+        deck_configuration=[],
+    )
+    key_2 = compute_analysis_cache_key(
+        protocol_source=_make_source(directory=Path("/protocols/protocol-id-2")),
+        run_time_parameters=[_make_bool_param(False)],
+        deck_configuration=[],
+    )
+    assert key_1 == key_2
+
+
+def test_different_inputs_different_keys() -> None:
+    """It should change with anything that can change the analysis result."""
+    baseline = compute_analysis_cache_key(
+        protocol_source=_make_source(),
+        run_time_parameters=[_make_bool_param(False)],
+        deck_configuration=[],
+    )
+    variants = [
+        compute_analysis_cache_key(
+            protocol_source=_make_source(content_hash="def456"),
+            run_time_parameters=[_make_bool_param(False)],
+            deck_configuration=[],
+        ),
+        compute_analysis_cache_key(
+            protocol_source=_make_source(api_version=APIVersion(2, 19)),
+            run_time_parameters=[_make_bool_param(False)],
+            deck_configuration=[],
+        ),
+        compute_analysis_cache_key(
+            protocol_source=_make_source(),
+            run_time_parameters=[_make_bool_param(True)],
+            deck_configuration=[],
+        ),
+        compute_analysis_cache_key(
+            protocol_source=_make_source(),
+            run_time_parameters=[_make_bool_param(False)],
+            deck_configuration=[("cutoutA1", "singleLeftSlot", None)],
+        ),
+        compute_analysis_cache_key(
+            protocol_source=ProtocolSource(
+                directory=Path("/protocols/protocol-id"),
+                main_file=Path("/protocols/protocol-id/main.json"),
+                files=[],
+                metadata={},
+                robot_type="OT-3 Standard",
+                content_hash="abc123",
+                config=JsonProtocolConfig(schema_version=8),
+            ),
+            run_time_parameters=[_make_bool_param(False)],
+            deck_configuration=[],
+        ),
+    ]
+    assert len(set(variants + [baseline])) == len(variants) + 1
+
+
+def test_csv_parameters_keyed_by_file_id() -> None:
+    """It should identify CSV parameters by their data file ID."""
+
+    def key_for_file(file: FileInfo) -> str:
+        return compute_analysis_cache_key(
+            protocol_source=_make_source(),
+            run_time_parameters=[
+                CSVParameter(displayName="CSV", variableName="csv", file=file)
+            ],
+            deck_configuration=[],
+        )
+
+    assert key_for_file(FileInfo(id="file-id", name="a.csv")) == key_for_file(
+        FileInfo(id="file-id", name="b.csv")
+    )
+    assert key_for_file(FileInfo(id="file-id", name="a.csv")) != key_for_file(
+        FileInfo(id="other-file-id", name="a.csv")
+    )
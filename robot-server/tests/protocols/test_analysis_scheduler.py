@@ -0,0 +1,118 @@
+"""Tests for robot_server.protocols.analysis_scheduler."""
+import asyncio
+from typing import AsyncIterator, Dict, List
+
+import pytest
+
+from robot_server.protocols.analysis_scheduler import (
+    AnalysisQueueStatus,
+    AnalysisScheduler,
+)
+from robot_server.service.task_runner import TaskRunner
+
+
+class _FakeAnalyses:
+    """Analysis functions that block until released, and record their order."""
+
+    def __init__(self) -> None:
+        self.started: List[str] = []
+        self._releases: Dict[str, asyncio.Event] = {}
+
+    async def analyze(self, analysis_id: str) -> None:
+        self.started.append(analysis_id)
+        release = self._releases.setdefault(analysis_id, asyncio.Event())
+        await release.wait()
+
+    def release(self, analysis_id: str) -> None:
+        self._releases.setdefault(analysis_id, asyncio.Event()).set()
+
+
+@pytest.fixture
+async def task_runner() -> AsyncIterator[TaskRunner]:
+    """Return a real TaskRunner, cleaned up after the test."""
+    task_runner = TaskRunner()
+    yield task_runner
+    await task_runner.cancel_all_and_clean_up()
+
+
+async def _let_tasks_run() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_runs_bounded_number_at_once(task_runner: TaskRunner) -> None:
+    """It should only run max_concurrent analyses at once, in FIFO order."""
+    analyses = _FakeAnalyses()
+    subject = AnalysisScheduler(task_runner=task_runner, max_concurrent=2)
+
+    for n in range(1, 5):
+        subject.schedule(f"protocol-{n}", f"analysis-{n}", analyses.analyze)
+    await _let_tasks_run()
+
+    assert analyses.started == ["analysis-1", "analysis-2"]
+    assert subject.get_status() == AnalysisQueueStatus(
+        queued=2, running=2, max_concurrent=2
+    )
+    assert subject.get_running_analysis_id("protocol-1") == "analysis-1"
+    assert subject.get_running_analysis_id("protocol-3") is None
+
+    analyses.release("analysis-1")
+    await _let_tasks_run()
+
+    assert analyses.started == ["analysis-1", "analysis-2", "analysis-3"]
+    assert subject.get_running_analysis_id("protocol-1") is None
+    assert subject.get_status() == AnalysisQueueStatus(
+        queued=1, running=2, max_concurrent=2
+    )
+
+
+async def test_prioritize(task_runner: TaskRunner) -> None:
+    """It should start a prioritized protocol's analysis next."""
+    analyses = _FakeAnalyses()
+    subject = AnalysisScheduler(task_runner=task_runner, max_concurrent=1)
+
+    for n in range(1, 4):
+        subject.schedule(f"protocol-{n}", f"analysis-{n}", analyses.analyze)
+    subject.prioritize("protocol-3")
+    subject.prioritize("protocol-that-has-nothing-queued")
+    analyses.release("analysis-1")
+    await _let_tasks_run()
+
+    assert analyses.started == ["analysis-1", "analysis-3"]
+
+
+async def test_cancel_queued(task_runner: TaskRunner) -> None:
+    """It should drop queued analyses, but not running ones."""
+    analyses = _FakeAnalyses()
+    subject = AnalysisScheduler(task_runner=task_runner, max_concurrent=1)
+
+    subject.schedule("protocol-1", "analysis-1", analyses.analyze)
+    subject.schedule("protocol-2", "analysis-2", analyses.analyze)
+    await _let_tasks_run()
+
+    assert subject.cancel_queued("protocol-1") is None
+    assert subject.cancel_queued("protocol-2") == "analysis-2"
+    assert subject.cancel_queued("protocol-2") is None
+
+    analyses.release("analysis-1")
+    await _let_tasks_run()
+
+    assert analyses.started == ["analysis-1"]
+    assert subject.get_status() == AnalysisQueueStatus(
+        queued=0, running=0, max_concurrent=1
+    )
+
+
+async def test_failed_analysis_frees_slot(task_runner: TaskRunner) -> None:
+    """It should start the next analysis even if one raises."""
+    analyses = _FakeAnalyses()
+    subject = AnalysisScheduler(task_runner=task_runner, max_concurrent=1)
+
+    async def fail(analysis_id: str) -> None:
+        raise RuntimeError("oh no")
+
+    subject.schedule("protocol-1", "analysis-1", fail)
+    subject.schedule("protocol-2", "analysis-2", analyses.analyze)
+    await _let_tasks_run()
+
+    assert analyses.started == ["analysis-2"]
@@ -500,6 +500,71 @@ async def test_update_infers_status_from_errors(
     assert analysis.result == expected_result
 
 
+async def test_add_from_cache(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should copy a completed analysis with the same cache key to a new protocol."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id-1"))
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id-2"))
+    run_time_param = mock_number_param("cool_param", 2.0)
+
+    assert (
+        await subject.add_from_cache(
+            protocol_id="protocol-id-2",
+            analysis_id="analysis-id-2",
+            cache_key="cache-key",
+        )
+        is None
+    )
+
+    subject.add_pending(
+        protocol_id="protocol-id-1", analysis_id="analysis-id-1", run_time_parameters=[]
+    )
+    await subject.update(
+        analysis_id="analysis-id-1",
+        robot_type="OT-2 Standard",
+        run_time_parameters=[run_time_param],
+        commands=[],
+        errors=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        liquids=[],
+        liquidClasses=[],
+        cache_key="cache-key",
+    )
+
+    assert (
+        await subject.add_from_cache(
+            protocol_id="protocol-id-2",
+            analysis_id="analysis-id-2",
+            cache_key="some-other-cache-key",
+        )
+        is None
+    )
+    result = await subject.add_from_cache(
+        protocol_id="protocol-id-2",
+        analysis_id="analysis-id-2",
+        cache_key="cache-key",
+    )
+
+    assert result == AnalysisSummary(
+        id="analysis-id-2",
+        status=AnalysisStatus.COMPLETED,
+        runTimeParameters=[run_time_param],
+    )
+    copied_analysis = await subject.get("analysis-id-2")
+    original_analysis = await subject.get("analysis-id-1")
+    assert isinstance(copied_analysis, CompletedAnalysis)
+    assert copied_analysis == original_analysis.copy(update={"id": "analysis-id-2"})
+    assert [a.id for a in subject.get_summaries_by_protocol("protocol-id-2")] == [
+        "analysis-id-2"
+    ]
+    assert await subject.matching_rtp_values_in_analysis(
+        last_analysis_summary=result, new_parameters=[run_time_param]
+    )
+
+
 async def test_save_initialization_failed_analysis(
     decoy: Decoy, sql_engine: SQLEngine, protocol_store: ProtocolStore
 ) -> None:
@@ -0,0 +1,94 @@
+"""Tests for robot_server.protocols.analysis_subprocess."""
+import asyncio
+import multiprocessing
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from opentrons.protocol_engine import EngineStatus
+from opentrons.protocol_engine.commands import Comment
+from opentrons.protocol_engine.types import NumberParameter
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_subprocess import simulate_protocol
+
+
+_PROTOCOL = textwrap.dedent(
+    """
+    requirements = {"robotType": "OT-2", "apiLevel": "2.18"}
+
+    def add_parameters(parameters):
+        parameters.add_int(
+            display_name="Count",
+            variable_name="count",
+            default=1,
+            minimum=1,
+            maximum=10,
+        )
+
+    def run(protocol):
+        for i in range(protocol.params.count):
+            protocol.comment(f"Comment {i}")
+    """
+)
+
+
+@pytest.fixture
+async def protocol_source(tmp_path: Path) -> ProtocolSource:
+    """Get the source of a small Python protocol with a run-time parameter."""
+    protocol_path = tmp_path / "protocol.py"
+    protocol_path.write_text(_PROTOCOL)
+    return await ProtocolReader().read_saved(files=[protocol_path], directory=None)
+
+
+async def test_simulate_protocol(protocol_source: ProtocolSource) -> None:
+    """It should simulate the protocol in a subprocess and return the result."""
+    result = await simulate_protocol(
+        protocol_source=protocol_source,
+        run_time_param_values={"count": 3},
+        run_time_param_paths=None,
+        deck_configuration=[],
+    )
+    assert result.state_summary.status == EngineStatus.SUCCEEDED
+    assert [
+        command.params.message
+        for command in result.commands
+        if isinstance(command, Comment)
+    ] == ["Comment 0", "Comment 1", "Comment 2"]
+    [parameter] = result.parameters
+    assert isinstance(parameter, NumberParameter)
+    assert parameter.value == 3
+
+
+async def test_simulate_protocol_raises(protocol_source: ProtocolSource) -> None:
+    """It should raise what the simulation raised."""
+    with pytest.raises(Exception, match="between 1 and 10"):
+        await simulate_protocol(
+            protocol_source=protocol_source,
+            run_time_param_values={"count": 11},
+            run_time_param_paths=None,
+            deck_configuration=[],
+        )
+
+
+async def test_cancel_terminates_subprocess(protocol_source: ProtocolSource) -> None:
+    """Cancelling a simulation should terminate its subprocess."""
+    task = asyncio.create_task(
+        simulate_protocol(
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+            deck_configuration=[],
+        )
+    )
+    while not multiprocessing.active_children():
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    for _ in range(500):
+        if not multiprocessing.active_children():
+            break
+        await asyncio.sleep(0.01)
+    assert multiprocessing.active_children() == []
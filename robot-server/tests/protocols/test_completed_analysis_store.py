@@ -26,6 +26,7 @@ from robot_server.data_files.data_files_store import (
     DataFilesStore,
     DataFileInfo,
 )
+from robot_server.persistence.pydantic import pydantic_to_json
 from robot_server.protocols.analysis_memcache import MemoryCache
 from robot_server.protocols.analysis_models import (
     CompletedAnalysis,
@@ -50,13 +51,22 @@ def memcache(decoy: Decoy) -> MemoryCache[str, CompletedAnalysisResource]:
     return decoy.mock(cls=MemoryCache)
 
 
+@pytest.fixture
+def document_memcache(decoy: Decoy) -> MemoryCache[str, str]:
+    """Get a memcache mock for analysis documents."""
+    return decoy.mock(cls=MemoryCache)
+
+
 @pytest.fixture
 def subject(
     memcache: MemoryCache[str, CompletedAnalysisResource],
+    document_memcache: MemoryCache[str, str],
     sql_engine: Engine,
 ) -> CompletedAnalysisStore:
     """Get a subject."""
-    return CompletedAnalysisStore(sql_engine, memcache, "2")
+    return CompletedAnalysisStore(
+        sql_engine, memcache, "2", document_memory_cache=document_memcache
+    )
 
 
 @pytest.fixture
@@ -183,12 +193,18 @@ async def test_get_by_analysis_id_stores_results_in_cache(
     decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
     from_sql = await subject.get_by_id("analysis-id")
     assert from_sql == resource
-    decoy.verify(memcache.insert("analysis-id", from_sql))
+    decoy.verify(
+        memcache.insert(
+            "analysis-id", from_sql, len(pydantic_to_json(resource.completed_analysis))
+        )
+    )
 
 
 async def test_get_by_analysis_id_as_document(
     subject: CompletedAnalysisStore,
+    document_memcache: MemoryCache[str, str],
     protocol_store: ProtocolStore,
+    decoy: Decoy,
 ) -> None:
     """It should return the analysis serialized as a JSON string."""
     resource = _completed_analysis_resource("analysis-id", "protocol-id")
@@ -198,8 +214,10 @@ async def test_get_by_analysis_id_as_document(
         primitive_rtp_resources=[],
         csv_rtp_resources=[],
     )
+    decoy.when(document_memcache.get("analysis-id")).then_raise(KeyError())
     result = await subject.get_by_id_as_document("analysis-id")
     assert result is not None
+    decoy.verify(document_memcache.insert("analysis-id", result, len(result)))
     assert json.loads(result) == {
         "id": "analysis-id",
         "result": "ok",
@@ -215,6 +233,26 @@ async def test_get_by_analysis_id_as_document(
     }
 
 
+async def test_get_by_analysis_id_as_document_prefers_cache(
+    subject: CompletedAnalysisStore,
+    document_memcache: MemoryCache[str, str],
+    decoy: Decoy,
+) -> None:
+    """It should return cached documents without using SQL."""
+    decoy.when(document_memcache.get("analysis-id")).then_return('{"id": "cached"}')
+    assert await subject.get_by_id_as_document("analysis-id") == '{"id": "cached"}'
+
+
+async def test_get_by_analysis_id_as_document_not_found(
+    subject: CompletedAnalysisStore,
+    document_memcache: MemoryCache[str, str],
+    decoy: Decoy,
+) -> None:
+    """It should return None if there is no such analysis."""
+    decoy.when(document_memcache.get("analysis-id")).then_raise(KeyError())
+    assert await subject.get_by_id_as_document("analysis-id") is None
+
+
 async def test_get_ids_by_protocol(
     subject: CompletedAnalysisStore, protocol_store: ProtocolStore
 ) -> None:
@@ -233,6 +271,13 @@ async def test_get_ids_by_protocol(
     ]
 
 
+async def _document_size(resource: CompletedAnalysisResource) -> int:
+    """Return the size that the store should cache a resource with."""
+    document = (await resource.to_sql_values())["completed_analysis"]
+    assert isinstance(document, str)
+    return len(document)
+
+
 async def test_get_by_protocol(
     subject: CompletedAnalysisStore,
     memcache: MemoryCache[str, CompletedAnalysisResource],
@@ -245,19 +290,21 @@ async def test_get_by_protocol(
     resource_3 = _completed_analysis_resource("analysis-id-3", "protocol-id-2")
     protocol_store.insert(make_dummy_protocol_resource("protocol-id-1"))
     protocol_store.insert(make_dummy_protocol_resource("protocol-id-2"))
-    decoy.when(memcache.insert("analysis-id-1", resource_1)).then_return(None)
-    decoy.when(memcache.insert("analysis-id-2", resource_2)).then_return(None)
-    decoy.when(memcache.insert("analysis-id-3", resource_3)).then_return(None)
     await subject.make_room_and_add(resource_1, [], [])
     await subject.make_room_and_add(resource_2, [], [])
     await subject.make_room_and_add(resource_3, [], [])
+    resource_1_size = await _document_size(resource_1)
+    resource_2_size = await _document_size(resource_2)
     decoy.when(memcache.get("analysis-id-1")).then_raise(KeyError())
     decoy.when(memcache.get("analysis-id-2")).then_return(resource_2)
     decoy.when(memcache.contains("analysis-id-1")).then_return(False)
     decoy.when(memcache.contains("analysis-id-2")).then_return(True)
-    decoy.when(memcache.insert("analysis-id-1", resource_1)).then_return(None)
     resources = await subject.get_by_protocol("protocol-id-1")
     assert resources == [resource_1, resource_2]
+    # Each analysis is cached when it's added, and the uncached one is cached
+    # again when it's read back from the database.
+    decoy.verify(memcache.insert("analysis-id-1", resource_1, resource_1_size), times=2)
+    decoy.verify(memcache.insert("analysis-id-2", resource_2, resource_2_size), times=1)
 
 
 async def test_store_and_get_primitive_rtps_by_analysis(
@@ -399,6 +446,7 @@ async def test_store_and_get_csv_rtps_by_analysis_id(
 async def test_add_makes_room_for_new_analysis(
     subject: CompletedAnalysisStore,
     memcache: MemoryCache[str, CompletedAnalysisResource],
+    document_memcache: MemoryCache[str, str],
     protocol_store: ProtocolStore,
     existing_analysis_ids: List[str],
     expected_analyses_ids_after_making_room: List[str],
@@ -442,6 +490,7 @@ async def test_add_makes_room_for_new_analysis(
     ]
     for analysis_id in removed_ids:
         decoy.verify(memcache.remove(analysis_id))
+        decoy.verify(document_memcache.remove(analysis_id))
 
 
 async def test_make_room_and_add_handles_rtp_tables_correctly(
@@ -1,7 +1,7 @@
 """Tests for the analysis memory cache."""
 import pytest
 
-from robot_server.protocols.analysis_memcache import MemoryCache
+from robot_server.protocols.analysis_memcache import MemoryCache, MemoryCacheStats
 
 
 def test_cache_ejects_old_values() -> None:
@@ -38,3 +38,52 @@ def test_cache_removes_values_by_key() -> None:
     assert subject.contains("key-0")
     subject.insert("key-5", "value-5")
     assert not subject.contains("key-0")
+
+
+def test_cache_ejects_least_recently_used() -> None:
+    """It should treat a get as a use, and eject the least recently used value."""
+    subject = MemoryCache(3, str, str)
+    for val in range(3):
+        subject.insert(f"key-{val}", f"value-{val}")
+    subject.get("key-0")
+    subject.insert("key-3", "value-3")
+    assert subject.contains("key-0")
+    assert not subject.contains("key-1")
+
+
+def test_cache_ejects_values_over_byte_limit() -> None:
+    """It should eject values to stay under its byte limit."""
+    subject = MemoryCache(10, str, str, byte_limit=100)
+    subject.insert("key-0", "value-0", 40)
+    subject.insert("key-1", "value-1", 40)
+    subject.insert("key-2", "value-2", 40)
+    assert not subject.contains("key-0")
+    assert subject.contains("key-1") and subject.contains("key-2")
+
+    # Replacing a value should account for its new size.
+    subject.insert("key-1", "value-1", 10)
+    assert subject.stats().size_bytes == 50
+
+
+def test_cache_skips_values_bigger_than_byte_limit() -> None:
+    """It should not cache a value that can never fit, nor eject anything for it."""
+    subject = MemoryCache(10, str, str, byte_limit=100)
+    subject.insert("key-0", "value-0", 40)
+    subject.insert("key-1", "value-1", 101)
+    assert subject.contains("key-0")
+    assert not subject.contains("key-1")
+
+
+def test_cache_stats() -> None:
+    """It should count hits, misses, and evictions."""
+    subject = MemoryCache(2, str, str, byte_limit=100)
+    subject.insert("key-0", "value-0", 10)
+    subject.insert("key-1", "value-1", 20)
+    subject.insert("key-2", "value-2", 30)
+    subject.get("key-2")
+    with pytest.raises(KeyError):
+        subject.get("key-0")
+
+    assert subject.stats() == MemoryCacheStats(
+        hits=1, misses=1, evictions=1, entries=2, size_bytes=50
+    )
@@ -27,6 +27,8 @@ from opentrons.protocol_runner.run_orchestrator import ParseMode
 
 import opentrons.util.helpers as datetime_helper
 
+from robot_server.protocols import analysis_subprocess
+from robot_server.protocols.analysis_cache_key import compute_analysis_cache_key
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import ProtocolResource
@@ -61,6 +63,13 @@ def patch_mock_create_simulating_orchestrator(
     monkeypatch.setattr(simulating_runner, "create_simulating_orchestrator", mock)
 
 
+@pytest.fixture(autouse=True)
+def patch_mock_simulate_protocol(decoy: Decoy, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace analysis_subprocess.simulate_protocol() with a mock."""
+    mock = decoy.mock(func=analysis_subprocess.simulate_protocol)
+    monkeypatch.setattr(analysis_subprocess, "simulate_protocol", mock)
+
+
 @pytest.fixture
 def analysis_store(decoy: Decoy) -> AnalysisStore:
     """Get a mocked out AnalysisStore."""
@@ -112,9 +121,64 @@ async def test_load_orchestrator(
             run_time_param_values={"rtp_var": 123},
             run_time_param_paths={"csv_param": Path("file-path")},
         ),
-        times=1,
+        await run_orchestrator.stop(),
+    )
+
+
+async def test_load_orchestrator_stops_orchestrator_on_error(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should stop the orchestrator and keep the validated RTPs if loading fails."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.py"),
+        config=PythonProtocolConfig(api_version=APIVersion(100, 200)),
+        files=[],
+        metadata={},
+        robot_type=robot_type,
+        content_hash="abc123",
+    )
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=protocol_source,
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store, protocol_resource=protocol_resource
+    )
+    bool_parameter = pe_types.BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=False
     )
 
+    run_orchestrator = decoy.mock(cls=protocol_runner.RunOrchestrator)
+    decoy.when(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=robot_type,
+            protocol_config=PythonProtocolConfig(api_version=APIVersion(100, 200)),
+        )
+    ).then_return(run_orchestrator)
+    decoy.when(
+        await run_orchestrator.load(
+            protocol_source=protocol_source,
+            parse_mode=ParseMode.NORMAL,
+            run_time_param_values={"rtp_var": 123},
+            run_time_param_paths={},
+        )
+    ).then_raise(RuntimeError("oh no"))
+    decoy.when(run_orchestrator.get_run_time_parameters()).then_return([bool_parameter])
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        await subject.load_orchestrator(
+            run_time_param_values={"rtp_var": 123}, run_time_param_paths={}
+        )
+
+    decoy.verify(await run_orchestrator.stop())
+    assert subject.get_verified_run_time_parameters() == [bool_parameter]
+
 
 async def test_analyze(
     decoy: Decoy,
@@ -175,10 +239,18 @@ async def test_analyze(
     subject = ProtocolAnalyzer(
         analysis_store=analysis_store, protocol_resource=protocol_resource
     )
+    decoy.when(orchestrator.get_run_time_parameters()).then_return([bool_parameter])
     await subject.load_orchestrator(
         run_time_param_values={"rtp_var": 123}, run_time_param_paths={}
     )
-    decoy.when(await orchestrator.run(deck_configuration=[],)).then_return(
+    decoy.when(
+        await analysis_subprocess.simulate_protocol(
+            protocol_source=protocol_resource.source,
+            run_time_param_values={"rtp_var": 123},
+            run_time_param_paths={},
+            deck_configuration=[],
+        )
+    ).then_return(
         protocol_runner.RunResult(
             commands=[analysis_command],
             state_summary=StateSummary(
@@ -213,6 +285,11 @@ async def test_analyze(
             errors=[],
             liquids=[],
             liquidClasses=[],
+            cache_key=compute_analysis_cache_key(
+                protocol_source=protocol_resource.source,
+                run_time_parameters=[bool_parameter],
+                deck_configuration=[],
+            ),
         )
     )
 
@@ -266,7 +343,10 @@ async def test_analyze_updates_pending_on_error(
         analysis_store=analysis_store, protocol_resource=protocol_resource
     )
     decoy.when(
-        await orchestrator.run(
+        await analysis_subprocess.simulate_protocol(
+            protocol_source=protocol_resource.source,
+            run_time_param_values={"rtp_var": 123},
+            run_time_param_paths={},
             deck_configuration=[],
         )
     ).then_raise(raised_exception)
@@ -0,0 +1,192 @@
+"""Tests for robot_server.protocols.protocol_source_cache."""
+import json
+from pathlib import Path
+
+import pytest
+from anyio import Path as AsyncPath
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    PythonProtocolConfig,
+)
+
+from robot_server.protocols.protocol_source_cache import (
+    ProtocolSourceCache,
+    compute_fingerprint,
+)
+
+
+@pytest.fixture
+def protocols_directory(tmp_path: Path) -> Path:
+    """Return a protocols directory containing a single protocol's files."""
+    protocols_directory = tmp_path / "protocols"
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    protocol_subdirectory.mkdir(parents=True)
+    (protocol_subdirectory / "main.py").write_text("# protocol")
+    (protocol_subdirectory / "labware.json").write_text("{}")
+    return protocols_directory
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path) -> Path:
+    """Return where to persist the cache."""
+    return tmp_path / "protocol_source_cache.json"
+
+
+def _python_source(protocol_subdirectory: Path) -> ProtocolSource:
+    return ProtocolSource(
+        directory=protocol_subdirectory,
+        main_file=protocol_subdirectory / "main.py",
+        content_hash="abc123",
+        files=[
+            ProtocolSourceFile(
+                path=protocol_subdirectory / "main.py", role=ProtocolFileRole.MAIN
+            ),
+            ProtocolSourceFile(
+                path=protocol_subdirectory / "labware.json",
+                role=ProtocolFileRole.LABWARE,
+            ),
+        ],
+        metadata={"protocolName": "My Protocol", "tags": ["a", "b"]},
+        robot_type="OT-3 Standard",
+        config=PythonProtocolConfig(api_version=APIVersion(2, 18)),
+    )
+
+
+async def test_round_trip(protocols_directory: Path, cache_file: Path) -> None:
+    """It should return saved sources after a reload, if the files are unchanged."""
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    source = _python_source(protocol_subdirectory)
+    fingerprint = await compute_fingerprint(AsyncPath(protocol_subdirectory))
+
+    writer = ProtocolSourceCache(cache_file, protocols_directory)
+    writer.set("protocol-id", fingerprint, source)
+    await writer.save()
+
+    reader = ProtocolSourceCache(cache_file, protocols_directory)
+    await reader.load()
+    assert reader.get("protocol-id", fingerprint) == source
+    assert reader.get("other-protocol-id", fingerprint) is None
+
+
+async def test_round_trip_json_protocol(
+    protocols_directory: Path, cache_file: Path
+) -> None:
+    """It should round-trip JSON protocol configs."""
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    source = ProtocolSource(
+        directory=protocol_subdirectory,
+        main_file=protocol_subdirectory / "main.json",
+        content_hash="abc123",
+        files=[],
+        metadata={},
+        robot_type="OT-2 Standard",
+        config=JsonProtocolConfig(schema_version=8),
+    )
+    fingerprint = await compute_fingerprint(AsyncPath(protocol_subdirectory))
+
+    writer = ProtocolSourceCache(cache_file, protocols_directory)
+    writer.set("protocol-id", fingerprint, source)
+    await writer.save()
+
+    reader = ProtocolSourceCache(cache_file, protocols_directory)
+    await reader.load()
+    assert reader.get("protocol-id", fingerprint) == source
+
+
+async def test_stale_fingerprint(protocols_directory: Path, cache_file: Path) -> None:
+    """It should not return a source whose files have changed since it was cached."""
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    fingerprint = await compute_fingerprint(AsyncPath(protocol_subdirectory))
+
+    subject = ProtocolSourceCache(cache_file, protocols_directory)
+    subject.set("protocol-id", fingerprint, _python_source(protocol_subdirectory))
+
+    (protocol_subdirectory / "main.py").write_text("# a longer protocol")
+    new_fingerprint = await compute_fingerprint(AsyncPath(protocol_subdirectory))
+
+    assert new_fingerprint != fingerprint
+    assert subject.get("protocol-id", new_fingerprint) is None
+
+
+async def test_other_software_version(
+    protocols_directory: Path, cache_file: Path
+) -> None:
+    """It should discard a cache written by a different software version."""
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    fingerprint = await compute_fingerprint(AsyncPath(protocol_subdirectory))
+
+    writer = ProtocolSourceCache(cache_file, protocols_directory)
+    writer.set("protocol-id", fingerprint, _python_source(protocol_subdirectory))
+    await writer.save()
+
+    document = json.loads(cache_file.read_text())
+    document["softwareVersion"] = "0.0.0-some-other-version"
+    cache_file.write_text(json.dumps(document))
+
+    reader = ProtocolSourceCache(cache_file, protocols_directory)
+    await reader.load()
+    assert reader.get("protocol-id", fingerprint) is None
+
+
+@pytest.mark.parametrize("contents", ["", "not json", '{"formatVersion": 1}'])
+async def test_unreadable_cache(
+    protocols_directory: Path, cache_file: Path, contents: str
+) -> None:
+    """It should treat a corrupt cache file as empty."""
+    cache_file.write_text(contents)
+    subject = ProtocolSourceCache(cache_file, protocols_directory)
+    await subject.load()
+    assert subject.get("protocol-id", []) is None
+
+
+async def test_missing_cache(protocols_directory: Path, cache_file: Path) -> None:
+    """It should treat a missing cache file as empty."""
+    subject = ProtocolSourceCache(cache_file, protocols_directory)
+    await subject.load()
+    assert subject.get("protocol-id", []) is None
+
+
+async def test_metadata_that_does_not_round_trip(
+    protocols_directory: Path, cache_file: Path
+) -> None:
+    """It should skip sources whose metadata JSON can't represent faithfully."""
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    source = _python_source(protocol_subdirectory)
+    source = ProtocolSource(
+        directory=source.directory,
+        main_file=source.main_file,
+        content_hash=source.content_hash,
+        files=source.files,
+        metadata={"tags": ("a", "b")},
+        robot_type=source.robot_type,
+        config=source.config,
+    )
+    fingerprint = await compute_fingerprint(AsyncPath(protocol_subdirectory))
+
+    writer = ProtocolSourceCache(cache_file, protocols_directory)
+    writer.set("protocol-id", fingerprint, source)
+    await writer.save()
+
+    reader = ProtocolSourceCache(cache_file, protocols_directory)
+    await reader.load()
+    assert reader.get("protocol-id", fingerprint) is None
+
+
+async def test_retain_only(protocols_directory: Path, cache_file: Path) -> None:
+    """It should forget protocols that no longer exist."""
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    source = _python_source(protocol_subdirectory)
+    fingerprint = await compute_fingerprint(AsyncPath(protocol_subdirectory))
+
+    subject = ProtocolSourceCache(cache_file, protocols_directory)
+    subject.set("protocol-id", fingerprint, source)
+    subject.set("deleted-protocol-id", fingerprint, source)
+    subject.retain_only(["protocol-id"])
+
+    assert subject.get("protocol-id", fingerprint) == source
+    assert subject.get("deleted-protocol-id", fingerprint) is None
@@ -6,7 +6,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.parse import PythonParseMode
 from opentrons.protocol_reader import (
+    ProtocolReader,
     ProtocolSource,
     ProtocolSourceFile,
     ProtocolFileRole,
@@ -85,7 +87,12 @@ def completed_analysis_store(
     sql_engine: SQLEngine,
 ) -> CompletedAnalysisStore:
     """Get a subject."""
-    return CompletedAnalysisStore(sql_engine, decoy.mock(cls=MemoryCache), "2")
+    return CompletedAnalysisStore(
+        sql_engine,
+        decoy.mock(cls=MemoryCache),
+        "2",
+        document_memory_cache=decoy.mock(cls=MemoryCache),
+    )
 
 
 async def test_insert_and_get_protocol(
@@ -161,6 +168,77 @@ async def test_insert_with_duplicate_key_raises(
     assert subject.get_all() == [protocol_resource_1]  # No traces of the failed insert.
 
 
+async def test_rehydrate_reuses_cached_sources(
+    decoy: Decoy, sql_engine: SQLEngine, tmp_path: Path
+) -> None:
+    """It should only read protocol files that changed since the last rehydration."""
+    protocols_directory = tmp_path / "protocols"
+    protocol_subdirectory = protocols_directory / "protocol-id"
+    protocol_subdirectory.mkdir(parents=True)
+    (protocol_subdirectory / "abc.json").write_text("{}")
+    source_cache_file = tmp_path / "protocol_source_cache.json"
+
+    source = ProtocolSource(
+        directory=protocol_subdirectory,
+        main_file=(protocol_subdirectory / "abc.json"),
+        config=JsonProtocolConfig(schema_version=8),
+        files=[
+            ProtocolSourceFile(
+                path=protocol_subdirectory / "abc.json", role=ProtocolFileRole.MAIN
+            )
+        ],
+        metadata={"protocolName": "My Protocol"},
+        robot_type="OT-2 Standard",
+        content_hash="abc123",
+    )
+    ProtocolStore.create_empty(sql_engine=sql_engine).insert(
+        ProtocolResource(
+            protocol_id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            source=source,
+            protocol_key=None,
+            protocol_kind=ProtocolKind.STANDARD,
+        )
+    )
+
+    protocol_reader = decoy.mock(cls=ProtocolReader)
+    decoy.when(
+        await protocol_reader.read_saved(
+            files=[protocol_subdirectory / "abc.json"],
+            directory=protocol_subdirectory,
+            files_are_prevalidated=True,
+            python_parse_mode=PythonParseMode.ALLOW_LEGACY_METADATA_AND_REQUIREMENTS,
+        )
+    ).then_return(source)
+
+    first = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocols_directory,
+        protocol_reader=protocol_reader,
+        source_cache_file=source_cache_file,
+    )
+    assert first.get("protocol-id").source == source
+
+    # A reader that can't read anything, so any source must come from the cache.
+    unused_protocol_reader = decoy.mock(cls=ProtocolReader)
+    second = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocols_directory,
+        protocol_reader=unused_protocol_reader,
+        source_cache_file=source_cache_file,
+    )
+    assert second.get("protocol-id").source == source
+    decoy.verify(
+        await unused_protocol_reader.read_saved(
+            files=[protocol_subdirectory / "abc.json"],
+            directory=protocol_subdirectory,
+            files_are_prevalidated=True,
+            python_parse_mode=PythonParseMode.ALLOW_LEGACY_METADATA_AND_REQUIREMENTS,
+        ),
+        times=0,
+    )
+
+
 async def test_get_missing_protocol_raises(subject: ProtocolStore) -> None:
     """It should raise an error when protocol not found."""
     with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
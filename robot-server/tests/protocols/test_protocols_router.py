@@ -343,6 +343,7 @@ async def test_get_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
     analysis_store: AnalysisStore,
+    analyses_manager: AnalysesManager,
 ) -> None:
     """It should return a single protocol file."""
     resource = ProtocolResource(
@@ -378,6 +379,7 @@ async def test_get_protocol_by_id(
         "protocol-id",
         protocol_store=protocol_store,
         analysis_store=analysis_store,
+        analyses_manager=analyses_manager,
     )
 
     assert result.content.data == Protocol(
@@ -394,6 +396,7 @@ async def test_get_protocol_by_id(
 
     assert result.content.links == ProtocolLinks.construct(referencingRuns=[])
     assert result.status_code == 200
+    decoy.verify(analyses_manager.prioritize("protocol-id"))
 
 
 async def test_get_protocol_not_found(
@@ -412,6 +415,7 @@ async def test_get_protocol_not_found(
             "protocol-id",
             protocol_store=protocol_store,
             analysis_store=decoy.mock(cls=AnalysisStore),
+            analyses_manager=decoy.mock(cls=AnalysesManager),
         )
 
     assert exc_info.value.status_code == 404
@@ -618,6 +622,7 @@ async def test_create_protocol(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            use_cache=True,
         )
     ).then_return(pending_analysis)
 
@@ -761,6 +766,7 @@ async def test_create_new_protocol_with_run_time_params(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            use_cache=True,
         )
     ).then_return(pending_analysis)
     decoy.when(protocol_store.get_all()).then_return([])
@@ -883,6 +889,7 @@ async def test_create_existing_protocol_with_no_previous_analysis(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            use_cache=True,
         )
     ).then_return(pending_analysis)
 
@@ -1033,6 +1040,7 @@ async def test_create_existing_protocol_with_different_run_time_params(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            use_cache=True,
         )
     ).then_return(pending_summary)
 
@@ -1851,6 +1859,7 @@ async def test_update_protocol_analyses_with_new_rtp_values(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id-2",
             analyzer=analyzer,
+            use_cache=True,
         )
     ).then_return(
         AnalysisSummary(
@@ -1943,6 +1952,7 @@ async def test_update_protocol_analyses_with_forced_reanalysis(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id-2",
             analyzer=analyzer,
+            use_cache=False,
         )
     ).then_return(AnalysisSummary(id="analysis-id-2", status=AnalysisStatus.PENDING))
 
@@ -2054,6 +2064,7 @@ async def test_create_protocol_kind_quick_transfer(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            use_cache=True,
         )
     ).then_return(pending_analysis)
     decoy.when(protocol_store.get_all()).then_return([])
@@ -29,6 +29,7 @@ from robot_server.runs.router.commands_router import (
     create_run_command,
     get_run_command,
     get_run_commands,
+    get_run_commands_as_ndjson,
     get_current_run_from_url,
 )
 
@@ -456,6 +457,50 @@ async def test_get_run_commands_not_found(
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
+async def test_get_run_commands_as_ndjson(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should stream the run's commands, one per line."""
+    decoy.when(
+        mock_run_data_manager.get_all_commands_as_preserialized_stream(
+            run_id="run-id", include_fixit_commands=False
+        )
+    ).then_return(iter(['{"id": "command-1"}', '{"id": "command-2"}']))
+
+    result = await get_run_commands_as_ndjson(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        includeFixitCommands=False,
+    )
+
+    assert result.media_type == "application/x-ndjson"
+    assert [chunk async for chunk in result.body_iterator] == [
+        '{"id": "command-1"}\n',
+        '{"id": "command-2"}\n',
+    ]
+
+
+async def test_get_run_commands_as_ndjson_not_found(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should 404 if the run is not found."""
+    decoy.when(
+        mock_run_data_manager.get_all_commands_as_preserialized_stream(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_raise(RunNotFoundError("run-id"))
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_commands_as_ndjson(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+            includeFixitCommands=True,
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
+
+
 async def test_get_run_command_by_id(
     decoy: Decoy, mock_run_data_manager: RunDataManager
 ) -> None:
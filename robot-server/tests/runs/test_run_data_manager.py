@@ -1228,6 +1228,35 @@ def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
         subject.get_all_commands_as_preserialized_list("current-run-id", True)
 
 
+def test_get_all_commands_as_preserialized_stream(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_store: RunStore,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should return the pre-serialized commands stream."""
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return(None)
+    decoy.when(
+        mock_run_store.get_all_commands_as_preserialized_stream("run-id", True)
+    ).then_return(iter(['{"id": command-1}', '{"id": command-2}']))
+    assert list(subject.get_all_commands_as_preserialized_stream("run-id", True)) == [
+        '{"id": command-1}',
+        '{"id": command-2}',
+    ]
+
+
+def test_get_all_commands_as_preserialized_stream_errors_for_active_runs(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should raise an error when streaming pre-serialized commands while run is active."""
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return("current-run-id")
+    decoy.when(mock_run_orchestrator_store.get_is_run_terminal()).then_return(False)
+    with pytest.raises(PreSerializedCommandsNotAvailableError):
+        subject.get_all_commands_as_preserialized_stream("current-run-id", True)
+
+
 async def test_get_current_run_labware_definition(
     decoy: Decoy,
     mock_run_orchestrator_store: RunOrchestratorStore,
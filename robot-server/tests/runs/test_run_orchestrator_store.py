@@ -99,6 +99,31 @@ async def test_create_engine_uses_robot_type(
     assert subject._run_orchestrator is not None
 
 
+async def test_create_engine_with_max_finished_commands_in_memory(
+    decoy: Decoy,
+) -> None:
+    """It should create ProtocolEngines that keep the given number of commands."""
+    subject = RunOrchestratorStore(
+        hardware_api=decoy.mock(cls=API),
+        robot_type="OT-2 Standard",
+        deck_type=pe_types.DeckType.OT2_SHORT_TRASH,
+        max_finished_commands_in_memory=123,
+    )
+
+    await subject.create(
+        run_id="run-id",
+        labware_offsets=[],
+        initial_error_recovery_policy=never_recover,
+        deck_configuration=[],
+        protocol=None,
+        file_provider=FileProvider(),
+        notify_publishers=mock_notify_publishers,
+    )
+
+    config = subject.run_orchestrator._protocol_engine.state_view.config
+    assert config.max_finished_commands_in_memory == 123
+
+
 async def test_create_engine_with_labware_offsets(
     subject: RunOrchestratorStore,
 ) -> None:
@@ -1,4 +1,5 @@
 """Tests for robot_server.runs.run_store."""
+import tracemalloc
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Type
@@ -9,6 +10,7 @@ from robot_server.data_files.data_files_store import (
     DataFileInfo,
     DataFilesStore,
 )
+import sqlalchemy
 from sqlalchemy.engine import Engine
 from unittest import mock
 
@@ -16,6 +18,7 @@ from opentrons_shared_data.pipette.types import PipetteNameType
 from opentrons_shared_data.errors.codes import ErrorCodes
 
 from robot_server.data_files.models import DataFileSource
+from robot_server.persistence.tables import CommandStatusSQLEnum, run_command_table
 from robot_server.protocols.protocol_store import ProtocolNotFoundError
 from robot_server.runs.run_store import (
     CSVParameterRunResource,
@@ -423,6 +426,76 @@ async def test_insert_and_get_csv_rtp(
     ]
 
 
+def test_update_run_state_rewrites_unsettled_commands(
+    subject: RunStore,
+    sql_engine: Engine,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should only rewrite commands that hadn't finished when last persisted."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    queued_command = protocol_commands[2].copy(
+        update={"status": pe_commands.CommandStatus.QUEUED, "result": None}
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[:2] + [queued_command],
+        run_time_parameters=[],
+    )
+
+    inserted_row_counts: List[int] = []
+
+    def _record_inserts(
+        conn: object,
+        cursor: object,
+        statement: str,
+        parameters: object,
+        context: object,
+        executemany: bool,
+    ) -> None:
+        if statement.startswith("INSERT INTO run_command"):
+            inserted_row_counts.append(len(parameters) if executemany else 1)  # type: ignore[arg-type]
+
+    sqlalchemy.event.listen(sql_engine, "before_cursor_execute", _record_inserts)
+    try:
+        subject.update_run_state(
+            run_id="run-id",
+            summary=state_summary,
+            commands=protocol_commands,
+            run_time_parameters=[],
+        )
+    finally:
+        sqlalchemy.event.remove(sql_engine, "before_cursor_execute", _record_inserts)
+
+    # Only the command that was queued and the new command are written,
+    # in a single batch.
+    assert inserted_row_counts == [2]
+    result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands),
+        cursor=0,
+        include_fixit_commands=True,
+    )
+    assert result.commands == protocol_commands
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[:1],
+        run_time_parameters=[],
+    )
+    result = subject.get_commands_slice(
+        run_id="run-id", length=10, cursor=0, include_fixit_commands=True
+    )
+    assert result.commands == protocol_commands[:1]
+    assert result.total_length == 1
+
+
 def test_update_state_run_not_found(
     subject: RunStore,
     state_summary: StateSummary,
@@ -972,6 +1045,37 @@ def test_get_commands_slice_no_fixit_commands(
     ]
 
 
+def test_command_counts_survive_new_store(
+    sql_engine: Engine,
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should count stored commands for runs it hasn't written itself."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+
+    new_subject = RunStore(sql_engine=sql_engine)
+    with_fixit = new_subject.get_commands_slice(
+        run_id="run-id", length=1, cursor=0, include_fixit_commands=True
+    )
+    without_fixit = new_subject.get_commands_slice(
+        run_id="run-id", length=1, cursor=0, include_fixit_commands=False
+    )
+
+    assert with_fixit.total_length == 4
+    assert without_fixit.total_length == 3
+
+
 def test_get_all_commands_as_preserialized_list(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
@@ -1029,3 +1133,88 @@ def test_get_all_commands_as_preserialized_list_no_fixit(
         ' "key": "command-key", "status": "succeeded", "params": {"message": "hey world"}, "result": {}, "intent": "protocol"}',
         '{"id": "pause-3", "createdAt": "2023-03-03T00:00:00", "commandType": "waitForResume", "key": "command-key", "status": "succeeded", "params": {"message": "sup world"}, "result": {}}',
     ]
+
+
+@pytest.mark.parametrize("include_fixit_commands", [True, False])
+def test_get_all_commands_as_preserialized_stream(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+    include_fixit_commands: bool,
+) -> None:
+    """It should stream the same commands as the pre-serialized list."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+    result = subject.get_all_commands_as_preserialized_stream(
+        run_id="run-id", include_fixit_commands=include_fixit_commands
+    )
+    assert list(result) == subject.get_all_commands_as_preserialized_list(
+        run_id="run-id", include_fixit_commands=include_fixit_commands
+    )
+
+
+def test_get_all_commands_as_preserialized_stream_run_not_found(
+    subject: RunStore,
+) -> None:
+    """It should raise RunNotFoundError before anything is consumed."""
+    with pytest.raises(RunNotFoundError):
+        subject.get_all_commands_as_preserialized_stream(
+            run_id="not-run-id", include_fixit_commands=True
+        )
+
+
+def test_get_all_commands_as_preserialized_stream_memory(
+    subject: RunStore,
+    sql_engine: Engine,
+) -> None:
+    """It should stream a very long run without holding all of it in memory."""
+    command_count = 100_000
+    padding = "x" * 200
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    # Insert rows directly; serializing 100k real commands would make this test slow.
+    with sql_engine.begin() as transaction:
+        transaction.execute(
+            sqlalchemy.insert(run_command_table),
+            [
+                {
+                    "run_id": "run-id",
+                    "index_in_run": index,
+                    "command_id": f"command-{index}",
+                    "command": f'{{"id": "command-{index}", "padding": "{padding}"}}',
+                    "command_intent": "protocol",
+                    "command_status": CommandStatusSQLEnum.SUCCEEDED,
+                }
+                for index in range(command_count)
+            ],
+        )
+
+    stream = subject.get_all_commands_as_preserialized_stream(
+        run_id="run-id", include_fixit_commands=True
+    )
+    streamed_count = 0
+    streamed_bytes = 0
+    tracemalloc.start()
+    try:
+        for command in stream:
+            streamed_count += 1
+            streamed_bytes += len(command)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert streamed_count == command_count
+    # Materializing the run would need at least streamed_bytes.
+    assert peak_bytes < streamed_bytes / 10
@@ -0,0 +1,121 @@
+"""Tests for the notification coalescer."""
+import asyncio
+from typing import List, Tuple
+
+from robot_server.service.notifications.notification_coalescer import (
+    NotificationCoalescer,
+    NotificationStats,
+)
+from robot_server.service.notifications.topics import TopicName
+
+_TOPIC = TopicName("robot-server/runs/run-id")
+_OTHER_TOPIC = TopicName("robot-server/runs")
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_subject(
+    window: float = 0.05,
+) -> Tuple[NotificationCoalescer, List[Tuple[str, str]], _FakeClock]:
+    published: List[Tuple[str, str]] = []
+    clock = _FakeClock()
+    subject = NotificationCoalescer(
+        publish=lambda topic, payload: published.append((topic, payload)),
+        window=window,
+        clock=clock,
+    )
+    return subject, published, clock
+
+
+async def test_burst_publishes_first_and_last() -> None:
+    """It should publish a burst of identical notifications once now and once later."""
+    subject, published, _ = _make_subject()
+
+    for _ in range(10):
+        subject.submit(_TOPIC, "refetch")
+
+    assert published == [(_TOPIC, "refetch")]
+
+    await asyncio.sleep(0.1)
+
+    assert published == [(_TOPIC, "refetch"), (_TOPIC, "refetch")]
+    assert subject.get_stats() == NotificationStats(published=2, suppressed=8)
+
+
+async def test_quiet_topic_publishes_immediately() -> None:
+    """It should not delay a notification on a topic that's been quiet."""
+    subject, published, clock = _make_subject()
+
+    subject.submit(_TOPIC, "refetch")
+    clock.now += 1
+    subject.submit(_TOPIC, "refetch")
+
+    assert published == [(_TOPIC, "refetch"), (_TOPIC, "refetch")]
+
+
+async def test_topics_are_independent() -> None:
+    """It should coalesce each topic separately."""
+    subject, published, _ = _make_subject()
+
+    subject.submit(_TOPIC, "refetch")
+    subject.submit(_OTHER_TOPIC, "refetch")
+
+    assert published == [(_TOPIC, "refetch"), (_OTHER_TOPIC, "refetch")]
+
+
+async def test_different_payload_keeps_order() -> None:
+    """It should flush a deferred notification before publishing a different one."""
+    subject, published, _ = _make_subject()
+
+    subject.submit(_TOPIC, "refetch")
+    subject.submit(_TOPIC, "refetch")
+    subject.submit(_TOPIC, "unsubscribe")
+
+    assert published == [
+        (_TOPIC, "refetch"),
+        (_TOPIC, "refetch"),
+        (_TOPIC, "unsubscribe"),
+    ]
+
+    await asyncio.sleep(0.1)
+    assert len(published) == 3
+
+
+async def test_flush_all() -> None:
+    """It should publish deferred notifications on demand."""
+    subject, published, _ = _make_subject()
+
+    subject.submit(_TOPIC, "refetch")
+    subject.submit(_TOPIC, "refetch")
+    subject.flush_all()
+
+    assert published == [(_TOPIC, "refetch"), (_TOPIC, "refetch")]
+
+    await asyncio.sleep(0.1)
+    assert len(published) == 2
+
+
+def test_no_event_loop() -> None:
+    """It should publish everything immediately if it can't defer."""
+    subject, published, _ = _make_subject()
+
+    subject.submit(_TOPIC, "refetch")
+    subject.submit(_TOPIC, "refetch")
+
+    assert published == [(_TOPIC, "refetch"), (_TOPIC, "refetch")]
+
+
+def test_zero_window() -> None:
+    """It should not coalesce anything with a window of 0."""
+    subject, published, _ = _make_subject(window=0)
+
+    subject.submit(_TOPIC, "refetch")
+    subject.submit(_TOPIC, "refetch")
+
+    assert published == [(_TOPIC, "refetch"), (_TOPIC, "refetch")]
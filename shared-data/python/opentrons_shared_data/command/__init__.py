@@ -70,7 +70,7 @@ def _schema_id_from_file(schema_file_name: str) -> str:
             detail={"type": "bad-schema-name", "schema-kind": "command"},
         )
     try:
-        schema_content = json.load(open(schema_file_name))
+        schema_content = json.loads(load_shared_data(schema_file_name))
     except json.JSONDecodeError as jde:
         raise InvalidStoredData(
             message=f"Command schema {schema_file_name} is not valid json",
@@ -2,21 +2,109 @@
 opentrons_shared_data.labware: types and functions for accessing labware defs
 """
 import json
-from typing import Any, Dict, NewType, TYPE_CHECKING
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, NewType, Optional, TYPE_CHECKING
 
-from .. import load_shared_data
+from .. import load_shared_data, get_shared_data_root
+from ..packed_data import PackedData, write_packed_data
 
 if TYPE_CHECKING:
     from .types import LabwareDefinition
+    from . import labware_definition
 
 Schema = NewType("Schema", Dict[str, Any])
 
+STANDARD_DEFINITIONS_INDEX_PATH = "labware/definitions/index.pack"
+"""Where the optional packed index of standard definitions is, under the root.
+
+It's generated when this package is built. Without it, standard definitions
+are read from their own files.
+"""
+
+_INDEXED_SCHEMA_VERSIONS = ("3", "2")
+"""Schema versions in the index, in the order that they're looked up."""
+
+VALIDATED_DEFINITION_CACHE_SIZE = 256
+"""How many validated standard definitions to keep in memory."""
+
 
 def load_definition(loadname: str, version: int) -> "LabwareDefinition":
-    return json.loads(
-        load_shared_data(f"labware/definitions/2/{loadname}/{version}.json")
-    )
+    return json.loads(_load_definition_bytes(f"2/{loadname}/{version}.json"))
 
 
 def load_schema() -> Schema:
     return json.loads(load_shared_data("labware/schemas/2.json"))
+
+
+def load_standard_definition(loadname: str, version: int) -> "LabwareDefinition":
+    """Load a standard labware definition, preferring its newest schema version.
+
+    Each call returns a new dict, which the caller is free to modify.
+
+    Raises:
+        FileNotFoundError: If there is no standard definition with this load name
+            and version.
+    """
+    for schema_version in _INDEXED_SCHEMA_VERSIONS:
+        try:
+            return json.loads(
+                _load_definition_bytes(f"{schema_version}/{loadname}/{version}.json")
+            )
+        except FileNotFoundError:
+            pass
+    raise FileNotFoundError(
+        f'Standard labware "{loadname}" not found with version {version}.'
+    )
+
+
+@lru_cache(maxsize=VALIDATED_DEFINITION_CACHE_SIZE)
+def load_validated_definition(
+    loadname: str, version: int
+) -> "labware_definition.LabwareDefinition":
+    """Load and validate a standard labware definition, like `load_standard_definition`.
+
+    Validated definitions are cached for the whole process, so the result is
+    shared by every caller and must not be modified.
+
+    Raises:
+        FileNotFoundError: If there is no standard definition with this load name
+            and version.
+    """
+    from .labware_definition import LabwareDefinition
+
+    return LabwareDefinition.parse_obj(load_standard_definition(loadname, version))
+
+
+def write_standard_definitions_index(data_root: Path) -> Path:
+    """Pack the standard definitions under `data_root` into an index file there.
+
+    Returns:
+        The path to the index file.
+    """
+    definitions_root = data_root / "labware" / "definitions"
+    contents = {
+        str(path.relative_to(definitions_root)): path.read_bytes()
+        for schema_version in _INDEXED_SCHEMA_VERSIONS
+        for path in sorted((definitions_root / schema_version).glob("*/*.json"))
+    }
+    index_path = data_root / STANDARD_DEFINITIONS_INDEX_PATH
+    write_packed_data(index_path, contents)
+    return index_path
+
+
+@lru_cache(maxsize=1)
+def _get_standard_definitions_index() -> Optional[PackedData]:
+    index_path = get_shared_data_root() / STANDARD_DEFINITIONS_INDEX_PATH
+    return PackedData(index_path) if index_path.exists() else None
+
+
+def _load_definition_bytes(relative_path: str) -> bytes:
+    """Load a file under the standard definitions directory."""
+    index = _get_standard_definitions_index()
+    if index is not None:
+        contents = index.get(relative_path)
+        if contents is None:
+            raise FileNotFoundError(f"{relative_path} is not a standard definition.")
+        return contents
+    return load_shared_data(f"labware/definitions/{relative_path}")
@@ -4,10 +4,33 @@ import os
 from pathlib import Path
 from functools import lru_cache
 
+from .packed_data import PackedData, write_packed_data
+
 log = logging.getLogger(__name__)
 
 ENV_SHARED_DATA_PATH = "OT_SHARED_DATA_PATH"
 
+BUNDLE_NAME = "bundle.pack"
+"""The name of the optional bundle of shared data files, in the root.
+
+It's generated when this package is built. Without it, every file is read on
+its own.
+"""
+
+BUNDLED_FILES = (
+    "command/schemas/*.json",
+    "deck/definitions/5/*.json",
+    "errors/definitions/1/*.json",
+    "robot/definitions/1/*.json",
+)
+"""Patterns, under the root, of the files that go in the bundle.
+
+These are the files that every run reads when it starts, whatever its
+protocol. Pipette, module and labware definitions depend on the protocol,
+so they're read on their own, except for standard labware definitions,
+which have their own index (see `opentrons_shared_data.labware`).
+"""
+
 
 class SharedDataMissingError(IOError):
     pass
@@ -52,6 +75,50 @@ def load_shared_data(path: typing.Union[str, Path]) -> bytes:
     Load file from shared data directory.
 
     path is relative to the root of all shared data (ie. no "shared-data")
+
+    Files that are in the bundle are served from it without touching the
+    filesystem. Anything else, like a file added after the package was built,
+    is read from the shared data directory.
     """
+    bundle = _get_bundle()
+    if bundle is not None:
+        contents = bundle.get(_get_bundle_key(path))
+        if contents is not None:
+            return contents
     with open(get_shared_data_root() / path, "rb") as f:
         return f.read()
+
+
+def write_bundle(data_root: Path) -> Path:
+    """Bundle the files under `data_root` that match `BUNDLED_FILES` into one file there.
+
+    Returns:
+        The path to the bundle.
+    """
+    contents = {
+        path.relative_to(data_root).as_posix(): path.read_bytes()
+        for pattern in BUNDLED_FILES
+        for path in sorted(data_root.glob(pattern))
+    }
+    bundle_path = data_root / BUNDLE_NAME
+    write_packed_data(bundle_path, contents)
+    return bundle_path
+
+
+@lru_cache(maxsize=1)
+def _get_bundle() -> typing.Optional[PackedData]:
+    bundle_path = get_shared_data_root() / BUNDLE_NAME
+    if not bundle_path.exists():
+        return None
+    log.info("Using shared data bundle: %s", bundle_path)
+    return PackedData(bundle_path)
+
+
+def _get_bundle_key(path: typing.Union[str, Path]) -> str:
+    path = Path(path)
+    if path.is_absolute():
+        try:
+            path = path.relative_to(get_shared_data_root())
+        except ValueError:
+            return ""
+    return path.as_posix()
@@ -0,0 +1,84 @@
+"""A read-only archive of many small data files, packed into one file.
+
+The archive starts with a magic string and the length of a JSON header, followed
+by the header and then the contents of every file, back to back. The header maps
+each file's name to the offset and length of its contents. The archive is memory
+mapped when opened, so looking up a file reads only that file's bytes.
+
+This has no dependencies outside the standard library so that it can be used
+while building this package.
+"""
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+_MAGIC = b"OTPACK1\n"
+_HEADER_LENGTH = struct.Struct("<Q")
+
+
+class PackedDataError(ValueError):
+    """Raised when a file is not a valid packed data archive."""
+
+
+def write_packed_data(path: Path, contents: Mapping[str, bytes]) -> None:
+    """Write an archive of `contents`, a map of file names to file contents."""
+    header: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for name, data in contents.items():
+        header[name] = (offset, len(data))
+        offset += len(data)
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for data in contents.values():
+            f.write(data)
+
+
+class PackedData:
+    """A packed data archive, opened for reading.
+
+    Lookups are safe to make from multiple threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open and memory map the archive at `path`."""
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise PackedDataError(f"{path} is empty.") from e
+        prefix_length = len(_MAGIC) + _HEADER_LENGTH.size
+        if self._mmap[: len(_MAGIC)] != _MAGIC or len(self._mmap) < prefix_length:
+            raise PackedDataError(f"{path} is not a packed data archive.")
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mmap, len(_MAGIC))
+        header_end = prefix_length + header_length
+        self._index: Dict[str, Tuple[int, int]] = {
+            name: (header_end + offset, length)
+            for name, (offset, length) in json.loads(
+                self._mmap[prefix_length:header_end]
+            ).items()
+        }
+
+    def get(self, name: str) -> Optional[bytes]:
+        """Get the contents of the file called `name`, if it's in the archive."""
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._mmap[offset : offset + length]
+
+    def __contains__(self, name: object) -> bool:
+        """Get whether a file called `name` is in the archive."""
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the files in the archive."""
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """Get the number of files in the archive."""
+        return len(self._index)
@@ -5,7 +5,7 @@ from typing_extensions import Final
 
 import json
 
-from .. import get_shared_data_root
+from .. import get_shared_data_root, load_shared_data
 
 from .types import RobotDefinition, RobotType
 
@@ -19,7 +19,7 @@ def load(
     for fi in Path(
         get_shared_data_root() / "robot" / "definitions" / f"{version}"
     ).iterdir():
-        defn = json.load(fi.open("r"))
+        defn = json.loads(load_shared_data(fi))
         if defn["robotType"] == robot_type:
             return cast(RobotDefinition, defn)
     raise KeyError(robot_type)
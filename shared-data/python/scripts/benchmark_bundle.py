@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark loading shared data from the bundle against loading loose files.
+
+This copies the shared data definitions and schemas into two temporary roots,
+bundles one of them the same way a package build does, and times a command in
+new processes with OT_SHARED_DATA_PATH pointing at each root. By default, the
+command loads every bundled file once.
+
+Usage: python scripts/benchmark_bundle.py [--runs N] [command ...]
+For example: python scripts/benchmark_bundle.py -m opentrons.simulate protocol.py
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from opentrons_shared_data import get_shared_data_root
+from opentrons_shared_data.load import write_bundle
+from opentrons_shared_data.packed_data import PackedData
+
+_LOAD_ALL = """
+import sys
+from opentrons_shared_data import load_shared_data
+for name in open(sys.argv[1]).read().split():
+    load_shared_data(name)
+"""
+
+
+def _copy_data(destination: Path) -> None:
+    source = get_shared_data_root()
+    for pattern in ("*/definitions/**/*.json", "*/schemas/**/*.json"):
+        for path in source.glob(pattern):
+            target = destination / path.relative_to(source)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, target)
+
+
+def _time_runs(command: List[str], data_root: Path, runs: int) -> List[float]:
+    env = dict(os.environ, OT_SHARED_DATA_PATH=str(data_root))
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main(args: List[str]) -> None:
+    """Print the median time to run the command with and without the bundle."""
+    runs = 10
+    if args[:1] == ["--runs"]:
+        runs = int(args[1])
+        args = args[2:]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files_root = Path(temp_dir) / "files"
+        bundle_root = Path(temp_dir) / "bundle"
+        _copy_data(files_root)
+        _copy_data(bundle_root)
+        names = list(PackedData(write_bundle(bundle_root)))
+        names_file = Path(temp_dir) / "names.txt"
+        names_file.write_text("\n".join(names))
+        command = [sys.executable] + (args or ["-c", _LOAD_ALL, str(names_file)])
+        print(f"{len(names)} files")
+        # Interleave the runs so that neither setup gets a warmer cache.
+        times: Dict[str, List[float]] = {"files": [], "bundle": []}
+        for _ in range(runs):
+            times["files"] += _time_runs(command, files_root, 1)
+            times["bundle"] += _time_runs(command, bundle_root, 1)
+    for label, label_times in times.items():
+        print(f"{label:<7} {statistics.median(label_times) * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
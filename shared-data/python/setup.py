@@ -12,6 +12,10 @@ HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.append(os.path.join(HERE, "..", "..", "scripts"))
 
 from python_build_utils import normalize_version  # noqa: E402
+from opentrons_shared_data.labware import (  # noqa: E402
+    write_standard_definitions_index,
+)
+from opentrons_shared_data.load import write_bundle  # noqa: E402
 
 # make stdout blocking since Travis sets it to nonblocking
 if os.name == "posix":
@@ -33,6 +37,7 @@ DATA_SUBDIRS = [
     "command",
     "commandAnnotation",
     "liquid",
+    "liquid-class",
 ]
 DATA_TYPES = ["definitions", "schemas"]
 DEST_BASE_PATH = "data"
@@ -103,6 +108,22 @@ class BuildWithData(build_py.build_py):
         )
         return files
 
+    def run(self) -> None:
+        super().run()
+        data_root = Path(self.build_lib) / "opentrons_shared_data" / DEST_BASE_PATH
+        if data_root.is_dir():
+            self.execute(
+                write_bundle,
+                args=(data_root,),
+                msg=f"bundling shared data files in {data_root}",
+            )
+        if (data_root / "labware" / "definitions").is_dir():
+            self.execute(
+                write_standard_definitions_index,
+                args=(data_root,),
+                msg=f"packing standard labware definitions in {data_root}",
+            )
+
 
 def get_version():
     buildno = os.getenv("BUILD_NUMBER")
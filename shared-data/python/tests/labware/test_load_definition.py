@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from opentrons_shared_data import get_shared_data_root, labware
+from opentrons_shared_data.labware import (
+    load_definition,
+    load_standard_definition,
+    load_validated_definition,
+    write_standard_definitions_index,
+)
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+from opentrons_shared_data.packed_data import PackedData
+
+
+@pytest.fixture
+def clear_index_cache() -> Iterator[None]:
+    labware._get_standard_definitions_index.cache_clear()
+    yield
+    labware._get_standard_definitions_index.cache_clear()
+
+
+def test_load_standard_definition_prefers_newest_schema() -> None:
+    result = load_standard_definition("agilent_1_reservoir_290ml", 2)
+    assert result["schemaVersion"] == 3
+    result = load_standard_definition("opentrons_96_tiprack_300ul", 1)
+    assert result["schemaVersion"] == 2
+
+
+def test_load_standard_definition_not_found() -> None:
+    with pytest.raises(FileNotFoundError):
+        load_standard_definition("not_a_real_labware", 1)
+
+
+def test_load_validated_definition() -> None:
+    result = load_validated_definition("opentrons_96_tiprack_300ul", 1)
+
+    assert result == LabwareDefinition.parse_obj(
+        load_standard_definition("opentrons_96_tiprack_300ul", 1)
+    )
+    assert load_validated_definition("opentrons_96_tiprack_300ul", 1) is result
+
+
+def test_load_from_index(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    clear_index_cache: None,
+) -> None:
+    definitions_root = get_shared_data_root() / "labware" / "definitions"
+    for relative_path in (
+        "2/opentrons_96_tiprack_300ul/1.json",
+        "3/agilent_1_reservoir_290ml/2.json",
+    ):
+        target = tmp_path / "labware" / "definitions" / relative_path
+        target.parent.mkdir(parents=True)
+        target.write_bytes((definitions_root / relative_path).read_bytes())
+
+    index_path = write_standard_definitions_index(tmp_path)
+    assert set(PackedData(index_path)) == {
+        "2/opentrons_96_tiprack_300ul/1.json",
+        "3/agilent_1_reservoir_290ml/2.json",
+    }
+
+    # Delete the loose files to make sure that they're coming from the index.
+    (tmp_path / "labware" / "definitions" / "2").rename(tmp_path / "moved")
+    monkeypatch.setattr(labware, "get_shared_data_root", lambda: tmp_path)
+
+    assert load_definition("opentrons_96_tiprack_300ul", 1) == json.loads(
+        (definitions_root / "2/opentrons_96_tiprack_300ul/1.json").read_bytes()
+    )
+    assert (
+        load_standard_definition("agilent_1_reservoir_290ml", 2)["schemaVersion"] == 3
+    )
+    with pytest.raises(FileNotFoundError):
+        load_standard_definition("nest_12_reservoir_15ml", 1)
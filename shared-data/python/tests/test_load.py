@@ -0,0 +1,67 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from opentrons_shared_data import load
+from opentrons_shared_data.load import BUNDLE_NAME, load_shared_data, write_bundle
+from opentrons_shared_data.packed_data import PackedData
+
+
+@pytest.fixture
+def data_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(load, "get_shared_data_root", lambda: tmp_path)
+    load._get_bundle.cache_clear()
+    yield tmp_path
+    load._get_bundle.cache_clear()
+
+
+def _write(path: Path, contents: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(contents)
+
+
+def test_write_bundle(data_root: Path) -> None:
+    _write(data_root / "deck" / "definitions" / "5" / "ot3_standard.json", b"{}")
+    _write(data_root / "robot" / "definitions" / "1" / "ot2.json", b"[]")
+    _write(data_root / "robot" / "notes.txt", b"not json")
+    _write(data_root / "labware" / "definitions" / "2" / "custom" / "1.json", b"{}")
+
+    bundle_path = write_bundle(data_root)
+
+    assert bundle_path == data_root / BUNDLE_NAME
+    bundle = PackedData(bundle_path)
+    assert set(bundle) == {
+        "deck/definitions/5/ot3_standard.json",
+        "robot/definitions/1/ot2.json",
+    }
+    assert bundle.get("robot/definitions/1/ot2.json") == b"[]"
+
+
+def test_load_from_bundle(data_root: Path) -> None:
+    _write(data_root / "deck" / "definitions" / "5" / "ot3_standard.json", b"{}")
+    write_bundle(data_root)
+    # Change the loose file to make sure that it's coming from the bundle.
+    _write(data_root / "deck" / "definitions" / "5" / "ot3_standard.json", b"[]")
+
+    assert load_shared_data("deck/definitions/5/ot3_standard.json") == b"{}"
+    assert load_shared_data(Path("deck/definitions/5/ot3_standard.json")) == b"{}"
+    assert (
+        load_shared_data(data_root / "deck" / "definitions" / "5" / "ot3_standard.json")
+        == b"{}"
+    )
+
+
+def test_load_falls_back_to_files(data_root: Path) -> None:
+    write_bundle(data_root)
+    _write(data_root / "labware" / "definitions" / "2" / "custom" / "1.json", b"{}")
+
+    assert load_shared_data("labware/definitions/2/custom/1.json") == b"{}"
+    with pytest.raises(FileNotFoundError):
+        load_shared_data("labware/definitions/2/missing/1.json")
+
+
+def test_load_without_bundle(data_root: Path) -> None:
+    _write(data_root / "deck" / "definitions" / "5" / "ot3_standard.json", b"{}")
+
+    assert load_shared_data("deck/definitions/5/ot3_standard.json") == b"{}"
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from opentrons_shared_data.packed_data import (
+    PackedData,
+    PackedDataError,
+    write_packed_data,
+)
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "test.pack"
+    contents = {"a/1.json": b'{"a": 1}', "b/2.json": b"", "c/3.json": b"[1, 2, 3]"}
+    write_packed_data(path, contents)
+
+    subject = PackedData(path)
+
+    assert len(subject) == 3
+    assert list(subject) == list(contents)
+    for name, data in contents.items():
+        assert name in subject
+        assert subject.get(name) == data
+    assert "d/4.json" not in subject
+    assert subject.get("d/4.json") is None
+
+
+@pytest.mark.parametrize("contents", [b"", b"not a packed data archive"])
+def test_invalid_archive(tmp_path: Path, contents: bytes) -> None:
+    path = tmp_path / "test.pack"
+    path.write_bytes(contents)
+
+    with pytest.raises(PackedDataError):
+        PackedData(path)